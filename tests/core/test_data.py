@@ -647,6 +647,255 @@ def test_Data_load_from_config(
     log_check(caplog, exp_log)
 
 
+@pytest.mark.parametrize(argnames="lazy_loading", argvalues=[False, True])
+def test_Data_load_from_config_lazy(tmp_path, lazy_loading):
+    """Test that the lazy loading option loads chunked arrays from config."""
+
+    from virtual_ecosystem.core.config import Config
+    from virtual_ecosystem.core.data import Data
+    from virtual_ecosystem.core.grid import Grid
+
+    values = np.arange(400, dtype=float).reshape(4, 100)
+    DataArray(values, dims=("time_index", "cell_id"), name="temp").to_netcdf(
+        tmp_path / "time_data.nc"
+    )
+
+    data = Data(Grid())
+    cfg = Config(
+        cfg_strings=f"""[core.data]
+        lazy_loading = {str(lazy_loading).lower()}
+        [[core.data.variable]]
+        file = "{tmp_path / "time_data.nc"}"
+        var_name = "temp"
+        """
+    )
+    data.load_data_config(config=cfg)
+
+    assert (data["temp"].chunks is not None) == lazy_loading
+    assert data.on_core_axis("temp", "spatial")
+    assert np.allclose(data["temp"].isel(time_index=1).to_numpy(), values[1])
+
+
+def test_Data_load_from_config_files(caplog, shared_datadir):
+    """Test loading variables from several files, with deferred failures."""
+
+    from virtual_ecosystem.core.config import Config
+    from virtual_ecosystem.core.data import Data
+    from virtual_ecosystem.core.grid import Grid
+
+    data = Data(Grid())
+    cfg = Config(
+        cfg_strings=f"""[[core.data.variable]]
+        file = "{shared_datadir / "cellid_coords.nc"}"
+        var_name = "temp"
+        [[core.data.variable]]
+        file = "{shared_datadir / "xy_dim.nc"}"
+        var_name = "temp_xy"
+        [[core.data.variable]]
+        file = "{shared_datadir / "not_there.nc"}"
+        var_name = "missing"
+        [[core.data.variable]]
+        file = "{shared_datadir / "cellid_coords.nc"}"
+        var_name = "prec"
+        """
+    )
+
+    with pytest.raises(ConfigurationError):
+        data.load_data_config(config=cfg)
+
+    # The variables from valid files are loaded and the missing file is reported
+    assert list(data.data.data_vars) == ["temp", "prec"]
+    errors = [rec.message for rec in caplog.records if rec.levelno == ERROR]
+    assert any("Variable temp_xy not found" in msg for msg in errors)
+    assert any(msg.startswith("Data file not found") for msg in errors)
+
+
+@pytest.mark.parametrize(
+    argnames="windowed_loading, exp_err",
+    argvalues=[
+        pytest.param(False, pytest.raises(ConfigurationError), id="unwindowed"),
+        pytest.param(True, does_not_raise(), id="windowed"),
+    ],
+)
+def test_Data_load_from_config_windowed(tmp_path, windowed_loading, exp_err):
+    """Test loading data covering a larger area and period than the simulation."""
+
+    from virtual_ecosystem.core.config import Config
+    from virtual_ecosystem.core.core_components import ModelTiming
+    from virtual_ecosystem.core.data import Data
+    from virtual_ecosystem.core.grid import Grid
+
+    # Data on a 4 x 4 grid of 100m cells over 30 time steps
+    values = np.arange(480, dtype=float).reshape(30, 4, 4)
+    DataArray(
+        values,
+        dims=("time_index", "y", "x"),
+        coords={"y": [350, 250, 150, 50], "x": [50, 150, 250, 350]},
+        name="temp",
+    ).to_netcdf(tmp_path / "xy_data.nc")
+
+    data = Data(Grid(cell_nx=2, cell_ny=2))
+    cfg = Config(
+        cfg_strings=f"""[core.timing]
+        start_date = "2020-01-01"
+        update_interval = "1 month"
+        run_length = "1 year"
+        [core.data]
+        windowed_loading = {str(windowed_loading).lower()}
+        [[core.data.variable]]
+        file = "{tmp_path / "xy_data.nc"}"
+        var_name = "temp"
+        """
+    )
+
+    with exp_err:
+        data.load_data_config(config=cfg, model_timing=ModelTiming(cfg))
+
+    if windowed_loading:
+        assert data["temp"].sizes == {"time_index": 12, "cell_id": 4}
+        assert np.allclose(
+            data["temp"].isel(time_index=0).to_numpy(), values[0, 2:, :2].flatten()
+        )
+
+
+@pytest.mark.parametrize(argnames="prefetch_forcing", argvalues=[False, True])
+def test_Data_get_forcing_slice(prefetch_forcing):
+    """Test the caching of forcing data time slices."""
+
+    from virtual_ecosystem.core.data import Data
+    from virtual_ecosystem.core.grid import Grid
+
+    data = Data(Grid(cell_nx=2, cell_ny=2))
+    data.prefetch_forcing = prefetch_forcing
+    values = np.arange(12, dtype=float).reshape(3, 4)
+    data["temp"] = DataArray(values, dims=("time_index", "cell_id"))
+
+    # Repeated requests within a time step return the same cached array
+    first = data.get_forcing_slice("temp", 0)
+    assert first is data.get_forcing_slice("temp", 0)
+    assert first.data.flags["C_CONTIGUOUS"]
+    assert np.allclose(first, values[0])
+
+    # Moving to a new time step replaces the cached slice, using the prefetched slice
+    # if requested.
+    assert data._forcing_prefetch_index == (1 if prefetch_forcing else None)
+    second = data.get_forcing_slice("temp", 1)
+    assert second is not first
+    assert np.allclose(second, values[1])
+
+    # Replacing the variable discards the cached slice.
+    data["temp"] = DataArray(values * 2, dims=("time_index", "cell_id"))
+    assert np.allclose(data.get_forcing_slice("temp", 1), values[1] * 2)
+    assert np.allclose(data.get_forcing_slice("temp", 2), values[2] * 2)
+
+    # Closing shuts down the prefetch thread and discards the cache
+    executor = data._prefetch_executor
+    data.close()
+    assert data._prefetch_executor is None
+    assert data._forcing_cache == {}
+    if prefetch_forcing:
+        assert executor._shutdown
+    assert np.allclose(data.get_forcing_slice("temp", 0), values[0] * 2)
+    data.close()
+
+
+def test_Data_set_constant(tmp_path):
+    """Test storing and saving broadcast constant variables."""
+
+    from virtual_ecosystem.core.data import Data
+    from virtual_ecosystem.core.grid import Grid
+
+    data = Data(Grid(cell_nx=4, cell_ny=3))
+
+    # Scalar and per-layer constants are stored as read only broadcast views
+    data.set_constant("scalar", 0.5)
+    layers = DataArray([1.0, 2.0, 3.0], dims="layers", coords={"layers": [0, 1, 2]})
+    data.set_constant("layered", layers)
+
+    assert data["scalar"].shape == (12,)
+    assert data["layered"].dims == ("layers", "cell_id")
+    assert data["layered"].shape == (3, 12)
+    assert data["layered"].data.strides[-1] == 0
+    assert np.allclose(data["layered"][:, 5], [1.0, 2.0, 3.0])
+    assert data.on_core_axis("scalar", "spatial")
+    assert set(data.constants) == {"scalar", "layered"}
+
+    with pytest.raises(ValueError):
+        data["scalar"][0] = 1.0
+
+    # Constants are written to file as their compact values
+    data.save_to_netcdf(tmp_path / "constants.nc")
+    with xr.open_dataset(tmp_path / "constants.nc") as saved:
+        assert saved["scalar"].shape == ()
+        assert saved["layered"].dims == ("layers",)
+        assert saved["layered"].attrs["broadcast_dims"] == "cell_id"
+
+    # Replacing a constant with an array stores the array
+    data["scalar"] = DataArray(np.arange(12.0), dims="cell_id")
+    assert "scalar" not in data.constants
+    data["scalar"][0] = 1.0
+
+    # Constants must not vary across cells
+    with pytest.raises(ValueError, match="varies across cell_id"):
+        data.set_constant("bad", DataArray(np.arange(12.0), dims="cell_id"))
+
+
+def test_Data_load_from_config_constant():
+    """Test loading constants from a data configuration."""
+
+    from virtual_ecosystem.core.config import Config
+    from virtual_ecosystem.core.data import Data
+    from virtual_ecosystem.core.grid import Grid
+
+    data = Data(Grid())
+    cfg = Config(
+        cfg_strings="""[[core.data.constant]]
+        var_name = "pH"
+        value = 5.5
+        """
+    )
+    data.load_data_config(config=cfg)
+
+    assert "pH" in data.constants
+    assert np.allclose(data["pH"], 5.5)
+    assert data["pH"].shape == (100,)
+
+
+@pytest.mark.parametrize(
+    argnames="drop_unused, exp_vars",
+    argvalues=[
+        pytest.param(False, {"pH", "clay_fraction"}, id="keep_unused"),
+        pytest.param(True, {"pH"}, id="drop_unused"),
+    ],
+)
+def test_Data_load_from_config_drop_unused(caplog, drop_unused, exp_vars):
+    """Test that unused variables are not loaded from a data configuration."""
+
+    from virtual_ecosystem.core.config import Config
+    from virtual_ecosystem.core.data import Data
+    from virtual_ecosystem.core.grid import Grid
+
+    data = Data(Grid())
+    cfg = Config(
+        cfg_strings=f"""[core.data]
+        drop_unused_variables = {str(drop_unused).lower()}
+        [[core.data.constant]]
+        var_name = "pH"
+        value = 5.5
+        [[core.data.constant]]
+        var_name = "clay_fraction"
+        value = 0.3
+        """
+    )
+    data.load_data_config(config=cfg, used_variables=["pH"])
+
+    assert set(data.data.data_vars) == exp_vars
+    assert (
+        "Not loading variables unused by configured models: clay_fraction"
+        in caplog.text
+    ) == drop_unused
+
+
 @pytest.mark.parametrize(
     argnames="vname, axname, result, err_ctxt, err_message",
     argvalues=[
@@ -974,6 +1223,10 @@ def test_output_current_state(mocker, dummy_carbon_data, time_index):
             "soil_c_pool_necromass",
             "soil_enzyme_pom",
             "soil_enzyme_maom",
+            "soil_integration_steps",
+            "soil_integration_evaluations",
+            "soil_integration_jacobians",
+            "soil_integration_step_size",
         ],
         time_index,
     )
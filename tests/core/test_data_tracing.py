@@ -0,0 +1,82 @@
+"""Testing the data_tracing module."""
+
+from logging import INFO, WARNING
+
+import numpy as np
+from xarray import DataArray
+
+from tests.conftest import log_check
+
+
+class DummyModel:
+    """A minimal model that reads and writes data during update."""
+
+    model_name = "dummy"
+    vars_required_for_init = ("init_var",)
+    vars_populated_by_init = ()
+    vars_required_for_update = ("existing_var", "unread_var")
+    vars_populated_by_first_update = ()
+    vars_updated = ("new_var",)
+
+    def __init__(self, data):
+        self.data = data
+
+    def update(self, time_index):
+        """Read and write variables."""
+        self.data.add_from_dict(
+            {"new_var": self.data["existing_var"] * 2, "other_var": self.data["ph"]}
+        )
+        self.data.get_forcing_slice("forcing", time_index)
+
+
+def test_DataTracer(fixture_data, caplog):
+    """Test tracing the data access of a model."""
+
+    from virtual_ecosystem.core.data import Data
+    from virtual_ecosystem.core.data_tracing import DataTracer, TracingData
+
+    fixture_data["ph"] = DataArray(np.arange(4.0), dims="cell_id")
+    fixture_data["forcing"] = DataArray(np.ones((3, 4)), dims=("time_index", "cell_id"))
+
+    model = DummyModel(fixture_data)
+    tracer = DataTracer(fixture_data)
+    tracer.trace_model(model)
+
+    assert isinstance(model.data, TracingData)
+    # Attributes are passed through to the data instance
+    assert model.data.grid is fixture_data.grid
+    assert "ph" in model.data
+
+    model.update(time_index=1)
+    model.update(time_index=2)
+
+    # Writes go through to the shared data instance
+    assert isinstance(tracer.data, Data)
+    assert "new_var" in fixture_data
+
+    access = tracer.access["dummy"]
+    assert access.vars_read == {"existing_var", "ph", "forcing"}
+    assert access.vars_written == {"new_var", "other_var"}
+    assert access.variables["existing_var"].reads == 2
+    assert access.variables["forcing"].bytes_read == 2 * 4 * 8
+    assert access.variables["new_var"].writes == 2
+
+    assert tracer.get_mismatches() == {
+        "dummy": {
+            "undeclared_reads": {"ph", "forcing"},
+            "undeclared_writes": {"other_var"},
+            "unused_declared": {"unread_var"},
+        }
+    }
+
+    caplog.clear()
+    tracer.log_report()
+    log_check(
+        caplog,
+        expected_log=(
+            (INFO, "Data access by model:"),
+            (WARNING, "Data access mismatch for dummy model - undeclared reads"),
+            (WARNING, "Data access mismatch for dummy model - undeclared writes"),
+            (WARNING, "Data access mismatch for dummy model - unused declared"),
+        ),
+    )
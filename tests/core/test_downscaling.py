@@ -0,0 +1,168 @@
+"""Testing the downscaling module."""
+
+from logging import CRITICAL
+
+import numpy as np
+import pytest
+from xarray import DataArray
+
+from tests.conftest import log_check
+
+
+@pytest.fixture
+def forcing_data(fixture_data):
+    """A Data instance with a three step forcing variable on four cells."""
+
+    fixture_data["forcing"] = DataArray(
+        np.array(
+            [[0.0, 10.0, 20.0, 0.4], [30.0, 40.0, 50.0, 0.4], [0.0, 0.0, 0.0, 0.0]]
+        ),
+        dims=("time_index", "cell_id"),
+    )
+
+    return fixture_data
+
+
+@pytest.mark.parametrize(
+    argnames="method, time_index, exp_steps",
+    argvalues=[
+        pytest.param(
+            "constant",
+            0,
+            [[0.0, 10.0, 20.0, 0.4]] * 4,
+            id="constant",
+        ),
+        pytest.param(
+            "divide",
+            1,
+            [[7.5, 10.0, 12.5, 0.1]] * 4,
+            id="divide",
+        ),
+        pytest.param(
+            "linear",
+            1,
+            [
+                [18.75, 28.75, 38.75, 0.4],
+                [26.25, 36.25, 46.25, 0.4],
+                [26.25, 35.0, 43.75, 0.35],
+                [18.75, 25.0, 31.25, 0.25],
+            ],
+            id="linear",
+        ),
+        pytest.param(
+            "linear",
+            0,
+            [[0.0, 10.0, 20.0, 0.4]] * 2
+            + [[3.75, 13.75, 23.75, 0.4], [11.25, 21.25, 31.25, 0.4]],
+            id="linear_first",
+        ),
+    ],
+)
+def test_downscale_forcing(forcing_data, method, time_index, exp_steps):
+    """Test the deterministic downscaling methods."""
+
+    from virtual_ecosystem.core.downscaling import downscale_forcing
+
+    steps = list(
+        downscale_forcing(
+            forcing_data, "forcing", time_index=time_index, n_steps=4, method=method
+        )
+    )
+
+    assert np.allclose(steps, exp_steps)
+
+
+def test_downscale_forcing_stochastic(forcing_data):
+    """Test that stochastic downscaling conserves totals and is reproducible."""
+
+    from virtual_ecosystem.core.downscaling import downscale_forcing
+
+    steps = np.array(
+        list(
+            downscale_forcing(
+                forcing_data, "forcing", 0, n_steps=30, method="stochastic", seed=42
+            )
+        )
+    )
+
+    assert steps.shape == (30, 4)
+    assert np.allclose(steps.sum(axis=0), [0.0, 10.0, 20.0, 0.4])
+    assert np.all(steps >= 0)
+    # Small totals are allocated as a single unit
+    assert np.count_nonzero(steps[:, 3]) == 1
+
+    repeat = list(
+        downscale_forcing(
+            forcing_data, "forcing", 0, n_steps=30, method="stochastic", seed=42
+        )
+    )
+    assert np.array_equal(steps, repeat)
+
+
+def test_downscale_forcing_stochastic_missing(forcing_data):
+    """Test that stochastic downscaling treats missing values as zero totals."""
+
+    from virtual_ecosystem.core.downscaling import downscale_forcing
+
+    forcing_data["forcing"][0, 1] = np.nan
+
+    steps = np.array(
+        list(
+            downscale_forcing(
+                forcing_data, "forcing", 0, n_steps=30, method="stochastic", seed=42
+            )
+        )
+    )
+
+    assert np.allclose(steps.sum(axis=0), [0.0, 0.0, 20.0, 0.4])
+    assert not np.any(np.isnan(steps))
+
+
+@pytest.mark.parametrize(
+    argnames="method, n_steps, exp_msg",
+    argvalues=[
+        pytest.param("cubic", 4, "Unknown downscaling method: cubic", id="bad_method"),
+        pytest.param(
+            "divide",
+            0,
+            "Number of downscaling steps must be positive, not 0",
+            id="bad_steps",
+        ),
+    ],
+)
+def test_downscale_forcing_errors(forcing_data, caplog, method, n_steps, exp_msg):
+    """Test errors in downscaling forcing."""
+
+    from virtual_ecosystem.core.downscaling import downscale_forcing
+
+    # Errors are raised when the iterator is created, not when it is first used
+    with pytest.raises(ValueError):
+        downscale_forcing(forcing_data, "forcing", 0, n_steps, method=method)
+
+    log_check(caplog, ((CRITICAL, exp_msg),))
+
+
+def test_register_downscaling_method(forcing_data):
+    """Test registering a new downscaling method."""
+
+    from virtual_ecosystem.core.downscaling import (
+        DOWNSCALING_REGISTRY,
+        downscale_forcing,
+        register_downscaling_method,
+    )
+
+    @register_downscaling_method("first_step")
+    def downscale_first_step(data, var_name, time_index, n_steps, seed=None):
+        values = data.get_forcing_slice(var_name, time_index).to_numpy()
+        yield values
+        for _ in range(n_steps - 1):
+            yield np.zeros_like(values)
+
+    try:
+        steps = list(
+            downscale_forcing(forcing_data, "forcing", 1, 3, method="first_step")
+        )
+        assert np.allclose(steps[0], [30.0, 40.0, 50.0, 0.4])
+        assert np.allclose(steps[1:], 0)
+    finally:
+        DOWNSCALING_REGISTRY.pop("first_step")
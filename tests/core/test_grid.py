@@ -373,6 +373,135 @@ def test_set_neighbours(grid_type, distance, expected):
         assert np.allclose(grid.neighbours[idx], expected[idx])
 
 
+@pytest.mark.parametrize(
+    argnames=["grid_type", "distance", "cell_nx", "cell_ny", "expected_shifts"],
+    argvalues=[
+        pytest.param(
+            "square",
+            100,
+            3,
+            3,
+            [[[-1, 0], [0, -1], [0, 0], [0, 1], [1, 0]]],
+            id="square_edges",
+        ),
+        pytest.param(
+            "square",
+            250,
+            5,
+            4,
+            [
+                [
+                    [dy, dx]
+                    for dy in range(-2, 3)
+                    for dx in range(-2, 3)
+                    if (dy**2 + dx**2) <= 2.5**2
+                ]
+            ],
+            id="square_wide",
+        ),
+        pytest.param(
+            "hexagon",
+            110,
+            3,
+            3,
+            [
+                [[-1, -1], [-1, 0], [0, -1], [0, 0], [0, 1], [1, -1], [1, 0]],
+                [[-1, 0], [-1, 1], [0, -1], [0, 0], [0, 1], [1, 0], [1, 1]],
+            ],
+            id="hex_edges",
+        ),
+        pytest.param("hexagon", 200, 3, 3, None, id="hex_irregular"),
+    ],
+)
+def test_neighbour_shifts(grid_type, distance, cell_nx, cell_ny, expected_shifts):
+    """Test the structured stencil derived from the neighbourhood."""
+
+    from virtual_ecosystem.core.grid import Grid
+
+    grid = Grid(grid_type, cell_nx=cell_nx, cell_ny=cell_ny)
+
+    with pytest.raises(AttributeError):
+        _ = grid.neighbour_shifts
+
+    grid.set_neighbours(distance=distance)
+
+    if expected_shifts is None:
+        assert grid.neighbour_shifts is None
+    else:
+        assert [s.tolist() for s in grid.neighbour_shifts] == expected_shifts
+
+    # The CSR graph should always match the neighbour lists
+    for idx, nbrs in enumerate(grid.neighbours):
+        assert np.array_equal(grid.neighbour_csr[[idx], :].indices, nbrs)
+
+
+@pytest.mark.parametrize(
+    argnames=["grid_type", "distance", "cell_nx", "cell_ny"],
+    argvalues=[
+        ("square", 100, 5, 4),
+        ("square", 100 * 2**0.5, 5, 4),
+        ("square", 250, 4, 1),
+        ("hexagon", 110, 5, 4),
+        ("hexagon", 200, 5, 4),
+        ("hexagon", 200, 3, 3),
+    ],
+)
+def test_neighbour_operations(grid_type, distance, cell_nx, cell_ny):
+    """Test the stencil neighbour operations against the neighbour lists.
+
+    The operations are also run with the stencil removed, to check that the fallback
+    using the neighbourhood graph gives the same answers.
+    """
+
+    from virtual_ecosystem.core.grid import Grid
+
+    grid = Grid(grid_type, cell_nx=cell_nx, cell_ny=cell_ny)
+    grid.set_neighbours(distance=distance)
+
+    rng = np.random.default_rng(seed=42)
+    # Use integer values to include ties between neighbours
+    values = rng.integers(0, 5, size=grid.n_cells).astype(float)
+
+    expected_argmin = [nbrs[np.argmin(values[nbrs])] for nbrs in grid.neighbours]
+    expected_sum = [values[nbrs].sum() for nbrs in grid.neighbours]
+
+    stencil = grid.neighbour_shifts
+    for shifts in (stencil, None):
+        grid._neighbour_shifts = shifts
+
+        assert np.array_equal(grid.argmin_neighbours(values), expected_argmin)
+
+        gathered = grid.gather_neighbours(values)
+        assert gathered.shape[0] == grid.n_cells
+        for idx, nbrs in enumerate(grid.neighbours):
+            valid = gathered[idx][~np.isnan(gathered[idx])]
+            assert np.array_equal(valid, values[nbrs])
+
+        # Sending each cell value to all its neighbours is a symmetric operation for
+        # distance based neighbourhoods, so each cell receives the sum of its neighbours
+        sent = np.where(np.isnan(gathered), 0, values[:, None])
+        assert np.allclose(grid.scatter_to_neighbours(sent), expected_sum)
+
+
+def test_neighbour_operations_errors():
+    """Test failure modes of the neighbour operations."""
+
+    from virtual_ecosystem.core.grid import Grid
+
+    grid = Grid("square", cell_nx=3, cell_ny=3)
+
+    with pytest.raises(AttributeError):
+        grid.gather_neighbours(np.arange(9))
+
+    grid.set_neighbours(distance=100)
+
+    with pytest.raises(ValueError, match="one dimensional array"):
+        grid.gather_neighbours(np.arange(8))
+
+    with pytest.raises(ValueError, match="neighbour slots"):
+        grid.scatter_to_neighbours(np.ones((9, 3)))
+
+
 def test_grid_dumps():
     """Test some basic properties of a dumped GeoJSON grid."""
 
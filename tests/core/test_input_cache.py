@@ -0,0 +1,165 @@
+"""Testing the input cache module."""
+
+import shutil
+from logging import INFO
+
+import numpy as np
+import pytest
+from xarray import DataArray, open_dataset
+
+from tests.conftest import log_check
+
+
+def test_get_input_cache_key(shared_datadir, tmp_path):
+    """Test that cache keys change with the file, variable, grid and window."""
+
+    from virtual_ecosystem.core.grid import Grid
+    from virtual_ecosystem.core.input_cache import get_file_hash, get_input_cache_key
+    from virtual_ecosystem.core.readers import DataWindow
+
+    grid = Grid()
+    datafile = shared_datadir / "xy_dim.nc"
+    file_hash = get_file_hash(datafile)
+    key = get_input_cache_key(file_hash, "temp", grid)
+
+    # Identical inputs, including a copy of the file, give the same key
+    copied = tmp_path / "copied.nc"
+    shutil.copy(datafile, copied)
+    assert get_input_cache_key(file_hash, "temp", Grid()) == key
+    assert get_input_cache_key(get_file_hash(copied), "temp", grid) == key
+
+    # Any change gives a new key
+    other_keys = [
+        get_input_cache_key(
+            get_file_hash(shared_datadir / "xy_coords.nc"), "temp", grid
+        ),
+        get_input_cache_key(file_hash, "other", grid),
+        get_input_cache_key(file_hash, "temp", Grid(cell_nx=5, cell_ny=20)),
+        get_input_cache_key(file_hash, "temp", grid, DataWindow.from_grid(grid)),
+        get_input_cache_key(file_hash, "temp", grid, regrid=True),
+    ]
+    assert len({key, *other_keys}) == 6
+
+
+@pytest.mark.parametrize(argnames="lazy", argvalues=[False, True])
+def test_InputCache_store_load(caplog, tmp_path, lazy):
+    """Test storing and loading validated variables in the cache."""
+
+    from virtual_ecosystem.core.input_cache import InputCache
+
+    cache = InputCache(tmp_path / "cache")
+    assert cache.load("missing", "temp") is None
+
+    darray = DataArray(
+        np.arange(200, dtype=float).reshape(2, 100),
+        dims=("time_index", "cell_id"),
+        coords={"cell_id": np.arange(100)},
+    )
+    validation = {"spatial": "spat_CellId_Dim_Any", "time": None}
+
+    caplog.clear()
+    cache.store("key", "temp", darray, validation)
+    cached = cache.load("key", "temp", lazy=lazy)
+
+    assert cached is not None
+    cached_darray, cached_validation = cached
+    assert cached_validation == validation
+    assert cached_darray.name == "temp"
+    assert (cached_darray.chunks is not None) == lazy
+    assert np.allclose(cached_darray.to_numpy(), darray.to_numpy())
+    assert not list(cache.folder.glob("*.partial"))
+    log_check(
+        caplog,
+        (
+            (INFO, "Stored variable 'temp' in input cache"),
+            (INFO, "Loaded variable 'temp' from input cache"),
+        ),
+    )
+
+    # Unreadable entries are ignored
+    (cache.folder / "bad.nc").write_text("not a netcdf file")
+    assert cache.load("bad", "temp") is None
+
+
+def test_Data_load_from_config_input_cache(caplog, shared_datadir, tmp_path):
+    """Test loading data from config using the input cache."""
+
+    from virtual_ecosystem.core.config import Config
+    from virtual_ecosystem.core.data import Data
+    from virtual_ecosystem.core.grid import Grid
+
+    # XY data requires remapping onto the grid during validation
+    datafile = tmp_path / "xy_dim.nc"
+    shutil.copy(shared_datadir / "xy_dim.nc", datafile)
+    cache_folder = tmp_path / "cache"
+
+    cfg = Config(
+        cfg_strings=f"""[core.data]
+        input_cache_folder = "{cache_folder}"
+        [[core.data.variable]]
+        file = "{datafile}"
+        var_name = "temp"
+        """
+    )
+
+    # First load populates the cache
+    uncached = Data(Grid())
+    uncached.load_data_config(config=cfg)
+    assert len(list(cache_folder.glob("*.nc"))) == 1
+
+    # Second load uses the cache without validating
+    caplog.clear()
+    cached = Data(Grid())
+    cached.load_data_config(config=cfg)
+
+    messages = [record.message for record in caplog.records]
+    assert any(msg.startswith("Loaded variable 'temp' from input") for msg in messages)
+    assert not any(msg.startswith("Stored variable") for msg in messages)
+    assert cached.variable_validation == uncached.variable_validation
+    assert np.allclose(cached["temp"].to_numpy(), uncached["temp"].to_numpy())
+    assert np.array_equal(cached["temp"]["cell_id"], uncached["temp"]["cell_id"])
+
+    # Changing the file contents gives a cache miss and a new entry
+    with open_dataset(datafile) as dataset:
+        changed = dataset.load()
+    changed["temp"] = changed["temp"] * 2
+    changed.to_netcdf(datafile)
+
+    updated = Data(Grid())
+    updated.load_data_config(config=cfg)
+    assert len(list(cache_folder.glob("*.nc"))) == 2
+    assert np.allclose(updated["temp"].to_numpy(), uncached["temp"].to_numpy() * 2)
+
+
+def test_Data_load_from_config_input_cache_hashes_once(tmp_path, mocker):
+    """Test that each file is only hashed once when loading several variables."""
+
+    from virtual_ecosystem.core import data as data_module
+    from virtual_ecosystem.core.config import Config
+    from virtual_ecosystem.core.data import Data
+    from virtual_ecosystem.core.grid import Grid
+
+    datafile = tmp_path / "cell_data.nc"
+    values = np.arange(100, dtype=float)
+    DataArray(values, dims="cell_id", name="temp").to_dataset().assign(
+        prec=DataArray(values * 2, dims="cell_id")
+    ).to_netcdf(datafile)
+
+    cfg = Config(
+        cfg_strings=f"""[core.data]
+        input_cache_folder = "{tmp_path / "cache"}"
+        [[core.data.variable]]
+        file = "{datafile}"
+        var_name = "temp"
+        [[core.data.variable]]
+        file = "{datafile}"
+        var_name = "prec"
+        """
+    )
+
+    hash_spy = mocker.spy(data_module, "get_file_hash")
+    data = Data(Grid())
+    data.load_data_config(config=cfg)
+
+    hash_spy.assert_called_once_with(datafile)
+    assert np.allclose(data["prec"].to_numpy(), values * 2)
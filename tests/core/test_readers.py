@@ -92,19 +92,41 @@ def test_file_format_loader(caplog, file_types, expected_log):
         ),
     ],
 )
-def test_load_netcdf(shared_datadir, caplog, file, file_var, exp_err, expected_log):
+@pytest.mark.parametrize(argnames="lazy", argvalues=[False, True])
+def test_load_netcdf(
+    shared_datadir, caplog, file, file_var, exp_err, expected_log, lazy
+):
     """Test the netdcf variable loader."""
 
     from virtual_ecosystem.core.readers import load_netcdf
 
     with exp_err:
-        darray = load_netcdf(shared_datadir / file, file_var)
+        darray = load_netcdf(shared_datadir / file, file_var, lazy=lazy)
         assert isinstance(darray, DataArray)
+        assert (darray.chunks is not None) == lazy
 
     # Check the error reports
     log_check(caplog, expected_log)
 
 
+def test_load_netcdf_lazy_chunks(tmp_path):
+    """Test that lazy loading chunks time dimensions to single steps."""
+
+    import numpy as np
+
+    from virtual_ecosystem.core.readers import load_netcdf
+
+    values = np.arange(60, dtype=float).reshape(6, 10)
+    DataArray(values, dims=("time_index", "cell_id"), name="temp").to_netcdf(
+        tmp_path / "time_data.nc"
+    )
+
+    darray = load_netcdf(tmp_path / "time_data.nc", "temp", lazy=True)
+
+    assert darray.chunks == ((1, 1, 1, 1, 1, 1), (10,))
+    assert np.allclose(darray.isel(time_index=2).to_numpy(), values[2])
+
+
 @pytest.mark.parametrize(
     argnames=[
         "filename",
@@ -163,3 +185,273 @@ def test_load_to_dataarray(
         assert str(err.value) == exp_msg
 
     log_check(caplog, exp_log)
+
+
+@pytest.mark.parametrize(argnames="lazy", argvalues=[False, True])
+def test_iter_file_dataarrays(mocker, shared_datadir, caplog, lazy):
+    """Test loading several variables from a file, opening the file once."""
+
+    from virtual_ecosystem.core import readers
+
+    open_spy = mocker.spy(readers, "open_dataset")
+    datafile = shared_datadir / "cellid_coords.nc"
+
+    loaded = list(
+        readers.iter_file_dataarrays(
+            file=datafile, var_names=["temp", "missing", "prec"], lazy=lazy
+        )
+    )
+
+    assert open_spy.call_count == 1
+    assert [var_name for var_name, _ in loaded] == ["temp", "missing", "prec"]
+    assert isinstance(loaded[0][1], DataArray)
+    assert isinstance(loaded[1][1], KeyError)
+    assert isinstance(loaded[2][1], DataArray)
+    assert (loaded[2][1].chunks is not None) == lazy
+    log_check(
+        caplog,
+        (
+            (INFO, "Loading variable 'temp' from file:"),
+            (INFO, "Loading variable 'missing' from file:"),
+            (CRITICAL, "Variable missing not found in"),
+            (INFO, "Loading variable 'prec' from file:"),
+        ),
+    )
+
+    # File errors are returned for each variable
+    caplog.clear()
+    loaded = list(
+        readers.iter_file_dataarrays(
+            file=shared_datadir / "not_there.nc", var_names=["temp", "prec"]
+        )
+    )
+    assert all(isinstance(err, FileNotFoundError) for _, err in loaded)
+
+    loaded = list(
+        readers.iter_file_dataarrays(
+            file=shared_datadir / "this_data_format.not_handled", var_names=["temp"]
+        )
+    )
+    assert isinstance(loaded[0][1], ValueError)
+
+
+def test_DataWindow_subset():
+    """Test subsetting data arrays to a data window."""
+
+    import numpy as np
+
+    from virtual_ecosystem.core.readers import DataWindow
+
+    darray = DataArray(
+        np.zeros((6, 5, 4, 3)),
+        dims=("time", "time_index", "y", "x"),
+        coords={
+            "time": np.datetime64("2020-01-01") + np.arange(6) * np.timedelta64(1, "D"),
+            "y": [350, 250, 150, 50],
+            "x": [50, 150, 250],
+        },
+    )
+
+    window = DataWindow(
+        bounds=(100, 100, 300, 300),
+        time_range=(np.datetime64("2020-01-02"), np.datetime64("2020-01-04")),
+        n_time_index=2,
+    )
+    subset = window.subset(darray)
+
+    assert subset.sizes == {"time": 2, "time_index": 2, "y": 2, "x": 2}
+    assert subset["y"].values.tolist() == [250, 150]
+    assert subset["x"].values.tolist() == [150, 250]
+
+    # An empty window leaves the data unchanged
+    assert DataWindow().subset(darray).sizes == darray.sizes
+
+
+@pytest.mark.parametrize(argnames="lazy", argvalues=[False, True])
+def test_load_netcdf_window(tmp_path, lazy):
+    """Test that windowed loading only returns data within the window."""
+
+    import numpy as np
+
+    from virtual_ecosystem.core.grid import Grid
+    from virtual_ecosystem.core.readers import DataWindow, load_netcdf
+
+    values = np.arange(48, dtype=float).reshape(3, 4, 4)
+    DataArray(
+        values,
+        dims=("time_index", "y", "x"),
+        coords={"y": [350, 250, 150, 50], "x": [50, 150, 250, 350]},
+        name="temp",
+    ).to_netcdf(tmp_path / "xy_data.nc")
+
+    window = DataWindow.from_grid(Grid(cell_nx=2, cell_ny=2))
+    darray = load_netcdf(tmp_path / "xy_data.nc", "temp", lazy=lazy, window=window)
+
+    assert darray.sizes == {"time_index": 3, "y": 2, "x": 2}
+    assert np.allclose(darray.to_numpy(), values[:, 2:, :2])
+
+
+@pytest.fixture
+def numpy_files(tmp_path):
+    """Create numpy binary data files with sidecar coordinate files."""
+
+    import json
+
+    import numpy as np
+
+    values = np.arange(48, dtype=float).reshape(3, 4, 4)
+    sidecar = {
+        "dims": {"temp": ["time_index", "y", "x"], "elev": ["y", "x"]},
+        "coords": {"y": [350, 250, 150, 50], "x": [50, 150, 250, 350]},
+    }
+
+    np.save(tmp_path / "single.npy", values)
+    np.savez(tmp_path / "multi.npz", temp=values, elev=values[0])
+    np.savez_compressed(tmp_path / "compressed.npz", temp=values, elev=values[0])
+    for stem in ("single", "multi", "compressed"):
+        with open(tmp_path / f"{stem}.json", "w") as sidecar_file:
+            json.dump(sidecar, sidecar_file)
+
+    # Files with a missing and a mismatched sidecar
+    np.save(tmp_path / "no_sidecar.npy", values)
+    np.save(tmp_path / "bad_sidecar.npy", values[0])
+    with open(tmp_path / "bad_sidecar.json", "w") as sidecar_file:
+        json.dump(sidecar, sidecar_file)
+
+    return tmp_path, values
+
+
+@pytest.mark.parametrize(
+    argnames=["file", "file_var", "exp_err", "expected_log", "mapped"],
+    argvalues=[
+        pytest.param("single.npy", "temp", does_not_raise(), (), True, id="npy"),
+        pytest.param("multi.npz", "temp", does_not_raise(), (), True, id="npz"),
+        pytest.param(
+            "compressed.npz", "temp", does_not_raise(), (), False, id="npz_compressed"
+        ),
+        pytest.param(
+            "not_there.npy",
+            "temp",
+            pytest.raises(FileNotFoundError),
+            ((CRITICAL, "Data file not found"),),
+            None,
+            id="missing_file",
+        ),
+        pytest.param(
+            "no_sidecar.npy",
+            "temp",
+            pytest.raises(FileNotFoundError),
+            ((CRITICAL, "Data file not found"),),
+            None,
+            id="missing_sidecar",
+        ),
+        pytest.param(
+            "multi.npz",
+            "missing",
+            pytest.raises(KeyError),
+            ((CRITICAL, "Variable missing not found in"),),
+            None,
+            id="missing_var",
+        ),
+        pytest.param(
+            "bad_sidecar.npy",
+            "temp",
+            pytest.raises(ValueError),
+            ((CRITICAL, "does not match data"),),
+            None,
+            id="bad_sidecar",
+        ),
+    ],
+)
+def test_load_numpy_memmap(
+    numpy_files, caplog, file, file_var, exp_err, expected_log, mapped
+):
+    """Test the memory-mapped numpy loader."""
+
+    import numpy as np
+
+    from virtual_ecosystem.core.readers import load_numpy_memmap
+
+    tmp_path, values = numpy_files
+
+    with exp_err:
+        darray = load_numpy_memmap(tmp_path / file, file_var)
+        assert np.allclose(darray.to_numpy(), values)
+        assert darray["x"].values.tolist() == [50, 150, 250, 350]
+        assert isinstance(darray.data.base, np.memmap) == mapped
+
+        # Updating data in memory must not alter the file
+        darray[:] = 0
+        assert np.allclose(load_numpy_memmap(tmp_path / file, file_var), values)
+
+    log_check(caplog, expected_log)
+
+
+def test_load_numpy_memmap_to_data(numpy_files):
+    """Test that numpy data can be windowed, validated and added to a Data instance."""
+
+    import numpy as np
+
+    from virtual_ecosystem.core.data import Data
+    from virtual_ecosystem.core.grid import Grid
+    from virtual_ecosystem.core.readers import DataWindow, load_to_dataarray
+
+    tmp_path, values = numpy_files
+    grid = Grid(cell_nx=2, cell_ny=2)
+    data = Data(grid)
+    data["temp"] = load_to_dataarray(
+        tmp_path / "multi.npz",
+        var_name="temp",
+        lazy=True,
+        window=DataWindow.from_grid(grid),
+    )
+
+    assert data["temp"].chunks is not None
+    assert np.allclose(
+        data["temp"].isel(time_index=1).to_numpy(), values[1, 2:, :2].flatten()
+    )
+
+
+def test_load_zarr(tmp_path, caplog):
+    """Test the Zarr store loader."""
+
+    pytest.importorskip("zarr")
+
+    import numpy as np
+
+    from virtual_ecosystem.core.readers import load_zarr
+
+    values = np.arange(40, dtype=float).reshape(4, 10)
+    DataArray(values, dims=("time_index", "cell_id"), name="temp").to_dataset().to_zarr(
+        tmp_path / "data.zarr"
+    )
+
+    darray = load_zarr(tmp_path / "data.zarr", "temp")
+    assert darray.chunks is None
+    assert np.allclose(darray.to_numpy(), values)
+
+    darray = load_zarr(tmp_path / "data.zarr", "temp", lazy=True)
+    assert darray.chunks == ((1, 1, 1, 1), (10,))
+
+    with pytest.raises(KeyError):
+        load_zarr(tmp_path / "data.zarr", "missing")
+
+    with pytest.raises(FileNotFoundError):
+        load_zarr(tmp_path / "missing.zarr", "temp")
+
+
+def test_load_zarr_not_installed(tmp_path, caplog, mocker):
+    """Test the Zarr store loader reports a missing zarr package."""
+
+    from virtual_ecosystem.core.readers import load_zarr
+
+    mocker.patch("virtual_ecosystem.core.readers.find_spec", return_value=None)
+
+    with pytest.raises(ValueError) as excep:
+        load_zarr(tmp_path / "data.zarr", "temp")
+
+    assert str(excep.value).endswith("requires the optional zarr package.")
+    log_check(
+        caplog,
+        ((CRITICAL, "loading Zarr data requires the optional zarr package"),),
+    )
@@ -0,0 +1,201 @@
+"""Testing the regrid module."""
+
+from contextlib import nullcontext as does_not_raise
+from logging import CRITICAL, INFO
+
+import numpy as np
+import pytest
+from xarray import DataArray
+
+from tests.conftest import log_check
+
+
+@pytest.fixture
+def grid_4x4():
+    """A 4 by 4 grid of 100m cells with bounds (0, 0, 400, 400)."""
+    from virtual_ecosystem.core.grid import Grid
+
+    return Grid(cell_area=10000, cell_nx=4, cell_ny=4)
+
+
+@pytest.mark.parametrize(
+    argnames="x_coords, y_coords, exp_err, exp_nnz",
+    argvalues=[
+        pytest.param([100, 300], [300, 100], does_not_raise(), 16, id="aligned_coarse"),
+        pytest.param(
+            [50, 250, 450], [450, 250, 50], does_not_raise(), 36, id="offset_coarse"
+        ),
+        pytest.param(
+            [100, 300], [300, 200], pytest.raises(ValueError), None, id="no_cover"
+        ),
+    ],
+)
+def test_get_regridding_weights(grid_4x4, x_coords, y_coords, exp_err, exp_nnz):
+    """Test the calculation of regridding weights."""
+
+    from virtual_ecosystem.core.regrid import get_regridding_weights
+
+    with exp_err:
+        weights = get_regridding_weights(
+            np.array(x_coords), np.array(y_coords), grid_4x4
+        )
+
+        assert weights.shape == (16, len(x_coords) * len(y_coords))
+        assert weights.nnz == exp_nnz
+        assert np.allclose(weights.sum(axis=1), 1)
+
+
+def test_get_regridding_weights_offset(grid_4x4):
+    """Test that offset weights split grid cells between source cells."""
+
+    from virtual_ecosystem.core.regrid import get_regridding_weights
+
+    # Source cells offset by half a grid cell
+    weights = get_regridding_weights(
+        np.array([50, 250, 450]), np.array([450, 250, 50]), grid_4x4
+    ).toarray()
+
+    # The first grid cell is split between the first two rows of source data and the
+    # second grid cell is split between the top left four source cells
+    assert np.allclose(weights[0, [0, 3]], 0.5)
+    assert np.allclose(weights[1, [0, 1, 3, 4]], 0.25)
+    assert np.allclose(weights.sum(axis=1), 1)
+
+
+@pytest.mark.parametrize(argnames="lazy", argvalues=[False, True])
+def test_regrid_dataarray(grid_4x4, lazy):
+    """Test regridding data with additional dimensions."""
+
+    from virtual_ecosystem.core.regrid import regrid_dataarray
+
+    values = np.arange(12, dtype=float).reshape(3, 2, 2)
+    darray = DataArray(
+        values,
+        dims=("time_index", "y", "x"),
+        coords={"y": [300, 100], "x": [100, 300]},
+        name="temp",
+    )
+    if lazy:
+        darray = darray.chunk({"time_index": 1})
+
+    regridded = regrid_dataarray(darray, grid_4x4)
+
+    assert regridded.dims == ("time_index", "cell_id")
+    assert regridded.name == "temp"
+    assert (regridded.chunks is not None) == lazy
+    assert np.array_equal(regridded["cell_id"], grid_4x4.cell_id)
+
+    # Cells in the top left quarter of the grid take the first source value
+    assert np.allclose(regridded.isel(cell_id=[0, 1, 4, 5]), values[:, :1, 0])
+    # Regridding conserves the area weighted mean
+    assert np.allclose(regridded.mean(dim="cell_id"), values.mean(axis=(1, 2)))
+
+
+def test_regrid_dataarray_no_xy(grid_4x4, caplog):
+    """Test regridding data without x and y coordinates fails."""
+
+    from virtual_ecosystem.core.regrid import regrid_dataarray
+
+    with pytest.raises(ValueError):
+        regrid_dataarray(DataArray(np.arange(4), dims="cell_id"), grid_4x4)
+
+    log_check(caplog, ((CRITICAL, "Regridding requires data with x and y"),))
+
+
+def test_RegriddingWeightsCache(grid_4x4, tmp_path, caplog, mocker):
+    """Test that regridding weights are calculated once and stored on disk."""
+
+    from virtual_ecosystem.core import regrid
+
+    calc_spy = mocker.spy(regrid, "get_regridding_weights")
+    x_coords, y_coords = np.array([100, 300]), np.array([300, 100])
+
+    cache = regrid.RegriddingWeightsCache(tmp_path / "weights")
+    weights = cache.get_weights(x_coords, y_coords, grid_4x4)
+    assert cache.get_weights(x_coords, y_coords, grid_4x4) is weights
+    assert calc_spy.call_count == 1
+
+    # A new cache using the same folder loads the weights from disk
+    caplog.clear()
+    new_cache = regrid.RegriddingWeightsCache(tmp_path / "weights")
+    loaded = new_cache.get_weights(x_coords, y_coords, grid_4x4)
+    assert calc_spy.call_count == 1
+    assert np.allclose(loaded.toarray(), weights.toarray())
+    log_check(caplog, ((INFO, "Loading regridding weights from"),))
+
+
+def test_Data_load_from_config_regrid(tmp_path, grid_4x4):
+    """Test regridding coarse data while loading from a data configuration."""
+
+    from virtual_ecosystem.core.config import Config
+    from virtual_ecosystem.core.data import Data
+
+    DataArray(
+        np.arange(36, dtype=float).reshape(4, 3, 3),
+        dims=("time_index", "y", "x"),
+        coords={"y": [450, 250, 50], "x": [50, 250, 450]},
+    ).to_dataset(name="temp").to_netcdf(tmp_path / "coarse.nc")
+
+    data = Data(grid_4x4)
+    cfg = Config(
+        cfg_strings=f"""[core.data]
+        regrid_weights_folder = "{tmp_path / "weights"}"
+        [[core.data.variable]]
+        file = "{tmp_path / "coarse.nc"}"
+        var_name = "temp"
+        regrid = true
+        """
+    )
+    data.load_data_config(config=cfg)
+
+    assert data["temp"].dims == ("time_index", "cell_id")
+    assert data.on_core_axis("temp", "spatial")
+    # The second cell is the mean of the top left four source cells
+    assert np.allclose(data["temp"].isel(time_index=0, cell_id=1), 2.0)
+    assert len(list((tmp_path / "weights").glob("*.npz"))) == 1
+
+
+def test_Data_load_from_config_regrid_lazy_chunked(tmp_path, grid_4x4, mocker):
+    """Test regridding lazily loaded data that is chunked spatially on disk."""
+
+    from virtual_ecosystem.core import readers
+    from virtual_ecosystem.core.config import Config
+    from virtual_ecosystem.core.data import Data
+
+    # A 10 by 10 grid of 40m source cells covering the grid, stored in 5 by 5 chunks,
+    # along with a variable that is already on the grid cells.
+    values = np.arange(300, dtype=float).reshape(3, 10, 10)
+    dataset = DataArray(
+        values,
+        dims=("time_index", "y", "x"),
+        coords={"y": np.arange(380, 0, -40), "x": np.arange(20, 400, 40)},
+    ).to_dataset(name="temp")
+    dataset["elev"] = DataArray(np.arange(16, dtype=float), dims="cell_id")
+    dataset.to_netcdf(
+        tmp_path / "chunked.nc",
+        encoding={"temp": {"chunksizes": (1, 5, 5)}},
+    )
+
+    open_spy = mocker.spy(readers, "open_dataset")
+    data = Data(grid_4x4)
+    cfg = Config(
+        cfg_strings=f"""[core.data]
+        lazy_loading = true
+        [[core.data.variable]]
+        file = "{tmp_path / "chunked.nc"}"
+        var_name = "temp"
+        regrid = true
+        [[core.data.variable]]
+        file = "{tmp_path / "chunked.nc"}"
+        var_name = "elev"
+        """
+    )
+    data.load_data_config(config=cfg)
+
+    # The file is opened once for both variables
+    assert open_spy.call_count == 1
+    assert data["temp"].chunks is not None
+    assert data["temp"].dims == ("time_index", "cell_id")
+    assert np.allclose(data["elev"], np.arange(16))
+    # Regridding conserves the area weighted mean
+    assert np.allclose(data["temp"].mean(dim="cell_id"), values.mean(axis=(1, 2)))
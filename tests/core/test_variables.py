@@ -419,6 +419,60 @@ def test_verify_variables_axis(known_variables, run_variables, axis_validators):
     variables.verify_variables_axis()
 
 
+def test_get_model_variables():
+    """Test the get_model_variables function."""
+    from virtual_ecosystem.core import variables
+
+    class TestModel:
+        vars_required_for_init = ("var1",)
+        vars_required_for_update = ("var2",)
+        vars_populated_by_init = ("var3",)
+        vars_populated_by_first_update = ()
+        vars_updated = ("var3", "var4")
+
+    class OtherModel:
+        vars_required_for_init = ()
+        vars_required_for_update = ("var1",)
+        vars_populated_by_init = ()
+        vars_populated_by_first_update = ("var5",)
+        vars_updated = ()
+
+    assert variables.get_model_variables([TestModel, OtherModel]) == {
+        "var1",
+        "var2",
+        "var3",
+        "var4",
+        "var5",
+    }
+
+
+def test_get_unused_and_unconsumed_variables(run_variables):
+    """Test the get_unused_data_variables and get_unconsumed_variables functions."""
+    from virtual_ecosystem.core import variables
+
+    for name in ("var1", "var2", "var3", "var4", "var5"):
+        run_variables[name] = variables.Variable(name, "", "", "", ())
+
+    # Data variables that are read, updated or unused
+    run_variables["var1"].populated_by_init = ["data"]
+    run_variables["var1"].required_by_update = ["model1"]
+    run_variables["var2"].populated_by_init = ["data"]
+    run_variables["var2"].updated_by = ["model1"]
+    run_variables["var3"].populated_by_init = ["data"]
+    # Model variables that are updated and read or not read
+    run_variables["var4"].populated_by_update = ["model1"]
+    run_variables["var4"].required_by_init = ["model2"]
+    run_variables["var5"].populated_by_init = ["model1"]
+    run_variables["var5"].updated_by = ["model1"]
+    # Diagnostic variables are intended as outputs and are not unconsumed
+    run_variables["var6"] = variables.Variable("var6", "", "", "", (), diagnostic=True)
+    run_variables["var6"].populated_by_update = ["model1"]
+    run_variables["var6"].updated_by = ["model1"]
+
+    assert variables.get_unused_data_variables() == ["var3"]
+    assert variables.get_unconsumed_variables() == ["var2", "var5"]
+
+
 def test_get_variable(known_variables, run_variables):
     """Test the get_variable function."""
     from virtual_ecosystem.core import variables
@@ -5,6 +5,7 @@ from logging import ERROR
 
 import numpy as np
 import pytest
+from xarray import DataArray
 
 from tests.conftest import log_check
 from virtual_ecosystem.core.constants import CoreConsts
@@ -56,28 +57,6 @@ def test_calculate_soil_evaporation(dens_air, latvap):
     np.testing.assert_allclose(result["soil_evaporation"], exp_evap, rtol=0.01)
 
 
-def test_find_lowest_neighbour(fixture_core_components, dummy_climate_data):
-    """Test finding lowest neighbours."""
-
-    # FIXME: At the moment this is being tested on a 2x2 grid with these elevations and
-    #        the implementation uses rook case neighbours. There is some odd behaviour
-    #        with the ties.
-    #
-    #     200, 100
-    #      10, 10
-
-    from virtual_ecosystem.models.hydrology.above_ground import find_lowest_neighbour
-
-    data = dummy_climate_data
-
-    grid = fixture_core_components.grid
-    grid.set_neighbours(distance=np.sqrt(grid.cell_area))
-    result = find_lowest_neighbour(grid.neighbours, data["elevation"].to_numpy())
-
-    exp_result = [2, 3, 2, 2]
-    assert result == exp_result
-
-
 def test_find_upstream_cells():
     """Test that upstream cells are ientified correctly."""
 
@@ -109,11 +88,15 @@ def test_find_upstream_cells():
         ),
     ],
 )
-def accumulate_horizontal_flow(caplog, acc_runoff, raises, expected_log_entries):
-    """Test."""
+@pytest.mark.parametrize("compile_matrix", [False, True])
+def test_accumulate_horizontal_flow(
+    caplog, acc_runoff, raises, expected_log_entries, compile_matrix
+):
+    """Test accumulation from a drainage map and from the upstream matrix."""
 
     from virtual_ecosystem.models.hydrology.above_ground import (
         accumulate_horizontal_flow,
+        calculate_upstream_matrix,
     )
 
     upstream_ids = {
@@ -129,14 +112,89 @@ def accumulate_horizontal_flow(caplog, acc_runoff, raises, expected_log_entries)
     surface_runoff = np.array([100, 100, 100, 100, 100, 100, 100, 100])
     exp_result = np.array([100, 200, 300, 100, 100, 200, 100, 500])
 
+    if compile_matrix:
+        upstream_ids = calculate_upstream_matrix(upstream_ids)
+
     with raises:
-        result = accumulate_horizontal_flow(upstream_ids, surface_runoff, acc_runoff)
+        result = accumulate_horizontal_flow(
+            upstream_ids, surface_runoff, acc_runoff.copy()
+        )
         np.testing.assert_array_equal(result, exp_result)
 
     # Final check that expected logging entries are produced
     log_check(caplog, expected_log_entries)
 
 
+def test_calculate_upstream_matrix():
+    """Test that the drainage map is compiled into an upstream adjacency matrix."""
+
+    from virtual_ecosystem.models.hydrology.above_ground import (
+        calculate_upstream_matrix,
+    )
+
+    result = calculate_upstream_matrix({0: [], 1: [0], 2: [1, 2], 3: []})
+
+    np.testing.assert_array_equal(
+        result.toarray(),
+        [[0, 0, 0, 0], [1, 0, 0, 0], [0, 1, 1, 0], [0, 0, 0, 0]],
+    )
+
+
+def test_calculate_flow_levels(caplog):
+    """Test that cells are sorted into topological levels and cycles are caught."""
+
+    from virtual_ecosystem.models.hydrology.above_ground import (
+        calculate_downstream_cells,
+        calculate_flow_levels,
+    )
+
+    drainage_map = {
+        0: [],
+        1: [0],
+        2: [1, 2],
+        3: [],
+        4: [],
+        5: [3],
+        6: [],
+        7: [4, 5, 6, 7],
+    }
+    downstream = calculate_downstream_cells(drainage_map)
+    np.testing.assert_array_equal(downstream, [1, 2, 2, 5, 7, 7, 7, 7])
+
+    levels = calculate_flow_levels(downstream)
+    assert [level.tolist() for level in levels] == [[0, 3, 4, 6], [1, 5], [2, 7]]
+
+    with pytest.raises(ValueError):
+        calculate_flow_levels(np.array([1, 2, 0, 3]))
+
+    log_check(caplog, ((ERROR, "The drainage network contains a cycle!"),))
+
+
+def test_accumulate_catchment_flow():
+    """Test that flow is accumulated from the full catchment of each cell."""
+
+    from virtual_ecosystem.models.hydrology.above_ground import (
+        accumulate_catchment_flow,
+        calculate_flow_levels,
+    )
+
+    downstream = np.array([1, 2, 2, 5, 7, 7, 7, 7])
+    current_flow = np.array([1.0, 2.0, 4.0, 8.0, 16.0, 32.0, 64.0, np.nan])
+    previous_accumulated_flow = np.full(8, 100.0)
+
+    result = accumulate_catchment_flow(
+        downstream=downstream,
+        flow_levels=calculate_flow_levels(downstream),
+        current_flow=current_flow,
+        previous_accumulated_flow=previous_accumulated_flow,
+    )
+
+    np.testing.assert_allclose(
+        result, [101.0, 103.0, 107.0, 108.0, 116.0, 140.0, 164.0, 220.0]
+    )
+    assert result is previous_accumulated_flow
+
+
 @pytest.mark.parametrize(
     "grid_type,raises,expected_log_entries",
     [
@@ -204,6 +262,45 @@ def test_calculate_drainage_map(caplog, grid_type, raises, expected_log_entries)
     log_check(caplog, expected_log_entries)
 
 
+@pytest.mark.parametrize(
+    "flow_routing,raises,expected_log_entries",
+    [
+        ("steepest_descent", does_not_raise(), {}),
+        (
+            "unknown",
+            pytest.raises(ValueError),
+            ((ERROR, "Unknown flow routing method: unknown"),),
+        ),
+    ],
+)
+def test_calculate_drainage_map_routing(
+    caplog, flow_routing, raises, expected_log_entries
+):
+    """Test the drainage map from steepest descent routing on a hexagon grid."""
+
+    from virtual_ecosystem.core.grid import Grid
+    from virtual_ecosystem.models.hydrology.above_ground import calculate_drainage_map
+
+    grid = Grid("hexagon", cell_nx=3, cell_ny=3)
+    elevation = np.array([5, 4, 5, 4, 3, 4, 3, 4, 1])
+
+    with raises:
+        result = calculate_drainage_map(grid, elevation, flow_routing=flow_routing)
+        assert result == {
+            0: [],
+            1: [0],
+            2: [],
+            3: [],
+            4: [1, 2, 3],
+            5: [],
+            6: [6],
+            7: [],
+            8: [4, 5, 7, 8],
+        }
+
+    log_check(caplog, expected_log_entries)
+
+
 def test_calculate_interception():
     """Test."""
     from virtual_ecosystem.models.hydrology.above_ground import calculate_interception
@@ -239,6 +336,89 @@ def test_distribute_monthly_rainfall():
     np.testing.assert_allclose(result, result1)
 
 
+def test_distribute_monthly_rainfall_statistics():
+    """Test that each millimetre of rainfall is equally likely to fall on any day."""
+    from virtual_ecosystem.models.hydrology.above_ground import (
+        distribute_monthly_rainfall,
+    )
+
+    monthly_rain = np.array([0.5, 3.0, 300.0])
+    result = distribute_monthly_rainfall(np.tile(monthly_rain, 2000), 30, 42)
+    result = result.reshape(2000, 3, 30)
+
+    # Rainfall below one millimetre is not allocated and whole millimetres fall on
+    # single days
+    np.testing.assert_array_equal(result[:, 0], 0.0)
+    np.testing.assert_allclose(
+        result.sum(axis=-1)[:, 1:], np.tile([3.0, 300.0], (2000, 1))
+    )
+    assert set(np.unique(result[:, 1])) <= {0.0, 1.0, 2.0, 3.0}
+
+    # Daily rainfall follows a binomial distribution with probability 1 / 30
+    np.testing.assert_allclose(result[:, 2].mean(), 10.0)
+    np.testing.assert_allclose(
+        result[:, 2].var(), 300 * (1 / 30) * (29 / 30), rtol=0.05
+    )
+
+
+def test_downscale_monthly_rainfall():
+    """Test the monthly rainfall downscaling method."""
+
+    from virtual_ecosystem.core.data import Data
+    from virtual_ecosystem.core.downscaling import downscale_forcing
+    from virtual_ecosystem.core.grid import Grid
+
+    monthly_rain = np.array([[0.5, 20.0, np.nan, 200.0], [1.0, 2.0, 3.0, 4.0]])
+    data = Data(Grid(cell_nx=2, cell_ny=2))
+    data["precipitation"] = DataArray(monthly_rain, dims=("time_index", "cell_id"))
+
+    daily_rain = downscale_forcing(
+        data, "precipitation", 0, n_steps=10, method="monthly_rainfall", seed=42
+    )
+    steps = np.array(list(daily_rain))
+
+    # Daily values are yielded for each day and conserve the monthly total, with less
+    # than a millimeter and missing values treated as no rainfall.
+    assert steps.shape == (10, 4)
+    np.testing.assert_allclose(steps.sum(axis=0), [0.0, 20.0, 0.0, 200.0])
+    assert set(np.unique(steps[:, 1])) <= set(range(21))
+
+    # The same seed gives the same daily rainfall
+    np.testing.assert_allclose(
+        steps,
+        list(
+            downscale_forcing(
+                data, "precipitation", 0, n_steps=10, method="monthly_rainfall", seed=42
+            )
+        ),
+    )
+
+
+def test_downscale_monthly_rainfall_statistics():
+    """Test the distribution of daily rainfall drawn one day at a time."""
+
+    from virtual_ecosystem.core.data import Data
+    from virtual_ecosystem.core.downscaling import downscale_forcing
+    from virtual_ecosystem.core.grid import Grid
+
+    data = Data(Grid(cell_nx=50, cell_ny=40))
+    data["precipitation"] = DataArray(
+        np.full((1, 2000), 300.0), dims=("time_index", "cell_id")
+    )
+
+    steps = np.array(
+        list(
+            downscale_forcing(
+                data, "precipitation", 0, n_steps=30, method="monthly_rainfall", seed=42
+            )
+        )
+    )
+
+    # Rainfall on each day follows a binomial distribution with probability 1 / 30
+    np.testing.assert_allclose(steps.mean(axis=1), 10.0, rtol=0.05)
+    np.testing.assert_allclose(steps.var(axis=1), 300 * (1 / 30) * (29 / 30), rtol=0.15)
+
+
 def test_calculate_bypass_flow():
     """Test."""
 
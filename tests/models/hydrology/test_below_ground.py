@@ -62,6 +62,84 @@ def test_calculate_vertical_flow(
     np.testing.assert_allclose(result, exp_flow, rtol=0.001)
 
 
+def test_solve_tridiagonal():
+    """Test that a batch of tridiagonal systems is solved for each column."""
+
+    from virtual_ecosystem.models.hydrology.below_ground import solve_tridiagonal
+
+    rng = np.random.default_rng(1)
+    n_rows, n_cols = 5, 4
+    lower = rng.uniform(-1, 0, (n_rows, n_cols))
+    upper = rng.uniform(-1, 0, (n_rows, n_cols))
+    diagonal = rng.uniform(2.5, 3, (n_rows, n_cols))
+    rhs = rng.uniform(-1, 1, (n_rows, n_cols))
+
+    result = solve_tridiagonal(lower, diagonal, upper, rhs)
+
+    for col in range(n_cols):
+        matrix = (
+            np.diag(diagonal[:, col])
+            + np.diag(lower[1:, col], k=-1)
+            + np.diag(upper[:-1, col], k=1)
+        )
+        np.testing.assert_allclose(result[:, col], np.linalg.solve(matrix, rhs[:, col]))
+
+
+@pytest.mark.parametrize("time_step", [1.0, 30.0])
+def test_solve_vertical_flow_implicit(time_step):
+    """Test the implicit vertical flow conserves water and converges with substeps."""
+
+    from virtual_ecosystem.models.hydrology.below_ground import (
+        solve_vertical_flow_implicit,
+    )
+
+    soil_moisture = np.array([[0.27, 0.5, 0.85], [0.28, 0.3, 0.2], [0.3, 0.3, 0.3]])
+    layer_thickness = np.array([[250.0] * 3, [500.0] * 3, [750.0] * 3])
+    consts = HydroConsts()
+
+    results = [
+        solve_vertical_flow_implicit(
+            soil_moisture=soil_moisture,
+            soil_layer_thickness=layer_thickness,
+            soil_moisture_capacity=consts.soil_moisture_capacity,
+            soil_moisture_residual=consts.soil_moisture_residual,
+            hydraulic_conductivity=consts.hydraulic_conductivity,
+            hydraulic_gradient=consts.hydraulic_gradient,
+            nonlinearily_parameter=consts.nonlinearily_parameter,
+            air_entry_water_potential=consts.air_entry_water_potential,
+            water_retention_curvature=consts.water_retention_curvature,
+            water_potential_to_head=consts.water_potential_to_head,
+            seconds_to_day=86400,
+            time_step=time_step,
+            n_substeps=n_substeps,
+        )
+        for n_substeps in (1, 10, 100, 200)
+    ]
+
+    for result in results:
+        # Soil moisture stays within bounds and the flow out of the lowest layer
+        # balances the change in water stored in the soil column
+        assert np.all(result["soil_moisture"] >= consts.soil_moisture_residual)
+        assert np.all(result["soil_moisture"] <= consts.soil_moisture_capacity)
+        storage_change = np.sum(
+            (result["soil_moisture"] - soil_moisture) * layer_thickness, axis=0
+        )
+        np.testing.assert_allclose(
+            result["vertical_flow"][-1] * time_step, -storage_change
+        )
+        assert np.all(result["vertical_flow"][-1] >= 0)
+
+    # Solutions converge as the number of substeps increases
+    np.testing.assert_allclose(
+        results[2]["soil_moisture"], results[3]["soil_moisture"], rtol=1e-2
+    )
+    flow_error = [
+        np.abs(result["vertical_flow"] - results[3]["vertical_flow"]).max()
+        for result in results[:3]
+    ]
+    assert flow_error[0] > flow_error[1] > flow_error[2]
+
+
 def test_update_soil_moisture():
     """Test soil moisture update."""
 
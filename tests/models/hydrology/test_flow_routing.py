@@ -0,0 +1,123 @@
+"""Test module for hydrology.flow_routing.py."""
+
+from contextlib import nullcontext as does_not_raise
+from logging import ERROR
+
+import numpy as np
+import pytest
+
+from tests.conftest import log_check
+
+PIT_ELEVATION = np.array(
+    [
+        [9, 9, 9, 9, 9],
+        [9, 5, 6, 7, 9],
+        [9, 6, 1, 7, 9],
+        [9, 7, 7, 7, 9],
+        [9, 9, 9, 9, 0],
+    ],
+    dtype=float,
+).ravel()
+"""A square 5 by 5 elevation with a pit in the centre that spills to the corner."""
+
+
+@pytest.mark.parametrize(
+    "grid_type,distance,raises,expected_log_entries",
+    [
+        pytest.param("square", np.sqrt(2) * 100, does_not_raise(), (), id="square"),
+        pytest.param(
+            "hexagon",
+            1.01 * np.sqrt(2 * 10000 / np.sqrt(3)),
+            does_not_raise(),
+            (),
+            id="hexagon",
+        ),
+        pytest.param(
+            "triangle",
+            None,
+            pytest.raises(ValueError),
+            ((ERROR, "This grid type is currently not supported!"),),
+            id="unsupported",
+        ),
+    ],
+)
+def test_get_routing_neighbours(
+    caplog, grid_type, distance, raises, expected_log_entries
+):
+    """Test that routing neighbours match the neighbourhood of the grid."""
+
+    from virtual_ecosystem.core.grid import Grid
+    from virtual_ecosystem.models.hydrology.flow_routing import (
+        get_routing_neighbours,
+    )
+
+    grid = Grid("hexagon" if grid_type == "hexagon" else "square", cell_nx=5, cell_ny=4)
+    grid.grid_type = grid_type
+
+    with raises:
+        result = get_routing_neighbours(grid)
+
+        grid.set_neighbours(distance=distance)
+        for cell_id, neighbours in enumerate(result):
+            expected = [nbr for nbr in grid.neighbours[cell_id] if nbr != cell_id]
+            assert neighbours[neighbours >= 0].tolist() == expected
+
+    log_check(caplog, expected_log_entries)
+
+
+def test_fill_depressions():
+    """Test that depressions are filled and every interior cell can drain."""
+
+    from virtual_ecosystem.core.grid import Grid
+    from virtual_ecosystem.models.hydrology.flow_routing import (
+        fill_depressions,
+        get_routing_neighbours,
+    )
+
+    grid = Grid("square", cell_nx=5, cell_ny=5)
+    neighbours = get_routing_neighbours(grid)
+    result = fill_depressions(PIT_ELEVATION, neighbours)
+
+    # The pit is raised to the spill elevation and the edge cells are unchanged
+    assert np.all(result >= PIT_ELEVATION)
+    np.testing.assert_allclose(result.reshape(5, 5)[1:4, 1:4], 7.0)
+    edge = np.any(neighbours < 0, axis=1)
+    np.testing.assert_array_equal(result[edge], PIT_ELEVATION[edge])
+
+    # Every interior cell has a strictly lower neighbour
+    nbr_elevation = np.where(neighbours >= 0, result[neighbours], np.inf)
+    assert np.all(nbr_elevation[~edge].min(axis=1) < result[~edge])
+
+
+@pytest.mark.parametrize("grid_type", ["square", "hexagon"])
+def test_get_flow_routing(grid_type):
+    """Test that flow from all cells reaches an outlet and routing is cached."""
+
+    from virtual_ecosystem.core.grid import Grid
+    from virtual_ecosystem.models.hydrology.flow_routing import get_flow_routing
+
+    grid = Grid(grid_type, cell_nx=5, cell_ny=5)
+    result = get_flow_routing(grid, PIT_ELEVATION)
+
+    # Follow flow downstream from each cell to an outlet
+    cells = np.arange(grid.n_cells)
+    for _ in range(grid.n_cells):
+        cells = result.downstream[cells]
+    outlets = np.unique(cells)
+    np.testing.assert_array_equal(result.downstream[outlets], outlets)
+
+    if grid_type == "square":
+        # The pit drains to the spill point and everything ends at the corner outlet
+        assert result.downstream[12] == 18
+        np.testing.assert_array_equal(outlets, [24])
+
+    # Drainage map is consistent with the downstream cells
+    drainage_map = result.drainage_map
+    upstream_cells = [cell for ids in drainage_map.values() for cell in ids]
+    assert sorted(upstream_cells) == list(range(grid.n_cells))
+    for cell_id, upstream_ids in drainage_map.items():
+        assert np.all(result.downstream[upstream_ids] == cell_id)
+
+    # The cached routing is reused for identical elevation data
+    assert get_flow_routing(grid, PIT_ELEVATION.copy()) is result
+    assert get_flow_routing(grid, PIT_ELEVATION + 1) is not result
@@ -112,6 +112,152 @@ def test_hydrology_model_initialization(
     log_check(caplog, expected_log_entries)
 
 
+@pytest.mark.parametrize(
+    "flow_accumulation, raises, expected_flow",
+    [
+        pytest.param(
+            "upstream_neighbours",
+            does_not_raise(),
+            [10.0, 10.0, 13.0, 11.0],
+            id="upstream_neighbours",
+        ),
+        pytest.param(
+            "full_catchment",
+            does_not_raise(),
+            [11.0, 11.0, 14.0, 12.0],
+            id="full_catchment",
+        ),
+        pytest.param("unknown", pytest.raises(InitialisationError), None, id="unknown"),
+    ],
+)
+def test_hydrology_model_flow_accumulation(
+    dummy_climate_data,
+    fixture_core_components,
+    flow_accumulation,
+    raises,
+    expected_flow,
+):
+    """Test the flow accumulation modes of the `HydrologyModel`."""
+    from virtual_ecosystem.models.hydrology.hydrology_model import HydrologyModel
+
+    with patch(
+        "virtual_ecosystem.models.hydrology.hydrology_model.HydrologyModel._setup"
+    ):
+        with raises:
+            model = HydrologyModel(
+                data=dummy_climate_data,
+                core_components=fixture_core_components,
+                initial_soil_moisture=0.5,
+                initial_groundwater_saturation=0.9,
+                flow_accumulation=flow_accumulation,
+            )
+
+            result = model.accumulate_flow(
+                current_flow=np.ones(4), previous_accumulated_flow=np.full(4, 10.0)
+            )
+            np.testing.assert_allclose(result, expected_flow)
+
+
+@pytest.mark.parametrize(
+    "flow_routing, raises, expected_drainage_map",
+    [
+        pytest.param(
+            "lowest_neighbour",
+            does_not_raise(),
+            {0: [], 1: [], 2: [0, 2, 3], 3: [1]},
+            id="lowest_neighbour",
+        ),
+        pytest.param(
+            "steepest_descent",
+            does_not_raise(),
+            {0: [], 1: [], 2: [0, 2], 3: [1, 3]},
+            id="steepest_descent",
+        ),
+        pytest.param("unknown", pytest.raises(InitialisationError), None, id="unknown"),
+    ],
+)
+def test_hydrology_model_flow_routing(
+    dummy_climate_data,
+    fixture_core_components,
+    flow_routing,
+    raises,
+    expected_drainage_map,
+):
+    """Test the flow routing methods of the `HydrologyModel`."""
+    from virtual_ecosystem.models.hydrology.hydrology_model import HydrologyModel
+
+    with patch(
+        "virtual_ecosystem.models.hydrology.hydrology_model.HydrologyModel._setup"
+    ):
+        with raises:
+            model = HydrologyModel(
+                data=dummy_climate_data,
+                core_components=fixture_core_components,
+                initial_soil_moisture=0.5,
+                initial_groundwater_saturation=0.9,
+                flow_routing=flow_routing,
+            )
+
+            assert model.drainage_map == expected_drainage_map
+
+
+@pytest.mark.parametrize(
+    "vertical_flow_solver, vertical_flow_substeps, raises",
+    [
+        pytest.param("explicit", 10, does_not_raise(), id="explicit"),
+        pytest.param("implicit", 10, does_not_raise(), id="implicit"),
+        pytest.param("implicit", 1, does_not_raise(), id="implicit_one_step"),
+        pytest.param("unknown", 10, pytest.raises(InitialisationError), id="unknown"),
+        pytest.param(
+            "implicit", 0, pytest.raises(InitialisationError), id="no_substeps"
+        ),
+        pytest.param(
+            "implicit", 2.5, pytest.raises(InitialisationError), id="float_substeps"
+        ),
+    ],
+)
+def test_hydrology_model_vertical_flow_solver(
+    dummy_climate_data,
+    fixture_core_components,
+    vertical_flow_solver,
+    vertical_flow_substeps,
+    raises,
+):
+    """Test the vertical flow solvers of the `HydrologyModel`."""
+    from virtual_ecosystem.models.hydrology.hydrology_model import HydrologyModel
+
+    with patch(
+        "virtual_ecosystem.models.hydrology.hydrology_model.HydrologyModel._setup"
+    ):
+        with raises:
+            model = HydrologyModel(
+                data=dummy_climate_data,
+                core_components=fixture_core_components,
+                initial_soil_moisture=0.5,
+                initial_groundwater_saturation=0.9,
+                vertical_flow_solver=vertical_flow_solver,
+                vertical_flow_substeps=vertical_flow_substeps,
+            )
+
+            soil_moisture = np.array([[60.0, 80.0, 100.0, 120.0], [300.0] * 4])
+            vertical_flow, result = model.calculate_soil_water_flow(
+                soil_moisture=soil_moisture, evapotranspiration=np.full(4, 5.0)
+            )
+
+            capacity = model.model_constants.soil_moisture_capacity
+            residual = model.model_constants.soil_moisture_residual
+            assert vertical_flow.shape == (2, 4)
+            assert np.all(result <= capacity * model.soil_layer_thickness_mm)
+            assert np.all(result >= residual * model.soil_layer_thickness_mm)
+
+            if vertical_flow_solver == "implicit":
+                # Water is conserved, apart from evapotranspiration and drainage
+                np.testing.assert_allclose(
+                    result.sum(axis=0),
+                    soil_moisture.sum(axis=0) - 5.0 - vertical_flow[-1],
+                )
+
+
 @pytest.mark.parametrize(
     "cfg_string,sm_capacity,raises,expected_log_entries",
     [
@@ -277,12 +423,12 @@ def test_setup(
         # Test 2d variables
         expected_2d = {
             "soil_moisture": [
-                [67.0621, 67.0829, 67.05435, 67.04017],
-                [209.8470, 209.8500, 209.8491, 209.8467],
+                [67.01033, 67.1595, 67.18708, 67.26365],
+                [209.84905, 209.85237, 209.85929, 209.85762],
             ],
             "matric_potential": [
-                [-1.532961e07, -1.536408e07, -1.528976e07, -1.53231e07],
-                [-1.250262e03, -1.250131e03, -1.250172e03, -1.250276e3],
+                [-1.533825e07, -1.540643e07, -1.591596e07, -1.56341e07],
+                [-1.250182e03, -1.250021e03, -1.249727e03, -1.249795e03],
             ],
         }
 
@@ -299,11 +445,11 @@ def test_setup(
 
         # Test one dimensional variables
         expected_1d = {
-            "vertical_flow": [0.69471, 0.695691, 0.695682, 0.694436],
-            "total_river_discharge": [0, 0, 63361, 20925],
+            "vertical_flow": [0.697847, 0.694079, 0.699775, 0.697847],
+            "total_river_discharge": [0, 0, 63510, 20925],
             "surface_runoff": [0, 0, 0, 0],
             "surface_runoff_accumulated": [0, 0, 0, 0],
-            "soil_evaporation": [345.1148, 344.759928, 345.15422, 344.90802],
+            "soil_evaporation": [345.312739, 344.514456, 342.172178, 344.675855],
         }
 
         for var_name, expected_vals in expected_1d.items():
@@ -12,6 +12,7 @@ def test_setup_hydrology_input_current_timestep(
 ):
     """Test that correct values are selected for current time step."""
 
+    from virtual_ecosystem.core.downscaling import downscale_forcing
     from virtual_ecosystem.models.hydrology.hydrology_tools import (
         setup_hydrology_input_current_timestep,
     )
@@ -19,9 +20,7 @@ def test_setup_hydrology_input_current_timestep(
     lyr_strct = fixture_core_components.layer_structure
     result = setup_hydrology_input_current_timestep(
         data=dummy_climate_data,
-        time_index=0,
         days=30,
-        seed=42,
         layer_structure=lyr_strct,
         soil_layer_thickness_mm=lyr_strct.soil_layer_thickness * 1000,
         soil_moisture_capacity=0.9,
@@ -34,7 +33,6 @@ def test_setup_hydrology_input_current_timestep(
     var_list = [
         "latent_heat_vapourisation",
         "molar_density_air",
-        "current_precipitation",
         "surface_temperature",
         "surface_humidity",
         "surface_pressure",
@@ -51,11 +49,27 @@ def test_setup_hydrology_input_current_timestep(
 
     assert set(result.keys()) == set(var_list)
 
-    # check if climate values are selected correctly
+    # check that the daily precipitation generated by the registered monthly_rainfall
+    # downscaling method conserves the monthly total
+    daily_precipitation = np.stack(
+        list(
+            downscale_forcing(
+                data=dummy_climate_data,
+                var_name="precipitation",
+                time_index=0,
+                n_steps=30,
+                method="monthly_rainfall",
+                seed=42,
+            )
+        ),
+        axis=1,
+    )
     np.testing.assert_allclose(
-        np.sum(result["current_precipitation"], axis=1),
+        np.sum(daily_precipitation, axis=1),
         (dummy_climate_data["precipitation"].isel(time_index=0)).to_numpy(),
     )
+
+    # check if climate values are selected correctly
     # Get the surface layer index as an integer to extract a 1D slice
     surface_idx = lyr_strct.index_surface_scalar
     np.testing.assert_allclose(
@@ -102,3 +116,40 @@ def test_initialise_soil_moisture_mm(fixture_core_components, init_soilm, expect
     # The fixture is configured with soil layers [-0.25, -1.0]
     exp_result = DataArray(np.broadcast_to(expected, (2, 4)))
     np.testing.assert_allclose(result[layer_structure.index_all_soil], exp_result)
+
+
+@pytest.mark.parametrize(
+    argnames="reduction, expected",
+    argvalues=(
+        pytest.param("sum", [[9.0, 12.0], [15.0, 18.0]], id="sum"),
+        pytest.param("mean", [[3.0, 4.0], [5.0, 6.0]], id="mean"),
+        pytest.param("last", [[5.0, 6.0], [7.0, 8.0]], id="last"),
+    ),
+)
+def test_DailyAccumulator(reduction, expected):
+    """Test the daily values are reduced correctly without modifying the inputs."""
+
+    from virtual_ecosystem.models.hydrology.hydrology_tools import DailyAccumulator
+
+    daily_values = [
+        np.array([[1, 2], [3, 4]], dtype=np.float32),
+        np.array([[3, 4], [5, 6]], dtype=np.float32),
+        np.array([[5, 6], [7, 8]], dtype=np.float32),
+    ]
+
+    accumulator = DailyAccumulator(reduction)
+    for values in daily_values:
+        accumulator.add(values)
+
+    assert accumulator.n_days == 3
+    np.testing.assert_allclose(accumulator.result, expected)
+    np.testing.assert_allclose(daily_values[0], [[1, 2], [3, 4]])
+
+
+def test_DailyAccumulator_empty(caplog):
+    """Test that an accumulator without daily values raises an error."""
+
+    from virtual_ecosystem.models.hydrology.hydrology_tools import DailyAccumulator
+
+    with pytest.raises(ValueError, match="No daily values have been added"):
+        _ = DailyAccumulator("sum").result
@@ -109,16 +109,25 @@ def dummy_litter_data(fixture_core_components):
 
 
 @pytest.fixture
-def decay_rates(dummy_litter_data, fixture_core_components, post_consumption_pools):
+def litter_pools(dummy_litter_data):
+    """Dense litter pool and chemistry arrays for the dummy litter data."""
+    from virtual_ecosystem.models.litter.pools import LitterPools
+
+    return LitterPools.from_data(dummy_litter_data)
+
+
+@pytest.fixture
+def decay_rates(
+    dummy_litter_data, fixture_core_components, post_consumption_pools, litter_pools
+):
     """Decay rates for the various litter pools."""
 
     from virtual_ecosystem.models.litter.carbon import calculate_decay_rates
+    from virtual_ecosystem.models.litter.pools import LIGNIN
 
     decay_rates = calculate_decay_rates(
         post_consumption_pools=post_consumption_pools,
-        lignin_above_structural=dummy_litter_data["lignin_above_structural"].to_numpy(),
-        lignin_woody=dummy_litter_data["lignin_woody"].to_numpy(),
-        lignin_below_structural=dummy_litter_data["lignin_below_structural"].to_numpy(),
+        lignin_proportions=litter_pools.chemistry[:, LIGNIN],
         air_temperatures=dummy_litter_data["air_temperature"],
         soil_temperatures=dummy_litter_data["soil_temperature"],
         water_potentials=dummy_litter_data["matric_potential"],
@@ -130,11 +139,11 @@ def decay_rates(dummy_litter_data, fixture_core_components, post_consumption_poo
 
 
 @pytest.fixture
-def litter_chemistry(dummy_litter_data):
+def litter_chemistry():
     """LitterChemistry object to be use throughout testing."""
     from virtual_ecosystem.models.litter.chemistry import LitterChemistry
 
-    litter_chemistry = LitterChemistry(dummy_litter_data, constants=LitterConsts)
+    litter_chemistry = LitterChemistry(constants=LitterConsts)
 
     return litter_chemistry
 
@@ -199,29 +208,14 @@ def metabolic_splits(total_litter_input):
 
 
 @pytest.fixture
-def post_consumption_pools(dummy_litter_data):
+def post_consumption_pools(dummy_litter_data, litter_pools):
     """Pool sizes after animal consumption for each litter pool."""
     from virtual_ecosystem.models.litter.carbon import calculate_post_consumption_pools
+    from virtual_ecosystem.models.litter.pools import stack_pool_variables
 
     post_consumption_pools = calculate_post_consumption_pools(
-        above_metabolic=dummy_litter_data["litter_pool_above_metabolic"].to_numpy(),
-        above_structural=dummy_litter_data["litter_pool_above_structural"].to_numpy(),
-        woody=dummy_litter_data["litter_pool_woody"].to_numpy(),
-        below_metabolic=dummy_litter_data["litter_pool_below_metabolic"].to_numpy(),
-        below_structural=dummy_litter_data["litter_pool_below_structural"].to_numpy(),
-        consumption_above_metabolic=dummy_litter_data[
-            "litter_consumption_above_metabolic"
-        ].to_numpy(),
-        consumption_above_structural=dummy_litter_data[
-            "litter_consumption_above_structural"
-        ].to_numpy(),
-        consumption_woody=dummy_litter_data["litter_consumption_woody"].to_numpy(),
-        consumption_below_metabolic=dummy_litter_data[
-            "litter_consumption_below_metabolic"
-        ].to_numpy(),
-        consumption_below_structural=dummy_litter_data[
-            "litter_consumption_below_structural"
-        ].to_numpy(),
+        litter_pools=litter_pools.carbon,
+        consumption=stack_pool_variables(dummy_litter_data, "litter_consumption_{}"),
     )
 
     return post_consumption_pools
@@ -247,7 +241,7 @@ def updated_pools(
     updated_pools = calculate_updated_pools(
         post_consumption_pools=post_consumption_pools,
         decay_rates=decay_rates,
-        litter_inputs=litter_inputs,
+        pool_inputs=litter_inputs.pool_inputs,
         update_interval=2.0,
     )
 
@@ -52,64 +52,45 @@ def temp_and_water_factors(dummy_litter_data, fixture_core_components):
     }
 
 
-def test_calculate_post_consumption_pools(dummy_litter_data):
+def test_calculate_post_consumption_pools(dummy_litter_data, litter_pools):
     """Test that the calculation of post consumption pool sizes is correct."""
     from virtual_ecosystem.models.litter.carbon import calculate_post_consumption_pools
+    from virtual_ecosystem.models.litter.pools import stack_pool_variables
 
-    expected_pools = {
-        "above_metabolic": [0.3, 0.15, 0.07, 0.07],
-        "above_structural": [0.5, 0.25, 0.09, 0.09],
-        "woody": [4.7, 11.8, 7.3, 7.3],
-        "below_metabolic": [0.4, 0.37, 0.07, 0.07],
-        "below_structural": [0.6, 0.31, 0.02, 0.02],
-    }
+    expected_pools = [
+        [0.3, 0.15, 0.07, 0.07],
+        [0.5, 0.25, 0.09, 0.09],
+        [4.7, 11.8, 7.3, 7.3],
+        [0.4, 0.37, 0.07, 0.07],
+        [0.6, 0.31, 0.02, 0.02],
+    ]
 
     actual_pools = calculate_post_consumption_pools(
-        above_metabolic=dummy_litter_data["litter_pool_above_metabolic"].to_numpy(),
-        above_structural=dummy_litter_data["litter_pool_above_structural"].to_numpy(),
-        woody=dummy_litter_data["litter_pool_woody"].to_numpy(),
-        below_metabolic=dummy_litter_data["litter_pool_below_metabolic"].to_numpy(),
-        below_structural=dummy_litter_data["litter_pool_below_structural"].to_numpy(),
-        consumption_above_metabolic=dummy_litter_data[
-            "litter_consumption_above_metabolic"
-        ].to_numpy(),
-        consumption_above_structural=dummy_litter_data[
-            "litter_consumption_above_structural"
-        ].to_numpy(),
-        consumption_woody=dummy_litter_data["litter_consumption_woody"].to_numpy(),
-        consumption_below_metabolic=dummy_litter_data[
-            "litter_consumption_below_metabolic"
-        ].to_numpy(),
-        consumption_below_structural=dummy_litter_data[
-            "litter_consumption_below_structural"
-        ].to_numpy(),
+        litter_pools=litter_pools.carbon,
+        consumption=stack_pool_variables(dummy_litter_data, "litter_consumption_{}"),
     )
 
-    assert set(expected_pools.keys()) == set(actual_pools.keys())
-
-    for key in actual_pools.keys():
-        assert np.allclose(actual_pools[key], expected_pools[key])
+    assert np.allclose(actual_pools, expected_pools)
 
 
 def test_calculate_decay_rates(
-    dummy_litter_data, fixture_core_components, post_consumption_pools
+    dummy_litter_data, fixture_core_components, post_consumption_pools, litter_pools
 ):
     """Test that calculation of the decay rates works as expected."""
     from virtual_ecosystem.models.litter.carbon import calculate_decay_rates
+    from virtual_ecosystem.models.litter.pools import LIGNIN
 
-    expected_decay = {
-        "metabolic_above": [0.00450883, 0.00225442, 0.00105206, 0.00105206],
-        "structural_above": [1.6742967e-4, 6.1857359e-4, 1.1086908e-5, 1.1086908e-5],
-        "woody": [0.0004832, 0.00027069, 0.0015888, 0.0015888],
-        "metabolic_below": [0.00912788, 0.00747205, 0.00113563, 0.00113563],
-        "structural_below": [3.0375501e-4, 4.8476324e-4, 2.0623487e-6, 2.0623487e-6],
-    }
+    expected_decay = [
+        [0.00450883, 0.00225442, 0.00105206, 0.00105206],
+        [1.6742967e-4, 6.1857359e-4, 1.1086908e-5, 1.1086908e-5],
+        [0.0004832, 0.00027069, 0.0015888, 0.0015888],
+        [0.00912788, 0.00747205, 0.00113563, 0.00113563],
+        [3.0375501e-4, 4.8476324e-4, 2.0623487e-6, 2.0623487e-6],
+    ]
 
     actual_decay = calculate_decay_rates(
         post_consumption_pools=post_consumption_pools,
-        lignin_above_structural=dummy_litter_data["lignin_above_structural"].to_numpy(),
-        lignin_woody=dummy_litter_data["lignin_woody"].to_numpy(),
-        lignin_below_structural=dummy_litter_data["lignin_below_structural"].to_numpy(),
+        lignin_proportions=litter_pools.chemistry[:, LIGNIN],
         air_temperatures=dummy_litter_data["air_temperature"],
         soil_temperatures=dummy_litter_data["soil_temperature"],
         water_potentials=dummy_litter_data["matric_potential"],
@@ -117,10 +98,7 @@ def test_calculate_decay_rates(
         constants=LitterConsts,
     )
 
-    assert set(expected_decay.keys()) == set(actual_decay.keys())
-
-    for name in expected_decay.keys():
-        assert np.allclose(actual_decay[name], expected_decay[name])
+    assert np.allclose(actual_decay, expected_decay)
 
 
 def test_calculate_total_C_mineralised(decay_rates):
@@ -139,134 +117,117 @@ def test_calculate_total_C_mineralised(decay_rates):
     assert np.allclose(actual_mineralisation, expected_mineralisation)
 
 
-def test_calculate_updated_pools(
-    dummy_litter_data, decay_rates, post_consumption_pools, litter_inputs
-):
+def test_calculate_updated_pools(decay_rates, post_consumption_pools, litter_inputs):
     """Test that the function to calculate the pool values after the update works."""
     from virtual_ecosystem.models.litter.carbon import calculate_updated_pools
 
-    expected_pools = {
-        "above_metabolic": [0.3154788, 0.15354349, 0.080772679, 0.073701212],
-        "above_structural": [0.5051986807, 0.2506105228, 0.1035010262, 0.1191224962],
-        "woody": [4.77403361, 11.89845863, 7.3598224, 7.3298224],
-        "below_metabolic": [0.3976309, 0.3630269, 0.06787947, 0.07794085],
-        "below_structural": [0.61050583, 0.32205947352, 0.02014514530, 0.03468376530],
-    }
+    expected_pools = [
+        [0.3154788, 0.15354349, 0.080772679, 0.073701212],
+        [0.5051986807, 0.2506105228, 0.1035010262, 0.1191224962],
+        [4.77403361, 11.89845863, 7.3598224, 7.3298224],
+        [0.3976309, 0.3630269, 0.06787947, 0.07794085],
+        [0.61050583, 0.32205947352, 0.02014514530, 0.03468376530],
+    ]
 
     actual_pools = calculate_updated_pools(
         post_consumption_pools=post_consumption_pools,
         decay_rates=decay_rates,
-        litter_inputs=litter_inputs,
+        pool_inputs=litter_inputs.pool_inputs,
         update_interval=2.0,
     )
 
-    assert set(expected_pools.keys()) == set(actual_pools.keys())
-
-    for name in expected_pools.keys():
-        assert np.allclose(actual_pools[name], expected_pools[name])
-
-
-def test_calculate_litter_decay_metabolic_above(
-    temp_and_water_factors, post_consumption_pools
-):
-    """Test calculation of above ground metabolic litter decay."""
-    from virtual_ecosystem.models.litter.carbon import (
-        calculate_litter_decay_metabolic_above,
-    )
-
-    expected_decay = [0.00450883464, 0.00225441732, 0.00105206141, 0.00105206141]
+    assert np.allclose(actual_pools, expected_pools)
 
-    actual_decay = calculate_litter_decay_metabolic_above(
-        temperature_factor=temp_and_water_factors["temp_above"],
-        litter_pool_above_metabolic=post_consumption_pools["above_metabolic"],
-        litter_decay_coefficient=LitterConsts.litter_decay_constant_metabolic_above,
-    )
-
-    assert np.allclose(actual_decay, expected_decay)
 
-
-def test_calculate_litter_decay_structural_above(
-    dummy_litter_data, temp_and_water_factors, post_consumption_pools
+def test_calculate_litter_decay_constants(
+    temp_and_water_factors, post_consumption_pools, litter_pools
 ):
-    """Test calculation of above ground structural litter decay."""
+    """Test calculation of the litter decay constants for each pool."""
     from virtual_ecosystem.models.litter.carbon import (
-        calculate_litter_decay_structural_above,
-    )
-
-    expected_decay = [1.67429665e-4, 6.18573593e-4, 1.10869077e-5, 1.10869077e-5]
-
-    actual_decay = calculate_litter_decay_structural_above(
-        temperature_factor=temp_and_water_factors["temp_above"],
-        litter_pool_above_structural=post_consumption_pools["above_structural"],
-        lignin_proportion=dummy_litter_data["lignin_above_structural"],
-        litter_decay_coefficient=LitterConsts.litter_decay_constant_structural_above,
+        calculate_litter_decay_constants,
+        get_litter_decay_coefficients,
+    )
+    from virtual_ecosystem.models.litter.pools import LIGNIN
+
+    expected_decay = [
+        [0.00450883464, 0.00225441732, 0.00105206141, 0.00105206141],
+        [1.67429665e-4, 6.18573593e-4, 1.10869077e-5, 1.10869077e-5],
+        [0.0004832, 0.00027069, 0.0015888, 0.0015888],
+        [0.01092804, 0.00894564, 0.00135959, 0.00135959],
+        [3.63659952e-04, 5.80365659e-04, 2.46907410e-06, 2.46907410e-06],
+    ]
+
+    above = np.array([True, True, True, False, False])[:, None]
+
+    actual_constants = calculate_litter_decay_constants(
+        temperature_factors=np.where(
+            above,
+            temp_and_water_factors["temp_above"],
+            temp_and_water_factors["temp_below"],
+        ),
+        moisture_factors=np.where(above, 1.0, temp_and_water_factors["water"]),
+        lignin_proportions=litter_pools.chemistry[:, LIGNIN],
+        litter_decay_coefficients=get_litter_decay_coefficients(LitterConsts)[:, None],
         lignin_inhibition_factor=LitterConsts.lignin_inhibition_factor,
     )
 
-    assert np.allclose(actual_decay, expected_decay)
+    assert np.allclose(actual_constants * post_consumption_pools, expected_decay)
 
 
-def test_calculate_litter_decay_woody(
-    dummy_litter_data, temp_and_water_factors, post_consumption_pools
+@pytest.mark.parametrize(argnames="update_interval", argvalues=[2.0, 365.0, 3650.0])
+def test_calculate_updated_pools_exponential(
+    decay_rates, post_consumption_pools, litter_inputs, update_interval
 ):
-    """Test calculation of woody litter decay."""
+    """Test the exponential pool update against a fine explicit integration."""
     from virtual_ecosystem.models.litter.carbon import (
-        calculate_litter_decay_woody,
+        calculate_updated_pools_exponential,
     )
 
-    expected_decay = [0.0004832, 0.00027069, 0.0015888, 0.0015888]
+    decay_constants = decay_rates / post_consumption_pools
+    pool_inputs = litter_inputs.pool_inputs
 
-    actual_decay = calculate_litter_decay_woody(
-        temperature_factor=temp_and_water_factors["temp_above"],
-        litter_pool_woody=post_consumption_pools["woody"],
-        lignin_proportion=dummy_litter_data["lignin_woody"],
-        litter_decay_coefficient=LitterConsts.litter_decay_constant_woody,
-        lignin_inhibition_factor=LitterConsts.lignin_inhibition_factor,
-    )
-
-    assert np.allclose(actual_decay, expected_decay)
-
-
-def test_calculate_litter_decay_metabolic_below(
-    temp_and_water_factors, post_consumption_pools
-):
-    """Test calculation of below ground metabolic litter decay."""
-    from virtual_ecosystem.models.litter.carbon import (
-        calculate_litter_decay_metabolic_below,
-    )
-
-    expected_decay = [0.01092804, 0.00894564, 0.00135959, 0.00135959]
-
-    actual_decay = calculate_litter_decay_metabolic_below(
-        temperature_factor=temp_and_water_factors["temp_below"],
-        moisture_factor=temp_and_water_factors["water"],
-        litter_pool_below_metabolic=post_consumption_pools["below_metabolic"],
-        litter_decay_coefficient=LitterConsts.litter_decay_constant_metabolic_below,
-    )
-
-    assert np.allclose(actual_decay, expected_decay)
-
-
-def test_calculate_litter_decay_structural_below(
-    dummy_litter_data, temp_and_water_factors, post_consumption_pools
+    actual_pools, remaining_inputs = calculate_updated_pools_exponential(
+        post_consumption_pools=post_consumption_pools,
+        decay_constants=decay_constants,
+        pool_inputs=pool_inputs,
+        update_interval=update_interval,
+    )
+
+    # Integrate the pools and the inputs separately using many short steps
+    n_steps = 100000
+    step = update_interval / n_steps
+    expected_pools = post_consumption_pools.copy()
+    expected_inputs = np.zeros_like(pool_inputs)
+    for _ in range(n_steps):
+        expected_pools += (
+            pool_inputs / n_steps - decay_constants * expected_pools * step
+        )
+        expected_inputs += (
+            pool_inputs / n_steps - decay_constants * expected_inputs * step
+        )
+
+    assert np.all(actual_pools > 0)
+    assert np.allclose(actual_pools, expected_pools, rtol=1e-3)
+    assert np.allclose(remaining_inputs, expected_inputs, rtol=1e-3)
+
+
+def test_calculate_updated_pools_exponential_no_decay(
+    post_consumption_pools, litter_inputs
 ):
-    """Test calculation of below ground structural litter decay."""
+    """Test that pools without decay just gain their inputs."""
     from virtual_ecosystem.models.litter.carbon import (
-        calculate_litter_decay_structural_below,
+        calculate_updated_pools_exponential,
     )
 
-    expected_decay = [3.63659952e-04, 5.80365659e-04, 2.46907410e-06, 2.46907410e-06]
-
-    actual_decay = calculate_litter_decay_structural_below(
-        temperature_factor=temp_and_water_factors["temp_below"],
-        moisture_factor=temp_and_water_factors["water"],
-        litter_pool_below_structural=post_consumption_pools["below_structural"],
-        lignin_proportion=dummy_litter_data["lignin_below_structural"],
-        litter_decay_coefficient=LitterConsts.litter_decay_constant_structural_below,
-        lignin_inhibition_factor=LitterConsts.lignin_inhibition_factor,
+    actual_pools, remaining_inputs = calculate_updated_pools_exponential(
+        post_consumption_pools=post_consumption_pools,
+        decay_constants=np.zeros_like(post_consumption_pools),
+        pool_inputs=litter_inputs.pool_inputs,
+        update_interval=30.0,
     )
 
-    assert np.allclose(actual_decay, expected_decay)
+    assert np.allclose(actual_pools, post_consumption_pools + litter_inputs.pool_inputs)
+    assert np.allclose(remaining_inputs, litter_inputs.pool_inputs)
 
 
 def test_calculate_carbon_mineralised():
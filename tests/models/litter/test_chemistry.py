@@ -4,6 +4,7 @@ This module tests the functionality of the litter chemistry module
 """
 
 import numpy as np
+import pytest
 
 from virtual_ecosystem.core.constants import CoreConsts
 from virtual_ecosystem.models.litter.constants import LitterConsts
@@ -27,9 +28,10 @@ def test_calculate_litter_chemistry_factor():
 
 
 def test_calculate_new_pool_chemistries(
-    dummy_litter_data, litter_inputs, updated_pools, litter_chemistry
+    litter_inputs, updated_pools, litter_pools, litter_chemistry
 ):
     """Test that function to calculate updated pool chemistries works correctly."""
+    from virtual_ecosystem.models.litter.pools import LitterPools
 
     expected_chemistries = {
         "lignin_above_structural": [0.49726272, 0.10113017, 0.67782882, 0.67072519],
@@ -48,37 +50,65 @@ def test_calculate_new_pool_chemistries(
     }
 
     actual_chemistries = litter_chemistry.calculate_new_pool_chemistries(
-        litter_inputs=litter_inputs,
         updated_pools=updated_pools,
+        pool_chemistries=litter_pools.chemistry,
+        litter_inputs=litter_inputs,
     )
 
-    assert set(actual_chemistries.keys()) == set(expected_chemistries.keys())
+    assert actual_chemistries.shape == (5, 3, 4)
 
-    for name in actual_chemistries.keys():
-        assert np.allclose(actual_chemistries[name], expected_chemistries[name])
+    actual_variables = LitterPools(
+        carbon=updated_pools, chemistry=actual_chemistries
+    ).to_data_arrays()
 
+    for name, expected in expected_chemistries.items():
+        assert np.allclose(actual_variables[name], expected)
 
-def test_calculate_lignin_updates(
-    input_lignin, updated_pools, litter_chemistry, litter_inputs
-):
-    """Test that the function to calculate the lignin updates works as expected."""
+    # The metabolic pools contain no lignin
+    assert np.allclose(actual_chemistries[[0, 3], 0], 0.0)
 
-    expected_lignin = {
-        "above_structural": [-0.0027373, 0.001130172, -0.022171178, -0.029274812],
-        "woody": [-0.00419457, -0.0021217, 0.00224272, 0.00012606],
-        "below_structural": [-0.00025662, 0.01270806, -0.00153633, -0.03044408],
-    }
 
-    actual_lignin = litter_chemistry.calculate_lignin_updates(
-        input_lignin=input_lignin,
-        litter_inputs=litter_inputs,
-        updated_pools=updated_pools,
+def test_calculate_change_in_pool_chemistries(
+    litter_inputs, updated_pools, litter_pools, litter_chemistry
+):
+    """Test the broadcast calculation of the chemistry changes for every pool."""
+    from virtual_ecosystem.models.litter.chemistry import (
+        calculate_change_in_chemical_concentration,
     )
 
-    assert set(actual_lignin.keys()) == set(expected_lignin.keys())
+    expected_lignin = [
+        [0.0, 0.0, 0.0, 0.0],
+        [-0.0027373, 0.001130172, -0.022171178, -0.029274812],
+        [-0.00419457, -0.0021217, 0.00224272, 0.00012606],
+        [0.0, 0.0, 0.0, 0.0],
+        [-0.00025662, 0.01270806, -0.00153633, -0.03044408],
+    ]
+    expected_c_n_ratio = [
+        [0.0921805, 0.3161456, 0.3324728, 0.1183441],
+        [0.05498852, 0.2317676, 2.2675813, 1.8651688],
+        [0.0816919, -0.0449302, 0.2208477, -0.0180086],
+        [0.02994209, 0.03945672, -0.00159759, -0.17775875],
+        [0.12282146, 0.39989943, -0.00516585, -2.53387232],
+    ]
+    expected_c_p_ratio = [
+        [12.666598, 0.9745483, 8.3267513, 0.3434882],
+        [8.5523105, 0.13029263, 52.0182397, -37.7791012],
+        [4.72870571, -0.73136364, 0.73530307, 1.30427444],
+        [-2.49921796, -6.18927446, -0.37518617, -39.52977135],
+        [12.56464272, 2.08324337, -0.31032454, -41.37190224],
+    ]
+
+    actual_change = calculate_change_in_chemical_concentration(
+        input_carbon=litter_inputs.pool_inputs[:, None, :],
+        updated_pool_carbon=updated_pools[:, None, :],
+        input_conc=litter_chemistry.calculate_input_chemistries(litter_inputs),
+        old_pool_conc=litter_pools.chemistry,
+    )
 
-    for name in actual_lignin.keys():
-        assert np.allclose(actual_lignin[name], expected_lignin[name])
+    assert np.allclose(
+        actual_change,
+        np.stack([expected_lignin, expected_c_n_ratio, expected_c_p_ratio], axis=1),
+    )
 
 
 def test_calculate_change_in_chemical_concentration(
@@ -96,7 +126,7 @@ def test_calculate_change_in_chemical_concentration(
 
     actual_lignin = calculate_change_in_chemical_concentration(
         input_carbon=input_carbon,
-        updated_pool_carbon=post_consumption_pools["woody"],
+        updated_pool_carbon=post_consumption_pools[2],
         input_conc=input_lignin,
         old_pool_conc=dummy_litter_data["lignin_woody"].to_numpy(),
     )
@@ -104,80 +134,32 @@ def test_calculate_change_in_chemical_concentration(
     assert np.allclose(actual_lignin, expected_lignin)
 
 
-def test_calculate_c_n_ratio_updates(
-    dummy_litter_data, litter_inputs, input_c_n_ratios, updated_pools, litter_chemistry
-):
-    """Test that calculation of C:N ratio updates works properly."""
-
-    expected_change = {
-        "above_metabolic": [0.0921805, 0.3161456, 0.3324728, 0.1183441],
-        "above_structural": [0.05498852, 0.2317676, 2.2675813, 1.8651688],
-        "woody": [0.0816919, -0.0449302, 0.2208477, -0.0180086],
-        "below_metabolic": [0.02994209, 0.03945672, -0.00159759, -0.17775875],
-        "below_structural": [0.12282146, 0.39989943, -0.00516585, -2.53387232],
-    }
-
-    actual_change = litter_chemistry.calculate_c_n_ratio_updates(
-        litter_inputs=litter_inputs,
-        input_c_n_ratios=input_c_n_ratios,
-        updated_pools=updated_pools,
-    )
-
-    assert set(expected_change.keys()) == set(actual_change.keys())
-
-    for key in actual_change.keys():
-        assert np.allclose(actual_change[key], expected_change[key])
-
-
-def test_calculate_c_p_ratio_updates(
-    dummy_litter_data, litter_inputs, input_c_p_ratios, updated_pools, litter_chemistry
+@pytest.mark.parametrize(
+    argnames="chemistry, expected_mineral",
+    argvalues=[
+        pytest.param(1, [0.00595963, 0.00379074, 0.00085095, 0.0009043], id="nitrogen"),
+        pytest.param(
+            2,
+            [4.39937479e-4, 2.13832149e-4, 6.40698004e-5, 6.56405873e-5],
+            id="phosphorus",
+        ),
+    ],
+)
+def test_calculate_nutrient_mineralisation(
+    decay_rates, litter_pools, chemistry, expected_mineral
 ):
-    """Test that calculation of C:P ratio updates works properly."""
-
-    expected_change = {
-        "above_metabolic": [12.666598, 0.9745483, 8.3267513, 0.3434882],
-        "above_structural": [8.5523105, 0.13029263, 52.0182397, -37.7791012],
-        "woody": [4.72870571, -0.73136364, 0.73530307, 1.30427444],
-        "below_metabolic": [-2.49921796, -6.18927446, -0.37518617, -39.52977135],
-        "below_structural": [12.56464272, 2.08324337, -0.31032454, -41.37190224],
-    }
-
-    actual_change = litter_chemistry.calculate_c_p_ratio_updates(
-        litter_inputs=litter_inputs,
-        input_c_p_ratios=input_c_p_ratios,
-        updated_pools=updated_pools,
-    )
-
-    assert set(expected_change.keys()) == set(actual_change.keys())
-
-    for key in actual_change.keys():
-        assert np.allclose(actual_change[key], expected_change[key])
-
-
-def test_calculate_N_mineralisation(dummy_litter_data, decay_rates, litter_chemistry):
-    """Test that function to calculate nitrogen mineralisation rate works properly."""
-
-    expected_n_mineral = [0.00595963, 0.00379074, 0.00085095, 0.0009043]
-
-    actual_n_mineral = litter_chemistry.calculate_N_mineralisation(
-        decay_rates=decay_rates,
-        active_microbe_depth=CoreConsts.max_depth_of_microbial_activity,
+    """Test that function to calculate nutrient mineralisation rates works properly."""
+    from virtual_ecosystem.models.litter.chemistry import (
+        calculate_nutrient_mineralisation,
     )
 
-    assert np.allclose(actual_n_mineral, expected_n_mineral)
-
-
-def test_calculate_P_mineralisation(dummy_litter_data, decay_rates, litter_chemistry):
-    """Test that function to calculate phosphorus mineralisation rate works properly."""
-
-    expected_p_mineral = [4.39937479e-4, 2.13832149e-4, 6.40698004e-5, 6.56405873e-5]
-
-    actual_p_mineral = litter_chemistry.calculate_P_mineralisation(
+    actual_mineral = calculate_nutrient_mineralisation(
         decay_rates=decay_rates,
+        c_nutrient_ratios=litter_pools.chemistry[:, chemistry],
         active_microbe_depth=CoreConsts.max_depth_of_microbial_activity,
     )
 
-    assert np.allclose(actual_p_mineral, expected_p_mineral)
+    assert np.allclose(actual_mineral, expected_mineral)
 
 
 def test_calculate_litter_input_lignin_concentrations(litter_inputs):
@@ -186,17 +168,19 @@ def test_calculate_litter_input_lignin_concentrations(litter_inputs):
         calculate_litter_input_lignin_concentrations,
     )
 
-    expected_woody = [0.233, 0.545, 0.612, 0.378]
-    expected_concs_above_struct = [0.2500931, 0.2532920, 0.5303109, 0.5803457]
-    expected_concs_below_struct = [0.48590258, 0.56412613, 0.54265483, 0.67810978]
+    expected_concs = [
+        [0.0, 0.0, 0.0, 0.0],
+        [0.2500931, 0.2532920, 0.5303109, 0.5803457],
+        [0.233, 0.545, 0.612, 0.378],
+        [0.0, 0.0, 0.0, 0.0],
+        [0.48590258, 0.56412613, 0.54265483, 0.67810978],
+    ]
 
     actual_concs = calculate_litter_input_lignin_concentrations(
         litter_inputs=litter_inputs,
     )
 
-    assert np.allclose(actual_concs["woody"], expected_woody)
-    assert np.allclose(actual_concs["above_structural"], expected_concs_above_struct)
-    assert np.allclose(actual_concs["below_structural"], expected_concs_below_struct)
+    assert np.allclose(actual_concs, expected_concs)
 
 
 def test_calculate_litter_input_nitrogen_ratios(dummy_litter_data, litter_inputs):
@@ -205,23 +189,20 @@ def test_calculate_litter_input_nitrogen_ratios(dummy_litter_data, litter_inputs
         calculate_litter_input_nitrogen_ratios,
     )
 
-    expected_c_n_ratios = {
-        "woody": [60.7, 57.9, 73.1, 55.1],
-        "below_metabolic": [11.449427, 13.09700, 14.48056, 11.04331],
-        "below_structural": [57.24714, 65.48498, 72.40281, 55.21655],
-        "above_metabolic": [8.4871511, 14.7283297, 12.1855116, 11.3024309],
-        "above_structural": [42.52031784, 74.63602461, 63.15513757, 57.82346359],
-    }
+    expected_c_n_ratios = [
+        [8.4871511, 14.7283297, 12.1855116, 11.3024309],
+        [42.52031784, 74.63602461, 63.15513757, 57.82346359],
+        [60.7, 57.9, 73.1, 55.1],
+        [11.449427, 13.09700, 14.48056, 11.04331],
+        [57.24714, 65.48498, 72.40281, 55.21655],
+    ]
 
     actual_c_n_ratios = calculate_litter_input_nitrogen_ratios(
         litter_inputs=litter_inputs,
         struct_to_meta_nitrogen_ratio=LitterConsts.structural_to_metabolic_n_ratio,
     )
 
-    assert set(expected_c_n_ratios.keys()) == set(actual_c_n_ratios.keys())
-
-    for key in actual_c_n_ratios.keys():
-        assert np.allclose(actual_c_n_ratios[key], expected_c_n_ratios[key])
+    assert np.allclose(actual_c_n_ratios, expected_c_n_ratios)
 
 
 def test_calculate_litter_input_phosphorus_ratios(dummy_litter_data, litter_inputs):
@@ -230,23 +211,20 @@ def test_calculate_litter_input_phosphorus_ratios(dummy_litter_data, litter_inpu
         calculate_litter_input_phosphorus_ratios,
     )
 
-    expected_c_p_ratios = {
-        "woody": [856.5, 675.4, 933.2, 888.8],
-        "below_metabolic": [248.1465, 129.418998, 146.243645, 110.700999],
-        "below_structural": [1240.73249721, 647.09498874, 731.2182237, 553.50499377],
-        "above_metabolic": [220.42737, 87.282889, 152.331456, 100.160733],
-        "above_structural": [1118.30505, 490.872368, 813.926271, 415.786304],
-    }
+    expected_c_p_ratios = [
+        [220.42737, 87.282889, 152.331456, 100.160733],
+        [1118.30505, 490.872368, 813.926271, 415.786304],
+        [856.5, 675.4, 933.2, 888.8],
+        [248.1465, 129.418998, 146.243645, 110.700999],
+        [1240.73249721, 647.09498874, 731.2182237, 553.50499377],
+    ]
 
     actual_c_p_ratios = calculate_litter_input_phosphorus_ratios(
         litter_inputs=litter_inputs,
         struct_to_meta_phosphorus_ratio=LitterConsts.structural_to_metabolic_p_ratio,
     )
 
-    assert set(expected_c_p_ratios.keys()) == set(actual_c_p_ratios.keys())
-
-    for key in actual_c_p_ratios.keys():
-        assert np.allclose(actual_c_p_ratios[key], expected_c_p_ratios[key])
+    assert np.allclose(actual_c_p_ratios, expected_c_p_ratios)
 
 
 def test_calculate_nutrient_split_between_litter_pools(
@@ -527,3 +527,65 @@ def test_update(fixture_litter_model, dummy_litter_data):
     assert np.allclose(dummy_litter_data["litter_C_mineralisation_rate"], c_mineral)
     assert np.allclose(dummy_litter_data["litter_N_mineralisation_rate"], n_mineral)
     assert np.allclose(dummy_litter_data["litter_P_mineralisation_rate"], p_mineral)
+
+
+@pytest.mark.parametrize(
+    argnames="update_interval, rtol",
+    argvalues=[
+        pytest.param("48 hours", 5e-2, id="short"),
+        pytest.param("365 days", None, id="long"),
+    ],
+)
+def test_update_exponential(dummy_litter_data, update_interval, rtol):
+    """Test updating the litter pools using exponential decay."""
+    from virtual_ecosystem.core.config import Config
+    from virtual_ecosystem.core.core_components import CoreComponents
+    from virtual_ecosystem.models.litter.litter_model import LitterModel
+    from virtual_ecosystem.models.litter.pools import LITTER_POOLS
+
+    models = {}
+    for method in ("explicit", "exponential"):
+        config = Config(
+            cfg_strings="[core]\n[core.timing]\n"
+            f"update_interval = '{update_interval}'\n"
+            f"[litter]\nintegration_method = '{method}'\n"
+        )
+        models[method] = LitterModel.from_config(
+            data=deepcopy(dummy_litter_data),
+            core_components=CoreComponents(config),
+            config=config,
+        )
+    assert models["exponential"].integration_method == "exponential"
+
+    start_pools = {
+        pool: dummy_litter_data[f"litter_pool_{pool}"].to_numpy()
+        - dummy_litter_data[f"litter_consumption_{pool}"].to_numpy()
+        for pool in LITTER_POOLS
+    }
+
+    for model in models.values():
+        model.update(time_index=0)
+
+    explicit = models["explicit"].data
+    exponential = models["exponential"].data
+
+    for pool in LITTER_POOLS:
+        assert np.all(exponential[f"litter_pool_{pool}"] > 0)
+        # The exponential update only decays pools
+        assert np.all(exponential[f"litter_pool_{pool}"] <= start_pools[pool] + 1)
+        if rtol is not None:
+            assert np.allclose(
+                exponential[f"litter_pool_{pool}"],
+                explicit[f"litter_pool_{pool}"],
+                rtol=rtol,
+            )
+
+    if rtol is not None:
+        assert np.allclose(
+            exponential["litter_C_mineralisation_rate"],
+            explicit["litter_C_mineralisation_rate"],
+            rtol=rtol,
+        )
+    else:
+        # The explicit update makes fast decaying pools negative over a long interval
+        assert np.any(explicit["litter_pool_above_metabolic"] < 0)
@@ -0,0 +1,68 @@
+"""Test module for litter.pools.py.
+
+This module tests the dense array representation of the litter pools.
+"""
+
+import numpy as np
+
+
+def test_litter_pools_from_data(dummy_litter_data):
+    """Test that the litter pools are stacked in the expected order."""
+    from virtual_ecosystem.models.litter.pools import (
+        C_N_RATIO,
+        C_P_RATIO,
+        LIGNIN,
+        LITTER_POOLS,
+        LitterPools,
+    )
+
+    litter_pools = LitterPools.from_data(dummy_litter_data)
+
+    assert litter_pools.carbon.shape == (5, 4)
+    assert litter_pools.chemistry.shape == (5, 3, 4)
+
+    for index, pool in enumerate(LITTER_POOLS):
+        assert np.allclose(
+            litter_pools.carbon[index], dummy_litter_data[f"litter_pool_{pool}"]
+        )
+        assert np.allclose(
+            litter_pools.chemistry[index, C_N_RATIO],
+            dummy_litter_data[f"c_n_ratio_{pool}"],
+        )
+        assert np.allclose(
+            litter_pools.chemistry[index, C_P_RATIO],
+            dummy_litter_data[f"c_p_ratio_{pool}"],
+        )
+
+    # Metabolic pools have zero lignin
+    assert np.allclose(litter_pools.chemistry[[0, 3], LIGNIN], 0.0)
+    assert np.allclose(
+        litter_pools.chemistry[2, LIGNIN], dummy_litter_data["lignin_woody"]
+    )
+
+
+def test_litter_pools_to_data_arrays(dummy_litter_data):
+    """Test that the litter pools convert back to the original variables."""
+    from virtual_ecosystem.models.litter.pools import LitterPools
+
+    variables = LitterPools.from_data(dummy_litter_data).to_data_arrays()
+
+    # Five pools, three lignin proportions and ten nutrient ratios
+    assert len(variables) == 18
+    assert "lignin_above_metabolic" not in variables
+
+    for name, darray in variables.items():
+        assert darray.dims == ("cell_id",)
+        assert np.allclose(darray, dummy_litter_data[name])
+
+
+def test_stack_pool_variables(dummy_litter_data):
+    """Test stacking a variable for each pool."""
+    from virtual_ecosystem.models.litter.pools import stack_pool_variables
+
+    consumption = stack_pool_variables(dummy_litter_data, "litter_consumption_{}")
+
+    assert consumption.shape == (5, 4)
+    assert np.allclose(
+        consumption[4], dummy_litter_data["litter_consumption_below_structural"]
+    )
@@ -0,0 +1,121 @@
+"""Test module for soil.equilibrium.py."""
+
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def soil_rhs_and_pools(dummy_carbon_data, fixture_core_components):
+    """A right hand side function and pools in the dummy carbon data."""
+
+    from virtual_ecosystem.models.soil.constants import SoilConsts
+    from virtual_ecosystem.models.soil.integration import (
+        SoilCarbonRHS,
+        SoilRateConstants,
+    )
+
+    pool_names = [
+        str(name)
+        for name in dummy_carbon_data.data.keys()
+        if str(name).startswith("soil_c_pool_") or str(name).startswith("soil_enzyme_")
+    ]
+    soil_rhs = SoilCarbonRHS(
+        rate_constants=SoilRateConstants.from_data(
+            data=dummy_carbon_data,
+            top_soil_layer_index=(
+                fixture_core_components.layer_structure.index_topsoil_scalar
+            ),
+            constants=SoilConsts(),
+        ),
+        constants=SoilConsts(),
+        pool_names=pool_names,
+    )
+    pools = np.stack([dummy_carbon_data[name].to_numpy() for name in pool_names])
+
+    return soil_rhs, pools
+
+
+def test_SoilCarbonRHS_jacobian(soil_rhs_and_pools):
+    """Test the analytic Jacobian against finite differences."""
+
+    soil_rhs, pools = soil_rhs_and_pools
+    n_pools, n_cells = pools.shape
+    pools = pools.ravel().astype(np.float64)
+
+    jacobian = soil_rhs.jacobian(pools)
+    assert jacobian.shape == (n_cells, n_pools, n_pools)
+
+    base = soil_rhs(0.0, pools)
+    for pool in range(n_pools):
+        delta = 1e-6 * max(pools[pool * n_cells : (pool + 1) * n_cells].max(), 1e-3)
+        perturbed = pools.copy()
+        perturbed[pool * n_cells : (pool + 1) * n_cells] += delta
+        finite_diff = (soil_rhs(0.0, perturbed) - base).reshape(n_pools, n_cells)
+        assert np.allclose(
+            finite_diff.T / delta, jacobian[:, :, pool], rtol=1e-3, atol=1e-8
+        )
+
+
+def test_solve_equilibrium(soil_rhs_and_pools):
+    """Test that the steady state has no change in any pool."""
+
+    from virtual_ecosystem.models.soil.equilibrium import solve_equilibrium
+
+    soil_rhs, pools = soil_rhs_and_pools
+
+    result = solve_equilibrium(soil_rhs, pools)
+
+    # Microbes cannot persist in the last two cells, so there is no positive steady
+    # state and the initial pools are kept.
+    assert np.array_equal(result.success, [True, True, False, False])
+    assert np.allclose(result.y[:, 2:], pools[:, 2:])
+
+    steady = result.y[:, :2]
+    assert np.all(steady > 0)
+    rates = soil_rhs.subset(np.array([0, 1]))(0.0, steady.ravel())
+    assert np.allclose(rates, 0, atol=1e-12)
+
+    # Microbial biomass balances the carbon input against respiration and leaching
+    rc = soil_rhs.rate_constants.subset(np.array([0, 1]))
+    lmwc = steady[soil_rhs.pool_names.index("soil_c_pool_lmwc")]
+    microbe = steady[soil_rhs.pool_names.index("soil_c_pool_microbe")]
+    exp_microbe = (
+        rc.carbon_use_efficiency
+        * (rc.mineralisation_rate - rc.leaching_rate * lmwc)
+        / (rc.microbial_turnover * (1 - rc.carbon_use_efficiency))
+    )
+    assert np.allclose(microbe, exp_microbe)
+
+
+def test_solve_equilibrium_fallback(mocker, soil_rhs_and_pools):
+    """Test that cells that fail Newton iteration are integrated forward."""
+
+    from virtual_ecosystem.models.soil import equilibrium
+
+    soil_rhs, pools = soil_rhs_and_pools
+    newton_spy = mocker.spy(equilibrium, "newton_equilibrium")
+    integrate_spy = mocker.spy(equilibrium, "integrate_chunk")
+
+    # A single Newton iteration cannot converge, so all cells are integrated and the
+    # second Newton iteration still fails
+    result = equilibrium.solve_equilibrium(soil_rhs, pools, max_iterations=1)
+
+    assert newton_spy.call_count == 2
+    assert integrate_spy.call_count == 1
+    assert np.array_equal(result.failed_cells, [0, 1, 2, 3])
+    assert np.allclose(result.y, pools)
+    assert np.all(result.n_iterations == 2)
+
+
+def test_newton_equilibrium_failure(soil_rhs_and_pools):
+    """Test that non-finite cells fail without affecting other cells."""
+
+    from virtual_ecosystem.models.soil.equilibrium import newton_equilibrium
+
+    soil_rhs, pools = soil_rhs_and_pools
+    soil_rhs.rate_constants.uptake_rate[0] = np.nan
+
+    result = newton_equilibrium(soil_rhs, pools)
+
+    assert np.array_equal(result.failed_cells, [0, 2, 3])
+    assert result.n_iterations[0] == 1
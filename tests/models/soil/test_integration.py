@@ -0,0 +1,290 @@
+"""Test module for soil.integration.py."""
+
+import numpy as np
+import pytest
+
+
+def test_SoilCarbonRHS(dummy_carbon_data, fixture_core_components):
+    """Test that the precalculated soil model matches the full soil model."""
+
+    from virtual_ecosystem.core.constants import CoreConsts
+    from virtual_ecosystem.models.soil.constants import SoilConsts
+    from virtual_ecosystem.models.soil.integration import (
+        SoilCarbonRHS,
+        SoilRateConstants,
+    )
+    from virtual_ecosystem.models.soil.soil_model import construct_full_soil_model
+
+    top_soil_layer_index = fixture_core_components.layer_structure.index_topsoil_scalar
+    pool_names = [
+        str(name)
+        for name in dummy_carbon_data.data.keys()
+        if str(name).startswith("soil_c_pool_") or str(name).startswith("soil_enzyme_")
+    ]
+    pools = np.concatenate([dummy_carbon_data[name].to_numpy() for name in pool_names])
+
+    soil_rhs = SoilCarbonRHS(
+        rate_constants=SoilRateConstants.from_data(
+            data=dummy_carbon_data,
+            top_soil_layer_index=top_soil_layer_index,
+            constants=SoilConsts(),
+        ),
+        constants=SoilConsts(),
+        pool_names=pool_names,
+    )
+    assert soil_rhs.no_cells == 4
+
+    expected = construct_full_soil_model(
+        0.0,
+        pools=pools,
+        data=dummy_carbon_data,
+        no_cells=4,
+        top_soil_layer_index=top_soil_layer_index,
+        delta_pools_ordered={name: np.array([]) for name in pool_names},
+        model_constants=SoilConsts(),
+        core_constants=CoreConsts(),
+    )
+
+    rate_of_change = soil_rhs(0.0, pools)
+    assert np.allclose(rate_of_change, expected)
+
+    # Each call returns a new array, so that integrators can keep earlier results
+    assert soil_rhs(0.0, pools) is not rate_of_change
+
+    # The pool order is taken from the pool names
+    reversed_rhs = SoilCarbonRHS(
+        soil_rhs.rate_constants, SoilConsts(), list(reversed(pool_names))
+    )
+    reversed_pools = pools.reshape(len(pool_names), 4)[::-1].ravel()
+    assert np.allclose(
+        reversed_rhs(0.0, reversed_pools).reshape(len(pool_names), 4)[::-1].ravel(),
+        expected,
+    )
+
+
+@pytest.fixture
+def soil_rhs_and_pools(dummy_carbon_data, fixture_core_components):
+    """A right hand side function and pools in the dummy carbon data."""
+
+    from virtual_ecosystem.models.soil.constants import SoilConsts
+    from virtual_ecosystem.models.soil.integration import (
+        SoilCarbonRHS,
+        SoilRateConstants,
+    )
+
+    pool_names = [
+        str(name)
+        for name in dummy_carbon_data.data.keys()
+        if str(name).startswith("soil_c_pool_") or str(name).startswith("soil_enzyme_")
+    ]
+    soil_rhs = SoilCarbonRHS(
+        rate_constants=SoilRateConstants.from_data(
+            data=dummy_carbon_data,
+            top_soil_layer_index=(
+                fixture_core_components.layer_structure.index_topsoil_scalar
+            ),
+            constants=SoilConsts(),
+        ),
+        constants=SoilConsts(),
+        pool_names=pool_names,
+    )
+    pools = np.stack([dummy_carbon_data[name].to_numpy() for name in pool_names])
+
+    return soil_rhs, pools
+
+
+def test_SoilCarbonRHS_subset(soil_rhs_and_pools):
+    """Test that a subset of the right hand side function matches the full function."""
+
+    soil_rhs, pools = soil_rhs_and_pools
+    cells = np.array([1, 3])
+
+    subset_rhs = soil_rhs.subset(cells)
+    assert subset_rhs.no_cells == 2
+
+    expected = soil_rhs(0.0, pools.ravel()).reshape(pools.shape)[:, cells]
+    assert np.allclose(subset_rhs(0.0, pools[:, cells].ravel()), expected.ravel())
+
+
+def test_integrate_per_cell(soil_rhs_and_pools):
+    """Test that per cell integration matches integrating all cells together."""
+
+    from scipy.integrate import solve_ivp
+
+    from virtual_ecosystem.models.soil.integration import integrate_per_cell
+
+    soil_rhs, pools = soil_rhs_and_pools
+
+    result = integrate_per_cell(soil_rhs, pools, t_end=30.0, rtol=1e-6, atol=1e-9)
+    expected = solve_ivp(
+        soil_rhs, (0.0, 30.0), pools.ravel(), method="RK45", rtol=1e-6, atol=1e-9
+    )
+
+    assert np.all(result.success)
+    assert result.failed_cells.size == 0
+    assert result.y.shape == pools.shape
+    assert np.all(result.n_steps > 0)
+    assert np.allclose(result.y.ravel(), expected.y[:, -1], rtol=1e-4)
+
+
+def test_integrate_per_cell_failure(soil_rhs_and_pools):
+    """Test that a failing cell does not affect the integration of other cells."""
+
+    from virtual_ecosystem.models.soil.integration import integrate_per_cell
+
+    soil_rhs, pools = soil_rhs_and_pools
+    soil_rhs.rate_constants.uptake_rate[2] = np.nan
+
+    result = integrate_per_cell(soil_rhs, pools, t_end=30.0)
+    cells = np.array([0, 1, 3])
+    expected = integrate_per_cell(soil_rhs.subset(cells), pools[:, cells], 30.0)
+
+    assert np.array_equal(result.success, [True, True, False, True])
+    assert np.array_equal(result.failed_cells, [2])
+    assert np.allclose(result.y[:, cells], expected.y)
+
+
+def test_SoilRateConstants_to_array(soil_rhs_and_pools):
+    """Test that rate constants are recovered from an array."""
+
+    from dataclasses import fields
+
+    from virtual_ecosystem.models.soil.integration import SoilRateConstants
+
+    soil_rhs, _ = soil_rhs_and_pools
+    array = soil_rhs.rate_constants.to_array()
+    assert array.shape == (len(fields(SoilRateConstants)), 4)
+
+    rate_constants = SoilRateConstants.from_array(array)
+    for fld in fields(SoilRateConstants):
+        assert np.allclose(
+            getattr(rate_constants, fld.name),
+            getattr(soil_rhs.rate_constants, fld.name),
+        )
+
+
+@pytest.mark.parametrize(argnames="method", argvalues=["RK45", "BDF", "per_cell"])
+@pytest.mark.parametrize(argnames="n_workers", argvalues=[2, 3])
+def test_integrate_parallel(soil_rhs_and_pools, method, n_workers):
+    """Test that integrating chunks in parallel matches integrating all cells."""
+
+    from virtual_ecosystem.models.soil.integration import (
+        integrate_chunk,
+        integrate_parallel,
+    )
+
+    soil_rhs, pools = soil_rhs_and_pools
+
+    result = integrate_parallel(
+        soil_rhs, pools, t_end=30.0, method=method, n_workers=n_workers
+    )
+    expected = integrate_chunk(soil_rhs, pools, t_end=30.0, method=method)
+
+    assert np.all(result.success)
+    assert result.y.shape == pools.shape
+    assert np.allclose(result.y, expected.y, rtol=1e-2, atol=1e-5)
+
+
+def test_integrate_parallel_worker_pool(soil_rhs_and_pools):
+    """Test that a pool of worker processes is reused across integrations."""
+
+    from virtual_ecosystem.models.soil.integration import (
+        integrate_parallel,
+        make_worker_pool,
+    )
+
+    soil_rhs, pools = soil_rhs_and_pools
+
+    worker_pool = make_worker_pool(2)
+    # Workers are not forked from the possibly multithreaded main process
+    assert worker_pool._mp_context.get_start_method() in ("forkserver", "spawn")
+
+    try:
+        expected = integrate_parallel(soil_rhs, pools, t_end=30.0, n_workers=2)
+        for _ in range(2):
+            result = integrate_parallel(
+                soil_rhs, pools, t_end=30.0, n_workers=2, executor=worker_pool
+            )
+            assert np.all(result.success)
+            assert np.allclose(result.y, expected.y)
+    finally:
+        worker_pool.shutdown()
+
+
+def test_integrate_parallel_failure(soil_rhs_and_pools):
+    """Test that failures in parallel chunks are reported for each cell."""
+
+    from virtual_ecosystem.models.soil.integration import integrate_parallel
+
+    soil_rhs, pools = soil_rhs_and_pools
+    soil_rhs.rate_constants.uptake_rate[3] = np.nan
+
+    result = integrate_parallel(
+        soil_rhs, pools, t_end=30.0, method="per_cell", n_workers=2
+    )
+
+    assert np.array_equal(result.failed_cells, [3])
+    assert np.all(np.isfinite(result.y[:, :3]))
+
+
+def test_integrate_chunk_failure(mocker, soil_rhs_and_pools):
+    """Test that a solve_ivp failure is reported for all cells in a chunk."""
+
+    from scipy.optimize import OptimizeResult
+
+    from virtual_ecosystem.models.soil import integration
+
+    soil_rhs, pools = soil_rhs_and_pools
+    mocker.patch.object(
+        integration,
+        "solve_ivp",
+        return_value=OptimizeResult(
+            success=False,
+            message="Example failure",
+            t=np.array([0.0]),
+            y=pools.reshape(-1, 1),
+            nfev=2,
+            njev=0,
+        ),
+    )
+
+    result = integration.integrate_chunk(soil_rhs, pools, t_end=30.0)
+
+    assert np.array_equal(result.failed_cells, [0, 1, 2, 3])
+    assert result.messages == ["Example failure"]
+
+
+@pytest.mark.parametrize(argnames="method", argvalues=["RK45", "BDF", "per_cell"])
+def test_integrate_chunk_warm_start(soil_rhs_and_pools, method):
+    """Test that integration reports solver statistics and can be warm started."""
+
+    from virtual_ecosystem.models.soil.integration import integrate_chunk
+
+    soil_rhs, pools = soil_rhs_and_pools
+
+    cold = integrate_chunk(soil_rhs, pools, t_end=30.0, method=method)
+    assert np.all(cold.n_steps > 0)
+    assert np.all(cold.n_evaluations > cold.n_steps)
+    assert np.all(cold.n_jacobians >= 0)
+    assert np.all(cold.last_step > 0)
+
+    # Starting with the last step size of the previous integration gives the same
+    # result without needing more steps.
+    warm = integrate_chunk(
+        soil_rhs, cold.y, t_end=30.0, method=method, first_step=cold.last_step
+    )
+    repeat = integrate_chunk(soil_rhs, cold.y, t_end=30.0, method=method)
+    assert np.allclose(warm.y, repeat.y, rtol=1e-2, atol=1e-5)
+    assert np.sum(warm.n_evaluations) <= np.sum(repeat.n_evaluations)
+
+
+def test_get_first_step():
+    """Test the selection of a single first step size."""
+
+    from virtual_ecosystem.models.soil.integration import get_first_step
+
+    assert get_first_step(None, 10.0) is None
+    assert get_first_step(np.array([0.5, np.nan]), 10.0) is None
+    assert get_first_step(np.array([0.5, 0.0]), 10.0) is None
+    assert get_first_step(np.array([0.5, 2.0]), 10.0) == 0.5
+    assert get_first_step(np.array([50.0, 20.0]), 10.0) == 10.0
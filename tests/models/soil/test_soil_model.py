@@ -1,7 +1,7 @@
 """Test module for soil_model.py."""
 
 from contextlib import nullcontext as does_not_raise
-from logging import CRITICAL, DEBUG, ERROR, INFO
+from logging import CRITICAL, DEBUG, ERROR, INFO, WARNING
 
 import numpy as np
 import pytest
@@ -328,6 +328,196 @@ def test_integrate_soil_model(
     log_check(caplog, expected_log)
 
 
+@pytest.mark.parametrize(
+    argnames="integration_method", argvalues=["RK45", "Radau", "BDF", "LSODA"]
+)
+def test_integrate_soil_model_methods(
+    mocker,
+    dummy_carbon_data,
+    fixture_soil_model,
+    fixture_soil_config,
+    fixture_soil_core_components,
+    integration_method,
+):
+    """Test that the configured integration methods give consistent results."""
+
+    from virtual_ecosystem.models.soil import soil_model
+
+    fixture_soil_config["soil"]["integration_method"] = integration_method
+    model = soil_model.SoilModel.from_config(
+        data=dummy_carbon_data,
+        core_components=fixture_soil_core_components,
+        config=fixture_soil_config,
+    )
+    assert model.integration_method == integration_method
+
+    solver_spy = mocker.spy(soil_model, "solve_ivp")
+    expected = fixture_soil_model.integrate()
+    new_pools = model.integrate()
+
+    # Only the finite difference Jacobian methods use the sparsity structure
+    assert ("jac_sparsity" in solver_spy.call_args_list[1].kwargs) == (
+        integration_method in ("Radau", "BDF")
+    )
+    for pool_name, values in expected.items():
+        assert np.allclose(new_pools[pool_name], values, rtol=1e-3)
+
+
+def test_integrate_soil_model_per_cell(
+    caplog,
+    dummy_carbon_data,
+    fixture_soil_model,
+    fixture_soil_config,
+    fixture_soil_core_components,
+):
+    """Test integrating the soil pools with a separate step size for each cell."""
+
+    from virtual_ecosystem.models.soil.soil_model import SoilModel
+
+    fixture_soil_config["soil"]["integration_method"] = "per_cell"
+    model = SoilModel.from_config(
+        data=dummy_carbon_data,
+        core_components=fixture_soil_core_components,
+        config=fixture_soil_config,
+    )
+
+    expected = fixture_soil_model.integrate()
+    new_pools = model.integrate()
+    for pool_name, values in expected.items():
+        assert np.allclose(new_pools[pool_name], values, rtol=1e-3)
+
+    # A failure in a single cell is reported by cell id
+    dummy_carbon_data["soil_c_pool_lmwc"][1] = np.nan
+    caplog.clear()
+    with pytest.raises(IntegrationError):
+        model.integrate()
+
+    log_check(
+        caplog,
+        expected_log=((ERROR, "Integration of soil module failed for grid cells: 1"),),
+    )
+
+
+@pytest.mark.parametrize(argnames="integration_method", argvalues=["RK45", "per_cell"])
+def test_integrate_soil_model_parallel(
+    dummy_carbon_data,
+    fixture_soil_model,
+    fixture_soil_config,
+    fixture_soil_core_components,
+    integration_method,
+):
+    """Test integrating chunks of grid cells in parallel."""
+
+    from virtual_ecosystem.models.soil.soil_model import SoilModel
+
+    fixture_soil_config["soil"]["integration_method"] = integration_method
+    fixture_soil_config["soil"]["integration_workers"] = 2
+    model = SoilModel.from_config(
+        data=dummy_carbon_data,
+        core_components=fixture_soil_core_components,
+        config=fixture_soil_config,
+    )
+    assert model.integration_workers == 2
+    worker_pool = model.worker_pool
+    assert worker_pool is not None
+
+    expected = fixture_soil_model.integrate()
+    new_pools = model.integrate()
+    for pool_name, values in expected.items():
+        assert np.allclose(new_pools[pool_name], values, rtol=1e-3)
+
+    # The same worker processes are used for each integration until cleanup
+    model.integrate()
+    assert model.worker_pool is worker_pool
+    model.cleanup()
+    assert model.worker_pool is None
+
+
+def test_spinup_soil_model(
+    caplog, dummy_carbon_data, fixture_soil_config, fixture_soil_core_components
+):
+    """Test that spin up sets the soil pools to their steady state."""
+
+    from virtual_ecosystem.models.soil.soil_model import SOIL_POOLS, SoilModel
+
+    fixture_soil_config["soil"]["spinup_to_equilibrium"] = True
+    model = SoilModel.from_config(
+        data=dummy_carbon_data,
+        core_components=fixture_soil_core_components,
+        config=fixture_soil_config,
+    )
+    assert model.spinup_to_equilibrium
+
+    initial_pools = {
+        name: dummy_carbon_data[name].to_numpy().copy() for name in SOIL_POOLS
+    }
+
+    caplog.clear()
+    model.spinup()
+
+    # Microbes cannot persist in the last two cells, which have no steady state
+    log_check(
+        caplog,
+        expected_log=(
+            (WARNING, "Soil carbon steady state not found for grid cells: 2, 3"),
+            (INFO, "Soil carbon pools spun up to steady state"),
+        ),
+        subset=slice(0, 2, None),
+    )
+
+    # The pools in the spun up cells do not change when the model is integrated
+    new_pools = model.integrate()
+    for name, values in new_pools.items():
+        assert np.allclose(values[:2], dummy_carbon_data[name][:2], rtol=1e-4)
+        assert np.allclose(dummy_carbon_data[name][2:], initial_pools[name][2:])
+
+
+def test_spinup_soil_model_disabled(caplog, dummy_carbon_data, fixture_soil_model):
+    """Test that spin up leaves the soil pools unchanged by default."""
+
+    from virtual_ecosystem.models.soil.soil_model import SOIL_POOLS
+
+    assert not fixture_soil_model.spinup_to_equilibrium
+
+    initial_pools = {
+        name: dummy_carbon_data[name].to_numpy().copy() for name in SOIL_POOLS
+    }
+
+    caplog.clear()
+    fixture_soil_model.spinup()
+
+    assert not caplog.records
+    for name, values in initial_pools.items():
+        assert np.array_equal(dummy_carbon_data[name], values)
+
+
+def test_update_soil_model_solver_statistics(
+    mocker, dummy_carbon_data, fixture_soil_model
+):
+    """Test that solver statistics are stored and used to warm start updates."""
+
+    from virtual_ecosystem.models.soil import soil_model
+
+    solver_spy = mocker.spy(soil_model, "solve_ivp")
+
+    fixture_soil_model.update(time_index=0)
+    assert solver_spy.call_args.kwargs["first_step"] is None
+    assert solver_spy.call_args.kwargs["rtol"] == 1e-3
+    assert solver_spy.call_args.kwargs["atol"] == 1e-6
+
+    for name in fixture_soil_model.vars_populated_by_first_update:
+        assert name in fixture_soil_model.vars_updated
+        assert dummy_carbon_data[name].dims == ("cell_id",)
+    assert np.all(dummy_carbon_data["soil_integration_steps"] > 0)
+    assert np.all(dummy_carbon_data["soil_integration_evaluations"] > 0)
+    last_step = dummy_carbon_data["soil_integration_step_size"].to_numpy()
+    assert np.all(last_step > 0)
+
+    # The next update starts from the last accepted step size
+    fixture_soil_model.update(time_index=1)
+    assert solver_spy.call_args.kwargs["first_step"] == last_step.min()
+
+
 def test_order_independance(
     dummy_carbon_data,
     fixture_soil_model,
@@ -471,3 +661,23 @@ def test_make_slices():
     assert len(slices) == no_pools
     assert slices[0] == slice(0, 4)
     assert slices[1] == slice(4, 8)
+
+
+def test_make_jacobian_sparsity():
+    """Test that the Jacobian sparsity structure only couples pools within cells."""
+    from virtual_ecosystem.models.soil.soil_model import (
+        make_jacobian_sparsity,
+        make_slices,
+    )
+
+    no_cells = 4
+    no_pools = 3
+
+    sparsity = make_jacobian_sparsity(no_cells, no_pools).toarray()
+
+    assert sparsity.shape == (12, 12)
+    assert sparsity.sum() == no_cells * no_pools**2
+    # Every block between two pools is diagonal
+    for row_slice in make_slices(no_cells, no_pools):
+        for col_slice in make_slices(no_cells, no_pools):
+            assert np.array_equal(sparsity[row_slice, col_slice], np.eye(no_cells))
@@ -61,6 +61,7 @@ def test_ve_run(capsys, mocker):
             with open(logfile) as logfile_io:
                 contents = logfile_io.readlines()
                 assert "Virtual Ecosystem model run completed!" in contents[-1]
+                assert any("All models successfully spun up." in ln for ln in contents)
 
         except Exception as excep:
             # If the code above fails then tidy up the logger to restore normal stream
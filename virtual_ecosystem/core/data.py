@@ -107,6 +107,49 @@ structure of the data configuration section within those TOML files is as follow
     [[core.data.variable]]
     var_name="elev"
 
+The variables are grouped by file, so that each file is only opened once, and different
+files are read and validated concurrently using a pool of threads.
+
+Variables that take the same value in every grid cell can be set using
+``[[core.data.constant]]`` entries, which provide a ``var_name`` and a numeric
+``value``. These are stored using
+:meth:`~virtual_ecosystem.core.data.Data.set_constant` as read-only broadcast views of
+the value and are written to output files as a single value.
+
+The ``core.data.prefetch_forcing`` option can be set to ``true`` to extract the
+forcing data for the next time step in the background while a time step is running (see
+:meth:`~virtual_ecosystem.core.data.Data.get_forcing_slice`).
+
+The ``core.data.windowed_loading`` option can be set to ``true`` to only read the data
+from each file that falls within the bounds of the simulation grid and the simulation
+period, allowing a simulation to use files covering a larger region or period.
+
+The ``core.data.input_cache_folder`` option can be set to a folder used to store
+validated input data (see :mod:`~virtual_ecosystem.core.input_cache`). Later runs
+loading the same variables from unchanged files onto the same grid will then load the
+validated data directly from that cache.
+
+Variables provided on a different grid, such as coarse resolution climate forcing, can
+be regridded onto the simulation grid while loading by setting ``regrid = true`` in
+their ``[[core.data.variable]]`` entry (see :mod:`~virtual_ecosystem.core.regrid`). The
+regridding weights are calculated once for each source grid, and the
+``core.data.regrid_weights_folder`` option can be set to store the weights for use in
+later runs.
+
+The ``core.data.drop_unused_variables`` option can be set to ``true`` to skip loading
+configured variables that are not used by any of the configured models (see
+:func:`~virtual_ecosystem.core.variables.get_model_variables`), so that they do not
+take up memory during a simulation.
+
+The ``core.data.trace_data_access`` option can be set to ``true`` to record and report
+the variables read and written by each model during a simulation (see
+:mod:`~virtual_ecosystem.core.data_tracing`).
+
+The ``core.data.lazy_loading`` option can be set to ``true`` to load configured
+variables lazily (see :mod:`~virtual_ecosystem.core.readers`). The variables are
+then validated using only their coordinates and the values for each time step are only
+read from file when a model uses them.
+
 Data configurations must not contain repeated data variable names. NOTE: At the moment,
 ```core.data.variable``` tags cannot be used across multiple toml config files without
 causing ```ConfigurationError: Duplicated entries in config files: core.data.variable```
@@ -120,7 +163,11 @@ file.
 
 """  # noqa: D205
 
+from collections.abc import Collection
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import replace
 from pathlib import Path
+from threading import Lock
 from typing import Any
 
 import dask
@@ -129,9 +176,16 @@ from xarray import DataArray, Dataset, open_mfdataset
 
 from virtual_ecosystem.core.axes import AXIS_VALIDATORS, validate_dataarray
 from virtual_ecosystem.core.config import Config, ConfigurationError
+from virtual_ecosystem.core.core_components import ModelTiming
 from virtual_ecosystem.core.grid import Grid
+from virtual_ecosystem.core.input_cache import (
+    InputCache,
+    get_file_hash,
+    get_input_cache_key,
+)
 from virtual_ecosystem.core.logger import LOGGER
-from virtual_ecosystem.core.readers import load_to_dataarray
+from virtual_ecosystem.core.readers import DataWindow, iter_file_dataarrays
+from virtual_ecosystem.core.regrid import RegriddingWeightsCache, regrid_dataarray
 from virtual_ecosystem.core.utils import check_outfile
 
 # There are ongoing xarray issues with NetCDF not being thread safe and this causes
@@ -180,6 +234,24 @@ class Data:
         subclass applied to that axis. If no validator was applied, the entry for that
         core axis will be ``None``.
         """
+        self.constants: dict[str, DataArray] = {}
+        """The compact values of variables stored as broadcast constants.
+
+        See :meth:`~virtual_ecosystem.core.data.Data.set_constant`.
+        """
+        self.prefetch_forcing: bool = False
+        """Should forcing slices for the next time step be extracted in the background.
+
+        See :meth:`~virtual_ecosystem.core.data.Data.get_forcing_slice`.
+        """
+
+        # Cache of forcing slices for the current time step and any slices being
+        # prefetched for the next time step.
+        self._forcing_time_index: int | None = None
+        self._forcing_cache: dict[str, DataArray | Future] = {}
+        self._forcing_prefetch_index: int | None = None
+        self._forcing_prefetch: dict[str, Future] = {}
+        self._prefetch_executor: ThreadPoolExecutor | None = None
 
     def __repr__(self) -> str:
         """Returns a representation of a Data instance."""
@@ -224,8 +296,78 @@ class Data:
 
         # Validate and store the data array
         value, valid_dict = validate_dataarray(value=value, grid=self.grid)
+        self._store_validated(key, value, valid_dict)
+
+    def _store_validated(
+        self, key: str, value: DataArray, valid_dict: dict[str, str | None]
+    ) -> None:
+        """Store an already validated data array in a Data instance.
+
+        Args:
+            key: The name to store the data under
+            value: The validated DataArray to be stored
+            valid_dict: The validation details for the DataArray
+        """
+
         self.data[key] = value
         self.variable_validation[key] = valid_dict
+        self.constants.pop(key, None)
+
+        # Discard any forcing slices extracted from previous data for this key
+        self._forcing_cache.pop(key, None)
+        prefetched = self._forcing_prefetch.pop(key, None)
+        if prefetched is not None:
+            prefetched.cancel()
+
+    def set_constant(self, key: str, value: float | DataArray) -> None:
+        """Store a constant value broadcast across the grid cells.
+
+        The value can be a scalar or a DataArray that does not vary across grid cells,
+        such as a vector of values for each vertical layer. The stored variable adds a
+        final ``cell_id`` dimension to the value, but this is a read-only broadcast view
+        of the value and so does not allocate memory for each cell. Attempting to
+        update the variable in place will raise an error, but it can be replaced as
+        normal.
+
+        The compact value is recorded in
+        :attr:`~virtual_ecosystem.core.data.Data.constants` and is written to output
+        files in place of the broadcast variable.
+
+        Args:
+            key: The name to store the data under
+            value: The constant value
+        """
+
+        compact = value if isinstance(value, DataArray) else DataArray(value)
+
+        if "cell_id" in compact.dims:
+            to_raise = ValueError(f"Constant value for '{key}' varies across cell_id")
+            LOGGER.critical(to_raise)
+            raise to_raise
+
+        self[key] = compact.expand_dims({"cell_id": self.grid.n_cells}, axis=-1)
+        self.constants[key] = compact
+
+    def _compact_constants(self, dataset: Dataset) -> Dataset:
+        """Replace broadcast constants in a dataset with their compact values.
+
+        The replaced variables have a ``broadcast_dims`` attribute giving the dimension
+        that the value is broadcast across.
+
+        Args:
+            dataset: A dataset of variables taken from the Data instance.
+        """
+
+        compacted = {
+            key: value.assign_attrs(broadcast_dims="cell_id")
+            for key, value in self.constants.items()
+            if key in dataset.data_vars
+        }
+
+        if not compacted:
+            return dataset
+
+        return dataset.drop_vars(list(compacted)).assign(compacted)
 
     def __getitem__(self, key: str) -> DataArray:
         """Get a given data variable from a Data instance.
@@ -289,17 +431,142 @@ class Data:
 
         return True
 
-    def load_data_config(self, config: Config) -> None:
+    def get_forcing_slice(self, var_name: str, time_index: int) -> DataArray:
+        """Get the values of a time indexed variable for a single time step.
+
+        Forcing variables are stored with a ``time_index`` dimension and several models
+        need the same time slices within a single update. This method extracts the slice
+        for a variable once per time step as a contiguous in-memory array, and then
+        returns that same cached slice to all subsequent requests for that time step.
+        This is particularly important for lazily loaded data (see
+        :mod:`~virtual_ecosystem.core.readers`), where each extraction reads from file.
+        The cached slices are shared, so they must not be modified in place.
+
+        When a different time step is requested, the slices for the previous time step
+        are discarded. Slices are also discarded if a variable is replaced using
+        :meth:`~virtual_ecosystem.core.data.Data.__setitem__`.
+
+        If :attr:`~virtual_ecosystem.core.data.Data.prefetch_forcing` is set, each
+        request for a variable also starts the extraction of the slice for the next time
+        step in a background thread, so that it is ready when the next update starts.
+
+        Args:
+            var_name: The name of a variable with a ``time_index`` dimension
+            time_index: The index of the time step to extract
+
+        Returns:
+            A DataArray of the variable values for the time step.
+        """
+
+        if time_index != self._forcing_time_index:
+            self._advance_forcing_cache(time_index)
+
+        cached = self._forcing_cache.get(var_name)
+        if cached is None:
+            time_slice = _extract_forcing_slice(self.data[var_name], time_index)
+        elif isinstance(cached, Future):
+            time_slice = cached.result()
+        else:
+            time_slice = cached
+        self._forcing_cache[var_name] = time_slice
+
+        if self.prefetch_forcing:
+            self._prefetch_forcing_slice(var_name, time_index + 1)
+
+        return time_slice
+
+    def _advance_forcing_cache(self, time_index: int) -> None:
+        """Move the forcing slice cache on to a new time step.
+
+        Slices for the previous time step are discarded. Any prefetched slices for the
+        new time step are used to populate the cache and prefetched slices for any other
+        time step are cancelled.
+
+        Args:
+            time_index: The index of the new time step.
+        """
+
+        if self._forcing_prefetch_index == time_index:
+            self._forcing_cache = dict(self._forcing_prefetch)
+        else:
+            for prefetched in self._forcing_prefetch.values():
+                prefetched.cancel()
+            self._forcing_cache = {}
+
+        self._forcing_time_index = time_index
+        self._forcing_prefetch_index = None
+        self._forcing_prefetch = {}
+
+    def _prefetch_forcing_slice(self, var_name: str, time_index: int) -> None:
+        """Start extracting a forcing slice in a background thread.
+
+        Args:
+            var_name: The name of a variable with a ``time_index`` dimension
+            time_index: The index of the time step to extract
+        """
+
+        if var_name in self._forcing_prefetch:
+            return
+
+        darray = self.data[var_name]
+        if time_index >= darray.sizes["time_index"]:
+            return
+
+        if self._prefetch_executor is None:
+            self._prefetch_executor = ThreadPoolExecutor(max_workers=1)
+
+        self._forcing_prefetch_index = time_index
+        self._forcing_prefetch[var_name] = self._prefetch_executor.submit(
+            _extract_forcing_slice, darray, time_index
+        )
+
+    def close(self) -> None:
+        """Release the resources used to cache forcing slices.
+
+        Any pending prefetches are cancelled, the background thread used for
+        prefetching is shut down and the cached forcing slices are discarded. The
+        instance can still be used after closing, and a new background thread is started
+        if another prefetch is requested.
+        """
+
+        for prefetched in self._forcing_prefetch.values():
+            prefetched.cancel()
+
+        if self._prefetch_executor is not None:
+            self._prefetch_executor.shutdown(wait=True)
+            self._prefetch_executor = None
+
+        self._forcing_time_index = None
+        self._forcing_cache = {}
+        self._forcing_prefetch_index = None
+        self._forcing_prefetch = {}
+
+    def load_data_config(
+        self,
+        config: Config,
+        model_timing: ModelTiming | None = None,
+        used_variables: Collection[str] | None = None,
+    ) -> None:
         """Setup the simulation data from a user configuration.
 
         This is a method is used to validate a provided user data configuration and
         populate the Data instance object from the provided data sources. The
         data_config dictionary can contain a 'variable' key containing an array of
         dictionaries providing the path to the file (``file``) and the
-        name of the variable within the file (``var_name``).
+        name of the variable within the file (``var_name``). If the ``lazy_loading``
+        option is set, variables are loaded as lazy chunked arrays. If the
+        ``windowed_loading`` option is set, only the data within the bounds of the grid
+        and the simulation period given by ``model_timing`` is read from each file.
+        If the ``drop_unused_variables`` option is set, configured variables that are
+        not included in ``used_variables`` are not loaded.
 
         Args:
             config: A validated Virtual Ecosystem model configuration object.
+            model_timing: The timing of the simulation, used to restrict the time steps
+                read from files when windowed loading is used.
+            used_variables: The names of the variables used by the configured models,
+                used to skip unused variables when the ``drop_unused_variables`` option
+                is set.
         """
 
         LOGGER.info("Loading data from configuration")
@@ -323,6 +590,24 @@ class Data:
             msg = "No data sources defined in the data configuration."
             LOGGER.warning(msg)
 
+        # Remove configured variables that are not used by any model
+        if data_config["drop_unused_variables"] and used_variables is not None:
+            data_config = self._drop_unused_config_variables(
+                data_config, set(used_variables)
+            )
+
+        self.prefetch_forcing = data_config["prefetch_forcing"]
+        input_cache = (
+            InputCache(Path(data_config["input_cache_folder"]))
+            if "input_cache_folder" in data_config
+            else None
+        )
+        window = (
+            DataWindow.from_grid(self.grid, model_timing)
+            if data_config["windowed_loading"]
+            else None
+        )
+
         # Handle variables
         if "variable" in data_config:
             # Check what name the data will be saved under but do then carry on to check
@@ -336,25 +621,62 @@ class Data:
                 LOGGER.error("Duplicate variable names in data configuration.")
                 clean_load = False
 
-            # Load data from each data source
+            # Group the variables by file, preserving the configuration order, so that
+            # each file is only opened once.
+            file_groups: dict[Path, list[str]] = {}
             for each_var in data_config["variable"]:
-                # Attempt to load the file, trapping exceptions as critical logger
-                # messages and defer failure until the whole configuration has been
-                # processed
-                try:
-                    self[each_var["var_name"]] = load_to_dataarray(
-                        file=Path(each_var["file"]),
-                        var_name=each_var["var_name"],
+                file_groups.setdefault(Path(each_var["file"]), []).append(
+                    each_var["var_name"]
+                )
+
+            # Variables to be regridded onto the grid while loading
+            regrid_vars = {
+                each_var["var_name"]
+                for each_var in data_config["variable"]
+                if each_var.get("regrid", False)
+            }
+            weights_cache = RegriddingWeightsCache(
+                Path(data_config["regrid_weights_folder"])
+                if "regrid_weights_folder" in data_config
+                else None
+            )
+
+            # Load and validate the files concurrently. Errors are logged and failure
+            # is deferred until the whole configuration has been processed.
+            store_lock = Lock()
+            with ThreadPoolExecutor() as executor:
+                file_loads = [
+                    executor.submit(
+                        self._load_file_variables,
+                        file=file,
+                        var_names=var_names,
+                        lazy=data_config["lazy_loading"],
+                        window=window,
+                        input_cache=input_cache,
+                        store_lock=store_lock,
+                        regrid_vars=regrid_vars,
+                        weights_cache=weights_cache,
                     )
+                    for file, var_names in file_groups.items()
+                ]
+                for file_load in file_loads:
+                    clean_load &= file_load.result()
+
+            # Files complete in any order, so restore the configuration order of the
+            # variables, which is used when resolving the model execution order.
+            loaded_vars = [var for var in data_var_names if var in self.data.data_vars]
+            other_vars = [var for var in self.data.data_vars if var not in loaded_vars]
+            self.data = self.data[other_vars + list(dict.fromkeys(loaded_vars))]
+
+        # Handle constants
+        if "constant" in data_config:
+            for each_const in data_config["constant"]:
+                try:
+                    self.set_constant(each_const["var_name"], each_const["value"])
                 except Exception as err:
                     LOGGER.error(str(err))
                     clean_load = False
 
-        if "constant" in data_config:
-            msg = "Data config for constants not yet implemented."
-            LOGGER.critical(msg)
-            raise NotImplementedError(msg)
-
         if "generator" in data_config:
             msg = "Data config for generators not yet implemented."
             LOGGER.critical(msg)
@@ -365,6 +687,167 @@ class Data:
             LOGGER.critical(msg)
             raise ConfigurationError(msg)
 
+    @staticmethod
+    def _drop_unused_config_variables(
+        data_config: dict[str, Any], used_variables: set[str]
+    ) -> dict[str, Any]:
+        """Remove unused variables from a data configuration.
+
+        Args:
+            data_config: The ``core.data`` section of a configuration.
+            used_variables: The names of the variables used by the configured models.
+
+        Returns:
+            A copy of the data configuration without the variable and constant entries
+            for unused variables.
+        """
+
+        data_config = dict(data_config)
+        for source_type in ("variable", "constant"):
+            if source_type not in data_config:
+                continue
+
+            unused = [
+                entry["var_name"]
+                for entry in data_config[source_type]
+                if entry["var_name"] not in used_variables
+            ]
+            if unused:
+                LOGGER.info(
+                    f"Not loading variables unused by configured models: "
+                    f"{', '.join(unused)}"
+                )
+            data_config[source_type] = [
+                entry
+                for entry in data_config[source_type]
+                if entry["var_name"] in used_variables
+            ]
+
+        return data_config
+
+    def _load_file_variables(
+        self,
+        file: Path,
+        var_names: list[str],
+        lazy: bool,
+        window: DataWindow | None,
+        input_cache: InputCache | None,
+        store_lock: Lock,
+        regrid_vars: set[str] | None = None,
+        weights_cache: RegriddingWeightsCache | None = None,
+    ) -> bool:
+        """Load and validate the configured variables from a file.
+
+        This method is run concurrently for different files by
+        :meth:`~virtual_ecosystem.core.data.Data.load_data_config`. The variables are
+        read and validated in the calling thread and then stored in the Data instance
+        while holding the store lock. If an input cache is provided, variables with a
+        cache entry for the file, grid and data window are taken from the cache and the
+        remaining variables are read from the file and then stored in the cache.
+
+        Variables listed in ``regrid_vars`` are regridded onto the grid (see
+        :mod:`~virtual_ecosystem.core.regrid`) before validation. Source cells outside
+        the grid bounds can still overlap grid cells, so these variables are not
+        subset to the spatial bounds of the data window.
+
+        Args:
+            file: The path to the data file.
+            var_names: The names of the variables to load from the file.
+            lazy: Should the variables be loaded lazily.
+            window: An optional data window used to subset the data.
+            input_cache: An optional input cache.
+            store_lock: A lock used to serialise updates to the Data instance.
+            regrid_vars: The names of variables to be regridded onto the grid.
+            weights_cache: A cache of regridding weights.
+
+        Returns:
+            A boolean showing if all of the variables loaded without errors.
+        """
+
+        clean_load = True
+        regrid_vars = set() if regrid_vars is None else regrid_vars
+        regrid_window = None if window is None else replace(window, bounds=None)
+        cache_keys: dict[str, str] = {}
+
+        # Missing files are left to the loader to report
+        if input_cache is not None and file.exists():
+            file_hash = get_file_hash(file)
+            cache_keys = {
+                var_name: get_input_cache_key(
+                    file_hash,
+                    var_name,
+                    self.grid,
+                    regrid_window if var_name in regrid_vars else window,
+                    regrid=var_name in regrid_vars,
+                )
+                for var_name in var_names
+            }
+
+            uncached = []
+            for var_name in var_names:
+                cached = input_cache.load(cache_keys[var_name], var_name, lazy=lazy)
+                if cached is None:
+                    uncached.append(var_name)
+                else:
+                    self._store_loaded(var_name, *cached, store_lock=store_lock)
+            var_names = uncached
+
+        loaded_vars = iter_file_dataarrays(
+            file=file,
+            var_names=var_names,
+            lazy=lazy,
+            window=window,
+            var_windows={var: regrid_window for var in var_names if var in regrid_vars},
+        )
+
+        for var_name, loaded in loaded_vars:
+            try:
+                if isinstance(loaded, Exception):
+                    raise loaded
+
+                darray = (
+                    regrid_dataarray(loaded, self.grid, weights_cache)
+                    if var_name in regrid_vars
+                    else loaded
+                )
+                darray, valid_dict = validate_dataarray(value=darray, grid=self.grid)
+                self._store_loaded(var_name, darray, valid_dict, store_lock=store_lock)
+
+                if var_name in cache_keys and input_cache is not None:
+                    input_cache.store(
+                        cache_keys[var_name], var_name, darray, valid_dict
+                    )
+
+            except Exception as err:
+                LOGGER.error(str(err))
+                clean_load = False
+
+        return clean_load
+
+    def _store_loaded(
+        self,
+        key: str,
+        value: DataArray,
+        valid_dict: dict[str, str | None],
+        store_lock: Lock,
+    ) -> None:
+        """Store a validated data array loaded from file while holding a lock.
+
+        Args:
+            key: The name to store the data under
+            value: The validated DataArray to be stored
+            valid_dict: The validation details for the DataArray
+            store_lock: A lock used to serialise updates to the Data instance.
+        """
+
+        with store_lock:
+            if key not in self.data.data_vars:
+                LOGGER.info(f"Adding data array for '{key}'")
+            else:
+                LOGGER.info(f"Replacing data array for '{key}'")
+
+            self._store_validated(key, value, valid_dict)
+
     def save_to_netcdf(
         self, output_file_path: Path, variables_to_save: list[str] | None = None
     ) -> None:
@@ -384,11 +867,10 @@ class Data:
         check_outfile(output_file_path)
 
         # If the file path is okay then write the model state out as a NetCDF. Should
-        # check if all variables should be saved or just the requested ones.
-        if variables_to_save:
-            self.data[variables_to_save].to_netcdf(output_file_path)
-        else:
-            self.data.to_netcdf(output_file_path)
+        # check if all variables should be saved or just the requested ones. Constant
+        # variables are written using their compact values.
+        dataset = self.data[variables_to_save] if variables_to_save else self.data
+        self._compact_constants(dataset).to_netcdf(output_file_path)
 
     def save_timeslice_to_netcdf(
         self, output_file_path: Path, variables_to_save: list[str], time_index: int
@@ -412,9 +894,10 @@ class Data:
         # saved there
         check_outfile(output_file_path)
 
-        # Loop over variables adding them to the new dataset
+        # Loop over variables adding them to the new dataset, using the compact values
+        # of constant variables
         time_slice = (
-            self.data[variables_to_save]
+            self._compact_constants(self.data[variables_to_save])
             .expand_dims({"time_index": 1})
             .assign_coords(time_index=[time_index])
         )
@@ -480,6 +963,21 @@ class Data:
         return out_path
 
 
+def _extract_forcing_slice(darray: DataArray, time_index: int) -> DataArray:
+    """Extract a single time step from a time indexed variable into memory.
+
+    Args:
+        darray: A DataArray with a ``time_index`` dimension
+        time_index: The index of the time step to extract
+
+    Returns:
+        A DataArray holding the time slice as a contiguous numpy array.
+    """
+
+    time_slice = darray.isel(time_index=time_index)
+    return time_slice.copy(data=np.ascontiguousarray(time_slice.to_numpy()))
+
+
 def merge_continuous_data_files(
     data_options: dict[str, Any], continuous_data_files: list[Path]
 ) -> None:
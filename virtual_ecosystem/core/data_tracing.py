@@ -0,0 +1,304 @@
+"""The :mod:`~virtual_ecosystem.core.data_tracing` module provides optional runtime
+tracing of the variables that each model reads from and writes to a
+:class:`~virtual_ecosystem.core.data.Data` instance.
+
+Models declare the variables that they use through their ``vars_required_for_init``,
+``vars_required_for_update``, ``vars_populated_by_init``,
+``vars_populated_by_first_update`` and ``vars_updated`` attributes, and these
+declarations are used to set up the variables registry and the model execution order
+(see :mod:`~virtual_ecosystem.core.variables`). The declarations are not enforced, so
+the :class:`~virtual_ecosystem.core.data_tracing.DataTracer` class can be used to check
+them against the actual data access of the models.
+
+The tracer replaces the ``data`` attribute of each traced model with a
+:class:`~virtual_ecosystem.core.data_tracing.TracingData` proxy. The proxy passes all
+access through to the shared Data instance, but records each variable read or written
+by the model, along with the number of bytes in the returned or stored arrays and the
+time spent in the Data access calls. The
+:meth:`~virtual_ecosystem.core.data_tracing.DataTracer.log_report` method then logs a
+table of data access statistics for each model and warns about any variables that are
+accessed but not declared by a model.
+
+Tracing is enabled in :func:`~virtual_ecosystem.main.ve_run` by setting the
+``core.data.trace_data_access`` configuration option to ``true``. Only access through
+the ``data`` attribute of a model during ``setup``, ``spinup`` and ``update`` is traced:
+references to the Data instance held by model components, and changes made in place to
+the values of a variable, are not recorded.
+"""  # noqa: D205
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, cast
+
+from tabulate import tabulate
+from xarray import DataArray
+
+from virtual_ecosystem.core.base_model import BaseModel
+from virtual_ecosystem.core.data import Data
+from virtual_ecosystem.core.logger import LOGGER
+
+
+@dataclass
+class VariableAccess:
+    """Access statistics for a single variable."""
+
+    reads: int = 0
+    """The number of times the variable was read."""
+    writes: int = 0
+    """The number of times the variable was written."""
+    bytes_read: int = 0
+    """The total size of the arrays read."""
+    bytes_written: int = 0
+    """The total size of the arrays written."""
+    access_time: float = 0.0
+    """The total time in seconds spent in Data access calls for the variable."""
+
+
+@dataclass
+class ModelDataAccess:
+    """Data access statistics for a single model."""
+
+    model_name: str
+    """The name of the model."""
+    variables: dict[str, VariableAccess] = field(default_factory=dict)
+    """Access statistics for each variable accessed by the model."""
+
+    def record(
+        self, var_name: str, darray: DataArray, start: float, write: bool = False
+    ) -> None:
+        """Record a read or write of a variable.
+
+        Args:
+            var_name: The name of the variable.
+            darray: The DataArray that was read or written.
+            start: The value of :func:`time.perf_counter` at the start of the access.
+            write: Was the variable written rather than read.
+        """
+        access = self.variables.setdefault(var_name, VariableAccess())
+        access.access_time += perf_counter() - start
+        if write:
+            access.writes += 1
+            access.bytes_written += darray.nbytes
+        else:
+            access.reads += 1
+            access.bytes_read += darray.nbytes
+
+    @property
+    def vars_read(self) -> set[str]:
+        """The names of the variables read by the model."""
+        return {name for name, access in self.variables.items() if access.reads}
+
+    @property
+    def vars_written(self) -> set[str]:
+        """The names of the variables written by the model."""
+        return {name for name, access in self.variables.items() if access.writes}
+
+
+class TracingData:
+    """A proxy for a Data instance that records the variables accessed by a model.
+
+    Reading variables using indexing or
+    :meth:`~virtual_ecosystem.core.data.Data.get_forcing_slice` and writing variables
+    using indexing, :meth:`~virtual_ecosystem.core.data.Data.add_from_dict` or
+    :meth:`~virtual_ecosystem.core.data.Data.set_constant` is recorded. All other
+    attributes and methods are passed through to the Data instance without being
+    recorded.
+
+    Args:
+        data: The Data instance to trace.
+        access: The data access statistics used to record access.
+    """
+
+    def __init__(self, data: Data, access: ModelDataAccess) -> None:
+        self._data = data
+        self._access = access
+
+    def __getattr__(self, name: str) -> Any:
+        """Pass other attributes through to the Data instance."""
+        return getattr(self._data, name)
+
+    def __repr__(self) -> str:
+        """Returns a representation of the proxy."""
+        return f"TracingData({self._access.model_name}, {self._data!r})"
+
+    def __contains__(self, key: str) -> bool:
+        """Check if a variable is in the Data instance."""
+        return key in self._data
+
+    def __getitem__(self, key: str) -> DataArray:
+        """Get a variable from the Data instance, recording the read."""
+        start = perf_counter()
+        darray = self._data[key]
+        self._access.record(key, darray, start)
+        return darray
+
+    def __setitem__(self, key: str, value: DataArray) -> None:
+        """Set a variable in the Data instance, recording the write."""
+        start = perf_counter()
+        self._data[key] = value
+        self._access.record(key, value, start, write=True)
+
+    def get_forcing_slice(self, var_name: str, time_index: int) -> DataArray:
+        """Get a forcing time slice from the Data instance, recording the read.
+
+        Args:
+            var_name: The name of a variable with a ``time_index`` dimension
+            time_index: The index of the time step to extract
+        """
+        start = perf_counter()
+        time_slice = self._data.get_forcing_slice(var_name, time_index)
+        self._access.record(var_name, time_slice, start)
+        return time_slice
+
+    def add_from_dict(self, output_dict: dict[str, DataArray]) -> None:
+        """Update the Data instance from a dictionary, recording each write.
+
+        Args:
+            output_dict: dictionary of variables from submodule
+        """
+        for variable, value in output_dict.items():
+            self[variable] = value
+
+    def set_constant(self, key: str, value: float | DataArray) -> None:
+        """Set a constant variable in the Data instance, recording the write.
+
+        Args:
+            key: The name of the variable.
+            value: The constant value of the variable.
+        """
+        start = perf_counter()
+        self._data.set_constant(key, value)
+        self._access.record(key, self._data[key], start, write=True)
+
+
+class DataTracer:
+    """Trace the data access of models using a shared Data instance.
+
+    Args:
+        data: The Data instance shared by the models.
+    """
+
+    def __init__(self, data: Data) -> None:
+        self.data: Data = data
+        """The Data instance shared by the models."""
+        self.access: dict[str, ModelDataAccess] = {}
+        """Data access statistics for each traced model."""
+        self._models: dict[str, BaseModel] = {}
+
+    def trace_model(self, model: BaseModel) -> None:
+        """Start tracing the data access of a model.
+
+        The ``data`` attribute of the model is replaced with a
+        :class:`~virtual_ecosystem.core.data_tracing.TracingData` proxy.
+
+        Args:
+            model: The model to trace.
+        """
+        access = self.access.setdefault(
+            model.model_name, ModelDataAccess(model.model_name)
+        )
+        self._models[model.model_name] = model
+        model.data = cast(Data, TracingData(self.data, access))
+
+    def trace_models(self, models: Iterable[BaseModel]) -> None:
+        """Start tracing the data access of a set of models.
+
+        Args:
+            models: The models to trace.
+        """
+        for model in models:
+            self.trace_model(model)
+
+    def get_mismatches(self) -> dict[str, dict[str, set[str]]]:
+        """Compare the traced data access with the variables declared by each model.
+
+        Reads are expected to be of variables that the model declares as required,
+        populated or updated, and writes are expected to be of variables that the model
+        declares as populated or updated.
+
+        Returns:
+            A dictionary, keyed by model name, giving the sets of undeclared variables
+            that were read (``undeclared_reads``), undeclared variables that were
+            written (``undeclared_writes``) and variables declared for model update
+            that were never accessed (``unused_declared``). Models without mismatches
+            are omitted.
+        """
+        mismatches: dict[str, dict[str, set[str]]] = {}
+
+        for model_name, access in self.access.items():
+            model = self._models[model_name]
+            declared_writes = (
+                set(model.vars_updated)
+                | set(model.vars_populated_by_init)
+                | set(model.vars_populated_by_first_update)
+            )
+            declared_reads = (
+                declared_writes
+                | set(model.vars_required_for_init)
+                | set(model.vars_required_for_update)
+            )
+
+            # Model initialisation is not traced, so only variables declared for
+            # update are expected to be accessed.
+            declared_update = (
+                set(model.vars_updated)
+                | set(model.vars_populated_by_first_update)
+                | set(model.vars_required_for_update)
+            )
+
+            model_mismatches = {
+                "undeclared_reads": access.vars_read - declared_reads,
+                "undeclared_writes": access.vars_written - declared_writes,
+                "unused_declared": declared_update - set(access.variables),
+            }
+            model_mismatches = {
+                key: value for key, value in model_mismatches.items() if value
+            }
+            if model_mismatches:
+                mismatches[model_name] = model_mismatches
+
+        return mismatches
+
+    def report(self) -> str:
+        """Get a table of the data access statistics for each model."""
+        rows = [
+            [
+                model_name,
+                len(access.vars_read),
+                len(access.vars_written),
+                sum(var.reads for var in access.variables.values()),
+                sum(var.writes for var in access.variables.values()),
+                sum(var.bytes_read for var in access.variables.values()),
+                sum(var.bytes_written for var in access.variables.values()),
+                sum(var.access_time for var in access.variables.values()),
+            ]
+            for model_name, access in self.access.items()
+        ]
+
+        return tabulate(
+            rows,
+            headers=[
+                "Model",
+                "Vars read",
+                "Vars written",
+                "Reads",
+                "Writes",
+                "Bytes read",
+                "Bytes written",
+                "Access time (s)",
+            ],
+        )
+
+    def log_report(self) -> None:
+        """Log the data access statistics and any mismatches with declared variables."""
+        LOGGER.info(f"Data access by model:\n{self.report()}")
+
+        for model_name, model_mismatches in self.get_mismatches().items():
+            for mismatch, var_names in model_mismatches.items():
+                LOGGER.warning(
+                    f"Data access mismatch for {model_name} model - "
+                    f"{mismatch.replace('_', ' ')}: {', '.join(sorted(var_names))}"
+                )
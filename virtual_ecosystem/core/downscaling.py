@@ -0,0 +1,278 @@
+"""The :mod:`~virtual_ecosystem.core.downscaling` module provides temporal downscaling
+of coarse forcing data onto the shorter time steps used within a model update.
+
+Forcing data is typically provided at the update interval of the simulation, such as
+monthly totals of precipitation or monthly mean temperatures, but some processes need to
+be simulated using shorter steps. The
+:func:`~virtual_ecosystem.core.downscaling.downscale_forcing` function returns an
+iterator over the values of a forcing variable for each sub-step of a single time index,
+so that daily or hourly values are only calculated as they are used and high frequency
+forcing never needs to be precomputed or stored.
+
+The DOWNSCALING_REGISTRY
+========================
+
+The :attr:`~virtual_ecosystem.core.downscaling.DOWNSCALING_REGISTRY` maps method names
+onto functions that implement a downscaling method. The following methods are
+provided:
+
+* ``constant``: each sub-step takes the value for the time index, which is suitable for
+  state variables such as temperature or humidity.
+* ``divide``: the value for the time index is divided equally between the sub-steps,
+  which is suitable for fluxes given as totals over the time index.
+* ``linear``: sub-step values are interpolated linearly between the values of adjacent
+  time indices, which are taken to apply at the centre of each time index. This gives
+  smoothly varying state variables.
+* ``stochastic``: the total for the time index is split into discrete units, which are
+  allocated randomly to sub-steps, giving intermittent fluxes such as rainfall. The
+  allocation is drawn as a multinomial distribution using a sequence of binomial draws,
+  one for each sub-step, and conserves the total for the time index.
+
+New methods can be added using the
+:func:`~virtual_ecosystem.core.downscaling.register_downscaling_method` decorator. For
+example:
+
+.. code-block:: python
+
+    @register_downscaling_method("new_method")
+    def new_downscaling_method(data, var_name, time_index, n_steps, seed):
+        # code yielding an array of values for each sub-step
+"""  # noqa: D205
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+
+import numpy as np
+from numpy.typing import NDArray
+
+from virtual_ecosystem.core.data import Data
+from virtual_ecosystem.core.logger import LOGGER
+
+DOWNSCALING_REGISTRY: dict[str, Callable[..., Iterator[NDArray]]] = {}
+"""A registry of temporal downscaling methods.
+
+This dictionary maps method names onto generator functions that yield the values of a
+forcing variable for each sub-step of a time index. Users can register their own
+methods using the
+:func:`~virtual_ecosystem.core.downscaling.register_downscaling_method` decorator. The
+function itself should have the following signature:
+
+.. code-block:: python
+
+    func(
+        data: Data,
+        var_name: str,
+        time_index: int,
+        n_steps: int,
+        seed: int | None = None,
+    ) -> Iterator[NDArray]
+"""
+
+
+def register_downscaling_method(name: str) -> Callable:
+    """Adds a downscaling function to the downscaling method registry.
+
+    Args:
+        name: The name used to select the downscaling method.
+    """
+
+    def decorator_downscaling_method(func: Callable) -> Callable:
+        if name in DOWNSCALING_REGISTRY:
+            LOGGER.debug(f"Replacing existing downscaling method for {name}")
+        else:
+            LOGGER.debug(f"Adding downscaling method for {name}")
+
+        DOWNSCALING_REGISTRY[name] = func
+
+        return func
+
+    return decorator_downscaling_method
+
+
+def downscale_forcing(
+    data: Data,
+    var_name: str,
+    time_index: int,
+    n_steps: int,
+    method: str = "divide",
+    seed: int | None = None,
+) -> Iterator[NDArray]:
+    """Get an iterator over the downscaled values of a forcing variable.
+
+    The method and number of steps are checked when this function is called, and the
+    values for each sub-step are then generated in turn by the selected method as the
+    iterator is used. The values for the time index are read using
+    :meth:`~virtual_ecosystem.core.data.Data.get_forcing_slice`, so the iterator can be
+    used with lazily loaded forcing data and shares the cached time slice with other
+    models.
+
+    Args:
+        data: A Data instance containing the forcing variable.
+        var_name: The name of a variable with a ``time_index`` dimension.
+        time_index: The index of the time step to downscale.
+        n_steps: The number of sub-steps within the time step.
+        method: The name of a method in the
+            :attr:`~virtual_ecosystem.core.downscaling.DOWNSCALING_REGISTRY`.
+        seed: A seed for the random number generator used by stochastic methods.
+
+    Returns:
+        An iterator over arrays of the values of the variable for each sub-step.
+
+    Raises:
+        ValueError: if the method is not known or the number of steps is not positive.
+    """
+
+    if method not in DOWNSCALING_REGISTRY:
+        to_raise = ValueError(f"Unknown downscaling method: {method}")
+        LOGGER.critical(to_raise)
+        raise to_raise
+
+    if n_steps < 1:
+        to_raise = ValueError(
+            f"Number of downscaling steps must be positive, not {n_steps}"
+        )
+        LOGGER.critical(to_raise)
+        raise to_raise
+
+    return DOWNSCALING_REGISTRY[method](
+        data=data, var_name=var_name, time_index=time_index, n_steps=n_steps, seed=seed
+    )
+
+
+@register_downscaling_method("constant")
+def downscale_constant(
+    data: Data,
+    var_name: str,
+    time_index: int,
+    n_steps: int,
+    seed: int | None = None,
+) -> Iterator[NDArray]:
+    """Repeat the value of a forcing variable for each sub-step.
+
+    Args:
+        data: A Data instance containing the forcing variable.
+        var_name: The name of a variable with a ``time_index`` dimension.
+        time_index: The index of the time step to downscale.
+        n_steps: The number of sub-steps within the time step.
+        seed: Not used by this method.
+    """
+
+    values = data.get_forcing_slice(var_name, time_index).to_numpy()
+    for _ in range(n_steps):
+        yield values
+
+
+@register_downscaling_method("divide")
+def downscale_divide(
+    data: Data,
+    var_name: str,
+    time_index: int,
+    n_steps: int,
+    seed: int | None = None,
+) -> Iterator[NDArray]:
+    """Divide the total of a forcing variable equally between sub-steps.
+
+    Args:
+        data: A Data instance containing the forcing variable.
+        var_name: The name of a variable with a ``time_index`` dimension.
+        time_index: The index of the time step to downscale.
+        n_steps: The number of sub-steps within the time step.
+        seed: Not used by this method.
+    """
+
+    values = data.get_forcing_slice(var_name, time_index).to_numpy() / n_steps
+    for _ in range(n_steps):
+        yield values
+
+
+@register_downscaling_method("linear")
+def downscale_linear(
+    data: Data,
+    var_name: str,
+    time_index: int,
+    n_steps: int,
+    seed: int | None = None,
+) -> Iterator[NDArray]:
+    """Interpolate a forcing variable linearly between adjacent time indices.
+
+    The values for each time index are taken to apply at the centre of the time step.
+    Sub-steps in the first half of the time step are interpolated from the previous time
+    index and sub-steps in the second half are interpolated towards the next time index.
+    The first and last time indices have no neighbour outside the data, so the value is
+    held constant over that half of the time step.
+
+    Args:
+        data: A Data instance containing the forcing variable.
+        var_name: The name of a variable with a ``time_index`` dimension.
+        time_index: The index of the time step to downscale.
+        n_steps: The number of sub-steps within the time step.
+        seed: Not used by this method.
+    """
+
+    n_times = data[var_name].sizes["time_index"]
+    current = data.get_forcing_slice(var_name, time_index).to_numpy()
+
+    # Adjacent slices are not read through the forcing cache, which only holds the
+    # slices for a single time index.
+    previous = (
+        data[var_name].isel(time_index=time_index - 1).to_numpy()
+        if time_index > 0
+        else current
+    )
+    following = (
+        data[var_name].isel(time_index=time_index + 1).to_numpy()
+        if time_index < n_times - 1
+        else current
+    )
+
+    for step in range(n_steps):
+        # Position of the sub-step centre relative to the time step centre, in units of
+        # time steps, between -0.5 and 0.5.
+        offset = (step + 0.5) / n_steps - 0.5
+        if offset < 0:
+            yield current + offset * (current - previous)
+        else:
+            yield current + offset * (following - current)
+
+
+@register_downscaling_method("stochastic")
+def downscale_stochastic(
+    data: Data,
+    var_name: str,
+    time_index: int,
+    n_steps: int,
+    seed: int | None = None,
+) -> Iterator[NDArray]:
+    """Allocate the total of a forcing variable randomly between sub-steps.
+
+    The total for each cell is split into whole units of the variable, rounding up so
+    that small non-zero totals are not lost, and each unit is allocated to a sub-step
+    at random with equal probability. Rather than drawing the full allocation at once,
+    the number of units in each sub-step is drawn from a binomial distribution of the
+    units not yet allocated, which gives the same multinomial distribution while only
+    holding the values for a single sub-step. The units are then scaled so that the
+    sub-steps sum to the total for the time index. Missing values in the forcing data
+    are treated as a total of zero.
+
+    Args:
+        data: A Data instance containing the forcing variable.
+        var_name: The name of a variable with a ``time_index`` dimension.
+        time_index: The index of the time step to downscale.
+        n_steps: The number of sub-steps within the time step.
+        seed: A seed for the random number generator.
+    """
+
+    rng = np.random.default_rng(seed)
+
+    total = np.nan_to_num(
+        data.get_forcing_slice(var_name, time_index).to_numpy(), nan=0.0
+    )
+    n_units = np.ceil(np.clip(total, 0, None)).astype(np.int64)
+    unit_size = np.divide(total, n_units, out=np.zeros_like(total), where=n_units > 0)
+
+    remaining = n_units
+    for step in range(n_steps):
+        units = rng.binomial(remaining, 1 / (n_steps - step))
+        remaining = remaining - units
+        yield units * unit_size
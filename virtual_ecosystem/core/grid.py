@@ -18,6 +18,7 @@ from typing import Any, TypeAlias
 
 import numpy as np
 from numpy.typing import NDArray
+from scipy.sparse import csr_array  # type: ignore
 from scipy.spatial.distance import cdist, pdist, squareform  # type: ignore
 from shapely.affinity import scale, translate  # type: ignore
 from shapely.geometry import GeometryCollection, Point, Polygon  # type: ignore
@@ -271,6 +272,9 @@ class Grid:
         # Define other attributes set by methods
         # TODO - this might become a networkx graph
         self._neighbours: list[NDArray[np.int_]] | None = None
+        self._neighbour_csr: csr_array | None = None
+        self._neighbour_table: NDArray[np.int_] | None = None
+        self._neighbour_shifts: list[NDArray[np.int_]] | None = None
 
         # Do not by default store the full distance matrix
         self._distances: NDArray | None = None
@@ -284,6 +288,37 @@ class Grid:
 
         return self._neighbours
 
+    @property
+    def neighbour_csr(self) -> csr_array:
+        """Return the neighbourhood graph as a sparse CSR adjacency matrix.
+
+        The matrix has shape ``(n_cells, n_cells)`` and row ``i`` has a value of one in
+        the columns of each neighbour of cell ``i``.
+        """
+
+        if self._neighbour_csr is None:
+            raise AttributeError("Neighbours not yet defined: use set_neighbours.")
+
+        return self._neighbour_csr
+
+    @property
+    def neighbour_shifts(self) -> list[NDArray[np.int_]] | None:
+        """Return the structured neighbourhood stencil, if one exists.
+
+        For square and hexagon grids, the neighbourhood can be expressed as a set of
+        ``(dy, dx)`` index shifts on the ``(cell_ny, cell_nx)`` view of the grid.
+        Hexagon grids have offset rows, so the shifts differ between even and odd rows
+        and the list contains one array of shifts for each row parity. Square grids
+        give a single array of shifts used for all rows. The property is None for grids
+        where the neighbourhood cannot be expressed as a stencil, in which case
+        neighbour operations use the :attr:`neighbour_csr` graph.
+        """
+
+        if self._neighbours is None:
+            raise AttributeError("Neighbours not yet defined: use set_neighbours.")
+
+        return self._neighbour_shifts
+
     def __repr__(self) -> str:
         """Represent a CoreGrid as a string."""
         return (
@@ -414,6 +449,230 @@ class Grid:
             for idx in self.cell_id
         ]
 
+        # Store the neighbourhood as a CSR graph and as a padded table of neighbour ids,
+        # using n_cells as the index of a ghost cell for unused slots.
+        n_neighbours = np.array([len(nbr) for nbr in self._neighbours])
+        indptr = np.concatenate([[0], np.cumsum(n_neighbours)])
+        indices = np.concatenate(self._neighbours).astype(np.int_)
+        self._neighbour_csr = csr_array(
+            (np.ones(indices.size), indices, indptr),
+            shape=(self.n_cells, self.n_cells),
+        )
+
+        table = np.full((self.n_cells, n_neighbours.max()), self.n_cells)
+        table[np.arange(table.shape[1]) < n_neighbours[:, None]] = indices
+        self._neighbour_table = table
+
+        self._neighbour_shifts = self._get_neighbour_shifts()
+
+    def _get_neighbour_shifts(self) -> list[NDArray[np.int_]] | None:
+        """Derive a structured stencil from the neighbourhood lists.
+
+        Square and hexagon grid cell ids run along rows of the ``(cell_ny, cell_nx)``
+        view of the grid, so neighbours can be described as ``(dy, dx)`` shifts within
+        that view. This method collects the shifts used by the neighbourhood of each
+        row parity and checks that applying those shifts exactly reproduces the
+        neighbourhood lists, with shifts that fall outside the grid acting as ghost
+        cells. The shifts for each parity are sorted so that neighbours are visited in
+        increasing cell id order, matching the neighbourhood lists.
+
+        Returns:
+            A list of arrays of ``(dy, dx)`` shifts, one for each row parity, or None if
+            the grid is not structured or the neighbourhood is not a regular stencil.
+        """
+
+        if self.grid_type not in ("square", "hexagon") or self._neighbours is None:
+            return None
+
+        # Row and column of each neighbour relationship
+        focal = np.repeat(self.cell_id, [len(nbr) for nbr in self._neighbours])
+        nbrs = np.concatenate(self._neighbours)
+        shifts = np.column_stack(
+            [
+                nbrs // self.cell_nx - focal // self.cell_nx,
+                nbrs % self.cell_nx - focal % self.cell_nx,
+            ]
+        )
+        # Hexagon grids have offset odd rows, so shifts depend on the row parity
+        n_parity = 2 if self.grid_type == "hexagon" and self.cell_ny > 1 else 1
+        parity = (focal // self.cell_nx) % n_parity
+
+        # Unique shifts by row parity, sorted by the change in cell id
+        stencil = []
+        for row_parity in range(n_parity):
+            parity_shifts = np.unique(shifts[parity == row_parity], axis=0)
+            order = np.argsort(
+                parity_shifts[:, 0] * self.cell_nx + parity_shifts[:, 1],
+                kind="stable",
+            )
+            stencil.append(parity_shifts[order])
+
+        if len(stencil) == 2:
+            if np.array_equal(stencil[0], stencil[1]):
+                stencil = stencil[:1]
+            elif stencil[0].shape != stencil[1].shape:
+                return None
+
+        # Check that the stencil reproduces the neighbourhood: the valid ids in each
+        # row of the stencil table should match the neighbour lists in order.
+        table = self._stencil_table(stencil)
+        valid = table < self.n_cells
+        if not np.array_equal(
+            valid.sum(axis=1), [len(nbr) for nbr in self._neighbours]
+        ) or not np.array_equal(table[valid], nbrs):
+            return None
+
+        return stencil
+
+    def _stencil_table(self, stencil: list[NDArray[np.int_]]) -> NDArray[np.int_]:
+        """Get the padded neighbour id table implied by a stencil.
+
+        Args:
+            stencil: A list of arrays of ``(dy, dx)`` shifts for each row parity.
+
+        Returns:
+            An array of shape ``(n_cells, n_shifts)`` of neighbour cell ids, using
+            ``n_cells`` for shifts that fall outside the grid.
+        """
+
+        ids = np.arange(self.n_cells)
+        table = self._stencil_gather(ids, fill=self.n_cells, stencil=stencil)
+        return table.reshape(self.n_cells, -1)
+
+    def _stencil_gather(
+        self,
+        values: NDArray,
+        fill: float,
+        stencil: list[NDArray[np.int_]],
+    ) -> NDArray:
+        """Gather neighbour values using shifted views of a ghost-padded grid.
+
+        Args:
+            values: An array of values for each cell
+            fill: The value to use for ghost cells outside the grid
+            stencil: A list of arrays of ``(dy, dx)`` shifts for each row parity.
+
+        Returns:
+            An array of shape ``(n_cells, n_shifts)`` of neighbour values.
+        """
+
+        pad_y, pad_x = np.abs(np.concatenate(stencil)).max(axis=0)
+        ny, nx = self.cell_ny, self.cell_nx
+        padded = np.full(
+            (ny + 2 * pad_y, nx + 2 * pad_x), fill, dtype=np.result_type(values, fill)
+        )
+        padded[pad_y : pad_y + ny, pad_x : pad_x + nx] = values.reshape(ny, nx)
+
+        step = len(stencil)
+        gathered = np.empty((ny, nx, len(stencil[0])), dtype=padded.dtype)
+        for row_parity, parity_shifts in enumerate(stencil):
+            for slot, (dy, dx) in enumerate(parity_shifts):
+                gathered[row_parity::step, :, slot] = padded[
+                    pad_y + dy + row_parity : pad_y + dy + ny : step,
+                    pad_x + dx : pad_x + dx + nx,
+                ]
+
+        return gathered.reshape(self.n_cells, -1)
+
+    def gather_neighbours(self, values: NDArray, fill: float = np.nan) -> NDArray:
+        """Gather the values of the neighbours of each cell.
+
+        For square and hexagon grids, this uses shifted views of the grid padded with
+        ghost cells (see :attr:`neighbour_shifts`). Otherwise, values are gathered
+        using a padded table of the neighbourhood graph. In both cases, neighbour slots
+        that do not correspond to a cell in the grid are filled with ``fill`` and the
+        valid neighbours of each cell appear in increasing cell id order.
+
+        Args:
+            values: A one dimensional array of values for each cell
+            fill: The value to use for neighbour slots outside the grid
+
+        Returns:
+            An array of shape ``(n_cells, n_slots)`` of neighbour values.
+        """
+
+        if self._neighbour_table is None:
+            raise AttributeError("Neighbours not yet defined: use set_neighbours.")
+
+        values = np.asarray(values)
+        if values.shape != (self.n_cells,):
+            raise ValueError("Values must be a one dimensional array of cell values.")
+
+        if self._neighbour_shifts is not None:
+            return self._stencil_gather(values, fill, self._neighbour_shifts)
+
+        return np.append(values, fill)[self._neighbour_table]
+
+    def scatter_to_neighbours(self, values: NDArray) -> NDArray:
+        """Sum values sent from each cell to its neighbours.
+
+        This is the transpose of :meth:`gather_neighbours`: the input gives the value
+        sent from each cell to each of its neighbour slots and the method returns the
+        total received by each cell. Values sent to slots outside the grid are
+        discarded.
+
+        Args:
+            values: An array of shape ``(n_cells, n_slots)``, matching the layout
+                returned by :meth:`gather_neighbours`.
+
+        Returns:
+            A one dimensional array of the total value received by each cell.
+        """
+
+        if self._neighbour_table is None:
+            raise AttributeError("Neighbours not yet defined: use set_neighbours.")
+
+        values = np.asarray(values)
+
+        if self._neighbour_shifts is None:
+            if values.shape != self._neighbour_table.shape:
+                raise ValueError("Values do not match the neighbour slots of the grid.")
+
+            return np.bincount(
+                self._neighbour_table.ravel(),
+                weights=values.ravel(),
+                minlength=self.n_cells + 1,
+            )[: self.n_cells]
+
+        stencil = self._neighbour_shifts
+        if values.shape != (self.n_cells, len(stencil[0])):
+            raise ValueError("Values do not match the neighbour slots of the grid.")
+
+        pad_y, pad_x = np.abs(np.concatenate(stencil)).max(axis=0)
+        ny, nx = self.cell_ny, self.cell_nx
+        padded = np.zeros((ny + 2 * pad_y, nx + 2 * pad_x), dtype=values.dtype)
+        sent = values.reshape(ny, nx, -1)
+
+        step = len(stencil)
+        for row_parity, parity_shifts in enumerate(stencil):
+            for slot, (dy, dx) in enumerate(parity_shifts):
+                padded[
+                    pad_y + dy + row_parity : pad_y + dy + ny : step,
+                    pad_x + dx : pad_x + dx + nx,
+                ] += sent[row_parity::step, :, slot]
+
+        return padded[pad_y : pad_y + ny, pad_x : pad_x + nx].ravel()
+
+    def argmin_neighbours(self, values: NDArray) -> NDArray[np.int_]:
+        """Find the neighbour of each cell with the lowest value.
+
+        Ties are resolved in favour of the neighbour with the lowest cell id.
+
+        Args:
+            values: A one dimensional array of values for each cell
+
+        Returns:
+            An array giving the cell id of the lowest valued neighbour of each cell.
+        """
+
+        neighbour_values = self.gather_neighbours(
+            np.asarray(values, dtype=np.float64), fill=np.inf
+        )
+        neighbour_ids = self.gather_neighbours(np.arange(self.n_cells), fill=-1)
+        slot = np.argmin(neighbour_values, axis=1)
+
+        return neighbour_ids[np.arange(self.n_cells), slot]
+
     def get_distances(
         self,
         cell_from: int | Sequence[int] | None,
@@ -0,0 +1,206 @@
+"""The :mod:`~virtual_ecosystem.core.input_cache` module provides a persistent cache of
+validated input data. Loading a variable from file into a
+:class:`~virtual_ecosystem.core.data.Data` instance involves reading the data and then
+validating it against the core axes, which can include remapping ``x`` and ``y``
+coordinates onto grid cells. Simulations are often run repeatedly using the same input
+files on the same grid, so this work can be stored and reused.
+
+The :class:`~virtual_ecosystem.core.input_cache.InputCache` class stores each validated
+variable, in ``cell_id`` order, along with the validation details recorded in
+:attr:`~virtual_ecosystem.core.data.Data.variable_validation`. Cached entries are keyed
+using :func:`~virtual_ecosystem.core.input_cache.get_input_cache_key`, which combines a
+hash of the file contents with the variable name, the grid definition and any data
+window used when loading the file. Changes to any of those components give a new key, so
+stale entries are never used.
+
+The cache is used by :meth:`~virtual_ecosystem.core.data.Data.load_data_config` when the
+``core.data.input_cache_folder`` configuration option is set.
+"""  # noqa: D205
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+
+from xarray import DataArray, open_dataset
+
+from virtual_ecosystem.core.grid import Grid
+from virtual_ecosystem.core.logger import LOGGER
+from virtual_ecosystem.core.readers import NETCDF_LOCK, DataWindow, chunk_time_dims
+
+
+def get_file_hash(file: Path) -> str:
+    """Calculate a SHA-256 hash of the contents of a file.
+
+    Some formats, such as Zarr stores, use a directory rather than a single file. For
+    directories, the relative paths and contents of all files within the directory are
+    hashed in sorted order.
+
+    Args:
+        file: The path to a file or directory.
+
+    Returns:
+        The hexadecimal hash digest.
+    """
+
+    digest = hashlib.sha256()
+    if file.is_dir():
+        paths = sorted(path for path in file.rglob("*") if path.is_file())
+    else:
+        paths = [file]
+
+    for path in paths:
+        digest.update(str(path.relative_to(file)).encode())
+        with open(path, "rb") as file_obj:
+            for block in iter(lambda: file_obj.read(2**20), b""):
+                digest.update(block)
+
+    return digest.hexdigest()
+
+
+def get_input_cache_key(
+    file_hash: str,
+    var_name: str,
+    grid: Grid,
+    window: DataWindow | None = None,
+    regrid: bool = False,
+) -> str:
+    """Get the cache key for a variable loaded from a file onto a grid.
+
+    Hashing a large file is expensive, so the file hash is calculated once using
+    :func:`~virtual_ecosystem.core.input_cache.get_file_hash` and then shared between
+    the keys for all of the variables loaded from the file.
+
+    Args:
+        file_hash: The hash of the contents of the data file.
+        var_name: The name of the variable in the file.
+        grid: The grid used to validate the data.
+        window: Any data window used to subset the data when it is loaded.
+        regrid: Is the data regridded onto the grid when it is loaded.
+
+    Returns:
+        A hexadecimal key identifying the cached data.
+    """
+
+    key_parts = {
+        "file_hash": file_hash,
+        "var_name": var_name,
+        "grid": [
+            grid.grid_type,
+            grid.cell_area,
+            grid.cell_nx,
+            grid.cell_ny,
+            grid.xoff,
+            grid.yoff,
+        ],
+        "window": None if window is None else repr(window),
+        "regrid": regrid,
+    }
+
+    return hashlib.sha256(json.dumps(key_parts).encode()).hexdigest()
+
+
+class InputCache:
+    """A persistent cache of validated input data.
+
+    Each cache entry is stored as a NetCDF file in the cache folder, named using the
+    cache key. The file contains the validated variable and the validation details for
+    the variable as a JSON string in the file attributes.
+
+    Args:
+        folder: The folder used to store the cache entries. This is created if it does
+            not exist.
+    """
+
+    def __init__(self, folder: Path) -> None:
+        self.folder: Path = Path(folder)
+        """The folder used to store cache entries."""
+
+        self.folder.mkdir(parents=True, exist_ok=True)
+
+    def _entry_path(self, key: str) -> Path:
+        """Get the path of the cache entry for a key.
+
+        Args:
+            key: A cache key.
+        """
+
+        return self.folder / f"{key}.nc"
+
+    def load(
+        self, key: str, var_name: str, lazy: bool = False
+    ) -> tuple[DataArray, dict[str, str | None]] | None:
+        """Load a validated variable from the cache.
+
+        Args:
+            key: The cache key for the variable.
+            var_name: The name of the cached variable.
+            lazy: Should the variable be loaded lazily as a chunked array.
+
+        Returns:
+            A tuple of the validated DataArray and its validation details, or None if
+            there is no cache entry for the key or the entry cannot be read.
+        """
+
+        entry = self._entry_path(key)
+        if not entry.exists():
+            return None
+
+        try:
+            with NETCDF_LOCK:
+                dataset = open_dataset(
+                    entry, chunks={} if lazy else None, lock=NETCDF_LOCK
+                )
+            validation = json.loads(dataset.attrs["variable_validation"])
+            darray = dataset[var_name]
+        except Exception as err:
+            LOGGER.warning(f"Ignoring unreadable input cache entry {entry}: {err}")
+            return None
+
+        if lazy:
+            darray = chunk_time_dims(darray)
+        else:
+            darray = darray.load()
+            with NETCDF_LOCK:
+                dataset.close()
+
+        LOGGER.info(f"Loaded variable '{var_name}' from input cache: {entry}")
+        return darray, validation
+
+    def store(
+        self,
+        key: str,
+        var_name: str,
+        darray: DataArray,
+        validation: dict[str, str | None],
+    ) -> None:
+        """Store a validated variable in the cache.
+
+        The entry is written to a temporary file and then moved into place, so that
+        incomplete entries are never read. Failing to store an entry does not prevent a
+        simulation from running, so errors are logged as warnings.
+
+        Args:
+            key: The cache key for the variable.
+            var_name: The name of the variable.
+            darray: The validated DataArray.
+            validation: The validation details for the variable.
+        """
+
+        entry = self._entry_path(key)
+        partial = entry.with_suffix(".partial")
+
+        dataset = darray.rename(var_name).to_dataset()
+        dataset.attrs["variable_validation"] = json.dumps(validation)
+
+        try:
+            with NETCDF_LOCK:
+                dataset.to_netcdf(partial)
+            partial.replace(entry)
+        except Exception as err:
+            LOGGER.warning(f"Could not store '{var_name}' in input cache: {err}")
+            partial.unlink(missing_ok=True)
+            return
+
+        LOGGER.info(f"Stored variable '{var_name}' in input cache: {entry}")
@@ -29,13 +29,68 @@ using :func:`~virtual_ecosystem.core.axes.validate_dataarray`. For example:
     @register_file_format_loader(('.tif', '.tiff'))
     def new_function_to_load_tif_data(...):
         # code to turn tif file into a data array
+
+Loading several variables
+=========================
+
+The :func:`~virtual_ecosystem.core.readers.iter_file_dataarrays` function loads a
+sequence of variables from a single file. Files read using the built-in NetCDF and Zarr
+loaders are then only opened once, rather than once for each variable. This is used by
+:meth:`~virtual_ecosystem.core.data.Data.load_data_config` to load the variables in
+each configured file.
+
+Lazy loading
+============
+
+Forcing data can cover long time series at high temporal resolution, which may be much
+larger than the available memory, even though each model update only uses the data for
+a single time step. The ``lazy`` argument to
+:func:`~virtual_ecosystem.core.readers.load_to_dataarray` asks loaders to return a
+DataArray backed by a chunked :mod:`dask` array rather than reading the whole variable
+into memory. Time dimensions are chunked to single time steps, so selecting a time step
+using ``isel`` only reads that step from file when the values are used, and the values
+are then discarded rather than being held in memory.
+
+Supported formats
+=================
+
+The module provides loaders for the following formats:
+
+* NetCDF files (``.nc``), using :func:`~virtual_ecosystem.core.readers.load_netcdf`.
+* Zarr stores (``.zarr``), using :func:`~virtual_ecosystem.core.readers.load_zarr`.
+  This requires the optional ``zarr`` package, which is installed with the ``zarr``
+  extra (``pip install virtual_ecosystem[zarr]``).
+* Numpy binary files (``.npy`` and ``.npz``), which are memory-mapped using
+  :func:`~virtual_ecosystem.core.readers.load_numpy_memmap` and require a sidecar
+  JSON file providing dimension names and coordinates.
+
+Windowed loading
+================
+
+Input files often cover a much larger area or period than a particular simulation. A
+:class:`~virtual_ecosystem.core.readers.DataWindow` can be passed to
+:func:`~virtual_ecosystem.core.readers.load_to_dataarray` to describe the extent of the
+simulation grid and the simulation period. Loaders use the window to restrict reading
+to the hyperslab of ``x``, ``y`` and time values that fall within the simulation, rather
+than reading the whole variable and discarding data after validation.
 """  # noqa: D205
 
-from collections.abc import Callable
+from __future__ import annotations
+
+import json
+import struct
+import zipfile
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from importlib.util import find_spec
 from pathlib import Path
+from threading import RLock
 
-from xarray import DataArray, load_dataset
+import numpy as np
+from xarray import DataArray, Dataset, open_dataset, open_zarr
 
+from virtual_ecosystem.core.core_components import ModelTiming
+from virtual_ecosystem.core.grid import Grid
 from virtual_ecosystem.core.logger import LOGGER
 
 FILE_FORMAT_REGISTRY: dict[str, Callable] = {}
@@ -50,12 +105,129 @@ function itself should have the following signature:
 
 .. code-block:: python
 
-    func(file: Path, var_name: str) -> DataArray
+    func(
+        file: Path,
+        var_name: str,
+        lazy: bool = False,
+        window: DataWindow | None = None,
+    ) -> DataArray
+
+Loaders that cannot load data lazily can ignore the ``lazy`` argument and load the data
+into memory. Loaders that cannot select data within a window while reading should
+apply :meth:`DataWindow.subset` to the loaded data.
+"""
+
+NETCDF_LOCK = RLock()
+"""A lock used to serialise access to NetCDF files.
 
+The underlying NetCDF library is not thread safe, so files are opened, read and closed
+while holding this lock. Data can be loaded from files concurrently in different threads
+(see :meth:`~virtual_ecosystem.core.data.Data.load_data_config`) and any other code
+accessing NetCDF files from threads should also hold this lock.
 """
 
+LAZY_CHUNK_DIMS: tuple[str, ...] = ("time_index", "time")
+"""Dimensions that are chunked to single steps when data is loaded lazily."""
+
 
-def register_file_format_loader(file_types: tuple[str]) -> Callable:
+@dataclass
+class DataWindow:
+    """The spatial and temporal extent of the data required by a simulation.
+
+    File format loaders use a window to restrict the data read from file to the values
+    that fall within the simulation grid and period. Each part of the window is
+    optional and data is not subset along a dimension if the window does not define an
+    extent for it.
+    """
+
+    bounds: tuple[float, float, float, float] | None = None
+    """The spatial bounds of the grid as ``(minx, miny, maxx, maxy)``."""
+    time_range: tuple[np.datetime64, np.datetime64] | None = None
+    """The start and end time of the simulation."""
+    n_time_index: int | None = None
+    """The number of model updates in the simulation."""
+
+    @classmethod
+    def from_grid(
+        cls, grid: Grid, model_timing: ModelTiming | None = None
+    ) -> DataWindow:
+        """Create a data window from the simulation grid and timing.
+
+        Args:
+            grid: The Grid instance used in the simulation.
+            model_timing: The ModelTiming instance used in the simulation. If this is
+                not provided, data is not subset along time dimensions.
+        """
+
+        if model_timing is None:
+            return cls(bounds=grid.bounds)
+
+        return cls(
+            bounds=grid.bounds,
+            time_range=(model_timing.start_time, model_timing.end_time),
+            n_time_index=model_timing.n_updates,
+        )
+
+    def subset(self, darray: DataArray) -> DataArray:
+        """Subset a DataArray to the window.
+
+        The ``x`` and ``y`` dimensions are reduced to the contiguous range of
+        coordinates that fall within the grid bounds. A ``time`` dimension with datetime
+        coordinates is reduced to the times within the simulation period and a
+        ``time_index`` dimension is reduced to the number of model updates. The subset
+        uses slices, so on lazily opened files only the selected hyperslab is read.
+
+        Args:
+            darray: The DataArray to subset.
+
+        Returns:
+            The DataArray reduced to the window.
+        """
+
+        slices: dict[str, slice] = {}
+
+        if self.bounds is not None:
+            minx, miny, maxx, maxy = self.bounds
+            for dim, lower, upper in (("x", minx, maxx), ("y", miny, maxy)):
+                if dim in darray.dims and dim in darray.coords:
+                    values = darray[dim].values
+                    slices[dim] = _window_slice((values >= lower) & (values <= upper))
+
+        if (
+            self.time_range is not None
+            and "time" in darray.dims
+            and "time" in darray.coords
+            and np.issubdtype(darray["time"].dtype, np.datetime64)
+        ):
+            start, end = self.time_range
+            values = darray["time"].values
+            slices["time"] = _window_slice((values >= start) & (values < end))
+
+        if self.n_time_index is not None and "time_index" in darray.dims:
+            slices["time_index"] = slice(0, self.n_time_index)
+
+        return darray.isel(slices) if slices else darray
+
+
+def _window_slice(in_window: np.ndarray) -> slice:
+    """Get the slice spanning the positions of coordinate values in a window.
+
+    Args:
+        in_window: A boolean array showing which coordinate values fall in the window.
+
+    Returns:
+        A slice running from the first to the last value in the window, or an empty
+        slice if no values fall in the window.
+    """
+
+    (positions,) = np.nonzero(in_window)
+    if positions.size == 0:
+        return slice(0, 0)
+
+    return slice(positions[0], positions[-1] + 1)
+
+
+def register_file_format_loader(file_types: tuple[str, ...]) -> Callable:
     """Adds a data loader function to the data loader registry.
 
     This decorator is used to register a function that loads data from a given file type
@@ -95,12 +267,24 @@ def register_file_format_loader(file_types: tuple[str]) -> Callable:
 
 
 @register_file_format_loader(file_types=(".nc",))
-def load_netcdf(file: Path, var_name: str) -> DataArray:
+def load_netcdf(
+    file: Path,
+    var_name: str,
+    lazy: bool = False,
+    window: DataWindow | None = None,
+) -> DataArray:
     """Loads a DataArray from a NetCDF file.
 
+    By default, the variable is read into memory. If ``lazy`` is True, the file is
+    opened with the variables held as chunked dask arrays, with any time dimensions
+    chunked to single time steps, so that data is only read from file when values are
+    used. If a window is provided, only the data within the window is read.
+
     Args:
         file: A Path for a NetCDF file containing the variable to load.
         var_name: A string providing the name of the variable in the file.
+        lazy: Should the variable be loaded lazily.
+        window: An optional DataWindow giving the extent of the data to read.
 
     Raises:
         FileNotFoundError: with bad file path names.
@@ -111,11 +295,217 @@ def load_netcdf(file: Path, var_name: str) -> DataArray:
     # Note that this deliberately doesn't contain any INFO logging messages to maintain
     # a simple logging sequence without unnecessary logger noise about the specific
     # format unless there is an exception.
+    dataset = _open_netcdf(file, lazy=lazy)
+
+    try:
+        return _select_dataarray(dataset, file, var_name, lazy=lazy, window=window)
+    finally:
+        if not lazy:
+            # Release the file once the selected data has been read into memory
+            with NETCDF_LOCK:
+                dataset.close()
+
+
+@register_file_format_loader(file_types=(".zarr",))
+def load_zarr(
+    file: Path,
+    var_name: str,
+    lazy: bool = False,
+    window: DataWindow | None = None,
+) -> DataArray:
+    """Loads a DataArray from a Zarr store.
+
+    The store is opened using consolidated metadata where it is available, and the
+    variables are held as dask arrays using the chunking of the store. If a window is
+    provided, only the chunks within the window are read. Unless ``lazy`` is True, the
+    selected data is then read into memory. This loader requires the optional ``zarr``
+    package to be installed.
+
+    Args:
+        file: A Path for a Zarr store containing the variable to load.
+        var_name: A string providing the name of the variable in the store.
+        lazy: Should the variable be loaded lazily.
+        window: An optional DataWindow giving the extent of the data to read.
+
+    Raises:
+        FileNotFoundError: with bad store path names.
+        ValueError: if the store is not readable or zarr is not installed.
+        KeyError: if the named variable is not present in the data.
+    """
+
+    dataset = _open_zarr(file, lazy=lazy)
+
+    return _select_dataarray(dataset, file, var_name, lazy=lazy, window=window)
+
+
+@register_file_format_loader(file_types=(".npy", ".npz"))
+def load_numpy_memmap(
+    file: Path,
+    var_name: str,
+    lazy: bool = False,
+    window: DataWindow | None = None,
+) -> DataArray:
+    """Loads a memory-mapped DataArray from a numpy binary file.
+
+    Numpy ``.npy`` files contain a single array and ``.npz`` files contain a set of
+    named arrays. The array is memory-mapped rather than read, so that large static
+    fields load almost instantly and the file contents are shared between processes
+    through the operating system page cache. Arrays in ``.npz`` files can only be
+    memory-mapped if the archive is not compressed (see :func:`numpy.savez`):
+    arrays in compressed archives are read into memory.
+
+    The arrays are mapped in copy-on-write mode, so the data can be updated in memory
+    without altering the file. Numpy files do not store dimension names or
+    coordinates, so these are read from a sidecar JSON file with the same path as the
+    data file but with a ``.json`` suffix. The sidecar file provides the dimension names
+    of each variable and, optionally, coordinate values for dimensions:
+
+    .. code-block:: json
+
+        {
+            "dims": {"elevation": ["y", "x"]},
+            "coords": {"x": [50, 150, 250], "y": [250, 150, 50]}
+        }
+
+    For ``.npy`` files, the ``var_name`` is only used to find the dimension names in the
+    sidecar file.
+
+    Args:
+        file: A Path for a numpy file containing the variable to load.
+        var_name: A string providing the name of the variable.
+        lazy: Should the variable be loaded as a chunked dask array.
+        window: An optional DataWindow giving the extent of the data to use.
+
+    Raises:
+        FileNotFoundError: with bad file path names or a missing sidecar file.
+        ValueError: if the file data or sidecar file is not readable or the sidecar
+            dimensions do not match the data.
+        KeyError: if the named variable is not present in the data or sidecar file.
+    """
+
+    to_raise: Exception
+    sidecar = file.with_suffix(".json")
+
+    for required_file in (file, sidecar):
+        if not required_file.exists():
+            to_raise = FileNotFoundError(f"Data file not found: {required_file}")
+            LOGGER.critical(to_raise)
+            raise to_raise
+
+    try:
+        with open(sidecar) as sidecar_file:
+            metadata = json.load(sidecar_file)
+        dims = metadata["dims"]
+        coords = metadata.get("coords", {})
+    except (json.JSONDecodeError, KeyError, TypeError) as err:
+        to_raise = ValueError(f"Could not load coordinates from {sidecar}: {err}.")
+        LOGGER.critical(to_raise)
+        raise to_raise
+
+    if var_name not in dims:
+        to_raise = KeyError(f"Variable {var_name} not found in {sidecar}")
+        LOGGER.critical(to_raise)
+        raise to_raise
+
+    try:
+        if file.suffix == ".npy":
+            values = np.load(file, mmap_mode="c")
+        else:
+            values = _memmap_npz_member(file, var_name)
+    except KeyError:
+        to_raise = KeyError(f"Variable {var_name} not found in {file}")
+        LOGGER.critical(to_raise)
+        raise to_raise
+    except (ValueError, OSError, zipfile.BadZipFile) as err:
+        to_raise = ValueError(f"Could not load data from {file}: {err}.")
+        LOGGER.critical(to_raise)
+        raise to_raise
+
+    try:
+        darray = DataArray(
+            values,
+            dims=dims[var_name],
+            coords={dim: coords[dim] for dim in dims[var_name] if dim in coords},
+            name=var_name,
+        )
+    except ValueError as err:
+        to_raise = ValueError(f"Sidecar file {sidecar} does not match data: {err}.")
+        LOGGER.critical(to_raise)
+        raise to_raise
+
+    if window is not None:
+        darray = window.subset(darray)
+
+    if not lazy:
+        return darray
+
+    return chunk_time_dims(darray)
+
+
+def _memmap_npz_member(file: Path, var_name: str) -> np.ndarray:
+    """Memory-map an array stored in a numpy ``.npz`` archive.
+
+    Arrays stored without compression are memory-mapped directly from their position in
+    the archive. Arrays in compressed archives are read into memory.
+
+    Args:
+        file: A Path for a numpy ``.npz`` file.
+        var_name: The name of the array in the archive.
+
+    Raises:
+        KeyError: if the archive does not contain the named array.
+    """
+
+    with zipfile.ZipFile(file) as archive:
+        info = archive.getinfo(f"{var_name}.npy")
+
+    if info.compress_type != zipfile.ZIP_STORED:
+        with np.load(file) as npz_data:
+            return npz_data[var_name]
+
+    with open(file, "rb") as npz_file:
+        # Skip the zip local file header, which has a fixed length of 30 bytes
+        # followed by the file name and extra field, to find the start of the npy data.
+        npz_file.seek(info.header_offset)
+        header = npz_file.read(30)
+        name_length, extra_length = struct.unpack("<HH", header[26:30])
+        npz_file.seek(info.header_offset + 30 + name_length + extra_length)
+
+        # Read the npy header
+        version = np.lib.format.read_magic(npz_file)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(npz_file)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(npz_file)
+        offset = npz_file.tell()
+
+    return np.memmap(
+        file,
+        dtype=dtype,
+        mode="c",
+        shape=shape,
+        order="F" if fortran_order else "C",
+        offset=offset,
+    )
+
+
+def _open_netcdf(file: Path, lazy: bool = False) -> Dataset:
+    """Open a NetCDF file as a Dataset.
+
+    Args:
+        file: A Path for a NetCDF file.
+        lazy: Should the variables be opened as chunked dask arrays.
+
+    Raises:
+        FileNotFoundError: with bad file path names.
+        ValueError: if the file data is not readable.
+    """
+
     to_raise: Exception
 
-    # Try and load the provided file
     try:
-        dataset = load_dataset(file)
+        with NETCDF_LOCK:
+            return open_dataset(file, chunks={} if lazy else None, lock=NETCDF_LOCK)
     except FileNotFoundError:
         to_raise = FileNotFoundError(f"Data file not found: {file}")
         LOGGER.critical(to_raise)
@@ -125,18 +515,112 @@ def load_netcdf(file: Path, var_name: str) -> DataArray:
         LOGGER.critical(to_raise)
         raise to_raise
 
+
+def _open_zarr(file: Path, lazy: bool = False) -> Dataset:
+    """Open a Zarr store as a Dataset.
+
+    Zarr stores are always opened as chunked dask arrays, so the ``lazy`` argument is
+    only accepted for consistency with other dataset openers.
+
+    Args:
+        file: A Path for a Zarr store.
+        lazy: Unused.
+
+    Raises:
+        FileNotFoundError: with bad store path names.
+        ValueError: if the store is not readable or zarr is not installed.
+    """
+
+    to_raise: Exception
+
+    if find_spec("zarr") is None:
+        to_raise = ValueError(
+            f"Could not load data from {file}: loading Zarr data requires the optional "
+            "zarr package."
+        )
+        LOGGER.critical(to_raise)
+        raise to_raise
+
+    if not file.exists():
+        to_raise = FileNotFoundError(f"Data file not found: {file}")
+        LOGGER.critical(to_raise)
+        raise to_raise
+
+    try:
+        return open_zarr(file, consolidated=None)
+    except (ValueError, KeyError, OSError) as err:
+        to_raise = ValueError(f"Could not load data from {file}: {err}.")
+        LOGGER.critical(to_raise)
+        raise to_raise
+
+
+def _select_dataarray(
+    dataset: Dataset,
+    file: Path,
+    var_name: str,
+    lazy: bool = False,
+    window: DataWindow | None = None,
+) -> DataArray:
+    """Select a variable from an open Dataset.
+
+    The variable is subset to any window and then either read into memory or, if
+    ``lazy`` is True, chunked along time dimensions.
+
+    Args:
+        dataset: The open Dataset.
+        file: The Path the dataset was opened from, used in error messages.
+        var_name: A string providing the name of the variable in the dataset.
+        lazy: Should the variable be loaded lazily.
+        window: An optional DataWindow giving the extent of the data to read.
+
+    Raises:
+        KeyError: if the named variable is not present in the data.
+    """
+
     # Check if file var is in the dataset
     if var_name not in dataset:
         to_raise = KeyError(f"Variable {var_name} not found in {file}")
         LOGGER.critical(to_raise)
         raise to_raise
 
-    return dataset[var_name]
+    darray = dataset[var_name]
+    if window is not None:
+        darray = window.subset(darray)
+
+    if not lazy:
+        return darray.load()
+
+    return chunk_time_dims(darray)
+
+
+_DATASET_OPENERS: dict[Callable, Callable] = {
+    load_netcdf: _open_netcdf,
+    load_zarr: _open_zarr,
+}
+"""Functions used to open files once when loading several variables from a file.
+
+The keys are the registered loader functions that read variables from an xarray
+Dataset and the values open a file as a Dataset. Loaders without an entry here are
+called once for each variable.
+"""
+
+
+def chunk_time_dims(darray: DataArray) -> DataArray:
+    """Chunk any time dimensions of a DataArray to single steps.
+
+    Args:
+        darray: The DataArray to chunk.
+    """
+
+    time_chunks = {dim: 1 for dim in LAZY_CHUNK_DIMS if dim in darray.dims}
+    return darray.chunk(time_chunks)
 
 
 def load_to_dataarray(
     file: Path,
     var_name: str,
+    lazy: bool = False,
+    window: DataWindow | None = None,
 ) -> DataArray:
     """Loads data from a file into a DataArray.
 
@@ -149,6 +633,8 @@ def load_to_dataarray(
     Args:
         file: A Path for the file containing the variable to load.
         var_name: A string providing the name of the variable in the file.
+        lazy: Should the loader return a lazily loaded, chunked DataArray.
+        window: An optional DataWindow used to restrict the data read from the file.
 
     Raises:
         ValueError: if there is no loader provided for the file format.
@@ -166,6 +652,91 @@ def load_to_dataarray(
     # If so, load the data
     LOGGER.info("Loading variable '%s' from file: %s", var_name, file)
     loader = FILE_FORMAT_REGISTRY[file_type]
-    value = loader(file, var_name)
+    value = loader(file, var_name, lazy=lazy, window=window)
 
     return value
+
+
+def iter_file_dataarrays(
+    file: Path,
+    var_names: Sequence[str],
+    lazy: bool = False,
+    window: DataWindow | None = None,
+    var_windows: Mapping[str, DataWindow | None] | None = None,
+) -> Iterator[tuple[str, DataArray | Exception]]:
+    """Loads several variables from a single file into DataArrays.
+
+    This function works like
+    :func:`~virtual_ecosystem.core.readers.load_to_dataarray` but loads a sequence of
+    variables from the same file. Files using one of the built-in NetCDF or Zarr
+    loaders are only opened once, rather than once for each variable. Files in other
+    formats are loaded using the registered loader for each variable.
+
+    Variables are loaded as the iterator is consumed, so callers can process each
+    variable before the next is read. Errors loading a variable, or opening the file,
+    are logged by the loaders and then returned in place of the DataArray, so that
+    problems with all of the variables can be reported.
+
+    Args:
+        file: A Path for the file containing the variables to load.
+        var_names: The names of the variables to load from the file.
+        lazy: Should the loader return lazily loaded, chunked DataArrays.
+        window: An optional DataWindow used to restrict the data read from the file.
+        var_windows: An optional mapping of variable names to the DataWindow used for
+            those variables, replacing ``window``.
+
+    Yields:
+        Tuples of the variable name and either the loaded DataArray or the exception
+        raised when loading the variable.
+    """
+
+    if not var_names:
+        return
+
+    file_type = file.suffix
+
+    if file_type not in FILE_FORMAT_REGISTRY:
+        to_raise = ValueError(f"No file format loader provided for {file_type}")
+        LOGGER.critical(to_raise)
+        for var_name in var_names:
+            yield var_name, to_raise
+        return
+
+    loader = FILE_FORMAT_REGISTRY[file_type]
+    opener = _DATASET_OPENERS.get(loader)
+    windows = {var_name: window for var_name in var_names}
+    if var_windows is not None:
+        windows.update(var_windows)
+
+    if opener is None:
+        for var_name in var_names:
+            LOGGER.info("Loading variable '%s' from file: %s", var_name, file)
+            try:
+                yield (
+                    var_name,
+                    loader(file, var_name, lazy=lazy, window=windows[var_name]),
+                )
+            except Exception as err:
+                yield var_name, err
+        return
+
+    # The file is opened when the first variable is loaded. If it cannot be opened,
+    # the attempt is repeated for each variable so that each reports the error.
+    dataset: Dataset | None = None
+    try:
+        for var_name in var_names:
+            LOGGER.info("Loading variable '%s' from file: %s", var_name, file)
+            try:
+                if dataset is None:
+                    dataset = opener(file, lazy=lazy)
+                darray = _select_dataarray(
+                    dataset, file, var_name, lazy=lazy, window=windows[var_name]
+                )
+            except Exception as err:
+                yield var_name, err
+            else:
+                yield var_name, darray
+    finally:
+        if dataset is not None and not lazy:
+            with NETCDF_LOCK:
+                dataset.close()
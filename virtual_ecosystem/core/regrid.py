@@ -0,0 +1,284 @@
+"""The :mod:`~virtual_ecosystem.core.regrid` module provides conservative regridding of
+input data onto the cells of a simulation :class:`~virtual_ecosystem.core.grid.Grid`.
+
+Input data, such as climate reanalysis forcing, is often provided on a coarser regular
+grid than the simulation grid. The axis validators in
+:mod:`~virtual_ecosystem.core.axes` require ``x`` and ``y`` coordinates to map
+one-to-one onto the grid cells, so this data must be regridded before it can be used.
+The
+:func:`~virtual_ecosystem.core.regrid.get_regridding_weights` function calculates
+area-weighted interpolation weights from the source grid cells onto the simulation grid
+cells, as a sparse matrix in which each row gives the proportion of the area of a grid
+cell that is covered by each source cell. Data is then regridded using
+:func:`~virtual_ecosystem.core.regrid.regrid_dataarray`, which applies the weights as a
+sparse matrix product to each slice of the data. This conserves the area-weighted mean
+of the source data.
+
+Calculating the weights requires intersecting the source and grid cell geometries, so
+the :class:`~virtual_ecosystem.core.regrid.RegriddingWeightsCache` class stores the
+weights for each source grid, both in memory and optionally on disk, so that they are
+only calculated once.
+
+Source data is expected to have one-dimensional ``x`` and ``y`` coordinates giving the
+centres of regularly or irregularly spaced rectangular cells. The cell edges are placed
+midway between the coordinates, and the outer edges are placed half a cell width beyond
+the outer coordinates.
+"""  # noqa: D205
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from threading import Lock
+
+import numpy as np
+import shapely
+from scipy.sparse import csr_array, load_npz, save_npz
+from xarray import DataArray, apply_ufunc
+
+from virtual_ecosystem.core.grid import Grid
+from virtual_ecosystem.core.logger import LOGGER
+
+
+def _cell_edges(centres: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Get the lower and upper edges of cells from their centre coordinates.
+
+    Args:
+        centres: A one dimensional array of monotonic cell centre coordinates.
+
+    Returns:
+        Arrays of the lower and upper edges of each cell.
+    """
+
+    if centres.size == 1:
+        to_raise = ValueError("Regridding requires at least two coordinates on x and y")
+        LOGGER.critical(to_raise)
+        raise to_raise
+
+    midpoints = (centres[1:] + centres[:-1]) / 2
+    edges = np.concatenate(
+        [
+            [centres[0] - (midpoints[0] - centres[0])],
+            midpoints,
+            [centres[-1] + (centres[-1] - midpoints[-1])],
+        ]
+    )
+
+    return np.minimum(edges[:-1], edges[1:]), np.maximum(edges[:-1], edges[1:])
+
+
+def get_regridding_weights(
+    x_coords: np.ndarray, y_coords: np.ndarray, grid: Grid
+) -> csr_array:
+    """Calculate area-weighted regridding weights from a source grid onto a Grid.
+
+    The weights are returned as a sparse array with a row for each grid cell and a
+    column for each source cell. The source cells are ordered as the flattened ``(y,
+    x)`` array of source data. Each weight gives the proportion of the area of the grid
+    cell that falls within the source cell.
+
+    Args:
+        x_coords: The ``x`` coordinates of the source cell centres.
+        y_coords: The ``y`` coordinates of the source cell centres.
+        grid: The Grid to regrid data onto.
+
+    Raises:
+        ValueError: if the source cells do not cover all of the grid cells.
+    """
+
+    x_lower, x_upper = _cell_edges(np.asarray(x_coords, dtype=float))
+    y_lower, y_upper = _cell_edges(np.asarray(y_coords, dtype=float))
+
+    # Source cells in flattened (y, x) order
+    y_idx, x_idx = np.meshgrid(
+        np.arange(len(y_coords)), np.arange(len(x_coords)), indexing="ij"
+    )
+    source_cells = shapely.box(
+        x_lower[x_idx.ravel()],
+        y_lower[y_idx.ravel()],
+        x_upper[x_idx.ravel()],
+        y_upper[y_idx.ravel()],
+    )
+
+    # Find the overlapping pairs of grid and source cells and their intersection areas
+    grid_cells = np.array(grid.polygons)
+    grid_idx, source_idx = shapely.STRtree(source_cells).query(
+        grid_cells, predicate="intersects"
+    )
+    overlap = shapely.area(
+        shapely.intersection(grid_cells[grid_idx], source_cells[source_idx])
+    )
+
+    weights = csr_array(
+        (overlap / shapely.area(grid_cells[grid_idx]), (grid_idx, source_idx)),
+        shape=(grid.n_cells, source_cells.size),
+    )
+    weights.eliminate_zeros()
+
+    coverage = weights.sum(axis=1)
+    if not np.allclose(coverage, 1):
+        to_raise = ValueError(
+            f"Source data does not cover {np.sum(~np.isclose(coverage, 1))} grid cells"
+        )
+        LOGGER.critical(to_raise)
+        raise to_raise
+
+    return weights
+
+
+def get_regridding_key(x_coords: np.ndarray, y_coords: np.ndarray, grid: Grid) -> str:
+    """Get a key identifying the regridding weights between a source grid and a Grid.
+
+    Args:
+        x_coords: The ``x`` coordinates of the source cell centres.
+        y_coords: The ``y`` coordinates of the source cell centres.
+        grid: The Grid to regrid data onto.
+
+    Returns:
+        A hexadecimal key identifying the regridding weights.
+    """
+
+    digest = hashlib.sha256()
+    digest.update(np.ascontiguousarray(x_coords, dtype=float).tobytes())
+    digest.update(np.ascontiguousarray(y_coords, dtype=float).tobytes())
+    digest.update(
+        json.dumps(
+            [
+                len(x_coords),
+                grid.grid_type,
+                grid.cell_area,
+                grid.cell_nx,
+                grid.cell_ny,
+                grid.xoff,
+                grid.yoff,
+            ]
+        ).encode()
+    )
+
+    return digest.hexdigest()
+
+
+class RegriddingWeightsCache:
+    """A cache of regridding weights.
+
+    Weights are held in memory for each source grid and, if a folder is provided, are
+    also stored on disk so that they can be reused by later simulations.
+
+    Args:
+        folder: An optional folder used to store regridding weights. This is created if
+            it does not exist.
+    """
+
+    def __init__(self, folder: Path | None = None) -> None:
+        self.folder: Path | None = None if folder is None else Path(folder)
+        """The folder used to store regridding weights."""
+        self._weights: dict[str, csr_array] = {}
+        self._lock = Lock()
+
+        if self.folder is not None:
+            self.folder.mkdir(parents=True, exist_ok=True)
+
+    def get_weights(
+        self, x_coords: np.ndarray, y_coords: np.ndarray, grid: Grid
+    ) -> csr_array:
+        """Get the regridding weights between a source grid and a Grid.
+
+        Args:
+            x_coords: The ``x`` coordinates of the source cell centres.
+            y_coords: The ``y`` coordinates of the source cell centres.
+            grid: The Grid to regrid data onto.
+        """
+
+        key = get_regridding_key(x_coords, y_coords, grid)
+
+        # Data can be loaded concurrently, so hold a lock to only calculate and store
+        # the weights for a source grid once.
+        with self._lock:
+            if key not in self._weights:
+                self._weights[key] = self._load_or_calculate(
+                    key, x_coords, y_coords, grid
+                )
+
+        return self._weights[key]
+
+    def _load_or_calculate(
+        self, key: str, x_coords: np.ndarray, y_coords: np.ndarray, grid: Grid
+    ) -> csr_array:
+        """Load regridding weights from disk or calculate them if not available.
+
+        Args:
+            key: The key identifying the regridding weights.
+            x_coords: The ``x`` coordinates of the source cell centres.
+            y_coords: The ``y`` coordinates of the source cell centres.
+            grid: The Grid to regrid data onto.
+        """
+
+        weights_file = None if self.folder is None else self.folder / f"{key}.npz"
+
+        if weights_file is not None and weights_file.exists():
+            LOGGER.info(f"Loading regridding weights from {weights_file}")
+            weights = csr_array(load_npz(weights_file))
+        else:
+            weights = get_regridding_weights(x_coords, y_coords, grid)
+            if weights_file is not None:
+                save_npz(weights_file, weights)
+                LOGGER.info(f"Saved regridding weights to {weights_file}")
+
+        return weights
+
+
+def regrid_dataarray(
+    darray: DataArray,
+    grid: Grid,
+    weights_cache: RegriddingWeightsCache | None = None,
+) -> DataArray:
+    """Regrid a DataArray with ``x`` and ``y`` dimensions onto the cells of a Grid.
+
+    The ``x`` and ``y`` dimensions are replaced with a ``cell_id`` dimension. The
+    regridding weights are applied separately to each slice along the other dimensions
+    and, for lazily loaded data, each chunk is regridded when it is computed.
+
+    Args:
+        darray: The DataArray to regrid.
+        grid: The Grid to regrid data onto.
+        weights_cache: An optional cache of regridding weights.
+
+    Raises:
+        ValueError: if the data does not have ``x`` and ``y`` coordinates or does not
+            cover the grid.
+    """
+
+    if not {"x", "y"}.issubset(darray.coords):
+        to_raise = ValueError("Regridding requires data with x and y coordinates")
+        LOGGER.critical(to_raise)
+        raise to_raise
+
+    if weights_cache is None:
+        weights_cache = RegriddingWeightsCache()
+
+    weights = weights_cache.get_weights(darray["x"].values, darray["y"].values, grid)
+
+    # Each regridded slice needs all of the source cells, so lazily loaded data that is
+    # chunked along the spatial dimensions is rechunked to a single spatial chunk.
+    if darray.chunks is not None:
+        darray = darray.chunk({"y": -1, "x": -1})
+
+    def _apply_weights(values: np.ndarray) -> np.ndarray:
+        # Apply the weights to the flattened (y, x) values for each slice
+        slices = values.reshape(-1, values.shape[-2] * values.shape[-1])
+        regridded = (weights @ slices.T).T
+        return regridded.reshape((*values.shape[:-2], grid.n_cells))
+
+    regridded = apply_ufunc(
+        _apply_weights,
+        darray,
+        input_core_dims=[["y", "x"]],
+        output_core_dims=[["cell_id"]],
+        dask="parallelized",
+        output_dtypes=[np.result_type(darray.dtype, weights.dtype)],
+        dask_gufunc_kwargs={"output_sizes": {"cell_id": grid.n_cells}},
+        keep_attrs=True,
+    )
+
+    return regridded.assign_coords(cell_id=grid.cell_id)
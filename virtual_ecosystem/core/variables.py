@@ -24,13 +24,24 @@ as:
     axis = ["axis1", "axis2"]
 
 where `axis1` and `axis2` are the name of axis validators defined
-on :mod:`~virtual_ecosystem.core.axes`.
+on :mod:`~virtual_ecosystem.core.axes`. Variables that are only calculated to be
+output, such as solver statistics, can also set ``diagnostic = true``.
+
+The declared variable usage is also used to find variables that are not needed in a
+run. The :func:`~virtual_ecosystem.core.variables.get_model_variables` function gives
+the variables used by a set of models, so that input data for other variables does not
+need to be loaded. Once the `RUN_VARIABLES_REGISTRY` is set up,
+:func:`~virtual_ecosystem.core.variables.get_unused_data_variables` finds input data
+variables that no model reads and
+:func:`~virtual_ecosystem.core.variables.get_unconsumed_variables` finds variables that
+models update but that no model reads. Diagnostic variables are intended as outputs and
+are not included.
 """
 
 import json
 import pkgutil
 import sys
-from collections.abc import Hashable
+from collections.abc import Hashable, Iterable
 from dataclasses import asdict, dataclass, field
 from graphlib import CycleError, TopologicalSorter
 from importlib import import_module, resources
@@ -78,6 +89,8 @@ class Variable:
     """Type of the variable."""
     axis: tuple[str, ...]
     """Axes the variable is defined on."""
+    diagnostic: bool = False
+    """Is the variable only calculated to be output."""
     populated_by_init: list[str] = field(default_factory=list, init=False)
     """Model that initialised the variable either in init or by input data."""
     populated_by_update: list[str] = field(default_factory=list, init=False)
@@ -440,6 +453,68 @@ def setup_variables(
     _collect_vars_required_for_update(models)
 
 
+def get_model_variables(models: Iterable[type[base_model.BaseModel]]) -> set[str]:
+    """Get the variables that are used by a set of models.
+
+    This includes all variables that the models declare as required, populated or
+    updated, and can be found before any data is loaded.
+
+    Args:
+        models: The models to get the variables for.
+
+    Returns:
+        The set of variable names used by the models.
+    """
+    model_vars: set[str] = set()
+    for model in models:
+        model_vars.update(
+            model.vars_required_for_init,
+            model.vars_required_for_update,
+            model.vars_populated_by_init,
+            model.vars_populated_by_first_update,
+            model.vars_updated,
+        )
+
+    return model_vars
+
+
+def get_unused_data_variables() -> list[str]:
+    """Get the input data variables that are not used by any model in a run.
+
+    These are variables in the `RUN_VARIABLES_REGISTRY` that are initialised by the
+    data object, but are not required or updated by any model.
+
+    Returns:
+        The names of the unused variables.
+    """
+    return [
+        var.name
+        for var in RUN_VARIABLES_REGISTRY.values()
+        if "data" in var.populated_by_init
+        and not (var.required_by_init or var.required_by_update or var.updated_by)
+    ]
+
+
+def get_unconsumed_variables() -> list[str]:
+    """Get the variables that are updated by a model but not used by any model.
+
+    These are variables in the `RUN_VARIABLES_REGISTRY` that are populated or updated
+    during model updates, but that no model requires for initialisation or update. The
+    values of these variables do not affect the simulation, but may still be of
+    interest as outputs. Diagnostic variables are calculated to be output, so are not
+    included.
+
+    Returns:
+        The names of the unconsumed variables.
+    """
+    return [
+        var.name
+        for var in RUN_VARIABLES_REGISTRY.values()
+        if (var.updated_by or var.populated_by_update)
+        and not (var.required_by_init or var.required_by_update or var.diagnostic)
+    ]
+
+
 def verify_variables_axis() -> None:
     """Verify that all required variables have valid, available axis."""
     for var in RUN_VARIABLES_REGISTRY.values():
@@ -15,6 +15,7 @@ from virtual_ecosystem.core import variables
 from virtual_ecosystem.core.config import Config
 from virtual_ecosystem.core.core_components import CoreComponents
 from virtual_ecosystem.core.data import Data, merge_continuous_data_files
+from virtual_ecosystem.core.data_tracing import DataTracer
 from virtual_ecosystem.core.exceptions import ConfigurationError, InitialisationError
 from virtual_ecosystem.core.grid import Grid
 from virtual_ecosystem.core.logger import LOGGER, add_file_logger, remove_file_logger
@@ -117,7 +118,11 @@ def ve_run(
         print("* Built core model components")
 
     data = Data(grid)
-    data.load_data_config(config)
+    data.load_data_config(
+        config,
+        model_timing=core_components.model_timing,
+        used_variables=variables.get_model_variables(config.model_classes.values()),
+    )
     if progress:
         print("* Initial data loaded")
 
@@ -129,6 +134,19 @@ def ve_run(
     # Verify that all variables have the correct axis
     variables.verify_variables_axis()
 
+    # Report variables that do not affect the simulation
+    unused_variables = variables.get_unused_data_variables()
+    if unused_variables:
+        LOGGER.warning(
+            f"Input data variables not used by any model: {', '.join(unused_variables)}"
+        )
+    unconsumed_variables = variables.get_unconsumed_variables()
+    if unconsumed_variables:
+        LOGGER.info(
+            "Updated variables not used by any model: "
+            f"{', '.join(unconsumed_variables)}"
+        )
+
     LOGGER.info("All models found in the registry, now attempting to configure them.")
 
     # Get the model initialisation sequence and initialise
@@ -148,13 +166,23 @@ def ve_run(
 
     LOGGER.info("All models successfully intialised.")
 
+    # Optionally trace the data access of the models during setup and update
+    tracer = None
+    if config["core"]["data"]["trace_data_access"]:
+        tracer = DataTracer(data)
+        tracer.trace_models(models_init.values())
+
     # Setup all models (those with placeholder setup processes won't change at all)
     for model in models_init.values():
         model.setup()
 
     LOGGER.info("All models successfully set up.")
 
-    # TODO - A model spin up might be needed here in future
+    # Spin up all models (most models do not currently need a spin up)
+    for model in models_init.values():
+        model.spinup()
+
+    LOGGER.info("All models successfully spun up.")
 
     # Create output folder if it does not exist
     out_path = Path(config["core"]["data_output_options"]["out_path"])
@@ -179,6 +207,11 @@ def ve_run(
     all_variables = (model.vars_updated for model in models_init.values())
     # Then flatten the list to generate list of variables to output
     variables_to_save = list(chain.from_iterable(all_variables))
+    # Variables that no model uses are only output if requested
+    if not config["core"]["data_output_options"]["save_unconsumed_variables"]:
+        variables_to_save = [
+            var for var in variables_to_save if var not in unconsumed_variables
+        ]
 
     # Take the models in their current execution sequence and change to the model update
     # sequence
@@ -217,6 +250,12 @@ def ve_run(
 
     pbar.close()
 
+    # Clean up the models, which shuts down any worker processes used by the models,
+    # and stop any background extraction of forcing slices
+    for model in models_update.values():
+        model.cleanup()
+    data.close()
+
     if progress:
         print("* Simulation completed")
 
@@ -236,6 +275,9 @@ def ve_run(
         if progress:
             print("* Saved final model state")
 
+    if tracer is not None:
+        tracer.log_report()
+
     LOGGER.info("Virtual Ecosystem model run completed!")
 
     # Restore default logging settings
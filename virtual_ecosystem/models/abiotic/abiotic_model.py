@@ -238,7 +238,9 @@ class AbioticModel(
 
         initial_canopy_and_soil = energy_balance.initialise_canopy_and_soil_fluxes(
             air_temperature=initial_microclimate["air_temperature"],
-            topofcanopy_radiation=self.data["topofcanopy_radiation"].isel(time_index=0),
+            topofcanopy_radiation=self.data.get_forcing_slice(
+                "topofcanopy_radiation", 0
+            ),
             leaf_area_index=self.data["leaf_area_index"],
             layer_heights=self.data["layer_heights"],
             layer_structure=self.layer_structure,
@@ -320,7 +322,7 @@ class AbioticModel(
                 self.data["sensible_heat_flux"][1].to_numpy()
             ),
             wind_speed_ref=(
-                self.data["wind_speed_ref"].isel(time_index=time_index).to_numpy()
+                self.data.get_forcing_slice("wind_speed_ref", time_index).to_numpy()
             ),
             wind_reference_height=(
                 self.data["layer_heights"][1]
@@ -407,10 +407,10 @@ def calculate_leaf_and_air_temperature(
         / -data["layer_heights"][layer_structure.index_topsoil_scalar]
         / core_constants.meters_to_mm
     )
-    air_temperature_ref = data["air_temperature_ref"].isel(time_index=time_index)
-    vapour_pressure_ref = data["vapour_pressure_ref"].isel(time_index=time_index)
-    atmospheric_pressure_ref = data["atmospheric_pressure_ref"].isel(
-        time_index=time_index
+    air_temperature_ref = data.get_forcing_slice("air_temperature_ref", time_index)
+    vapour_pressure_ref = data.get_forcing_slice("vapour_pressure_ref", time_index)
+    atmospheric_pressure_ref = data.get_forcing_slice(
+        "atmospheric_pressure_ref", time_index
     )
 
     # Calculate vapour pressures
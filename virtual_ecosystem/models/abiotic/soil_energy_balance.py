@@ -239,8 +239,8 @@ def calculate_soil_heat_balance(
     output = {}
 
     # Calculate soil absorption of shortwave radiation, [W m-2]
-    shortwave_radiation_surface = data["topofcanopy_radiation"].isel(
-        time_index=time_index
+    shortwave_radiation_surface = data.get_forcing_slice(
+        "topofcanopy_radiation", time_index
     ) - (data["canopy_absorption"].sum(dim="layers"))
     soil_absorption = calculate_soil_absorption(
         shortwave_radiation_surface=shortwave_radiation_surface.to_numpy(),
@@ -99,7 +99,7 @@ def run_microclimate(
 
         output[var] = log_interpolation(
             data=data,
-            reference_data=data[var + "_ref"].isel(time_index=time_index),
+            reference_data=data.get_forcing_slice(var + "_ref", time_index),
             leaf_area_index_sum=leaf_area_index_sum,
             layer_structure=layer_structure,
             layer_heights=data["layer_heights"],
@@ -111,16 +111,16 @@ def run_microclimate(
     # Mean atmospheric pressure profile, [kPa]
     # TODO: this should only be filled for filled/true above ground layers
     output["atmospheric_pressure"] = layer_structure.from_template()
-    output["atmospheric_pressure"][layer_structure.index_atmosphere] = data[
-        "atmospheric_pressure_ref"
-    ].isel(time_index=time_index)
+    output["atmospheric_pressure"][layer_structure.index_atmosphere] = (
+        data.get_forcing_slice("atmospheric_pressure_ref", time_index)
+    )
 
     # Mean atmospheric C02 profile, [ppm]
     # TODO: this should only be filled for filled/true above ground layers
     output["atmospheric_co2"] = layer_structure.from_template()
-    output["atmospheric_co2"][layer_structure.index_atmosphere] = data[
-        "atmospheric_co2_ref"
-    ].isel(time_index=time_index)
+    output["atmospheric_co2"][layer_structure.index_atmosphere] = (
+        data.get_forcing_slice("atmospheric_co2_ref", time_index)
+    )
 
     # Calculate soil temperatures
     lower, upper = getattr(bounds, "soil_temperature")
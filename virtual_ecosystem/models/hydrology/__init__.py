@@ -20,6 +20,10 @@ Each of the hydrology sub-modules has its own API reference page:
   Ecosystem. At the moment, this includes vertical flow, soil moisture and
   matric potential, groundwater storage, and subsurface horizontal flow.
 
+* The :mod:`~virtual_ecosystem.models.hydrology.flow_routing` submodule calculates
+  the direction of horizontal flow between grid cells from the elevation, using a
+  priority-flood depression fill and steepest descent routing.
+
 * The :mod:`~virtual_ecosystem.models.hydrology.constants` submodule contains
   parameters and constants for the hydrology model.
 
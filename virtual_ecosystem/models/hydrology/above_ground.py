@@ -8,13 +8,18 @@ TODO change temperatures to Kelvin
 TODO add canopy evaporation
 """  # noqa: D205
 
+from collections.abc import Iterator
 from math import sqrt
 
 import numpy as np
 from numpy.typing import NDArray
+from scipy.sparse import csr_array  # type: ignore
 
+from virtual_ecosystem.core.data import Data
+from virtual_ecosystem.core.downscaling import register_downscaling_method
 from virtual_ecosystem.core.grid import Grid
 from virtual_ecosystem.core.logger import LOGGER
+from virtual_ecosystem.models.hydrology.flow_routing import get_flow_routing
 
 
 def calculate_soil_evaporation(
@@ -121,30 +126,6 @@ def calculate_soil_evaporation(
     return output
 
 
-def find_lowest_neighbour(
-    neighbours: list[np.ndarray],
-    elevation: np.ndarray,
-) -> list[int]:
-    """Find lowest neighbour for each grid cell from digital elevation model.
-
-    This function finds the cell IDs of the lowest neighbour for each grid cell. This
-    can be used to determine in which direction surface runoff flows.
-
-    Args:
-        neighbours: List of neighbour IDs
-        elevation: Elevation, [m]
-
-    Returns:
-        list of lowest neighbour IDs
-    """
-    lowest_neighbour = []
-    for cell_id, neighbors_id in enumerate(neighbours):
-        downstream_id_loc = np.argmax(elevation[cell_id] - elevation[neighbors_id])
-        lowest_neighbour.append(neighbors_id[downstream_id_loc])
-
-    return lowest_neighbour
-
-
 def find_upstream_cells(lowest_neighbour: list[int]) -> list[list[int]]:
     """Find all upstream cell IDs for all grid cells.
 
@@ -165,8 +146,39 @@ def find_upstream_cells(lowest_neighbour: list[int]) -> list[list[int]]:
     return upstream_ids
 
 
+def calculate_upstream_matrix(drainage_map: dict[int, list[int]]) -> csr_array:
+    """Compile a drainage map into a sparse upstream adjacency matrix.
+
+    The matrix has a row and a column for each grid cell, with a value of one in row
+    ``i`` and column ``j`` if cell ``j`` is upstream of cell ``i`` in the drainage map.
+    The flow from the upstream cells of every grid cell can then be summed with a
+    single sparse matrix multiplication.
+
+    Args:
+        drainage_map: Dict of all upstream IDs for each grid cell
+
+    Returns:
+        sparse upstream adjacency matrix
+    """
+
+    n_cells = len(drainage_map)
+    rows = np.repeat(
+        np.arange(n_cells),
+        [len(upstream_ids) for upstream_ids in drainage_map.values()],
+    )
+    cols = np.fromiter(
+        (cell for upstream_ids in drainage_map.values() for cell in upstream_ids),
+        dtype=np.int_,
+        count=len(rows),
+    )
+
+    return csr_array(
+        (np.ones(len(rows)), (rows, cols)), shape=(n_cells, n_cells), dtype=np.float64
+    )
+
+
 def accumulate_horizontal_flow(
-    drainage_map: dict[int, list[int]],
+    drainage_map: dict[int, list[int]] | csr_array,
     current_flow: np.ndarray,
     previous_accumulated_flow: np.ndarray,
 ) -> np.ndarray:
@@ -174,12 +186,131 @@ def accumulate_horizontal_flow(
 
     This function takes the accumulated above-/belowground horizontal flow from the
     previous timestep and adds all (sub-)surface flow of the current time step from
-    upstream cell IDs.
+    upstream cell IDs. The accumulated flow is updated in place.
+
+    The drainage map can be provided as the upstream adjacency matrix from
+    :func:`~virtual_ecosystem.models.hydrology.above_ground.calculate_upstream_matrix`,
+    which should be calculated once and reused when the flow is accumulated repeatedly.
 
     The function currently raises a `ValueError` if accumulated flow is negative.
 
+    Args:
+        drainage_map: Dict of all upstream IDs for each grid cell, or the upstream
+            adjacency matrix
+        current_flow: (Sub-)surface flow of the current time step, [mm]
+        previous_accumulated_flow: Accumulated flow from previous time step, [mm]
+
+    Returns:
+        accumulated (sub-)surface flow, [mm]
+    """
+
+    if isinstance(drainage_map, dict):
+        drainage_map = calculate_upstream_matrix(drainage_map)
+
+    current_flow_true = np.nan_to_num(np.asarray(current_flow, dtype=np.float64))
+    upstream_flow = drainage_map @ current_flow_true
+    previous_accumulated_flow += upstream_flow.astype(
+        previous_accumulated_flow.dtype, copy=False
+    )
+
+    if (previous_accumulated_flow < 0.0).any():
+        to_raise = ValueError("The accumulated flow should not be negative!")
+        LOGGER.error(to_raise)
+        raise to_raise
+
+    return previous_accumulated_flow
+
+
+def calculate_downstream_cells(drainage_map: dict[int, list[int]]) -> NDArray[np.int_]:
+    """Find the downstream cell ID for each grid cell from a drainage map.
+
+    Cells that are not upstream of any cell, or that are only upstream of themselves,
+    are sinks and are given their own cell ID.
+
     Args:
         drainage_map: Dict of all upstream IDs for each grid cell
+
+    Returns:
+        downstream cell ID for each grid cell
+    """
+
+    downstream = np.arange(len(drainage_map))
+    for cell_id, upstream_ids in drainage_map.items():
+        downstream[upstream_ids] = cell_id
+
+    return downstream
+
+
+def calculate_flow_levels(downstream: NDArray[np.int_]) -> list[NDArray[np.int_]]:
+    """Sort grid cells into topological levels of the drainage network.
+
+    The first level contains the cells without any upstream cells, and each following
+    level contains the cells for which all upstream cells are in previous levels. The
+    flow of all cells in a level can therefore be passed downstream at the same time.
+    The levels are found by repeatedly removing the cells that have no remaining
+    upstream cells.
+
+    Args:
+        downstream: Downstream cell ID for each grid cell, with sinks draining to
+            themselves
+
+    Returns:
+        arrays of the cell IDs in each level
+
+    Raises:
+        ValueError: if the drainage network contains a cycle, so that the cells in the
+            cycle can not be sorted.
+    """
+
+    n_cells = len(downstream)
+    cell_ids = np.arange(n_cells)
+    drains = downstream != cell_ids
+    n_upstream = np.bincount(downstream[drains], minlength=n_cells)
+
+    levels = []
+    level = np.flatnonzero(n_upstream == 0)
+    n_sorted = 0
+    while level.size:
+        levels.append(level)
+        n_sorted += level.size
+
+        # Remove the level from the upstream counts of its downstream cells
+        receivers = downstream[level[drains[level]]]
+        n_upstream -= np.bincount(receivers, minlength=n_cells)
+        receivers = np.unique(receivers)
+        level = receivers[n_upstream[receivers] == 0]
+
+    if n_sorted < n_cells:
+        to_raise = ValueError("The drainage network contains a cycle!")
+        LOGGER.error(to_raise)
+        raise to_raise
+
+    return levels
+
+
+def accumulate_catchment_flow(
+    downstream: NDArray[np.int_],
+    flow_levels: list[NDArray[np.int_]],
+    current_flow: np.ndarray,
+    previous_accumulated_flow: np.ndarray,
+) -> np.ndarray:
+    """Calculate accumulated horizontal flow from the full catchment of each grid cell.
+
+    Unlike
+    :func:`~virtual_ecosystem.models.hydrology.above_ground.accumulate_horizontal_flow`,
+    which only adds the flow from the direct upstream neighbours, this function adds
+    the (sub-)surface flow of the current time step from each grid cell and all cells
+    that drain through it. The flow is passed downstream one topological level at a
+    time, so that the flow leaving a cell includes the flow from its whole catchment.
+    The accumulated flow is updated in place.
+
+    The function currently raises a `ValueError` if accumulated flow is negative.
+
+    Args:
+        downstream: Downstream cell ID for each grid cell, with sinks draining to
+            themselves
+        flow_levels: Arrays of the cell IDs in each topological level, see
+            :func:`~virtual_ecosystem.models.hydrology.above_ground.calculate_flow_levels`
         current_flow: (Sub-)surface flow of the current time step, [mm]
         previous_accumulated_flow: Accumulated flow from previous time step, [mm]
 
@@ -187,9 +318,17 @@ def accumulate_horizontal_flow(
         accumulated (sub-)surface flow, [mm]
     """
 
-    current_flow_true = np.nan_to_num(current_flow, nan=0.0)
-    for cell_id, upstream_ids in enumerate(drainage_map.values()):
-        previous_accumulated_flow[cell_id] += np.sum(current_flow_true[upstream_ids])
+    n_cells = len(downstream)
+    catchment_flow = np.nan_to_num(np.array(current_flow, dtype=np.float64))
+    for level in flow_levels:
+        level = level[downstream[level] != level]
+        catchment_flow += np.bincount(
+            downstream[level], weights=catchment_flow[level], minlength=n_cells
+        )
+
+    previous_accumulated_flow += catchment_flow.astype(
+        previous_accumulated_flow.dtype, copy=False
+    )
 
     if (previous_accumulated_flow < 0.0).any():
         to_raise = ValueError("The accumulated flow should not be negative!")
@@ -199,16 +338,25 @@ def accumulate_horizontal_flow(
     return previous_accumulated_flow
 
 
-def calculate_drainage_map(grid: Grid, elevation: np.ndarray) -> dict[int, list[int]]:
+def calculate_drainage_map(
+    grid: Grid, elevation: np.ndarray, flow_routing: str = "lowest_neighbour"
+) -> dict[int, list[int]]:
     """Calculate drainage map based on digital elevation model.
 
-    This function finds the lowest neighbour for each grid cell, identifies all upstream
+    This function finds the downstream cell for each grid cell, identifies all upstream
     cell IDs and creates a dictionary that provides all upstream cell IDs for each grid
-    cell. This function currently supports only square grids.
+    cell. Two flow routing methods are available:
+
+    * ``lowest_neighbour`` routes flow to the lowest neighbour of each cell, sharing an
+      edge with the cell. This method currently supports only square grids.
+    * ``steepest_descent`` fills depressions in the elevation and routes flow to the
+      neighbour with the steepest downhill slope, on square and hexagon grids. See
+      :mod:`~virtual_ecosystem.models.hydrology.flow_routing` for details.
 
     Args:
         grid: Grid object
         elevation: Elevation, [m]
+        flow_routing: The flow routing method
 
     Returns:
         dictionary of cell IDs and their upstream neighbours
@@ -216,13 +364,21 @@ def calculate_drainage_map(grid: Grid, elevation: np.ndarray) -> dict[int, list[
     TODO move this to core.grid once we decided on common use
     """
 
+    if flow_routing == "steepest_descent":
+        return get_flow_routing(grid, np.asarray(elevation)).drainage_map
+
+    if flow_routing != "lowest_neighbour":
+        to_raise = ValueError(f"Unknown flow routing method: {flow_routing}")
+        LOGGER.error(to_raise)
+        raise to_raise
+
     if grid.grid_type != "square":
         to_raise = ValueError("This grid type is currently not supported!")
         LOGGER.error(to_raise)
         raise to_raise
 
     grid.set_neighbours(distance=sqrt(grid.cell_area))
-    lowest_neighbours = find_lowest_neighbour(grid.neighbours, elevation)
+    lowest_neighbours = grid.argmin_neighbours(elevation).tolist()
     upstream_ids = find_upstream_cells(lowest_neighbours)
 
     return dict(enumerate(upstream_ids))
@@ -302,7 +458,10 @@ def distribute_monthly_rainfall(
 
     At the moment, this function allocates each millimeter of monthly rainfall to a
     randomly selected day. In the future, this allocation could be based on observed
-    rainfall patterns.
+    rainfall patterns. The number of millimeters allocated to each day is drawn for all
+    grid cells at once from a multinomial distribution with equal probabilities for
+    each day, and the daily amounts are then scaled to the total monthly rainfall.
+    Cells with less than one millimeter of rainfall receive no rainfall.
 
     Args:
         total_monthly_rainfall: Total monthly rainfall, [mm]
@@ -314,18 +473,72 @@ def distribute_monthly_rainfall(
     """
     rng = np.random.default_rng(seed)
 
-    daily_rainfall_data = []
-    for rainfall in total_monthly_rainfall:
-        daily_rainfall = np.zeros(num_days)
+    total_monthly_rainfall = np.asarray(total_monthly_rainfall)
+    rainy_days = rng.multinomial(
+        total_monthly_rainfall.astype(np.int64), np.full(num_days, 1 / num_days)
+    )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        daily_rainfall = (
+            rainy_days * (total_monthly_rainfall / rainy_days.sum(axis=-1))[..., None]
+        )
+
+    return np.nan_to_num(daily_rainfall, nan=0.0)
 
-        for _ in range(int(rainfall)):
-            day = rng.integers(0, num_days, seed)  # Randomly select a day
-            daily_rainfall[day] += 1.0  # Add 1.0 mm of rainfall to the selected day
 
-        daily_rainfall *= rainfall / np.sum(daily_rainfall)
-        daily_rainfall_data.append(daily_rainfall)
+@register_downscaling_method("monthly_rainfall")
+def downscale_monthly_rainfall(
+    data: Data,
+    var_name: str,
+    time_index: int,
+    n_steps: int,
+    seed: int | None = None,
+) -> Iterator[NDArray[np.float32]]:
+    """Downscale monthly rainfall to daily values for each day in turn.
+
+    This is registered as a temporal downscaling method, see
+    :mod:`~virtual_ecosystem.core.downscaling`, and is used to generate the daily
+    rainfall within a hydrology update. Each millimeter of monthly rainfall is allocated
+    to a randomly selected day, as in :func:`distribute_monthly_rainfall`, but the
+    rainfall for each day is drawn as it is used. The number of millimeters falling on
+    each day is drawn from a binomial distribution of the millimeters not yet allocated,
+    which gives the same multinomial distribution as allocating the whole month at once,
+    and the daily amounts are scaled so that they sum to the monthly total.
+
+    Unlike the core ``stochastic`` method, which rounds small totals up to a single
+    unit, cells with less than one millimeter of rainfall receive no rainfall, matching
+    :func:`distribute_monthly_rainfall`. Missing rainfall values are treated as zero
+    rainfall.
+
+    Args:
+        data: A Data instance containing the rainfall forcing, [mm]
+        var_name: The name of the rainfall variable
+        time_index: The index of the time step to downscale
+        n_steps: Number of days to distribute the rainfall over
+        seed: Seed for random number generator, optional
+
+    Yields:
+        An array containing the rainfall for each day, [mm]
+    """
+
+    rng = np.random.default_rng(seed)
+
+    total_monthly_rainfall = np.nan_to_num(
+        data.get_forcing_slice(var_name, time_index).to_numpy(), nan=0.0
+    )
+    n_millimeters = np.floor(np.clip(total_monthly_rainfall, 0, None)).astype(np.int64)
+    scaling = np.divide(
+        total_monthly_rainfall,
+        n_millimeters,
+        out=np.zeros_like(total_monthly_rainfall),
+        where=n_millimeters > 0,
+    )
 
-    return np.nan_to_num(np.array(daily_rainfall_data), nan=0.0)
+    remaining = n_millimeters
+    for day in range(n_steps):
+        rainy_millimeters = rng.binomial(remaining, 1 / (n_steps - day))
+        remaining = remaining - rainy_millimeters
+        yield rainy_millimeters * scaling
 
 
 def calculate_bypass_flow(
@@ -105,6 +105,195 @@ def calculate_vertical_flow(
     return np.array(flow_min)
 
 
+def solve_tridiagonal(
+    lower: NDArray[np.floating],
+    diagonal: NDArray[np.floating],
+    upper: NDArray[np.floating],
+    rhs: NDArray[np.floating],
+) -> NDArray[np.floating]:
+    """Solve a batch of tridiagonal systems of equations using the Thomas algorithm.
+
+    Each column of the inputs gives a separate system of equations, for example for
+    each grid cell, and the rows give the coefficients for each equation, for example
+    for each soil layer. The algorithm loops over the rows, so all systems in the batch
+    are solved at the same time. The systems are not pivoted, so they should be
+    diagonally dominant.
+
+    Args:
+        lower: The coefficients below the diagonal, the first row is not used
+        diagonal: The coefficients on the diagonal
+        upper: The coefficients above the diagonal, the last row is not used
+        rhs: The right hand side of the equations
+
+    Returns:
+        The solution of each system of equations
+    """
+
+    n_rows = len(diagonal)
+    upper_prime = np.empty_like(diagonal, dtype=np.float64)
+    rhs_prime = np.empty_like(diagonal, dtype=np.float64)
+
+    # Forward sweep to eliminate the coefficients below the diagonal
+    upper_prime[0] = upper[0] / diagonal[0]
+    rhs_prime[0] = rhs[0] / diagonal[0]
+    for row in range(1, n_rows):
+        denominator = diagonal[row] - lower[row] * upper_prime[row - 1]
+        upper_prime[row] = upper[row] / denominator
+        rhs_prime[row] = (rhs[row] - lower[row] * rhs_prime[row - 1]) / denominator
+
+    # Back substitution
+    solution = rhs_prime
+    for row in range(n_rows - 2, -1, -1):
+        solution[row] -= upper_prime[row] * solution[row + 1]
+
+    return solution
+
+
+def solve_vertical_flow_implicit(
+    soil_moisture: NDArray[np.float32],
+    soil_layer_thickness: NDArray[np.float32],
+    soil_moisture_capacity: float | NDArray[np.float32],
+    soil_moisture_residual: float | NDArray[np.float32],
+    hydraulic_conductivity: float | NDArray[np.float32],
+    hydraulic_gradient: float | NDArray[np.float32],
+    nonlinearily_parameter: float | NDArray[np.float32],
+    air_entry_water_potential: float,
+    water_retention_curvature: float,
+    water_potential_to_head: float,
+    seconds_to_day: float,
+    time_step: float = 1.0,
+    n_substeps: int = 1,
+) -> dict[str, NDArray[np.floating]]:
+    r"""Calculate vertical water flow through the soil column with an implicit solver.
+
+    This function solves the Richards equation for the soil moisture :math:`\Theta_{i}`
+    of each soil layer :math:`i` using a linearised backward Euler step. The downward
+    flow :math:`q_{i}` out of each layer is the sum of gravity drainage, using the
+    effective hydraulic conductivity :math:`K(S)` and hydraulic gradient as in
+    :func:`~virtual_ecosystem.models.hydrology.below_ground.calculate_vertical_flow`,
+    and capillary flow down the gradient in soil moisture to the layer below:
+
+    :math:`q_{i} = K(S_{i})(1-\frac{dh}{dl})
+    + D_{i+1/2}\frac{\Theta_{i}-\Theta_{i+1}}{\Delta z_{i+1/2}}`
+
+    where :math:`\Delta z_{i+1/2}` is the distance between the layer centres and
+    :math:`D = K(S)\frac{d\Psi}{d\Theta}` is the soil water diffusivity, averaged
+    between the two layers. The water potential :math:`\Psi` is given by the water
+    retention curve of
+    :func:`~virtual_ecosystem.models.hydrology.below_ground.convert_soil_moisture_to_water_potential`.
+    There is no flow through the top of the soil column and the lowest layer drains
+    freely by gravity into the groundwater.
+
+    The flows at the end of each step are linearised around the soil moisture at the
+    start of the step, which gives a tridiagonal system of equations for the change in
+    soil moisture in each grid cell. These are solved for all grid cells at the same
+    time using
+    :func:`~virtual_ecosystem.models.hydrology.below_ground.solve_tridiagonal`. The
+    implicit step remains stable for long time steps and thin soil layers, but the
+    linearised flows are only accurate while the soil moisture changes little within a
+    step. The time step is therefore split into ``n_substeps`` implicit steps, and more
+    substeps are needed for longer time steps and wetter, more conductive soils. The
+    soil moisture is kept between the residual and saturated soil moisture, and the
+    flows between layers are then calculated from the change in the water stored in
+    each layer, so that water is conserved.
+
+    Args:
+        soil_moisture: Volumetric relative water content for each soil layer,
+            [unitless]
+        soil_layer_thickness: Thickness of all soil_layers, [mm]
+        soil_moisture_capacity: Soil moisture capacity, [unitless]
+        soil_moisture_residual: Residual soil moisture, [unitless]
+        hydraulic_conductivity: Hydraulic conductivity of soil, [m/s]
+        hydraulic_gradient: Hydraulic gradient (change in hydraulic head) along the flow
+            path, positive values indicate downward flow, [m/m]
+        nonlinearily_parameter: Dimensionless parameter in van Genuchten model that
+            describes the degree of nonlinearity of the relationship between the
+            volumetric water content and the soil matric potential.
+        air_entry_water_potential: Water potential at which soil pores begin to aerate,
+            [kPa]
+        water_retention_curvature: Curvature of water retention curve, [unitless]
+        water_potential_to_head: Hydraulic head equivalent to a water potential of one
+            kilopascal, [mm kPa-1]
+        seconds_to_day: Factor to convert between second and day
+        time_step: Time step to solve over, [d]
+        n_substeps: Number of implicit steps used within the time step
+
+    Returns:
+        A dictionary containing the updated volumetric relative water content for each
+        soil layer, [unitless], and the mean vertical flow out of the bottom of each
+        soil layer over the time step, [mm d-1]
+    """
+
+    shape_parameter = 1 - 1 / nonlinearily_parameter
+    moisture_range = soil_moisture_capacity - soil_moisture_residual
+    conductivity_factor = hydraulic_conductivity * seconds_to_day
+    gravity_factor = (1 - hydraulic_gradient) * conductivity_factor
+    thickness = np.asarray(soil_layer_thickness, dtype=np.float64)
+    interface_distance = (thickness[:-1] + thickness[1:]) / 2
+    dt = time_step / n_substeps
+
+    initial_moisture = np.array(soil_moisture, dtype=np.float64)
+    moisture = initial_moisture.copy()
+    for _ in range(n_substeps):
+        # Effective saturation, kept away from zero and one where the derivatives of the
+        # conductivity and water potential are not defined
+        saturation = np.clip(
+            (moisture - soil_moisture_residual) / moisture_range, 1e-6, 1 - 1e-6
+        )
+        root = saturation ** (1 / shape_parameter)
+        shape_term = 1 - (1 - root) ** shape_parameter
+        conductivity = np.sqrt(saturation) * shape_term**2
+        d_conductivity = (
+            0.5 / np.sqrt(saturation) * shape_term**2
+            + 2
+            * np.sqrt(saturation)
+            * shape_term
+            * (1 - root) ** (shape_parameter - 1)
+            * root
+            / saturation
+        ) / moisture_range
+
+        # Gravity drainage from each layer and its derivative, [mm d-1]
+        gravity_flow = gravity_factor * conductivity
+        d_gravity_flow = gravity_factor * d_conductivity
+
+        # Diffusivity from the slope of the water retention curve, [mm2 d-1]
+        d_potential = (
+            air_entry_water_potential
+            * water_retention_curvature
+            / soil_moisture_capacity
+            * (moisture / soil_moisture_capacity) ** (water_retention_curvature - 1)
+        )
+        diffusivity = (
+            conductivity_factor * conductivity * d_potential * water_potential_to_head
+        )
+        exchange = (diffusivity[:-1] + diffusivity[1:]) / 2 / interface_distance
+
+        # Flow out of the bottom of each layer at the start of the step, [mm d-1]
+        flow = gravity_flow.copy()
+        flow[:-1] += exchange * (moisture[:-1] - moisture[1:])
+        inflow = np.zeros_like(flow)
+        inflow[1:] = flow[:-1]
+
+        # Assemble the tridiagonal system for the change in soil moisture
+        lower = np.zeros_like(moisture)
+        upper = np.zeros_like(moisture)
+        diagonal = thickness / dt + d_gravity_flow
+        diagonal[:-1] += exchange
+        diagonal[1:] += exchange
+        lower[1:] = -(d_gravity_flow[:-1] + exchange)
+        upper[:-1] = -exchange
+
+        moisture += solve_tridiagonal(lower, diagonal, upper, inflow - flow)
+        moisture = np.clip(moisture, soil_moisture_residual, soil_moisture_capacity)
+
+    # Flow out of each layer from the change in storage of that layer and the layers
+    # above, [mm d-1]
+    vertical_flow = np.cumsum((initial_moisture - moisture) * thickness, axis=0)
+
+    return {"soil_moisture": moisture, "vertical_flow": vertical_flow / time_step}
+
+
 def update_soil_moisture(
     soil_moisture: NDArray[np.float32],
     vertical_flow: NDArray[np.float32],
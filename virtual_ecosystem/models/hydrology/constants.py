@@ -119,6 +119,13 @@ class HydroConsts(ConstantsDataclass):
     :attr:`air_entry_water_potential` for further details.
     """
 
+    water_potential_to_head: float = 101.97
+    """Hydraulic head equivalent to a water potential of one kilopascal, [mm kPa-1].
+
+    This is used to convert the water retention curve into the capillary flow between
+    soil layers in the implicit vertical flow solver.
+    """
+
     extinction_coefficient_global_radiation: float = 0.7
     """Extinction coefficient for global radiation, [unitless].
 
@@ -0,0 +1,251 @@
+"""The ``models.hydrology.flow_routing`` module calculates the direction of horizontal
+flow between grid cells from a digital elevation model.
+
+Runoff that is routed directly to the lowest neighbour of each cell is trapped in local
+minima of the elevation data, such as pits and flat areas. The elevation is therefore
+first conditioned using a priority-flood depression fill
+:cite:p:`barnes_priority-flood_2014`: cells are flooded inwards from the edge of the
+grid in order of increasing elevation, and each cell is raised to just above the cell
+that it was flooded from. This removes all depressions and gives every interior cell a
+strictly downhill path to the edge of the grid.
+
+Flow is then routed from each cell to the neighbour with the steepest downhill slope
+of the filled elevation. On square grids, the eight cells that share an edge or a
+vertex are used as neighbours (the D8 method), and on hexagon grids the six cells that
+share an edge are used. Cells on the edge of the grid without a lower neighbour are
+outlets and drain to themselves.
+
+Routing only depends on the grid and the elevation, so the
+:func:`~virtual_ecosystem.models.hydrology.flow_routing.get_flow_routing` function
+caches the routing for each combination, keyed using a hash of the elevation data.
+"""  # noqa: D205
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+import json
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import NDArray
+
+from virtual_ecosystem.core.grid import Grid
+from virtual_ecosystem.core.logger import LOGGER
+
+ROUTING_SHIFTS: dict[str, list[list[tuple[int, int]]]] = {
+    "square": [
+        [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)],
+    ],
+    "hexagon": [
+        [(-1, -1), (-1, 0), (0, -1), (0, 1), (1, -1), (1, 0)],
+        [(-1, 0), (-1, 1), (0, -1), (0, 1), (1, 0), (1, 1)],
+    ],
+}
+"""The ``(row, column)`` shifts to the routing neighbours of a cell for each grid type.
+
+Hexagon grids have odd rows offset to the right, so the shifts are given separately for
+even and odd rows. The shifts are ordered so that neighbours are visited in increasing
+cell id order.
+"""
+
+_ROUTING_CACHE: dict[str, FlowRouting] = {}
+
+
+@dataclass
+class FlowRouting:
+    """The flow routing for a grid and elevation."""
+
+    filled_elevation: NDArray[np.floating]
+    """The elevation of each cell after depression filling, [m]"""
+    downstream: NDArray[np.int_]
+    """The cell ID that each cell drains to, with outlets draining to themselves."""
+
+    @property
+    def drainage_map(self) -> dict[int, list[int]]:
+        """Dict of all upstream IDs for each grid cell."""
+
+        upstream_ids: dict[int, list[int]] = {
+            cell_id: [] for cell_id in range(len(self.downstream))
+        }
+        for cell_id, downstream_id in enumerate(self.downstream.tolist()):
+            upstream_ids[downstream_id].append(cell_id)
+
+        return upstream_ids
+
+
+def get_routing_neighbours(grid: Grid) -> NDArray[np.int_]:
+    """Get the routing neighbours of each grid cell.
+
+    The neighbours are found from the row and column of each cell, using the shifts in
+    :data:`~virtual_ecosystem.models.hydrology.flow_routing.ROUTING_SHIFTS`, so the
+    neighbourhood of the grid does not need to be set.
+
+    Args:
+        grid: Grid object
+
+    Returns:
+        An array with a row for each cell giving the IDs of its neighbours, with -1 for
+        neighbours outside the grid.
+
+    Raises:
+        ValueError: if the grid type is not supported.
+    """
+
+    if grid.grid_type not in ROUTING_SHIFTS:
+        to_raise = ValueError("This grid type is currently not supported!")
+        LOGGER.error(to_raise)
+        raise to_raise
+
+    row, col = np.divmod(np.arange(grid.n_cells), grid.cell_nx)
+    parity_shifts = ROUTING_SHIFTS[grid.grid_type]
+    shifts = np.array(parity_shifts)[row % len(parity_shifts)]
+
+    nbr_row = row[:, None] + shifts[..., 0]
+    nbr_col = col[:, None] + shifts[..., 1]
+    inside = (
+        (nbr_row >= 0)
+        & (nbr_row < grid.cell_ny)
+        & (nbr_col >= 0)
+        & (nbr_col < grid.cell_nx)
+    )
+
+    return np.where(inside, nbr_row * grid.cell_nx + nbr_col, -1)
+
+
+def fill_depressions(
+    elevation: NDArray[np.floating], neighbours: NDArray[np.int_]
+) -> NDArray[np.floating]:
+    """Fill depressions in the elevation using the priority-flood algorithm.
+
+    Cells on the edge of the grid are added to a priority queue ordered by elevation.
+    The lowest cell is repeatedly removed from the queue and its unvisited neighbours
+    are added, raised if necessary to the next representable value above the cell
+    that they were flooded from. The filled elevation therefore has no flat areas or
+    depressions and decreases strictly along a path from every interior cell to an edge
+    cell.
+
+    Args:
+        elevation: Elevation, [m]
+        neighbours: The routing neighbours of each cell, with -1 for neighbours outside
+            the grid
+
+    Returns:
+        filled elevation, [m]
+    """
+
+    filled = np.array(elevation, dtype=np.float64)
+    visited = np.zeros(len(filled), dtype=np.bool_)
+
+    edge_cells = np.flatnonzero(np.any(neighbours < 0, axis=1))
+    queue = [(filled[cell_id], cell_id) for cell_id in edge_cells.tolist()]
+    heapq.heapify(queue)
+    visited[edge_cells] = True
+
+    neighbour_lists = [nbrs[nbrs >= 0].tolist() for nbrs in neighbours]
+    while queue:
+        cell_elevation, cell_id = heapq.heappop(queue)
+        raised = np.nextafter(cell_elevation, np.inf)
+        for nbr_id in neighbour_lists[cell_id]:
+            if not visited[nbr_id]:
+                visited[nbr_id] = True
+                filled[nbr_id] = max(filled[nbr_id], raised)
+                heapq.heappush(queue, (filled[nbr_id], nbr_id))
+
+    return filled
+
+
+def calculate_flow_directions(
+    grid: Grid, elevation: NDArray[np.floating], neighbours: NDArray[np.int_]
+) -> NDArray[np.int_]:
+    """Route flow from each cell to the neighbour with the steepest downhill slope.
+
+    The slope to each neighbour is the drop in elevation divided by the distance
+    between the cell centroids. Ties are resolved in favour of the neighbour with the
+    lowest cell ID, and cells without a lower neighbour drain to themselves.
+
+    Args:
+        grid: Grid object
+        elevation: Elevation, [m]
+        neighbours: The routing neighbours of each cell, with -1 for neighbours outside
+            the grid
+
+    Returns:
+        The cell ID that each cell drains to.
+    """
+
+    cell_ids = np.arange(grid.n_cells)
+    inside = neighbours >= 0
+    nbr_ids = np.where(inside, neighbours, cell_ids[:, None])
+
+    # Round the distances so that floating point differences in the cell centroids do
+    # not break ties between neighbours at the same distance
+    distance = np.round(
+        np.linalg.norm(grid.centroids[nbr_ids] - grid.centroids[:, None], axis=-1), 6
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = (elevation[:, None] - elevation[nbr_ids]) / distance
+    slope = np.where(inside, slope, -np.inf)
+
+    steepest = np.argmax(slope, axis=1)
+    has_lower = slope[cell_ids, steepest] > 0
+
+    return np.where(has_lower, nbr_ids[cell_ids, steepest], cell_ids)
+
+
+def get_routing_key(grid: Grid, elevation: NDArray[np.floating]) -> str:
+    """Get a key identifying the flow routing for a grid and elevation.
+
+    Args:
+        grid: Grid object
+        elevation: Elevation, [m]
+
+    Returns:
+        A hexadecimal key identifying the flow routing.
+    """
+
+    digest = hashlib.sha256()
+    digest.update(np.ascontiguousarray(elevation, dtype=np.float64).tobytes())
+    digest.update(
+        json.dumps(
+            [
+                grid.grid_type,
+                grid.cell_area,
+                grid.cell_nx,
+                grid.cell_ny,
+                grid.xoff,
+                grid.yoff,
+            ]
+        ).encode()
+    )
+
+    return digest.hexdigest()
+
+
+def get_flow_routing(grid: Grid, elevation: NDArray[np.floating]) -> FlowRouting:
+    """Get the flow routing for a grid and elevation.
+
+    The elevation is filled using
+    :func:`~virtual_ecosystem.models.hydrology.flow_routing.fill_depressions` and flow
+    is routed using
+    :func:`~virtual_ecosystem.models.hydrology.flow_routing.calculate_flow_directions`.
+    The routing is cached and reused for later calls with the same grid and elevation.
+
+    Args:
+        grid: Grid object
+        elevation: Elevation, [m]
+
+    Returns:
+        The filled elevation and downstream cell ID of each cell.
+    """
+
+    key = get_routing_key(grid, elevation)
+    if key not in _ROUTING_CACHE:
+        neighbours = get_routing_neighbours(grid)
+        filled_elevation = fill_depressions(elevation, neighbours)
+        _ROUTING_CACHE[key] = FlowRouting(
+            filled_elevation=filled_elevation,
+            downstream=calculate_flow_directions(grid, filled_elevation, neighbours),
+        )
+
+    return _ROUTING_CACHE[key]
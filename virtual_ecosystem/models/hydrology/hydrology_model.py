@@ -28,11 +28,9 @@ TODO units and module coordination
 
 from __future__ import annotations
 
-from math import sqrt
-from typing import Any
+from typing import Any, Literal
 
 import numpy as np
-from numpy.typing import NDArray
 from pint import Quantity
 from xarray import DataArray
 
@@ -41,6 +39,7 @@ from virtual_ecosystem.core.config import Config
 from virtual_ecosystem.core.constants_loader import load_constants
 from virtual_ecosystem.core.core_components import CoreComponents
 from virtual_ecosystem.core.data import Data
+from virtual_ecosystem.core.downscaling import downscale_forcing
 from virtual_ecosystem.core.exceptions import InitialisationError
 from virtual_ecosystem.core.logger import LOGGER
 from virtual_ecosystem.models.abiotic.constants import AbioticConsts
@@ -51,6 +50,24 @@ from virtual_ecosystem.models.hydrology import (
 )
 from virtual_ecosystem.models.hydrology.constants import HydroConsts
 
+DAILY_REDUCTIONS: dict[str, Literal["sum", "mean", "last"]] = {
+    "precipitation_surface": "sum",
+    "surface_runoff": "sum",
+    "soil_evaporation": "sum",
+    "subsurface_flow": "sum",
+    "baseflow": "sum",
+    "bypass_flow": "sum",
+    "surface_runoff_accumulated": "sum",
+    "subsurface_flow_accumulated": "sum",
+    "total_river_discharge": "sum",
+    "river_discharge_rate": "mean",
+    "aerodynamic_resistance_surface": "mean",
+    "soil_moisture": "mean",
+    "matric_potential": "mean",
+    "groundwater_storage": "last",
+}
+"""The reduction of the daily values of each output variable over an update."""
+
 
 class HydrologyModel(
     BaseModel,
@@ -129,10 +146,22 @@ class HydrologyModel(
             0 and 1) for all layers and grid cells identical. This will be converted to
             groundwater storage in mm.
         model_constants: Set of constants for the hydrology model.
+        flow_accumulation: The cells that horizontal flow is accumulated from, either
+            the direct upstream neighbours of each cell or its full catchment.
+        flow_routing: The method used to route horizontal flow between cells, either
+            to the lowest neighbour or by steepest descent of the depression filled
+            elevation.
+        vertical_flow_solver: The method used to calculate vertical flow between soil
+            layers, either explicitly from the soil moisture at the start of each day or
+            by solving the Richards equation implicitly.
+        vertical_flow_substeps: The number of implicit steps used by the implicit
+            vertical flow solver within each day.
 
     Raises:
         InitialisationError: when soil moisture or saturation parameters are not numeric
-            or out of [0, 1] bounds.
+            or out of [0, 1] bounds, the flow accumulation mode, flow routing method or
+            vertical flow solver is not recognised, or the number of vertical flow
+            substeps is not a positive integer.
     """
 
     def __init__(
@@ -142,10 +171,42 @@ class HydrologyModel(
         initial_soil_moisture: float,
         initial_groundwater_saturation: float,
         model_constants: HydroConsts = HydroConsts(),
+        flow_accumulation: str = "upstream_neighbours",
+        flow_routing: str = "lowest_neighbour",
+        vertical_flow_solver: str = "explicit",
+        vertical_flow_substeps: int = 10,
         **kwargs: Any,
     ):
         super().__init__(data=data, core_components=core_components, **kwargs)
 
+        if flow_accumulation not in ("upstream_neighbours", "full_catchment"):
+            to_raise = InitialisationError(
+                f"Unknown flow accumulation mode: {flow_accumulation}"
+            )
+            LOGGER.error(to_raise)
+            raise to_raise
+
+        if flow_routing not in ("lowest_neighbour", "steepest_descent"):
+            to_raise = InitialisationError(
+                f"Unknown flow routing method: {flow_routing}"
+            )
+            LOGGER.error(to_raise)
+            raise to_raise
+
+        if vertical_flow_solver not in ("explicit", "implicit"):
+            to_raise = InitialisationError(
+                f"Unknown vertical flow solver: {vertical_flow_solver}"
+            )
+            LOGGER.error(to_raise)
+            raise to_raise
+
+        if not isinstance(vertical_flow_substeps, int) or vertical_flow_substeps < 1:
+            to_raise = InitialisationError(
+                "The vertical_flow_substeps must be a positive integer!"
+            )
+            LOGGER.error(to_raise)
+            raise to_raise
+
         # Sanity checks for initial soil moisture and initial_groundwater_saturation
         for attr, value in (
             ("initial_soil_moisture", initial_soil_moisture),
@@ -170,13 +231,30 @@ class HydrologyModel(
         """Set of constants for the hydrology model"""
         self.core_constants = core_components.core_constants
         """Set of core constants for the hydrology model"""
-        self.grid.set_neighbours(distance=sqrt(self.grid.cell_area))
-        """Set neighbours."""
         self.drainage_map = above_ground.calculate_drainage_map(
             grid=self.data.grid,
             elevation=np.array(self.data["elevation"]),
+            flow_routing=flow_routing,
         )
         """Upstream neighbours for the calculation of accumulated horizontal flow."""
+        self.upstream_matrix = above_ground.calculate_upstream_matrix(self.drainage_map)
+        """Sparse upstream adjacency matrix compiled from the drainage map."""
+        self.flow_accumulation: str = flow_accumulation
+        """The cells that horizontal flow is accumulated from."""
+        self.vertical_flow_solver: str = vertical_flow_solver
+        """The method used to calculate vertical flow between soil layers."""
+        self.vertical_flow_substeps: int = vertical_flow_substeps
+        """The number of implicit vertical flow steps within each day."""
+        self.downstream_cells = above_ground.calculate_downstream_cells(
+            self.drainage_map
+        )
+        """Downstream cell ID for each grid cell."""
+        self.flow_levels = (
+            above_ground.calculate_flow_levels(self.downstream_cells)
+            if flow_accumulation == "full_catchment"
+            else []
+        )
+        """Grid cell IDs in each topological level of the drainage network."""
 
         # Calculate layer thickness for soil moisture unit conversion and set structures
         # and tile across grid cells
@@ -218,6 +296,11 @@ class HydrologyModel(
             "initial_groundwater_saturation"
         ]
 
+        flow_accumulation = config["hydrology"]["flow_accumulation"]
+        flow_routing = config["hydrology"]["flow_routing"]
+        vertical_flow_solver = config["hydrology"]["vertical_flow_solver"]
+        vertical_flow_substeps = config["hydrology"]["vertical_flow_substeps"]
+
         # Load in the relevant constants
         model_constants = load_constants(config, "hydrology", "HydroConsts")
 
@@ -231,6 +314,10 @@ class HydrologyModel(
             initial_soil_moisture=initial_soil_moisture,
             initial_groundwater_saturation=initial_groundwater_saturation,
             model_constants=model_constants,
+            flow_accumulation=flow_accumulation,
+            flow_routing=flow_routing,
+            vertical_flow_solver=vertical_flow_solver,
+            vertical_flow_substeps=vertical_flow_substeps,
         )
 
     def setup(self) -> None:
@@ -285,7 +372,7 @@ class HydrologyModel(
             "atmospheric_pressure",
         ]:
             self.data[var] = (
-                DataArray(self.data[var + "_ref"].isel(time_index=0))
+                DataArray(self.data.get_forcing_slice(var + "_ref", 0))
                 .expand_dims("layers")
                 .rename(var)
                 .assign_coords(
@@ -346,9 +433,11 @@ class HydrologyModel(
 
         Many of the underlying processes are problematic at a monthly timestep, which is
         currently the only supported update interval. As a short-term work around, the
-        input precipitation is randomly distributed over 30 days and input
-        evapotranspiration is divided by 30, and the return variables are monthly means
-        or monthly accumulated values.
+        input precipitation is randomly distributed over 30 days, using the
+        ``monthly_rainfall`` downscaling method from
+        :mod:`~virtual_ecosystem.core.downscaling`, and input evapotranspiration is
+        divided by 30. The return variables are monthly means or monthly accumulated
+        values.
 
         Precipitation that reaches the surface is defined as incoming precipitation
         minus canopy interception, which is estimated using a stroage-based approach,
@@ -429,9 +518,7 @@ class HydrologyModel(
         abiotic_constants = AbioticConsts()
         hydro_input = hydrology_tools.setup_hydrology_input_current_timestep(
             data=self.data,
-            time_index=time_index,
             days=days,
-            seed=seed,
             layer_structure=self.layer_structure,
             soil_layer_thickness_mm=self.soil_layer_thickness_mm,
             soil_moisture_capacity=self.model_constants.soil_moisture_capacity,
@@ -440,14 +527,30 @@ class HydrologyModel(
             latent_heat_vap_equ_factors=(abiotic_constants.latent_heat_vap_equ_factors),
         )
 
-        # Create lists for output variables to store daily data
-        daily_lists: dict = {name: [] for name in self.vars_updated}
+        # Generate daily precipitation from the monthly forcing as it is used
+        daily_precipitation = downscale_forcing(
+            data=self.data,
+            var_name="precipitation",
+            time_index=time_index,
+            n_steps=days,
+            method="monthly_rainfall",
+            seed=seed,
+        )
+
+        # Create running accumulators for the daily values of the output variables
+        daily_values = {
+            name: hydrology_tools.DailyAccumulator(reduction)
+            for name, reduction in DAILY_REDUCTIONS.items()
+        }
+
+        # Soil moisture after evaporation is calculated in place each day, [mm]
+        soil_moisture_evap_mm = np.empty_like(hydro_input["current_soil_moisture"])
 
-        for day in np.arange(days):
+        for day, precipitation in enumerate(daily_precipitation):
             # Interception of water in canopy, [mm]
             interception = above_ground.calculate_interception(
                 leaf_area_index=hydro_input["leaf_area_index_sum"],
-                precipitation=hydro_input["current_precipitation"][:, day],
+                precipitation=precipitation,
                 intercept_parameters=self.model_constants.intercept_parameters,
                 veg_density_param=self.model_constants.veg_density_param,
             )
@@ -455,10 +558,8 @@ class HydrologyModel(
             # TODO add canopy evaporation
 
             # Precipitation that reaches the surface per day, [mm]
-            precipitation_surface = (
-                hydro_input["current_precipitation"][:, day] - interception
-            )
-            daily_lists["precipitation_surface"].append(precipitation_surface)
+            precipitation_surface = precipitation - interception
+            daily_values["precipitation_surface"].add(precipitation_surface)
 
             # Calculate daily surface runoff of each grid cell, [mm]; replace by SPLASH
             surface_runoff = above_ground.calculate_surface_runoff(
@@ -466,7 +567,7 @@ class HydrologyModel(
                 top_soil_moisture=hydro_input["current_soil_moisture"][0],
                 top_soil_moisture_capacity=hydro_input["top_soil_moisture_capacity"],
             )
-            daily_lists["surface_runoff"].append(surface_runoff)
+            daily_values["surface_runoff"].add(surface_runoff)
 
             # Calculate preferential bypass flow, [mm]
             bypass_flow = above_ground.calculate_bypass_flow(
@@ -477,7 +578,7 @@ class HydrologyModel(
                     self.model_constants.infiltration_shape_parameter
                 ),
             )
-            daily_lists["bypass_flow"].append(bypass_flow)
+            daily_values["bypass_flow"].add(bypass_flow)
 
             # Calculate top soil moisture after infiltration, [mm]
             soil_moisture_infiltrated = np.clip(
@@ -526,69 +627,32 @@ class HydrologyModel(
                     self.model_constants.extinction_coefficient_global_radiation
                 ),
             )
-            daily_lists["soil_evaporation"].append(soil_evaporation["soil_evaporation"])
-            daily_lists["aerodynamic_resistance_surface"].append(
+            daily_values["soil_evaporation"].add(soil_evaporation["soil_evaporation"])
+            daily_values["aerodynamic_resistance_surface"].add(
                 soil_evaporation["aerodynamic_resistance_surface"]
             )
 
             # Calculate top soil moisture after evap and combine with lower layers, [mm]
-            soil_moisture_evap_mm: NDArray[np.float32] = np.concatenate(
-                (
-                    np.expand_dims(
-                        np.clip(
-                            (
-                                soil_moisture_infiltrated
-                                - soil_evaporation["soil_evaporation"]
-                            ),
-                            hydro_input["top_soil_moisture_residual"],
-                            hydro_input["top_soil_moisture_capacity"],
-                        ),
-                        axis=0,
-                    ),
-                    hydro_input["current_soil_moisture"][1:],
-                )
+            np.clip(
+                soil_moisture_infiltrated - soil_evaporation["soil_evaporation"],
+                hydro_input["top_soil_moisture_residual"],
+                hydro_input["top_soil_moisture_capacity"],
+                out=soil_moisture_evap_mm[0],
             )
+            soil_moisture_evap_mm[1:] = hydro_input["current_soil_moisture"][1:]
 
-            # Calculate vertical flow between soil layers in mm per day
-            # Note that there are severe limitations to this approach on the temporal
-            # spatial scale of this model and this can only be treated as a very rough
-            # approximation to discuss nutrient leaching.
-            vertical_flow = below_ground.calculate_vertical_flow(
-                soil_moisture=soil_moisture_evap_mm
-                / self.soil_layer_thickness_mm,  # vol
-                soil_layer_thickness=self.soil_layer_thickness_mm,  # mm
-                soil_moisture_capacity=(
-                    self.model_constants.soil_moisture_capacity
-                ),  # vol
-                soil_moisture_residual=(
-                    self.model_constants.soil_moisture_residual
-                ),  # vol
-                hydraulic_conductivity=(
-                    self.model_constants.hydraulic_conductivity
-                ),  # m/s
-                hydraulic_gradient=self.model_constants.hydraulic_gradient,  # m/m
-                nonlinearily_parameter=self.model_constants.nonlinearily_parameter,
-                groundwater_capacity=self.model_constants.groundwater_capacity,
-                seconds_to_day=self.core_constants.seconds_to_day,
-            )
-            daily_lists["vertical_flow"].append(vertical_flow)
-
-            # Update soil moisture by +/- vertical flow to each layer and remove root
-            # water uptake by plants (transpiration), [mm]
-            soil_moisture_updated = below_ground.update_soil_moisture(
-                soil_moisture=soil_moisture_evap_mm,  # mm
-                vertical_flow=vertical_flow,  # mm
-                evapotranspiration=hydro_input["current_evapotranspiration"],  # mm
-                soil_moisture_capacity=(  # mm
-                    self.model_constants.soil_moisture_capacity
-                    * self.soil_layer_thickness_mm
-                ),
-                soil_moisture_residual=(  # mm
-                    self.model_constants.soil_moisture_residual
-                    * self.soil_layer_thickness_mm
-                ),
+            # Calculate vertical flow between soil layers in mm per day and update the
+            # soil moisture, removing root water uptake by plants (transpiration), [mm]
+            vertical_flow, soil_moisture_updated = self.calculate_soil_water_flow(
+                soil_moisture=soil_moisture_evap_mm,
+                evapotranspiration=hydro_input["current_evapotranspiration"],
             )
-            daily_lists["soil_moisture"].append(soil_moisture_updated)
+            if day == 0:
+                # The vertical flow returned to the data object is the mean across the
+                # soil layers of the vertical flow on the first day
+                first_day_vertical_flow = np.mean(vertical_flow, axis=0)
+
+            daily_values["soil_moisture"].add(soil_moisture_updated)
 
             # Convert soil moisture to matric potential
             matric_potential = below_ground.convert_soil_moisture_to_water_potential(
@@ -603,7 +667,7 @@ class HydrologyModel(
                 ),
                 soil_moisture_capacity=self.model_constants.soil_moisture_capacity,
             )
-            daily_lists["matric_potential"].append(matric_potential)
+            daily_values["matric_potential"].add(matric_potential)
 
             # calculate below ground horizontal flow and update ground water
             below_ground_flow = below_ground.update_groundwater_storage(
@@ -623,20 +687,18 @@ class HydrologyModel(
             )
 
             for var in ["groundwater_storage", "subsurface_flow", "baseflow"]:
-                daily_lists[var].append(below_ground_flow[var])
+                daily_values[var].add(below_ground_flow[var])
 
             # Calculate horizontal flow
             # Calculate accumulated runoff for each cell (me+sum of upstream neighbours)
-            new_accumulated_runoff = above_ground.accumulate_horizontal_flow(
-                drainage_map=self.drainage_map,
+            new_accumulated_runoff = self.accumulate_flow(
                 current_flow=surface_runoff,
                 previous_accumulated_flow=hydro_input["previous_accumulated_runoff"],
             )
-            daily_lists["surface_runoff_accumulated"].append(new_accumulated_runoff)
+            daily_values["surface_runoff_accumulated"].add(new_accumulated_runoff)
 
             # Calculate subsurface accumulated flow, [mm]
-            new_subsurface_flow_accumulated = above_ground.accumulate_horizontal_flow(
-                drainage_map=self.drainage_map,
+            new_subsurface_flow_accumulated = self.accumulate_flow(
                 current_flow=np.array(
                     below_ground_flow["subsurface_flow"] + below_ground_flow["baseflow"]
                 ),
@@ -644,7 +706,7 @@ class HydrologyModel(
                     hydro_input["previous_subsurface_flow_accumulated"]
                 ),
             )
-            daily_lists["subsurface_flow_accumulated"].append(
+            daily_values["subsurface_flow_accumulated"].add(
                 new_subsurface_flow_accumulated
             )
 
@@ -652,7 +714,7 @@ class HydrologyModel(
             total_river_discharge = (
                 new_accumulated_runoff + new_subsurface_flow_accumulated
             )
-            daily_lists["total_river_discharge"].append(total_river_discharge)
+            daily_values["total_river_discharge"].add(total_river_discharge)
 
             # Convert total discharge to river discharge rate, [m3 s-1]
             river_discharge_rate = above_ground.convert_mm_flow_to_m3_per_second(
@@ -662,7 +724,7 @@ class HydrologyModel(
                 seconds_to_day=self.core_constants.seconds_to_day,
                 meters_to_millimeters=self.core_constants.meters_to_mm,
             )
-            daily_lists["river_discharge_rate"].append(river_discharge_rate)
+            daily_values["river_discharge_rate"].add(river_discharge_rate)
 
             # update inputs for next day
             hydro_input["current_soil_moisture"] = soil_moisture_updated
@@ -685,52 +747,161 @@ class HydrologyModel(
             )
 
         # Calculate monthly accumulated/mean values for hydrology variables
-        for var in [
-            "precipitation_surface",
-            "surface_runoff",
-            "soil_evaporation",
-            "subsurface_flow",
-            "baseflow",
-            "bypass_flow",
-            "surface_runoff_accumulated",
-            "subsurface_flow_accumulated",
-            "total_river_discharge",
-        ]:
+        for var, reduction in DAILY_REDUCTIONS.items():
+            if reduction == "last" or var in ["soil_moisture", "matric_potential"]:
+                continue
             soil_hydrology[var] = DataArray(
-                np.sum(np.stack(daily_lists[var], axis=1), axis=1),
+                daily_values[var].result,
                 dims="cell_id",
                 coords={"cell_id": self.grid.cell_id},
             )
 
-        soil_hydrology["vertical_flow"] = DataArray(  # vertical flow through top soil
-            np.mean(np.stack(daily_lists["vertical_flow"][0], axis=1), axis=1),
+        soil_hydrology["vertical_flow"] = DataArray(
+            first_day_vertical_flow,
             dims="cell_id",
             coords={"cell_id": self.grid.cell_id},
         )
 
-        for var in ["river_discharge_rate", "aerodynamic_resistance_surface"]:
-            soil_hydrology[var] = DataArray(
-                np.mean(np.stack(daily_lists[var], axis=1), axis=1),
-                dims="cell_id",
-                coords={"cell_id": self.grid.cell_id},
-            )
-
         # Return mean soil moisture, [-], and matric potential, [kPa], and add
         # atmospheric layers (nan)
         for var in ["soil_moisture", "matric_potential"]:
             soil_hydrology[var] = self.layer_structure.from_template()
-            soil_hydrology[var][self.layer_structure.index_all_soil] = np.mean(
-                np.stack(daily_lists[var], axis=0), axis=0
-            )
+            soil_hydrology[var][self.layer_structure.index_all_soil] = daily_values[
+                var
+            ].result
 
         # Save last state of groundwater stoage, [mm]
         soil_hydrology["groundwater_storage"] = DataArray(
-            daily_lists["groundwater_storage"][day],
+            daily_values["groundwater_storage"].result,
             dims=self.data["groundwater_storage"].dims,
         )
 
         # Update data object
         self.data.add_from_dict(output_dict=soil_hydrology)
 
+    def calculate_soil_water_flow(
+        self, soil_moisture: np.ndarray, evapotranspiration: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Calculate vertical flow between soil layers and update soil moisture.
+
+        With the ``explicit`` vertical flow solver, the flow is calculated from the soil
+        moisture at the start of the day, see
+        :func:`~virtual_ecosystem.models.hydrology.below_ground.calculate_vertical_flow`,
+        and then applied to the soil layers, see
+        :func:`~virtual_ecosystem.models.hydrology.below_ground.update_soil_moisture`.
+        With the ``implicit`` vertical flow solver, the Richards equation is solved
+        over the day using ``vertical_flow_substeps`` implicit steps, see
+        :func:`~virtual_ecosystem.models.hydrology.below_ground.solve_vertical_flow_implicit`,
+        and root water uptake is then removed from the second soil layer.
+
+        Note that there are severe limitations to this approach on the temporal and
+        spatial scale of this model and this can only be treated as a very rough
+        approximation to discuss nutrient leaching.
+
+        Args:
+            soil_moisture: Soil moisture after infiltration and surface evaporation,
+                [mm]
+            evapotranspiration: Root water uptake by plants, [mm]
+
+        Returns:
+            The vertical flow out of each soil layer, [mm d-1], and the updated soil
+            moisture, [mm]
+        """
+
+        soil_moisture_capacity = (
+            self.model_constants.soil_moisture_capacity * self.soil_layer_thickness_mm
+        )
+        soil_moisture_residual = (
+            self.model_constants.soil_moisture_residual * self.soil_layer_thickness_mm
+        )
+
+        if self.vertical_flow_solver == "implicit":
+            soil_water = below_ground.solve_vertical_flow_implicit(
+                soil_moisture=soil_moisture / self.soil_layer_thickness_mm,  # vol
+                soil_layer_thickness=self.soil_layer_thickness_mm,  # mm
+                soil_moisture_capacity=self.model_constants.soil_moisture_capacity,
+                soil_moisture_residual=self.model_constants.soil_moisture_residual,
+                hydraulic_conductivity=self.model_constants.hydraulic_conductivity,
+                hydraulic_gradient=self.model_constants.hydraulic_gradient,
+                nonlinearily_parameter=self.model_constants.nonlinearily_parameter,
+                air_entry_water_potential=(
+                    self.model_constants.air_entry_water_potential
+                ),
+                water_retention_curvature=(
+                    self.model_constants.water_retention_curvature
+                ),
+                water_potential_to_head=self.model_constants.water_potential_to_head,
+                seconds_to_day=self.core_constants.seconds_to_day,
+                n_substeps=self.vertical_flow_substeps,
+            )
+
+            soil_moisture_updated = soil_water["soil_moisture"] * (
+                self.soil_layer_thickness_mm
+            )
+            soil_moisture_updated[1] -= evapotranspiration
+            soil_moisture_updated = np.clip(
+                soil_moisture_updated, soil_moisture_residual, soil_moisture_capacity
+            )
+
+            return soil_water["vertical_flow"], soil_moisture_updated
+
+        vertical_flow = below_ground.calculate_vertical_flow(
+            soil_moisture=soil_moisture / self.soil_layer_thickness_mm,  # vol
+            soil_layer_thickness=self.soil_layer_thickness_mm,  # mm
+            soil_moisture_capacity=self.model_constants.soil_moisture_capacity,  # vol
+            soil_moisture_residual=self.model_constants.soil_moisture_residual,  # vol
+            hydraulic_conductivity=self.model_constants.hydraulic_conductivity,  # m/s
+            hydraulic_gradient=self.model_constants.hydraulic_gradient,  # m/m
+            nonlinearily_parameter=self.model_constants.nonlinearily_parameter,
+            groundwater_capacity=self.model_constants.groundwater_capacity,
+            seconds_to_day=self.core_constants.seconds_to_day,
+        )
+
+        # Update soil moisture by +/- vertical flow to each layer and remove root
+        # water uptake by plants (transpiration), [mm]
+        soil_moisture_updated = below_ground.update_soil_moisture(
+            soil_moisture=soil_moisture,  # mm
+            vertical_flow=vertical_flow,  # mm
+            evapotranspiration=evapotranspiration,  # mm
+            soil_moisture_capacity=soil_moisture_capacity,  # mm
+            soil_moisture_residual=soil_moisture_residual,  # mm
+        )
+
+        return vertical_flow, soil_moisture_updated
+
+    def accumulate_flow(
+        self, current_flow: np.ndarray, previous_accumulated_flow: np.ndarray
+    ) -> np.ndarray:
+        """Accumulate horizontal flow using the flow accumulation mode of the model.
+
+        In ``upstream_neighbours`` mode, the flow from the direct upstream neighbours of
+        each cell is added using the precompiled upstream adjacency matrix, see
+        :func:`~virtual_ecosystem.models.hydrology.above_ground.accumulate_horizontal_flow`.
+        In ``full_catchment`` mode, the flow from the full catchment of each cell is
+        added, see
+        :func:`~virtual_ecosystem.models.hydrology.above_ground.accumulate_catchment_flow`.
+
+        Args:
+            current_flow: (Sub-)surface flow of the current time step, [mm]
+            previous_accumulated_flow: Accumulated flow from previous time step, [mm]
+
+        Returns:
+            accumulated (sub-)surface flow, [mm]
+        """
+
+        if self.flow_accumulation == "full_catchment":
+            return above_ground.accumulate_catchment_flow(
+                downstream=self.downstream_cells,
+                flow_levels=self.flow_levels,
+                current_flow=current_flow,
+                previous_accumulated_flow=previous_accumulated_flow,
+            )
+
+        return above_ground.accumulate_horizontal_flow(
+            drainage_map=self.upstream_matrix,
+            current_flow=current_flow,
+            previous_accumulated_flow=previous_accumulated_flow,
+        )
+
     def cleanup(self) -> None:
         """Placeholder function for hydrology model cleanup."""
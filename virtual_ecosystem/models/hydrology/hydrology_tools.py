@@ -1,5 +1,7 @@
 """Functions to set up hydrology model and select data for current time step."""
 
+from typing import Literal
+
 import numpy as np
 from numpy.typing import NDArray
 from xarray import DataArray
@@ -7,15 +9,13 @@ from xarray import DataArray
 from virtual_ecosystem.core.constants import CoreConsts
 from virtual_ecosystem.core.core_components import LayerStructure
 from virtual_ecosystem.core.data import Data
+from virtual_ecosystem.core.logger import LOGGER
 from virtual_ecosystem.models.abiotic import abiotic_tools
-from virtual_ecosystem.models.hydrology import above_ground
 
 
 def setup_hydrology_input_current_timestep(
     data: Data,
-    time_index: int,
     days: int,
-    seed: None | int,
     layer_structure: LayerStructure,
     soil_layer_thickness_mm: NDArray[np.float32],
     soil_moisture_capacity: float | NDArray[np.float32],
@@ -27,9 +27,10 @@ def setup_hydrology_input_current_timestep(
 
     The hydrology model currently loops over 30 days per month. Atmospheric variables
     near the surface are selected here and kept constant for the whole month. Daily
-    timeseries of precipitation and evapotranspiration are generated from monthly
-    values in `data` to be used in the daily loop. States of other hydrology variables
-    are selected and updated in the daily loop.
+    evapotranspiration is generated from the monthly value in `data` to be used in the
+    daily loop, and daily precipitation is generated within the loop using
+    :func:`~virtual_ecosystem.core.downscaling.downscale_forcing`. States of other
+    hydrology variables are selected and updated in the daily loop.
 
     The function returns a dictionary with the following variables:
 
@@ -41,7 +42,6 @@ def setup_hydrology_input_current_timestep(
     * surface_pressure (TODO switch to subcanopy_pressure)
     * surface_wind_speed (TODO switch to subcanopy_wind_speed)
     * leaf_area_index_sum
-    * current_precipitation
     * current_evapotranspiration
     * current_soil_moisture
     * top_soil_moisture_capacity
@@ -53,9 +53,7 @@ def setup_hydrology_input_current_timestep(
     Args:
         data: Data object that contains inputs from the microclimate model, the plant
             model, and the hydrology model that are required for current update
-        time_index: Time index of current time step
         days: Number of days in core time step
-        seed: Seed for random rainfall generator
         layer_structure: The LayerStructure instance for a simulation.
         soil_layer_thickness_mm: The thickness of the soil layer, [mm]
         soil_moisture_capacity: Soil moisture capacity, unitless
@@ -88,13 +86,6 @@ def setup_hydrology_input_current_timestep(
     )
     output["molar_density_air"] = molar_density_air
 
-    # Get atmospheric variables
-    output["current_precipitation"] = above_ground.distribute_monthly_rainfall(
-        (data["precipitation"].isel(time_index=time_index)).to_numpy(),
-        num_days=days,
-        seed=seed,
-    )
-
     # named 'surface_...' for now TODO needs to be replaced with 2m above ground
     # We explicitly get a scalar index for the surface layer to extract the values as a
     # 1D array of grid cells and not a 2D array with a singleton layer dimension.
@@ -165,3 +156,55 @@ def initialise_soil_moisture_mm(
     )
 
     return soil_moisture
+
+
+class DailyAccumulator:
+    """Running reduction of a daily hydrology variable over an update interval.
+
+    The hydrology model loops over the days within each update. Rather than storing
+    the values of a variable for every day and reducing them at the end of the update,
+    this class keeps a single array that is updated in place each day. The array is
+    allocated from the values on the first day, so the memory used does not depend on
+    the number of days.
+
+    Args:
+        reduction: The reduction applied to the daily values, one of ``sum``, ``mean``
+            or ``last``.
+    """
+
+    def __init__(self, reduction: Literal["sum", "mean", "last"]) -> None:
+        self.reduction = reduction
+        """The reduction applied to the daily values."""
+        self.n_days: int = 0
+        """The number of days added."""
+        self._values: NDArray[np.float32] | None = None
+
+    def add(self, values: NDArray[np.float32]) -> None:
+        """Add the values of the variable for a day.
+
+        Args:
+            values: The values of the variable for the day.
+        """
+
+        if self._values is None:
+            self._values = np.array(values, dtype=np.float64)
+        elif self.reduction == "last":
+            self._values[...] = values
+        else:
+            self._values += values
+
+        self.n_days += 1
+
+    @property
+    def result(self) -> NDArray[np.float32]:
+        """The reduced values of the variable over the days added."""
+
+        if self._values is None:
+            to_raise = ValueError("No daily values have been added")
+            LOGGER.error(to_raise)
+            raise to_raise
+
+        if self.reduction == "mean":
+            return self._values / self.n_days
+
+        return self._values
@@ -9,6 +9,8 @@ Each of the litter sub-modules has its own API reference page:
   use of.
 * :mod:`~virtual_ecosystem.models.litter.carbon` provides the set of litter carbon
   pools that the litter model is comprised of.
+* :mod:`~virtual_ecosystem.models.litter.pools` provides the dense array
+  representation of the litter pools and their chemistry.
 * :mod:`~virtual_ecosystem.models.litter.chemistry` tracks the chemistry (lignin,
   nitrogen and phosphorus) of the litter pools.
 * :mod:`~virtual_ecosystem.models.litter.inputs` handles the partitioning of biomass
@@ -15,9 +15,7 @@ of lignin on decay rates is directly calculated.
 
 import numpy as np
 from numpy.typing import NDArray
-from xarray import DataArray
 
-from virtual_ecosystem.core.data import Data
 from virtual_ecosystem.models.litter.constants import LitterConsts
 from virtual_ecosystem.models.litter.inputs import LitterInputs
 
@@ -26,390 +24,135 @@ class LitterChemistry:
     """This class handles the chemistry of litter pools.
 
     This class contains methods to calculate the changes in the litter pool chemistry
-    based on the contents of the `data` object, as well as method to calculate total
-    mineralisation based on litter pool decay rates.
+    based on the chemistry of the inputs to each pool. The chemistry of the pools is
+    held as an array with shape (pool, chemistry, cell), as described in
+    :mod:`~virtual_ecosystem.models.litter.pools`.
     """
 
-    def __init__(self, data: Data, constants: LitterConsts):
-        self.data = data
+    def __init__(self, constants: LitterConsts):
         self.structural_to_metabolic_n_ratio = constants.structural_to_metabolic_n_ratio
         self.structural_to_metabolic_p_ratio = constants.structural_to_metabolic_p_ratio
 
     def calculate_new_pool_chemistries(
         self,
-        updated_pools: dict[str, NDArray[np.float32]],
+        updated_pools: NDArray[np.float32],
+        pool_chemistries: NDArray[np.float32],
         litter_inputs: LitterInputs,
-    ) -> dict[str, DataArray]:
+        remaining_inputs: NDArray[np.float32] | None = None,
+    ) -> NDArray[np.float32]:
         """Method to calculate the updated chemistry of each litter pool.
 
         All pools contain nitrogen and phosphorus, so this is updated for every pool.
         Only the structural (above and below ground) pools and the woody pools contain
-        lignin, so it is only updated for those pools.
-
-        Args:
-            updated_pools: Dictionary containing the updated pool densities for all 5
-                litter pools [kg C m^-2]
-            litter_inputs: An LitterInputs instance containing the total input of each
-                plant biomass type, the proportion of the input that goes to the
-                relevant metabolic pool for each input type (expect deadwood) and the
-                total input into each litter pool.
-        """
-
-        # Find lignin and nitrogen contents of the litter input flows
-        input_lignin = calculate_litter_input_lignin_concentrations(
-            litter_inputs=litter_inputs,
-        )
-        input_c_n_ratios = calculate_litter_input_nitrogen_ratios(
-            litter_inputs=litter_inputs,
-            struct_to_meta_nitrogen_ratio=self.structural_to_metabolic_n_ratio,
-        )
-        input_c_p_ratios = calculate_litter_input_phosphorus_ratios(
-            litter_inputs=litter_inputs,
-            struct_to_meta_phosphorus_ratio=self.structural_to_metabolic_p_ratio,
-        )
-
-        # Then use to find the changes
-        change_in_lignin = self.calculate_lignin_updates(
-            litter_inputs=litter_inputs,
-            input_lignin=input_lignin,
-            updated_pools=updated_pools,
-        )
-        change_in_c_n_ratios = self.calculate_c_n_ratio_updates(
-            litter_inputs=litter_inputs,
-            input_c_n_ratios=input_c_n_ratios,
-            updated_pools=updated_pools,
-        )
-        change_in_c_p_ratios = self.calculate_c_p_ratio_updates(
-            litter_inputs=litter_inputs,
-            input_c_p_ratios=input_c_p_ratios,
-            updated_pools=updated_pools,
-        )
-
-        # List all the variables this function outputs, which are then used to generate
-        # the dictionaries to return
-        lignin_variable_names = ["above_structural", "woody", "below_structural"]
-        nutrient_variable_names = [
-            "above_metabolic",
-            "above_structural",
-            "woody",
-            "below_metabolic",
-            "below_structural",
-        ]
-
-        lignin_changes = {
-            f"lignin_{name}": DataArray(
-                self.data[f"lignin_{name}"] + change_in_lignin[name], dims="cell_id"
-            )
-            for name in lignin_variable_names
-        }
-        nitrogen_changes = {
-            f"c_n_ratio_{name}": DataArray(
-                self.data[f"c_n_ratio_{name}"] + change_in_c_n_ratios[name],
-                dims="cell_id",
-            )
-            for name in nutrient_variable_names
-        }
-        phosphorus_changes = {
-            f"c_p_ratio_{name}": DataArray(
-                self.data[f"c_p_ratio_{name}"] + change_in_c_p_ratios[name],
-                dims="cell_id",
-            )
-            for name in nutrient_variable_names
-        }
-
-        return lignin_changes | nitrogen_changes | phosphorus_changes
-
-    def calculate_lignin_updates(
-        self,
-        litter_inputs: LitterInputs,
-        input_lignin: dict[str, NDArray[np.float32]],
-        updated_pools: dict[str, NDArray[np.float32]],
-    ) -> dict[str, NDArray[np.float32]]:
-        """Calculate the changes in lignin proportion for the relevant litter pools.
-
-        The relevant pools are the two structural pools, and the dead wood pool. This
-        function calculates the total change over the entire time step, so cannot be
-        used in an integration process.
-
-        Args:
-            litter_inputs: An LitterInputs instance containing the total input of each
-                plant biomass type, the proportion of the input that goes to the
-                relevant metabolic pool for each input type (expect deadwood) and the
-                total input into each litter pool.
-            input_lignin: Dictionary containing the lignin concentration of the input to
-                each of the three lignin containing litter pools [kg lignin kg C^-1]
-            updated_pools: Dictionary containing the updated pool densities for all 5
-                litter pools [kg C m^-2]
-
-        Returns:
-            Dictionary containing the updated lignin proportions for the 3 relevant
-            litter pools (above ground structural, dead wood, and below ground
-            structural) [unitless]
-        """
-
-        change_in_lignin_above_structural = calculate_change_in_chemical_concentration(
-            input_carbon=litter_inputs.input_above_structural,
-            updated_pool_carbon=updated_pools["above_structural"],
-            input_conc=input_lignin["above_structural"],
-            old_pool_conc=self.data["lignin_above_structural"].to_numpy(),
-        )
-        change_in_lignin_woody = calculate_change_in_chemical_concentration(
-            input_carbon=litter_inputs.input_woody,
-            updated_pool_carbon=updated_pools["woody"],
-            input_conc=input_lignin["woody"],
-            old_pool_conc=self.data["lignin_woody"].to_numpy(),
-        )
-        change_in_lignin_below_structural = calculate_change_in_chemical_concentration(
-            input_carbon=litter_inputs.input_below_structural,
-            updated_pool_carbon=updated_pools["below_structural"],
-            input_conc=input_lignin["below_structural"],
-            old_pool_conc=self.data["lignin_below_structural"].to_numpy(),
-        )
-
-        return {
-            "above_structural": change_in_lignin_above_structural,
-            "woody": change_in_lignin_woody,
-            "below_structural": change_in_lignin_below_structural,
-        }
-
-    def calculate_c_n_ratio_updates(
-        self,
-        litter_inputs: LitterInputs,
-        input_c_n_ratios: dict[str, NDArray[np.float32]],
-        updated_pools: dict[str, NDArray[np.float32]],
-    ) -> dict[str, NDArray[np.float32]]:
-        """Calculate the changes in carbon nitrogen ratios for all litter pools.
+        lignin, the lignin proportions of the metabolic pools and their inputs are zero
+        and so remain unchanged.
 
         This function calculates the total change over the entire time step, so cannot
         be used in an integration process.
 
         Args:
+            updated_pools: The updated pool densities for all 5 litter pools, with a row
+                for each pool and a column for each grid cell [kg C m^-2]
+            pool_chemistries: The chemistry of each litter pool before the update, with
+                shape (pool, chemistry, cell) [unitless]
             litter_inputs: An LitterInputs instance containing the total input of each
                 plant biomass type, the proportion of the input that goes to the
                 relevant metabolic pool for each input type (expect deadwood) and the
                 total input into each litter pool.
-            input_c_n_ratios: Dictionary containing the carbon to nitrogen ratios of the
-                input to each of the litter pools [unitless]
-            updated_pools: Dictionary containing the updated pool densities for all 5
-                litter pools [kg C m^-2]
+            remaining_inputs: The input to each litter pool that remains at the end of
+                the update, when inputs also decay during the update (see
+                :func:`~virtual_ecosystem.models.litter.carbon.calculate_updated_pools_exponential`).
+                Defaults to the total input to each pool [kg C m^-2]
 
         Returns:
-            Dictionary containing the updated carbon nitrogen ratios for all of the
-            litter pools [unitless]
+            The updated chemistry of each litter pool, with shape (pool, chemistry,
+            cell) [unitless]
         """
 
-        change_in_n_above_metabolic = calculate_change_in_chemical_concentration(
-            input_carbon=litter_inputs.input_above_metabolic,
-            updated_pool_carbon=updated_pools["above_metabolic"],
-            input_conc=input_c_n_ratios["above_metabolic"],
-            old_pool_conc=self.data["c_n_ratio_above_metabolic"].to_numpy(),
-        )
-        change_in_n_above_structural = calculate_change_in_chemical_concentration(
-            input_carbon=litter_inputs.input_above_structural,
-            updated_pool_carbon=updated_pools["above_structural"],
-            input_conc=input_c_n_ratios["above_structural"],
-            old_pool_conc=self.data["c_n_ratio_above_structural"].to_numpy(),
-        )
-        change_in_n_woody = calculate_change_in_chemical_concentration(
-            input_carbon=litter_inputs.input_woody,
-            updated_pool_carbon=updated_pools["woody"],
-            input_conc=input_c_n_ratios["woody"],
-            old_pool_conc=self.data["c_n_ratio_woody"].to_numpy(),
-        )
-        change_in_n_below_metabolic = calculate_change_in_chemical_concentration(
-            input_carbon=litter_inputs.input_below_metabolic,
-            updated_pool_carbon=updated_pools["below_metabolic"],
-            input_conc=input_c_n_ratios["below_metabolic"],
-            old_pool_conc=self.data["c_n_ratio_below_metabolic"].to_numpy(),
-        )
-        change_in_n_below_structural = calculate_change_in_chemical_concentration(
-            input_carbon=litter_inputs.input_below_structural,
-            updated_pool_carbon=updated_pools["below_structural"],
-            input_conc=input_c_n_ratios["below_structural"],
-            old_pool_conc=self.data["c_n_ratio_below_structural"].to_numpy(),
-        )
+        input_chemistries = self.calculate_input_chemistries(litter_inputs)
+        if remaining_inputs is None:
+            remaining_inputs = litter_inputs.pool_inputs
 
-        return {
-            "above_metabolic": change_in_n_above_metabolic,
-            "above_structural": change_in_n_above_structural,
-            "woody": change_in_n_woody,
-            "below_metabolic": change_in_n_below_metabolic,
-            "below_structural": change_in_n_below_structural,
-        }
+        change_in_chemistries = calculate_change_in_chemical_concentration(
+            input_carbon=remaining_inputs[:, None, :],
+            updated_pool_carbon=updated_pools[:, None, :],
+            input_conc=input_chemistries,
+            old_pool_conc=pool_chemistries,
+        )
 
-    def calculate_c_p_ratio_updates(
-        self,
-        litter_inputs: LitterInputs,
-        input_c_p_ratios: dict[str, NDArray[np.float32]],
-        updated_pools: dict[str, NDArray[np.float32]],
-    ) -> dict[str, NDArray[np.float32]]:
-        """Calculate the changes in carbon phosphorus ratios for all litter pools.
+        return pool_chemistries + change_in_chemistries
 
-        This function calculates the total change over the entire time step, so cannot
-        be used in an integration process.
+    def calculate_input_chemistries(
+        self, litter_inputs: LitterInputs
+    ) -> NDArray[np.float32]:
+        """Calculate the chemistry of the input to each litter pool.
 
         Args:
             litter_inputs: An LitterInputs instance containing the total input of each
                 plant biomass type, the proportion of the input that goes to the
                 relevant metabolic pool for each input type (expect deadwood) and the
                 total input into each litter pool.
-            input_c_p_ratios: Dictionary containing the carbon to phosphorus ratios of
-                the input to each of the litter pools [unitless]
-            updated_pools: Dictionary containing the updated pool densities for all 5
-                litter pools [kg C m^-2]
 
         Returns:
-            Dictionary containing the updated carbon phosphorus ratios for all of the
-            litter pools [unitless]
-        """
-
-        change_in_p_above_metabolic = calculate_change_in_chemical_concentration(
-            input_carbon=litter_inputs.input_above_metabolic,
-            updated_pool_carbon=updated_pools["above_metabolic"],
-            input_conc=input_c_p_ratios["above_metabolic"],
-            old_pool_conc=self.data["c_p_ratio_above_metabolic"].to_numpy(),
-        )
-        change_in_p_above_structural = calculate_change_in_chemical_concentration(
-            input_carbon=litter_inputs.input_above_structural,
-            updated_pool_carbon=updated_pools["above_structural"],
-            input_conc=input_c_p_ratios["above_structural"],
-            old_pool_conc=self.data["c_p_ratio_above_structural"].to_numpy(),
-        )
-        change_in_p_woody = calculate_change_in_chemical_concentration(
-            input_carbon=litter_inputs.input_woody,
-            updated_pool_carbon=updated_pools["woody"],
-            input_conc=input_c_p_ratios["woody"],
-            old_pool_conc=self.data["c_p_ratio_woody"].to_numpy(),
-        )
-        change_in_p_below_metabolic = calculate_change_in_chemical_concentration(
-            input_carbon=litter_inputs.input_below_metabolic,
-            updated_pool_carbon=updated_pools["below_metabolic"],
-            input_conc=input_c_p_ratios["below_metabolic"],
-            old_pool_conc=self.data["c_p_ratio_below_metabolic"].to_numpy(),
-        )
-        change_in_p_below_structural = calculate_change_in_chemical_concentration(
-            input_carbon=litter_inputs.input_below_structural,
-            updated_pool_carbon=updated_pools["below_structural"],
-            input_conc=input_c_p_ratios["below_structural"],
-            old_pool_conc=self.data["c_p_ratio_below_structural"].to_numpy(),
-        )
-
-        return {
-            "above_metabolic": change_in_p_above_metabolic,
-            "above_structural": change_in_p_above_structural,
-            "woody": change_in_p_woody,
-            "below_metabolic": change_in_p_below_metabolic,
-            "below_structural": change_in_p_below_structural,
-        }
-
-    def calculate_N_mineralisation(
-        self,
-        decay_rates: dict[str, NDArray[np.float32]],
-        active_microbe_depth: float,
-    ) -> dict[str, NDArray[np.float32]]:
-        """Method to calculate the amount of nitrogen mineralised by litter decay.
-
-        This function finds the nitrogen mineralisation rate of each litter pool, by
-        dividing the rate of decay (in carbon terms) by the carbon to nitrogen ratio of
-        each pool. These are then summed to find the total rate of nitrogen
-        mineralisation from litter. Finally, this rate is converted from per area units
-        (which the litter model works in) to per volume units (which the soil model
-        works in) by dividing the rate by the depth of soil considered to be microbially
-        active.
-
-        Args:
-            decay_rates: Dictionary containing the rates of decay for all 5 litter pools
-                [kg C m^-2 day^-1]
-            active_microbe_depth: Maximum depth of microbial activity in the soil layers
-                [m]
-
-        Returns:
-            The total rate of nitrogen mineralisation from litter [kg N m^-3 day^-1].
+            The lignin proportion, carbon to nitrogen ratio and carbon to phosphorus
+            ratio of the input to each litter pool, with shape (pool, chemistry, cell)
+            [unitless]
         """
 
-        # Find nitrogen mineralisation rate for each pool
-        above_meta_n_mineral = (
-            decay_rates["metabolic_above"] / self.data["c_n_ratio_above_metabolic"]
-        )
-        above_struct_n_mineral = (
-            decay_rates["structural_above"] / self.data["c_n_ratio_above_structural"]
-        )
-        woody_n_mineral = decay_rates["woody"] / self.data["c_n_ratio_woody"]
-        below_meta_n_mineral = (
-            decay_rates["metabolic_below"] / self.data["c_n_ratio_below_metabolic"]
-        )
-        below_struct_n_mineral = (
-            decay_rates["structural_below"] / self.data["c_n_ratio_below_structural"]
-        )
-
-        # Sum them to find total rate of nitrogen mineralisation
-        total_N_mineralisation_rate = (
-            above_meta_n_mineral
-            + above_struct_n_mineral
-            + woody_n_mineral
-            + below_meta_n_mineral
-            + below_struct_n_mineral
-        )
-
-        # Convert from per area to per volume units
-        return total_N_mineralisation_rate / active_microbe_depth
-
-    def calculate_P_mineralisation(
-        self,
-        decay_rates: dict[str, NDArray[np.float32]],
-        active_microbe_depth: float,
-    ) -> dict[str, NDArray[np.float32]]:
-        """Method to calculate the amount of phosphorus mineralised by litter decay.
-
-        This function finds the phosphorus mineralisation rate of each litter pool, by
-        dividing the rate of decay (in carbon terms) by the carbon to phosphorus ratio
-        of each pool. These are then summed to find the total rate of phosphorus
-        mineralisation from litter. Finally, this rate is converted from per area units
-        (which the litter model works in) to per volume units (which the soil model
-        works in) by dividing the rate by the depth of soil considered to be microbially
-        active.
-
-        Args:
-            decay_rates: Dictionary containing the rates of decay for all 5 litter pools
-                [kg C m^-2 day^-1]
-            active_microbe_depth: Maximum depth of microbial activity in the soil layers
-                [m]
+        return np.stack(
+            [
+                calculate_litter_input_lignin_concentrations(
+                    litter_inputs=litter_inputs
+                ),
+                calculate_litter_input_nitrogen_ratios(
+                    litter_inputs=litter_inputs,
+                    struct_to_meta_nitrogen_ratio=self.structural_to_metabolic_n_ratio,
+                ),
+                calculate_litter_input_phosphorus_ratios(
+                    litter_inputs=litter_inputs,
+                    struct_to_meta_phosphorus_ratio=self.structural_to_metabolic_p_ratio,
+                ),
+            ],
+            axis=1,
+        )
+
+
+def calculate_nutrient_mineralisation(
+    decay_rates: NDArray[np.float32],
+    c_nutrient_ratios: NDArray[np.float32],
+    active_microbe_depth: float,
+) -> NDArray[np.float32]:
+    """Calculate the amount of a nutrient mineralised by litter decay.
 
-        Returns:
-            The total rate of phosphorus mineralisation from litter [kg P m^-3 day^-1].
-        """
+    This function finds the nutrient mineralisation rate of each litter pool, by
+    dividing the rate of decay (in carbon terms) by the carbon to nutrient ratio of each
+    pool. These are then summed to find the total rate of nutrient mineralisation from
+    litter. Finally, this rate is converted from per area units (which the litter model
+    works in) to per volume units (which the soil model works in) by dividing the rate
+    by the depth of soil considered to be microbially active. This is used for both
+    nitrogen and phosphorus.
 
-        # Find phosphorus mineralisation rate for each pool
-        above_meta_p_mineral = (
-            decay_rates["metabolic_above"] / self.data["c_p_ratio_above_metabolic"]
-        )
-        above_struct_p_mineral = (
-            decay_rates["structural_above"] / self.data["c_p_ratio_above_structural"]
-        )
-        woody_p_mineral = decay_rates["woody"] / self.data["c_p_ratio_woody"]
-        below_meta_p_mineral = (
-            decay_rates["metabolic_below"] / self.data["c_p_ratio_below_metabolic"]
-        )
-        below_struct_p_mineral = (
-            decay_rates["structural_below"] / self.data["c_p_ratio_below_structural"]
-        )
+    Args:
+        decay_rates: The rates of decay for all 5 litter pools, with a row for each
+            pool and a column for each grid cell [kg C m^-2 day^-1]
+        c_nutrient_ratios: The carbon to nutrient ratio of each litter pool, with a row
+            for each pool and a column for each grid cell [unitless]
+        active_microbe_depth: Maximum depth of microbial activity in the soil layers
+            [m]
 
-        # Sum them to find total rate of phosphorus mineralisation
-        total_P_mineralisation_rate = (
-            above_meta_p_mineral
-            + above_struct_p_mineral
-            + woody_p_mineral
-            + below_meta_p_mineral
-            + below_struct_p_mineral
-        )
+    Returns:
+        The total rate of nutrient mineralisation from litter [kg nutrient m^-3
+        day^-1].
+    """
 
-        # Convert from per area to per volume units
-        return total_P_mineralisation_rate / active_microbe_depth
+    # Sum the mineralisation rate of each pool, and convert from per area to per volume
+    # units
+    return np.sum(decay_rates / c_nutrient_ratios, axis=0) / active_microbe_depth
 
 
 def calculate_litter_input_lignin_concentrations(
     litter_inputs: LitterInputs,
-) -> dict[str, NDArray[np.float32]]:
+) -> NDArray[np.float32]:
     """Calculate the concentration of lignin for each plant biomass to litter flow.
 
     By definition the metabolic litter pools do not contain lignin, so all input
@@ -433,9 +176,9 @@ def calculate_litter_input_lignin_concentrations(
             into each litter pool.
 
     Returns:
-        Dictionary containing the lignin concentration of the input to each of the
-        three lignin containing litter pools (woody, above and below ground
-        structural) [kg lignin kg C^-1]
+        The lignin concentration of the input to each of the litter pools, with a row
+        for each pool and a column for each grid cell. This is zero for the metabolic
+        pools [kg lignin kg C^-1]
     """
 
     lignin_proportion_woody = litter_inputs.deadwood_lignin
@@ -451,17 +194,23 @@ def calculate_litter_input_lignin_concentrations(
         + (litter_inputs.reprod_lignin * litter_inputs.reprod_mass)
     ) / litter_inputs.input_above_structural
 
-    return {
-        "woody": lignin_proportion_woody,
-        "below_structural": lignin_proportion_below_structural,
-        "above_structural": lignin_proportion_above_structural,
-    }
+    no_lignin = np.zeros_like(lignin_proportion_woody)
+
+    return np.stack(
+        [
+            no_lignin,
+            lignin_proportion_above_structural,
+            lignin_proportion_woody,
+            no_lignin,
+            lignin_proportion_below_structural,
+        ]
+    )
 
 
 def calculate_litter_input_nitrogen_ratios(
     litter_inputs: LitterInputs,
     struct_to_meta_nitrogen_ratio: float,
-) -> dict[str, NDArray[np.float32]]:
+) -> NDArray[np.float32]:
     """Calculate the carbon to nitrogen ratio for each plant biomass to litter flow.
 
     The ratio for the input to the woody litter pool just matches the ratio of the
@@ -480,8 +229,8 @@ def calculate_litter_input_nitrogen_ratios(
             structural vs metabolic litter pools [unitless]
 
     Returns:
-        Dictionary containing the carbon to nitrogen ratios of the input to each of
-        the pools [unitless]
+        The carbon to nitrogen ratios of the input to each of the pools, with a row for
+        each pool and a column for each grid cell [unitless]
     """
 
     # Calculate c_n_ratio split for each (non-wood) input biomass type
@@ -543,19 +292,21 @@ def calculate_litter_input_nitrogen_ratios(
         + (litter_inputs.reprod_mass * (1 - litter_inputs.reproduct_meta_split)),
     )
 
-    return {
-        "woody": c_n_ratio_woody,
-        "below_metabolic": c_n_ratio_below_metabolic,
-        "below_structural": c_n_ratio_below_structural,
-        "above_metabolic": c_n_ratio_above_metabolic,
-        "above_structural": c_n_ratio_above_structural,
-    }
+    return np.stack(
+        [
+            c_n_ratio_above_metabolic,
+            c_n_ratio_above_structural,
+            c_n_ratio_woody,
+            c_n_ratio_below_metabolic,
+            c_n_ratio_below_structural,
+        ]
+    )
 
 
 def calculate_litter_input_phosphorus_ratios(
     litter_inputs: LitterInputs,
     struct_to_meta_phosphorus_ratio: float,
-) -> dict[str, NDArray[np.float32]]:
+) -> NDArray[np.float32]:
     """Calculate carbon to phosphorus ratio for each plant biomass to litter flow.
 
     The ratio for the input to the woody litter pool just matches the ratio of the
@@ -574,8 +325,8 @@ def calculate_litter_input_phosphorus_ratios(
             structural vs metabolic litter pools [unitless]
 
     Returns:
-        Dictionary containing the carbon to phosphorus ratios of the input to each of
-        the pools [unitless]
+        The carbon to phosphorus ratios of the input to each of the pools, with a row
+        for each pool and a column for each grid cell [unitless]
     """
 
     # Calculate c_p_ratio split for each (non-wood) input biomass type
@@ -637,13 +388,15 @@ def calculate_litter_input_phosphorus_ratios(
         + (litter_inputs.reprod_mass * (1 - litter_inputs.reproduct_meta_split)),
     )
 
-    return {
-        "woody": c_p_ratio_woody,
-        "below_metabolic": c_p_ratio_below_metabolic,
-        "below_structural": c_p_ratio_below_structural,
-        "above_metabolic": c_p_ratio_above_metabolic,
-        "above_structural": c_p_ratio_above_structural,
-    }
+    return np.stack(
+        [
+            c_p_ratio_above_metabolic,
+            c_p_ratio_above_structural,
+            c_p_ratio_woody,
+            c_p_ratio_below_metabolic,
+            c_p_ratio_below_structural,
+        ]
+    )
 
 
 def calculate_litter_chemistry_factor(
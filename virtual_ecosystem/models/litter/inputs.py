@@ -13,6 +13,7 @@ from numpy.typing import NDArray
 from virtual_ecosystem.core.data import Data
 from virtual_ecosystem.core.logger import LOGGER
 from virtual_ecosystem.models.litter.constants import LitterConsts
+from virtual_ecosystem.models.litter.pools import LITTER_POOLS
 
 
 @dataclass(frozen=True)
@@ -73,6 +74,15 @@ class LitterInputs:
     input_below_structural: NDArray[np.float32]
     """Total input to the below ground structural litter pool [kg C m^-2]"""
 
+    @property
+    def pool_inputs(self) -> NDArray[np.float32]:
+        """The total input to each litter pool, with shape (pool, cell) [kg C m^-2].
+
+        The pools are in the order given by
+        :data:`~virtual_ecosystem.models.litter.pools.LITTER_POOLS`.
+        """
+        return np.stack([getattr(self, f"input_{pool}") for pool in LITTER_POOLS])
+
     @classmethod
     def create_from_data(cls, data: Data, constants: LitterConsts) -> LitterInputs:
         """Factory method to populate the various litter input flows.
@@ -39,20 +39,31 @@ from virtual_ecosystem.core.data import Data
 from virtual_ecosystem.core.exceptions import InitialisationError
 from virtual_ecosystem.core.logger import LOGGER
 from virtual_ecosystem.models.litter.carbon import (
-    calculate_decay_rates,
+    calculate_decay_constants,
     calculate_post_consumption_pools,
     calculate_total_C_mineralised,
     calculate_updated_pools,
+    calculate_updated_pools_exponential,
+)
+from virtual_ecosystem.models.litter.chemistry import (
+    LitterChemistry,
+    calculate_nutrient_mineralisation,
 )
-from virtual_ecosystem.models.litter.chemistry import LitterChemistry
 from virtual_ecosystem.models.litter.constants import LitterConsts
 from virtual_ecosystem.models.litter.inputs import LitterInputs
+from virtual_ecosystem.models.litter.pools import (
+    C_N_RATIO,
+    C_P_RATIO,
+    LIGNIN,
+    LitterPools,
+    stack_pool_variables,
+)
 
 
 class LitterModel(
     BaseModel,
     model_name="litter",
-    model_update_bounds=("30 minutes", "3 months"),
+    model_update_bounds=("30 minutes", "1 year"),
     vars_required_for_init=(
         "litter_pool_above_metabolic",
         "litter_pool_above_structural",
@@ -158,6 +169,8 @@ class LitterModel(
         data: The data object to be used in the model.
         core_components: The core components used across models.
         model_constants: Set of constants for the litter model.
+        integration_method: The method used to update the litter pools, either
+            ``explicit`` or ``exponential``.
     """
 
     def __init__(
@@ -165,6 +178,7 @@ class LitterModel(
         data: Data,
         core_components: CoreComponents,
         model_constants: LitterConsts = LitterConsts(),
+        integration_method: str = "explicit",
         **kwargs: Any,
     ):
         super().__init__(data=data, core_components=core_components, **kwargs)
@@ -233,11 +247,13 @@ class LitterModel(
             LOGGER.error(to_raise)
             raise to_raise
 
-        self.litter_chemistry = LitterChemistry(data, constants=model_constants)
+        self.litter_chemistry = LitterChemistry(constants=model_constants)
         """Litter chemistry object for tracking of litter pool chemistries."""
 
         self.model_constants = model_constants
         """Set of constants for the litter model."""
+        self.integration_method: str = integration_method
+        """The method used to update the litter pools."""
 
     @classmethod
     def from_config(
@@ -257,6 +273,7 @@ class LitterModel(
 
         # Load in the relevant constants
         model_constants = load_constants(config, "litter", "LitterConsts")
+        integration_method = config["litter"]["integration_method"]
 
         LOGGER.info(
             "Information required to initialise the litter model successfully "
@@ -266,6 +283,7 @@ class LitterModel(
             data=data,
             core_components=core_components,
             model_constants=model_constants,
+            integration_method=integration_method,
         )
 
     def setup(self) -> None:
@@ -282,40 +300,32 @@ class LitterModel(
         pool are calculated, and used to find the new mass and lignin concentration of
         each litter pool.
 
+        When the ``integration_method`` is ``explicit``, the pools decay at their rates
+        from the start of the update over the whole update interval. When it is
+        ``exponential``, the pools are updated using the exact solution for first order
+        decay with constant inputs, and the mineralisation rates are found from the mean
+        decay rates over the update interval. This remains accurate for update intervals
+        that are long compared to the pool turnover times.
+
         Args:
             time_index: The index representing the current time step in the data object.
             **kwargs: Further arguments to the update method.
         """
 
+        # Stack the litter pools and their chemistries into dense arrays with a row for
+        # each pool
+        litter_pools = LitterPools.from_data(self.data)
+
         # Calculate the pool sizes after animal consumption has occurred, which then get
         # used then for subsequent calculations
         consumed_pools = calculate_post_consumption_pools(
-            above_metabolic=self.data["litter_pool_above_metabolic"].to_numpy(),
-            above_structural=self.data["litter_pool_above_structural"].to_numpy(),
-            woody=self.data["litter_pool_woody"].to_numpy(),
-            below_metabolic=self.data["litter_pool_below_metabolic"].to_numpy(),
-            below_structural=self.data["litter_pool_below_structural"].to_numpy(),
-            consumption_above_metabolic=self.data[
-                "litter_consumption_above_metabolic"
-            ].to_numpy(),
-            consumption_above_structural=self.data[
-                "litter_consumption_above_structural"
-            ].to_numpy(),
-            consumption_woody=self.data["litter_consumption_woody"].to_numpy(),
-            consumption_below_metabolic=self.data[
-                "litter_consumption_below_metabolic"
-            ].to_numpy(),
-            consumption_below_structural=self.data[
-                "litter_consumption_below_structural"
-            ].to_numpy(),
+            litter_pools=litter_pools.carbon,
+            consumption=stack_pool_variables(self.data, "litter_consumption_{}"),
         )
 
-        # Calculate the litter pool decay rates
-        decay_rates = calculate_decay_rates(
-            post_consumption_pools=consumed_pools,
-            lignin_above_structural=self.data["lignin_above_structural"].to_numpy(),
-            lignin_woody=self.data["lignin_woody"].to_numpy(),
-            lignin_below_structural=self.data["lignin_below_structural"].to_numpy(),
+        # Calculate the litter pool decay constants
+        decay_constants = calculate_decay_constants(
+            lignin_proportions=litter_pools.chemistry[:, LIGNIN],
             air_temperatures=self.data["air_temperature"],
             soil_temperatures=self.data["soil_temperature"],
             water_potentials=self.data["matric_potential"],
@@ -326,83 +336,63 @@ class LitterModel(
         litter_inputs = LitterInputs.create_from_data(
             self.data, constants=self.model_constants
         )
-
-        # Calculate the updated pool masses
-        updated_pools = calculate_updated_pools(
-            post_consumption_pools=consumed_pools,
-            decay_rates=decay_rates,
-            litter_inputs=litter_inputs,
-            update_interval=self.model_timing.update_interval_quantity.to(
-                "day"
-            ).magnitude,
-        )
-
-        # Calculate all the litter chemistry changes
-        updated_chemistries = self.litter_chemistry.calculate_new_pool_chemistries(
-            updated_pools=updated_pools, litter_inputs=litter_inputs
+        pool_inputs = litter_inputs.pool_inputs
+        update_interval = self.model_timing.update_interval_quantity.to("day").magnitude
+
+        # Calculate the updated pool masses and the decay rates
+        if self.integration_method == "exponential":
+            updated_carbon, remaining_inputs = calculate_updated_pools_exponential(
+                post_consumption_pools=consumed_pools,
+                decay_constants=decay_constants,
+                pool_inputs=pool_inputs,
+                update_interval=update_interval,
+            )
+            decay_rates = (
+                consumed_pools + pool_inputs - updated_carbon
+            ) / update_interval
+        else:
+            decay_rates = decay_constants * consumed_pools
+            updated_carbon = calculate_updated_pools(
+                post_consumption_pools=consumed_pools,
+                decay_rates=decay_rates,
+                pool_inputs=pool_inputs,
+                update_interval=update_interval,
+            )
+            remaining_inputs = pool_inputs
+
+        # Calculate the updated pool chemistries
+        updated_pools = LitterPools(
+            carbon=updated_carbon,
+            chemistry=self.litter_chemistry.calculate_new_pool_chemistries(
+                updated_pools=updated_carbon,
+                pool_chemistries=litter_pools.chemistry,
+                litter_inputs=litter_inputs,
+                remaining_inputs=remaining_inputs,
+            ),
         )
 
-        # Calculate the total mineralisation rates from the litter
+        # Calculate the total mineralisation rates from the litter, using the pool
+        # chemistries from before the update
+        active_microbe_depth = self.core_constants.max_depth_of_microbial_activity
         total_C_mineralisation_rate = calculate_total_C_mineralised(
             decay_rates,
             model_constants=self.model_constants,
             core_constants=self.core_constants,
         )
-        total_N_mineralisation_rate = self.litter_chemistry.calculate_N_mineralisation(
+        total_N_mineralisation_rate = calculate_nutrient_mineralisation(
             decay_rates=decay_rates,
-            active_microbe_depth=self.core_constants.max_depth_of_microbial_activity,
+            c_nutrient_ratios=litter_pools.chemistry[:, C_N_RATIO],
+            active_microbe_depth=active_microbe_depth,
         )
-        total_P_mineralisation_rate = self.litter_chemistry.calculate_P_mineralisation(
+        total_P_mineralisation_rate = calculate_nutrient_mineralisation(
             decay_rates=decay_rates,
-            active_microbe_depth=self.core_constants.max_depth_of_microbial_activity,
+            c_nutrient_ratios=litter_pools.chemistry[:, C_P_RATIO],
+            active_microbe_depth=active_microbe_depth,
         )
 
-        # Construct dictionary of data arrays to return
-        updated_litter_variables = {
-            "litter_pool_above_metabolic": DataArray(
-                updated_pools["above_metabolic"], dims="cell_id"
-            ),
-            "litter_pool_above_structural": DataArray(
-                updated_pools["above_structural"], dims="cell_id"
-            ),
-            "litter_pool_woody": DataArray(updated_pools["woody"], dims="cell_id"),
-            "litter_pool_below_metabolic": DataArray(
-                updated_pools["below_metabolic"], dims="cell_id"
-            ),
-            "litter_pool_below_structural": DataArray(
-                updated_pools["below_structural"], dims="cell_id"
-            ),
-            "lignin_above_structural": DataArray(
-                updated_chemistries["lignin_above_structural"], dims="cell_id"
-            ),
-            "lignin_woody": updated_chemistries["lignin_woody"],
-            "lignin_below_structural": updated_chemistries["lignin_below_structural"],
-            "c_n_ratio_above_metabolic": updated_chemistries[
-                "c_n_ratio_above_metabolic"
-            ],
-            "c_n_ratio_above_structural": updated_chemistries[
-                "c_n_ratio_above_structural"
-            ],
-            "c_n_ratio_woody": updated_chemistries["c_n_ratio_woody"],
-            "c_n_ratio_below_metabolic": updated_chemistries[
-                "c_n_ratio_below_metabolic"
-            ],
-            "c_n_ratio_below_structural": updated_chemistries[
-                "c_n_ratio_below_structural"
-            ],
-            "c_p_ratio_above_metabolic": updated_chemistries[
-                "c_p_ratio_above_metabolic"
-            ],
-            "c_p_ratio_above_structural": updated_chemistries[
-                "c_p_ratio_above_structural"
-            ],
-            "c_p_ratio_woody": updated_chemistries["c_p_ratio_woody"],
-            "c_p_ratio_below_metabolic": updated_chemistries[
-                "c_p_ratio_below_metabolic"
-            ],
-            "c_p_ratio_below_structural": updated_chemistries[
-                "c_p_ratio_below_structural"
-            ],
+        # Construct dictionary of data arrays to return, and then use it to update the
+        # litter variables
+        updated_litter_variables = updated_pools.to_data_arrays() | {
             "litter_C_mineralisation_rate": DataArray(
                 total_C_mineralisation_rate, dims="cell_id"
             ),
@@ -413,8 +403,6 @@ class LitterModel(
                 total_P_mineralisation_rate, dims="cell_id"
             ),
         }
-
-        # And then use then to update the litter variables
         self.data.add_from_dict(updated_litter_variables)
 
     def cleanup(self) -> None:
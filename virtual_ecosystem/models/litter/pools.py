@@ -0,0 +1,129 @@
+"""The ``models.litter.pools`` module provides the dense array representation of the
+litter pools used by the litter model. The carbon mass of the five litter pools is held
+as a single array with a row for each pool and a column for each grid cell, in the order
+given by :data:`~virtual_ecosystem.models.litter.pools.LITTER_POOLS`. The chemistry of
+the pools is held as a companion array with an additional middle axis for the lignin
+proportion, carbon to nitrogen ratio and carbon to phosphorus ratio, in the order given
+by :data:`~virtual_ecosystem.models.litter.pools.LITTER_CHEMISTRIES`.
+
+The metabolic pools contain no lignin by definition, so their lignin proportions are
+held as zero. This means that the decay rates and chemistry updates for all pools can
+be calculated using the same broadcast operations, as the lignin inhibition of decay
+is one and the lignin change is zero for the metabolic pools.
+
+The :class:`~virtual_ecosystem.models.litter.pools.LitterPools` class converts between
+these arrays and the individual pool and chemistry variables stored in the
+:class:`~virtual_ecosystem.core.data.Data` object, which are shared with other models.
+"""  # noqa: D205
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import NDArray
+from xarray import DataArray
+
+from virtual_ecosystem.core.data import Data
+
+LITTER_POOLS: tuple[str, ...] = (
+    "above_metabolic",
+    "above_structural",
+    "woody",
+    "below_metabolic",
+    "below_structural",
+)
+"""The names of the litter pools, in the order of the pool axis."""
+
+LITTER_CHEMISTRIES: tuple[str, ...] = ("lignin", "c_n_ratio", "c_p_ratio")
+"""The names of the litter pool chemistries, in the order of the chemistry axis."""
+
+LIGNIN, C_N_RATIO, C_P_RATIO = range(len(LITTER_CHEMISTRIES))
+"""The indices of the lignin proportion, carbon to nitrogen ratio and carbon to
+phosphorus ratio on the chemistry axis."""
+
+LIGNIN_POOLS: tuple[str, ...] = ("above_structural", "woody", "below_structural")
+"""The names of the litter pools that contain lignin."""
+
+ABOVE_GROUND_POOLS: NDArray[np.bool_] = np.array(
+    [pool in ("above_metabolic", "above_structural", "woody") for pool in LITTER_POOLS]
+)
+"""Whether each litter pool is above ground, in the order of the pool axis."""
+
+
+def _chemistry_variables() -> list[tuple[int, int, str]]:
+    """The pool index, chemistry index and variable name of each chemistry variable."""
+
+    return [
+        (pool_index, chem_index, f"{chem}_{pool}")
+        for pool_index, pool in enumerate(LITTER_POOLS)
+        for chem_index, chem in enumerate(LITTER_CHEMISTRIES)
+        if chem != "lignin" or pool in LIGNIN_POOLS
+    ]
+
+
+def stack_pool_variables(data: Data, template: str) -> NDArray[np.floating]:
+    """Stack a variable for each litter pool into a single array.
+
+    Args:
+        data: The `Data` object containing the variables.
+        template: A format string giving the variable name for a pool, with ``{}`` in
+            place of the pool name (e.g. ``"litter_consumption_{}"``).
+
+    Returns:
+        An array with a row for each litter pool and a column for each grid cell.
+    """
+
+    return np.stack([data[template.format(pool)].to_numpy() for pool in LITTER_POOLS])
+
+
+@dataclass
+class LitterPools:
+    """The carbon mass and chemistry of the litter pools in each grid cell."""
+
+    carbon: NDArray[np.floating]
+    """The carbon mass of each pool, with shape (pool, cell) [kg C m^-2]"""
+    chemistry: NDArray[np.floating]
+    """The lignin proportion [unitless], carbon to nitrogen ratio [unitless] and carbon
+    to phosphorus ratio [unitless] of each pool, with shape (pool, chemistry, cell)."""
+
+    @classmethod
+    def from_data(cls, data: Data) -> LitterPools:
+        """Factory method to stack the litter pool variables from a `Data` object.
+
+        Args:
+            data: The `Data` object containing the litter pool variables.
+
+        Returns:
+            A LitterPools instance with the pool values from the data.
+        """
+
+        carbon = stack_pool_variables(data, "litter_pool_{}")
+
+        # Metabolic pools have no lignin variables and keep a lignin proportion of zero
+        chemistry = np.zeros(
+            (len(LITTER_POOLS), len(LITTER_CHEMISTRIES), carbon.shape[1])
+        )
+        for pool_index, chem_index, var_name in _chemistry_variables():
+            chemistry[pool_index, chem_index] = data[var_name].to_numpy()
+
+        return cls(carbon=carbon, chemistry=chemistry)
+
+    def to_data_arrays(self) -> dict[str, DataArray]:
+        """Convert the litter pools to the individual pool and chemistry variables.
+
+        Returns:
+            A dictionary of DataArrays, keyed by variable name, to be used to update
+            the `Data` object.
+        """
+
+        variables = {
+            f"litter_pool_{pool}": DataArray(self.carbon[pool_index], dims="cell_id")
+            for pool_index, pool in enumerate(LITTER_POOLS)
+        }
+        for pool_index, chem_index, var_name in _chemistry_variables():
+            variables[var_name] = DataArray(
+                self.chemistry[pool_index, chem_index], dims="cell_id"
+            )
+
+        return variables
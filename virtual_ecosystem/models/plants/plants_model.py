@@ -298,11 +298,9 @@ class PlantsModel(
         #       shade.
 
         # Extract a PPFD time slice
-        canopy_top_ppfd = (
-            self.data["photosynthetic_photon_flux_density"]
-            .isel(time_index=time_index)
-            .data
-        )
+        canopy_top_ppfd = self.data.get_forcing_slice(
+            "photosynthetic_photon_flux_density", time_index
+        ).data
 
         # Calculate the fate of PPFD through the layers
         absorbed_irradiance = canopy_top_ppfd * self.data["layer_fapar"].data
@@ -451,36 +449,25 @@ class PlantsModel(
             the variables it returns.
         """
 
-        # All outputs are just constants at the moment
-        self.data["deadwood_production"] = xr.full_like(self.data["elevation"], 0.075)
-        self.data["leaf_turnover"] = xr.full_like(self.data["elevation"], 0.027)
-        self.data["plant_reproductive_tissue_turnover"] = xr.full_like(
-            self.data["elevation"], 0.003
-        )
-        self.data["root_turnover"] = xr.full_like(self.data["elevation"], 0.027)
-        self.data["deadwood_lignin"] = xr.full_like(self.data["elevation"], 0.545)
-        self.data["leaf_turnover_lignin"] = xr.full_like(self.data["elevation"], 0.05)
-        self.data["plant_reproductive_tissue_turnover_lignin"] = xr.full_like(
-            self.data["elevation"], 0.01
-        )
-        self.data["root_turnover_lignin"] = xr.full_like(self.data["elevation"], 0.2)
-        self.data["deadwood_c_n_ratio"] = xr.full_like(self.data["elevation"], 56.5)
-        self.data["leaf_turnover_c_n_ratio"] = xr.full_like(
-            self.data["elevation"], 25.5
-        )
-        self.data["plant_reproductive_tissue_turnover_c_n_ratio"] = xr.full_like(
-            self.data["elevation"], 12.5
-        )
-        self.data["root_turnover_c_n_ratio"] = xr.full_like(
-            self.data["elevation"], 45.6
-        )
-        self.data["deadwood_c_p_ratio"] = xr.full_like(self.data["elevation"], 856.5)
-        self.data["leaf_turnover_c_p_ratio"] = xr.full_like(
-            self.data["elevation"], 415.0
-        )
-        self.data["plant_reproductive_tissue_turnover_c_p_ratio"] = xr.full_like(
-            self.data["elevation"], 125.5
-        )
-        self.data["root_turnover_c_p_ratio"] = xr.full_like(
-            self.data["elevation"], 656.7
-        )
+        # All outputs are just constants at the moment, so they are stored as broadcast
+        # constants rather than allocating an array for each variable.
+        turnover_constants = {
+            "deadwood_production": 0.075,
+            "leaf_turnover": 0.027,
+            "plant_reproductive_tissue_turnover": 0.003,
+            "root_turnover": 0.027,
+            "deadwood_lignin": 0.545,
+            "leaf_turnover_lignin": 0.05,
+            "plant_reproductive_tissue_turnover_lignin": 0.01,
+            "root_turnover_lignin": 0.2,
+            "deadwood_c_n_ratio": 56.5,
+            "leaf_turnover_c_n_ratio": 25.5,
+            "plant_reproductive_tissue_turnover_c_n_ratio": 12.5,
+            "root_turnover_c_n_ratio": 45.6,
+            "deadwood_c_p_ratio": 856.5,
+            "leaf_turnover_c_p_ratio": 415.0,
+            "plant_reproductive_tissue_turnover_c_p_ratio": 125.5,
+            "root_turnover_c_p_ratio": 656.7,
+        }
+        for var_name, value in turnover_constants.items():
+            self.data.set_constant(var_name, value)
@@ -8,6 +8,10 @@ Each of the soil sub-modules has its own API reference page:
   class, which the high level functions of the Virtual Ecosystem can then make use of.
 * The :mod:`~virtual_ecosystem.models.soil.carbon` provides a model for the soil carbon
   cycle.
+* The :mod:`~virtual_ecosystem.models.soil.integration` provides the precalculated
+  right hand side function used to integrate the soil carbon pools.
+* The :mod:`~virtual_ecosystem.models.soil.equilibrium` finds the steady state of the
+  soil carbon pools, which is used to spin up the soil model.
 * The :mod:`~virtual_ecosystem.models.soil.env_factors` provides functions that capture
   the impact of environmental factors on microbial rates.
 * The :mod:`~virtual_ecosystem.models.soil.constants` provides a set of dataclasses
@@ -0,0 +1,216 @@
+"""The ``models.soil.equilibrium`` module finds the steady state of the soil carbon
+pools, which is used to spin up the soil model.
+
+The slowest soil pools, such as mineral associated organic matter, take centuries of
+model time to equilibrate when the soil model is simulated forwards. Instead, the
+:func:`~virtual_ecosystem.models.soil.equilibrium.solve_equilibrium` function solves
+for the pool values at which the rates of change of all pools are zero, given fixed
+environmental conditions and litter mineralisation input. The grid cells are
+independent, so this uses a Newton iteration that is vectorised across cells, with the
+analytic Jacobian of each cell given by
+:meth:`~virtual_ecosystem.models.soil.integration.SoilCarbonRHS.jacobian`. Each Newton
+step is limited so that the pools remain positive and is halved until it reduces the
+size of the rates of change.
+
+Newton iteration may not converge when the initial pool values are far from the
+steady state. The pools in those cells are integrated forward over a long period using
+an implicit method, which can take large steps as the pools approach the steady state,
+and the Newton iteration is then repeated from the integrated pool values.
+"""  # noqa: D205
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import NDArray
+
+from virtual_ecosystem.models.soil.integration import SoilCarbonRHS, integrate_chunk
+
+
+@dataclass
+class EquilibriumResult:
+    """The steady state of the soil pools in each grid cell."""
+
+    y: NDArray[np.floating]
+    """The pool values, with a row for each pool and a column for each cell."""
+    success: NDArray[np.bool_]
+    """Whether a steady state was found for each cell."""
+    n_iterations: NDArray[np.int_]
+    """The number of Newton iterations used for each cell."""
+
+    @property
+    def failed_cells(self) -> NDArray[np.int_]:
+        """The indices of the cells without a steady state."""
+        return np.flatnonzero(~self.success)
+
+
+def newton_equilibrium(
+    soil_rhs: SoilCarbonRHS,
+    y0: NDArray[np.floating],
+    rtol: float = 1e-8,
+    atol: float = 1e-12,
+    max_iterations: int = 50,
+) -> EquilibriumResult:
+    """Find the steady state of the soil pools using Newton iteration.
+
+    A cell has converged when the Newton step and the change over a day for every pool
+    are smaller than ``atol`` plus ``rtol`` times the pool value. Cells fail if they
+    have not converged after ``max_iterations``, or if the Jacobian is singular or the
+    pools become non-finite.
+
+    Args:
+        soil_rhs: The right hand side function for all cells.
+        y0: The initial pool values, with a row for each pool and a column for each
+            cell.
+        rtol: The relative tolerance for convergence.
+        atol: The absolute tolerance for convergence.
+        max_iterations: The maximum number of Newton iterations.
+
+    Returns:
+        The steady state pool values and whether each cell converged.
+    """
+
+    n_pools, n_cells = y0.shape
+    y = np.array(y0, dtype=np.float64)
+    success = np.zeros(n_cells, dtype=np.bool_)
+    n_iterations = np.zeros(n_cells, dtype=np.int_)
+    active = np.arange(n_cells)
+    rhs = soil_rhs
+
+    def evaluate(pools: NDArray[np.floating]) -> NDArray[np.floating]:
+        # Evaluate the rates of change for pools with a column for each cell
+        return rhs(0.0, pools.ravel()).reshape(pools.shape)
+
+    for _ in range(max_iterations):
+        y_act = y[:, active]
+        rates = evaluate(y_act)
+        jacobian = rhs.jacobian(y_act.ravel())
+
+        step = newton_step(jacobian, rates)
+        with np.errstate(all="ignore"):
+            # Limit the step so that pools remain positive, and then halve the step
+            # until the rates of change are reduced.
+            shrink = np.where(step < 0, -0.9 * y_act / step, np.inf)
+            factor = np.minimum(1.0, np.min(shrink, axis=0))
+            rate_norm = np.linalg.norm(rates, axis=0)
+            for _ in range(10):
+                trial_norm = np.linalg.norm(evaluate(y_act + factor * step), axis=0)
+                reduced = trial_norm <= rate_norm
+                if np.all(reduced):
+                    break
+                factor = np.where(reduced, factor, factor / 2)
+
+            step *= factor
+            y_new = y_act + step
+
+        # Cells converge when both the step and the change in the pools over a day
+        # are within the tolerance, so that pools that grow without limit do not
+        # converge.
+        n_iterations[active] += 1
+        failed = ~np.all(np.isfinite(y_new), axis=0)
+        tolerance = atol + rtol * np.abs(y_new)
+        with np.errstate(all="ignore"):
+            converged = (
+                ~failed
+                & np.all(np.abs(step) <= tolerance, axis=0)
+                & np.all(np.abs(evaluate(y_new)) <= tolerance, axis=0)
+            )
+        y[:, active[~failed]] = y_new[:, ~failed]
+        success[active[converged]] = True
+
+        finished = failed | converged
+        if np.any(finished):
+            active = active[~finished]
+            if not active.size:
+                break
+            rhs = soil_rhs.subset(active)
+
+    return EquilibriumResult(y=y, success=success, n_iterations=n_iterations)
+
+
+def newton_step(
+    jacobian: NDArray[np.floating], rates: NDArray[np.floating]
+) -> NDArray[np.floating]:
+    """Calculate the Newton step for each grid cell.
+
+    Args:
+        jacobian: The Jacobian for each cell, with shape (n_cells, n_pools, n_pools).
+        rates: The rates of change, with a row for each pool and a column for each cell.
+
+    Returns:
+        The Newton step for each cell. Cells with a singular or non-finite Jacobian are
+        given a step of NaN.
+    """
+
+    step = np.full_like(rates, np.nan)
+    finite = np.all(np.isfinite(jacobian), axis=(1, 2)) & np.all(
+        np.isfinite(rates), axis=0
+    )
+
+    try:
+        step[:, finite] = -np.linalg.solve(
+            jacobian[finite], rates[:, finite].T[..., None]
+        )[..., 0].T
+    except np.linalg.LinAlgError:
+        # Solve each cell separately to find the cells with singular Jacobians
+        for cell in np.flatnonzero(finite):
+            try:
+                step[:, cell] = -np.linalg.solve(jacobian[cell], rates[:, cell])
+            except np.linalg.LinAlgError:
+                pass
+
+    return step
+
+
+def solve_equilibrium(
+    soil_rhs: SoilCarbonRHS,
+    y0: NDArray[np.floating],
+    rtol: float = 1e-8,
+    max_iterations: int = 50,
+    integration_time: float = 36500.0,
+) -> EquilibriumResult:
+    """Find the steady state of the soil pools in each grid cell.
+
+    The steady state is first found using
+    :func:`~virtual_ecosystem.models.soil.equilibrium.newton_equilibrium`. Cells that
+    do not converge are integrated forward from their initial pool values using the
+    ``BDF`` method, and Newton iteration is then repeated from the integrated values.
+
+    Args:
+        soil_rhs: The right hand side function for all cells.
+        y0: The initial pool values, with a row for each pool and a column for each
+            cell.
+        rtol: The relative tolerance for convergence.
+        max_iterations: The maximum number of Newton iterations.
+        integration_time: The time that cells that do not converge are integrated
+            forward over [days].
+
+    Returns:
+        The steady state pool values and whether a steady state was found for each
+        cell. Cells without a steady state keep their initial pool values.
+    """
+
+    result = newton_equilibrium(soil_rhs, y0, rtol=rtol, max_iterations=max_iterations)
+    failed = result.failed_cells
+    if not failed.size:
+        return result
+
+    # Integrate the failed cells forward and retry from the integrated pools
+    failed_rhs = soil_rhs.subset(failed)
+    integrated = integrate_chunk(
+        failed_rhs, y0[:, failed], t_end=integration_time, method="BDF"
+    )
+    retry = newton_equilibrium(
+        failed_rhs, integrated.y, rtol=rtol, max_iterations=max_iterations
+    )
+
+    retry_success = retry.success & integrated.success
+    y = np.array(result.y)
+    y[:, failed] = np.where(retry_success, retry.y, y0[:, failed])
+    result.success[failed] = retry_success
+    result.n_iterations[failed] += retry.n_iterations
+
+    return EquilibriumResult(
+        y=y, success=result.success, n_iterations=result.n_iterations
+    )
@@ -0,0 +1,959 @@
+"""The ``models.soil.integration`` module provides the right hand side function that is
+integrated to update the soil carbon pools.
+
+The rates of change of the soil pools are defined by
+:func:`~virtual_ecosystem.models.soil.carbon.calculate_soil_carbon_updates`, which
+calculates the environmental effect factors, temperature responses and rate constants
+from the environmental conditions each time it is called. An integrator evaluates the
+rates of change many times within a single update, but the environmental conditions are
+fixed for the whole update. The
+:class:`~virtual_ecosystem.models.soil.integration.SoilRateConstants` class therefore
+calculates the rate constants for each grid cell once per update, and the
+:class:`~virtual_ecosystem.models.soil.integration.SoilCarbonRHS` class uses them to
+calculate the rates of change of the pools using only arithmetic on the pool values.
+
+The pools in different grid cells do not interact, so the module also provides
+:func:`~virtual_ecosystem.models.soil.integration.integrate_per_cell`. When all cells
+are integrated together by :func:`~scipy.integrate.solve_ivp`, the cell with the fastest
+changing pools sets the step size for every cell and a problem in a single cell causes
+the whole integration to fail. This function instead uses the same explicit Runge-Kutta
+method as the ``RK45`` method of :func:`~scipy.integrate.solve_ivp`, but each cell has
+its own adaptive step size and time. The steps for all cells that have not yet reached
+the end of the integration are calculated together as arrays, and cells that fail to
+integrate are reported individually.
+
+Because the grid cells are independent, they can also be integrated in parallel using
+:func:`~virtual_ecosystem.models.soil.integration.integrate_parallel`. This splits the
+grid cells into a chunk for each worker process, and each worker integrates its chunk
+using either :func:`~scipy.integrate.solve_ivp` or
+:func:`~virtual_ecosystem.models.soil.integration.integrate_per_cell`. The rate
+constants and initial pool values for all cells are placed in a single shared memory
+block, so only the chunk boundaries and the final pool values for each chunk are passed
+between processes. The worker processes are not forked from the main process (see
+:func:`~virtual_ecosystem.models.soil.integration.make_worker_pool`), so that they can
+be safely started while other threads are running, and a pool of workers can be reused
+across calls.
+"""  # noqa: D205
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields
+from itertools import pairwise, repeat
+from multiprocessing import get_all_start_methods, get_context
+from multiprocessing.context import BaseContext
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+from scipy.integrate import RK45, solve_ivp
+from scipy.optimize import OptimizeResult  # type: ignore
+from scipy.sparse import csr_array, identity, kron
+
+from virtual_ecosystem.core.data import Data
+from virtual_ecosystem.models.soil.carbon import calculate_carbon_use_efficiency
+from virtual_ecosystem.models.soil.constants import SoilConsts
+from virtual_ecosystem.models.soil.env_factors import (
+    calculate_environmental_effect_factors,
+    calculate_leaching_rate,
+    calculate_temperature_effect_on_microbes,
+)
+
+
+@dataclass
+class SoilRateConstants:
+    """Rate constants for the soil carbon pools in each grid cell.
+
+    These combine the soil model constants with the environmental conditions in each
+    grid cell, which are held constant within a model update.
+    """
+
+    uptake_rate: NDArray[np.float32]
+    """Rate constant for microbial uptake of LMWC [day^-1]."""
+    uptake_saturation: NDArray[np.float32]
+    """Saturation constant for microbial uptake of LMWC [kg C m^-3]."""
+    carbon_use_efficiency: NDArray[np.float32]
+    """Microbial carbon use efficiency [unitless]."""
+    microbial_turnover: NDArray[np.float32]
+    """Rate constant for microbial biomass loss [day^-1]."""
+    pom_decomposition_rate: NDArray[np.float32]
+    """Rate constant for enzyme mediated POM decomposition [day^-1]."""
+    pom_decomposition_saturation: NDArray[np.float32]
+    """Saturation constant for enzyme mediated POM decomposition [kg C m^-3]."""
+    maom_decomposition_rate: NDArray[np.float32]
+    """Rate constant for enzyme mediated MAOM decomposition [day^-1]."""
+    maom_decomposition_saturation: NDArray[np.float32]
+    """Saturation constant for enzyme mediated MAOM decomposition [kg C m^-3]."""
+    leaching_rate: NDArray[np.float32]
+    """Rate constant for leaching of LMWC [day^-1]."""
+    mineralisation_rate: NDArray[np.float32]
+    """Rate at which litter is mineralised into the POM pool [kg C m^-3 day^-1]."""
+
+    @classmethod
+    def from_environment(
+        cls,
+        soil_water_potential: NDArray[np.float32],
+        pH: NDArray[np.float32],
+        clay_fraction: NDArray[np.float32],
+        soil_temp: NDArray[np.float32],
+        vertical_flow_rate: NDArray[np.float32],
+        soil_moisture: NDArray[np.float32],
+        mineralisation_rate: NDArray[np.float32],
+        constants: SoilConsts,
+    ) -> SoilRateConstants:
+        """Calculate the rate constants from the environmental conditions.
+
+        Args:
+            soil_water_potential: Soil water potential for each grid cell [kPa]
+            pH: pH values for each soil grid cell [unitless]
+            clay_fraction: The clay fraction for each soil grid cell [unitless]
+            soil_temp: soil temperature for each soil grid cell [degrees C]
+            vertical_flow_rate: The vertical flow rate [mm day^-1]
+            soil_moisture: amount of water contained by the top soil layer [mm]
+            mineralisation_rate: Amount of litter mineralised into POM pool [kg C m^-3
+                day^-1]
+            constants: Set of constants for the soil model.
+        """
+
+        env_factors = calculate_environmental_effect_factors(
+            soil_water_potential=soil_water_potential,
+            pH=pH,
+            clay_fraction=clay_fraction,
+            constants=constants,
+        )
+
+        def temp_factor(activation_energy: float) -> NDArray[np.float32]:
+            return calculate_temperature_effect_on_microbes(
+                soil_temperature=soil_temp,
+                activation_energy=activation_energy,
+                reference_temperature=constants.arrhenius_reference_temp,
+            )
+
+        enzyme_env_factor = env_factors.water * env_factors.pH
+
+        return cls(
+            uptake_rate=constants.max_uptake_rate_labile_C
+            * temp_factor(constants.activation_energy_microbial_uptake)
+            * enzyme_env_factor,
+            uptake_saturation=constants.half_sat_labile_C_uptake
+            * temp_factor(constants.activation_energy_labile_C_saturation),
+            carbon_use_efficiency=calculate_carbon_use_efficiency(
+                soil_temp,
+                constants.reference_cue,
+                constants.cue_reference_temp,
+                constants.cue_with_temperature,
+            ),
+            microbial_turnover=constants.microbial_turnover_rate
+            * temp_factor(constants.activation_energy_microbial_turnover),
+            pom_decomposition_rate=constants.max_decomp_rate_pom
+            * temp_factor(constants.activation_energy_pom_decomp_rate)
+            * enzyme_env_factor,
+            pom_decomposition_saturation=constants.half_sat_pom_decomposition
+            * temp_factor(constants.activation_energy_pom_decomp_saturation)
+            * env_factors.clay_saturation,
+            maom_decomposition_rate=constants.max_decomp_rate_maom
+            * temp_factor(constants.activation_energy_maom_decomp_rate)
+            * enzyme_env_factor,
+            maom_decomposition_saturation=constants.half_sat_maom_decomposition
+            * temp_factor(constants.activation_energy_maom_decomp_saturation)
+            * env_factors.clay_saturation,
+            leaching_rate=calculate_leaching_rate(
+                solute_density=np.ones_like(soil_moisture),
+                vertical_flow_rate=vertical_flow_rate,
+                soil_moisture=soil_moisture,
+                solubility_coefficient=constants.solubility_coefficient_lmwc,
+            ),
+            mineralisation_rate=np.asarray(mineralisation_rate),
+        )
+
+    def subset(self, cells: NDArray[np.int_]) -> SoilRateConstants:
+        """Get the rate constants for a subset of grid cells.
+
+        Args:
+            cells: The indices of the grid cells to select.
+        """
+
+        return SoilRateConstants(
+            **{
+                fld.name: np.asarray(getattr(self, fld.name))[cells]
+                for fld in fields(self)
+            }
+        )
+
+    def to_array(self) -> NDArray[np.float64]:
+        """Get the rate constants as an array with a row for each rate constant."""
+
+        return np.stack(
+            np.broadcast_arrays(*(getattr(self, fld.name) for fld in fields(self)))
+        ).astype(np.float64)
+
+    @classmethod
+    def from_array(cls, array: NDArray[np.float64]) -> SoilRateConstants:
+        """Get the rate constants from an array created using ``to_array``.
+
+        Args:
+            array: An array with a row for each rate constant.
+        """
+
+        return cls(*array)
+
+    @classmethod
+    def from_data(
+        cls, data: Data, top_soil_layer_index: int, constants: SoilConsts
+    ) -> SoilRateConstants:
+        """Calculate the rate constants from the current state of a Data instance.
+
+        Args:
+            data: The data object, used to populate the environmental conditions
+            top_soil_layer_index: Index for layer in data object representing top soil
+                layer
+            constants: Set of constants for the soil model.
+        """
+
+        return cls.from_environment(
+            soil_water_potential=data["matric_potential"][
+                top_soil_layer_index
+            ].to_numpy(),
+            pH=data["pH"].to_numpy(),
+            clay_fraction=data["clay_fraction"].to_numpy(),
+            soil_temp=data["soil_temperature"][top_soil_layer_index].to_numpy(),
+            vertical_flow_rate=data["vertical_flow"].to_numpy(),
+            soil_moisture=data["soil_moisture"][top_soil_layer_index].to_numpy(),
+            mineralisation_rate=data["litter_C_mineralisation_rate"].to_numpy(),
+            constants=constants,
+        )
+
+
+class SoilCarbonRHS:
+    """The right hand side function for integrating the soil carbon pools.
+
+    Instances are called with the current time and a vector of all soil pools, which
+    holds the values for each pool for all grid cells in turn, in the order given by
+    ``pool_names`` (see :func:`~virtual_ecosystem.models.soil.soil_model.make_slices`).
+    The rates of change are calculated in the same way as
+    :func:`~virtual_ecosystem.models.soil.carbon.calculate_soil_carbon_updates`, but
+    using precalculated rate constants, and are written directly into the output array
+    without concatenating the pools. The output array is allocated for each call,
+    because integrators keep references to previously returned rates of change.
+
+    Args:
+        rate_constants: The rate constants for each grid cell.
+        constants: Set of constants for the soil model.
+        pool_names: The names of the soil pools, in the order they are stored in the
+            vector of pools.
+    """
+
+    def __init__(
+        self,
+        rate_constants: SoilRateConstants,
+        constants: SoilConsts,
+        pool_names: Sequence[str],
+    ) -> None:
+        self.rate_constants: SoilRateConstants = rate_constants
+        """The rate constants for each grid cell."""
+        self.constants: SoilConsts = constants
+        """Set of constants for the soil model."""
+        self.pool_names: tuple[str, ...] = tuple(pool_names)
+        """The order of the soil pools in the vector of pools."""
+        self.no_cells: int = len(rate_constants.uptake_rate)
+        """The number of grid cells."""
+
+        # Slices for each pool in the vector of pools
+        self._slices = {
+            name: slice(idx * self.no_cells, (idx + 1) * self.no_cells)
+            for idx, name in enumerate(self.pool_names)
+        }
+
+        # Combined constants
+        self._non_enzyme_loss = (
+            1 - constants.maintenance_pom_enzyme - constants.maintenance_maom_enzyme
+        )
+
+    def subset(self, cells: NDArray[np.int_]) -> SoilCarbonRHS:
+        """Get the right hand side function for a subset of grid cells.
+
+        Args:
+            cells: The indices of the grid cells to select.
+        """
+
+        return SoilCarbonRHS(
+            rate_constants=self.rate_constants.subset(cells),
+            constants=self.constants,
+            pool_names=self.pool_names,
+        )
+
+    def __call__(self, t: float, pools: NDArray[np.float32]) -> NDArray[np.float32]:
+        """Calculate the rate of change for each soil pool.
+
+        Args:
+            t: Current time [days]. The model has no explicit time dependence.
+            pools: An array containing all soil pools in a single vector
+
+        Returns:
+            The rate of change for each soil pool
+        """
+
+        rates = self.rate_constants
+        consts = self.constants
+        slc = self._slices
+
+        lmwc = pools[slc["soil_c_pool_lmwc"]]
+        maom = pools[slc["soil_c_pool_maom"]]
+        microbe = pools[slc["soil_c_pool_microbe"]]
+        pom = pools[slc["soil_c_pool_pom"]]
+        necromass = pools[slc["soil_c_pool_necromass"]]
+        enzyme_pom = pools[slc["soil_enzyme_pom"]]
+        enzyme_maom = pools[slc["soil_enzyme_maom"]]
+
+        # Microbial uptake, growth and losses
+        uptake = rates.uptake_rate * lmwc * microbe / (lmwc + rates.uptake_saturation)
+        biomass_loss = rates.microbial_turnover * microbe
+        pom_enzyme_turnover = consts.pom_enzyme_turnover_rate * enzyme_pom
+        maom_enzyme_turnover = consts.maom_enzyme_turnover_rate * enzyme_maom
+
+        # Enzyme mediated decomposition
+        pom_to_lmwc = (
+            rates.pom_decomposition_rate
+            * enzyme_pom
+            * pom
+            / (rates.pom_decomposition_saturation + pom)
+        )
+        maom_to_lmwc = (
+            rates.maom_decomposition_rate
+            * enzyme_maom
+            * maom
+            / (rates.maom_decomposition_saturation + maom)
+        )
+
+        # Transfers between the lmwc, necromass and maom pools
+        maom_desorption = consts.maom_desorption_rate * maom
+        necromass_decay = consts.necromass_decay_rate * necromass
+        necromass_sorption = consts.necromass_sorption_rate * necromass
+        lmwc_sorption = consts.lmwc_sorption_rate * lmwc
+
+        delta_pools = np.empty_like(pools)
+        delta_pools[slc["soil_c_pool_lmwc"]] = (
+            pom_to_lmwc
+            + maom_to_lmwc
+            + maom_desorption
+            + necromass_decay
+            - uptake
+            - lmwc_sorption
+            - rates.leaching_rate * lmwc
+        )
+        delta_pools[slc["soil_c_pool_maom"]] = (
+            necromass_sorption + lmwc_sorption - maom_to_lmwc - maom_desorption
+        )
+        delta_pools[slc["soil_c_pool_microbe"]] = (
+            uptake * rates.carbon_use_efficiency - biomass_loss
+        )
+        delta_pools[slc["soil_c_pool_pom"]] = rates.mineralisation_rate - pom_to_lmwc
+        delta_pools[slc["soil_c_pool_necromass"]] = (
+            pom_enzyme_turnover
+            + maom_enzyme_turnover
+            + self._non_enzyme_loss * biomass_loss
+            - necromass_decay
+            - necromass_sorption
+        )
+        delta_pools[slc["soil_enzyme_pom"]] = (
+            consts.maintenance_pom_enzyme * biomass_loss - pom_enzyme_turnover
+        )
+        delta_pools[slc["soil_enzyme_maom"]] = (
+            consts.maintenance_maom_enzyme * biomass_loss - maom_enzyme_turnover
+        )
+
+        return delta_pools
+
+    def jacobian(self, pools: NDArray[np.floating]) -> NDArray[np.floating]:
+        """Calculate the Jacobian of the rates of change for each grid cell.
+
+        The pools in each grid cell only depend on the pools in the same cell, so the
+        Jacobian is returned as a separate block for each cell.
+
+        Args:
+            pools: An array containing all soil pools in a single vector
+
+        Returns:
+            An array of shape (no_cells, no_pools, no_pools), where element ``[c, i,
+            j]`` is the derivative of the rate of change of pool ``i`` with respect to
+            pool ``j`` in cell ``c``, with pools in the order given by ``pool_names``.
+        """
+
+        rates = self.rate_constants
+        consts = self.constants
+        slc = self._slices
+        idx = {name: position for position, name in enumerate(self.pool_names)}
+
+        lmwc = pools[slc["soil_c_pool_lmwc"]]
+        maom = pools[slc["soil_c_pool_maom"]]
+        microbe = pools[slc["soil_c_pool_microbe"]]
+        pom = pools[slc["soil_c_pool_pom"]]
+        enzyme_pom = pools[slc["soil_enzyme_pom"]]
+        enzyme_maom = pools[slc["soil_enzyme_maom"]]
+
+        # Partial derivatives of the non-linear fluxes
+        uptake_d_lmwc = (
+            rates.uptake_rate
+            * microbe
+            * rates.uptake_saturation
+            / (lmwc + rates.uptake_saturation) ** 2
+        )
+        uptake_d_microbe = rates.uptake_rate * lmwc / (lmwc + rates.uptake_saturation)
+        pom_to_lmwc_d_pom = (
+            rates.pom_decomposition_rate
+            * enzyme_pom
+            * rates.pom_decomposition_saturation
+            / (rates.pom_decomposition_saturation + pom) ** 2
+        )
+        pom_to_lmwc_d_enzyme = (
+            rates.pom_decomposition_rate
+            * pom
+            / (rates.pom_decomposition_saturation + pom)
+        )
+        maom_to_lmwc_d_maom = (
+            rates.maom_decomposition_rate
+            * enzyme_maom
+            * rates.maom_decomposition_saturation
+            / (rates.maom_decomposition_saturation + maom) ** 2
+        )
+        maom_to_lmwc_d_enzyme = (
+            rates.maom_decomposition_rate
+            * maom
+            / (rates.maom_decomposition_saturation + maom)
+        )
+
+        jacobian = np.zeros((self.no_cells, len(self.pool_names), len(self.pool_names)))
+
+        def set_row(pool: str, derivatives: dict[str, NDArray | float]) -> None:
+            for wrt, value in derivatives.items():
+                jacobian[:, idx[pool], idx[wrt]] = value
+
+        set_row(
+            "soil_c_pool_lmwc",
+            {
+                "soil_c_pool_lmwc": -uptake_d_lmwc
+                - consts.lmwc_sorption_rate
+                - rates.leaching_rate,
+                "soil_c_pool_maom": maom_to_lmwc_d_maom + consts.maom_desorption_rate,
+                "soil_c_pool_microbe": -uptake_d_microbe,
+                "soil_c_pool_pom": pom_to_lmwc_d_pom,
+                "soil_c_pool_necromass": consts.necromass_decay_rate,
+                "soil_enzyme_pom": pom_to_lmwc_d_enzyme,
+                "soil_enzyme_maom": maom_to_lmwc_d_enzyme,
+            },
+        )
+        set_row(
+            "soil_c_pool_maom",
+            {
+                "soil_c_pool_lmwc": consts.lmwc_sorption_rate,
+                "soil_c_pool_maom": -maom_to_lmwc_d_maom - consts.maom_desorption_rate,
+                "soil_c_pool_necromass": consts.necromass_sorption_rate,
+                "soil_enzyme_maom": -maom_to_lmwc_d_enzyme,
+            },
+        )
+        set_row(
+            "soil_c_pool_microbe",
+            {
+                "soil_c_pool_lmwc": rates.carbon_use_efficiency * uptake_d_lmwc,
+                "soil_c_pool_microbe": rates.carbon_use_efficiency * uptake_d_microbe
+                - rates.microbial_turnover,
+            },
+        )
+        set_row(
+            "soil_c_pool_pom",
+            {
+                "soil_c_pool_pom": -pom_to_lmwc_d_pom,
+                "soil_enzyme_pom": -pom_to_lmwc_d_enzyme,
+            },
+        )
+        set_row(
+            "soil_c_pool_necromass",
+            {
+                "soil_c_pool_microbe": self._non_enzyme_loss * rates.microbial_turnover,
+                "soil_c_pool_necromass": -consts.necromass_decay_rate
+                - consts.necromass_sorption_rate,
+                "soil_enzyme_pom": consts.pom_enzyme_turnover_rate,
+                "soil_enzyme_maom": consts.maom_enzyme_turnover_rate,
+            },
+        )
+        set_row(
+            "soil_enzyme_pom",
+            {
+                "soil_c_pool_microbe": consts.maintenance_pom_enzyme
+                * rates.microbial_turnover,
+                "soil_enzyme_pom": -consts.pom_enzyme_turnover_rate,
+            },
+        )
+        set_row(
+            "soil_enzyme_maom",
+            {
+                "soil_c_pool_microbe": consts.maintenance_maom_enzyme
+                * rates.microbial_turnover,
+                "soil_enzyme_maom": -consts.maom_enzyme_turnover_rate,
+            },
+        )
+
+        return jacobian
+
+
+@dataclass
+class PerCellIntegrationResult:
+    """The result of integrating the soil pools separately for each grid cell."""
+
+    y: NDArray[np.floating]
+    """The final pool values, with a row for each pool and a column for each cell."""
+    success: NDArray[np.bool_]
+    """Whether the integration succeeded for each cell."""
+    n_steps: NDArray[np.int_]
+    """The number of accepted steps taken for each cell."""
+    n_evaluations: NDArray[np.int_]
+    """The number of evaluations of the rates of change for each cell."""
+    n_jacobians: NDArray[np.int_]
+    """The number of evaluations of the Jacobian for each cell."""
+    last_step: NDArray[np.floating]
+    """The size of the last accepted step for each cell [days]."""
+    messages: list[str] = field(default_factory=list)
+    """Any failure messages from the integrator."""
+
+    @property
+    def failed_cells(self) -> NDArray[np.int_]:
+        """The indices of the cells that failed to integrate."""
+        return np.flatnonzero(~self.success)
+
+    @classmethod
+    def from_solve_ivp(
+        cls, output: OptimizeResult, shape: tuple[int, int]
+    ) -> PerCellIntegrationResult:
+        """Get the result for each cell from the output of a single integration.
+
+        The status and solver statistics of the integration apply to every cell. The
+        last step taken by :func:`~scipy.integrate.solve_ivp` is usually shortened to
+        end at the end of the integration, so the larger of the last two steps is used
+        as the last accepted step size.
+
+        Args:
+            output: The output of :func:`~scipy.integrate.solve_ivp`.
+            shape: The shape of the pools, with a row for each pool and a column for
+                each cell.
+        """
+
+        n_cells = shape[1]
+        steps = np.diff(output.t)
+
+        return cls(
+            y=output.y[:, -1].reshape(shape),
+            success=np.full(n_cells, output.success),
+            n_steps=np.full(n_cells, steps.size),
+            n_evaluations=np.full(n_cells, output.nfev),
+            n_jacobians=np.full(n_cells, output.njev),
+            last_step=np.full(n_cells, steps[-2:].max() if steps.size else np.nan),
+            messages=[] if output.success else [str(output.message)],
+        )
+
+
+def integrate_per_cell(
+    soil_rhs: SoilCarbonRHS,
+    y0: NDArray[np.float32],
+    t_end: float,
+    rtol: float = 1e-3,
+    atol: float = 1e-6,
+    max_steps: int = 10000,
+    first_step: NDArray[np.floating] | None = None,
+) -> PerCellIntegrationResult:
+    """Integrate the soil pools with a separate adaptive step size for each grid cell.
+
+    This uses the Dormand-Prince Runge-Kutta method and step size control used by the
+    ``RK45`` method of :func:`~scipy.integrate.solve_ivp`, with the error norm and the
+    step size calculated separately for each cell. At each iteration, a step is
+    attempted for all cells that have not yet finished, evaluating the rates of change
+    for only those cells. A cell fails if its step size becomes too small, for example
+    because the pool values become non-finite, or if it needs more than ``max_steps``
+    steps. Failed cells are left at the values reached before the failure.
+
+    Args:
+        soil_rhs: The right hand side function for all cells.
+        y0: The initial pool values, with a row for each pool and a column for each
+            cell.
+        t_end: The time to integrate to, starting from zero [days].
+        rtol: The relative tolerance for each step.
+        atol: The absolute tolerance for each step.
+        max_steps: The maximum number of steps for any single cell.
+        first_step: The initial step size for each cell [days], such as the last step
+            size from a previous integration. The initial step size is selected
+            automatically for cells where this is not given or is not a positive
+            number.
+
+    Returns:
+        The final pool values and the integration status for each cell. The last
+        step size for each cell is the step size proposed for the next step, which can
+        be used as the first step of a later integration.
+    """
+
+    n_pools, n_cells = y0.shape
+    order = RK45.error_estimator_order
+    stage_a, weights_b, weights_e = RK45.A, RK45.B, RK45.E
+
+    y = np.array(y0, dtype=np.float64)
+    t = np.zeros(n_cells)
+    n_steps = np.zeros(n_cells, dtype=np.int_)
+    n_evaluations = np.full(n_cells, 2, dtype=np.int_)
+    success = np.ones(n_cells, dtype=np.bool_)
+    active = np.arange(n_cells)
+
+    def evaluate(
+        rhs: SoilCarbonRHS, pools: NDArray[np.floating]
+    ) -> NDArray[np.floating]:
+        # Evaluate the rates of change for pools with a column for each cell
+        return rhs(0.0, pools.ravel()).reshape(pools.shape)
+
+    def rms_norm(values: NDArray[np.floating]) -> NDArray[np.floating]:
+        return np.sqrt(np.mean(values**2, axis=0))
+
+    # Select the initial step size for each cell as in solve_ivp
+    rhs = soil_rhs
+    f = evaluate(rhs, y)
+    scale = atol + np.abs(y) * rtol
+    d0 = rms_norm(y / scale)
+    d1 = rms_norm(f / scale)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        h0 = np.where((d0 < 1e-5) | (d1 < 1e-5), 1e-6, 0.01 * d0 / d1)
+        f1 = evaluate(rhs, y + h0 * f)
+        d2 = rms_norm((f1 - f) / scale) / h0
+        h1 = np.where(
+            (d1 <= 1e-15) & (d2 <= 1e-15),
+            np.maximum(1e-6, h0 * 1e-3),
+            (0.01 / np.maximum(d1, d2)) ** (1 / (order + 1)),
+        )
+    h = np.minimum(np.minimum(100 * h0, h1), t_end)
+    if first_step is not None:
+        with np.errstate(invalid="ignore"):
+            warm = first_step > 0
+        h = np.where(warm, np.minimum(first_step, t_end), h)
+
+    while active.size:
+        y_act, t_act = y[:, active], t[active]
+        h_act = np.minimum(h[active], t_end - t_act)
+
+        # Calculate the Runge-Kutta stages for the active cells
+        stages = np.empty((len(weights_e), n_pools, active.size))
+        stages[0] = f[:, active]
+        with np.errstate(all="ignore"):
+            for stage in range(1, len(weights_b)):
+                dy = (
+                    np.tensordot(stage_a[stage, :stage], stages[:stage], axes=1) * h_act
+                )
+                stages[stage] = evaluate(rhs, y_act + dy)
+            y_new = y_act + np.tensordot(weights_b, stages[:-1], axes=1) * h_act
+            stages[-1] = evaluate(rhs, y_new)
+
+            # Estimate the error for each cell and rescale the step sizes
+            error = np.tensordot(weights_e, stages, axes=1) * h_act
+            scale = atol + np.maximum(np.abs(y_act), np.abs(y_new)) * rtol
+            error_norm = rms_norm(error / scale)
+            error_norm = np.where(np.isfinite(error_norm), error_norm, np.inf)
+            factor = np.where(
+                error_norm == 0, 10.0, 0.9 * error_norm ** (-1 / (order + 1))
+            )
+
+        accepted = error_norm < 1
+        h[active] = h_act * np.where(
+            accepted, np.minimum(10.0, factor), np.maximum(0.2, factor)
+        )
+
+        # Update the accepted cells
+        done = active[accepted]
+        y[:, done] = y_new[:, accepted]
+        f[:, done] = stages[-1][:, accepted]
+        t[done] = np.where(
+            h_act[accepted] >= t_end - t_act[accepted],
+            t_end,
+            t_act[accepted] + h_act[accepted],
+        )
+        n_steps[done] += 1
+        n_evaluations[active] += len(weights_b)
+
+        # Cells fail if the step size becomes too small or too many steps are needed.
+        # Non-finite rates of change give a step size of NaN, which also fails.
+        failed = ~(h[active] >= 10 * np.spacing(t[active])) | (
+            n_steps[active] >= max_steps
+        )
+        success[active[failed]] = False
+
+        finished = failed | (t[active] >= t_end)
+        if np.any(finished):
+            active = active[~finished]
+            rhs = soil_rhs.subset(active)
+
+    return PerCellIntegrationResult(
+        y=y,
+        success=success,
+        n_steps=n_steps,
+        n_evaluations=n_evaluations,
+        n_jacobians=np.zeros(n_cells, dtype=np.int_),
+        last_step=h,
+    )
+
+
+def make_jacobian_sparsity(no_cells: int, no_pools: int) -> csr_array:
+    """Constructs the sparsity structure of the Jacobian of the soil model.
+
+    The pools are stored in the layout given by
+    :func:`~virtual_ecosystem.models.soil.soil_model.make_slices`, and each pool only
+    depends on the pools in the same grid cell. The Jacobian is therefore made up of a
+    diagonal block for each pair of pools.
+
+    Args:
+        no_cells: Number of grid cells the pools are defined for
+        no_pools: Number of soil pools being integrated
+
+    Returns:
+        A sparse array that is non-zero where the Jacobian can be non-zero
+    """
+
+    return csr_array(kron(np.ones((no_pools, no_pools)), identity(no_cells)))
+
+
+def get_first_step(
+    first_step: NDArray[np.floating] | None, t_end: float
+) -> float | None:
+    """Get a single initial step size for :func:`~scipy.integrate.solve_ivp`.
+
+    Args:
+        first_step: The initial step size for each cell [days].
+        t_end: The time to integrate to, starting from zero [days].
+
+    Returns:
+        The smallest of the step sizes, limited to the integration time, or None to
+        select the initial step size automatically if any step size is not a positive
+        number.
+    """
+
+    if first_step is None or not np.all(first_step > 0):
+        return None
+
+    return float(min(first_step.min(), t_end))
+
+
+def integrate_chunk(
+    soil_rhs: SoilCarbonRHS,
+    y0: NDArray[np.floating],
+    t_end: float,
+    method: str = "RK45",
+    rtol: float = 1e-3,
+    atol: float = 1e-6,
+    first_step: NDArray[np.floating] | None = None,
+) -> PerCellIntegrationResult:
+    """Integrate the soil pools for a set of grid cells.
+
+    Args:
+        soil_rhs: The right hand side function for the grid cells.
+        y0: The initial pool values, with a row for each pool and a column for each
+            cell.
+        t_end: The time to integrate to, starting from zero [days].
+        method: The :func:`~scipy.integrate.solve_ivp` method used to integrate the
+            pools, or ``per_cell`` to use
+            :func:`~virtual_ecosystem.models.soil.integration.integrate_per_cell`.
+        rtol: The relative tolerance for each step.
+        atol: The absolute tolerance for each step.
+        first_step: The initial step size for each cell [days]. A single integration of
+            all cells using :func:`~scipy.integrate.solve_ivp` starts with the smallest
+            of these step sizes, and selects the initial step size automatically if any
+            step size is not a positive number.
+
+    Returns:
+        The final pool values and the integration status for each cell. When
+        :func:`~scipy.integrate.solve_ivp` fails, the integration fails for all cells.
+    """
+
+    if method == "per_cell":
+        return integrate_per_cell(
+            soil_rhs, y0, t_end, rtol=rtol, atol=atol, first_step=first_step
+        )
+
+    # The implicit methods that estimate the Jacobian by finite differences can use
+    # the block diagonal structure of the Jacobian to reduce the cost of estimation
+    n_pools, n_cells = y0.shape
+    solver_options: dict[str, Any] = {"rtol": rtol, "atol": atol}
+    if method in ("Radau", "BDF"):
+        solver_options["jac_sparsity"] = make_jacobian_sparsity(n_cells, n_pools)
+    solver_options["first_step"] = get_first_step(first_step, t_end)
+
+    output = solve_ivp(
+        soil_rhs, (0.0, t_end), y0.ravel(), method=method, **solver_options
+    )
+
+    return PerCellIntegrationResult.from_solve_ivp(output, y0.shape)
+
+
+def _integrate_shared_chunk(
+    shared_name: str,
+    shape: tuple[int, int],
+    cells: slice,
+    constants: SoilConsts,
+    pool_names: tuple[str, ...],
+    t_end: float,
+    method: str,
+    rtol: float,
+    atol: float,
+) -> PerCellIntegrationResult:
+    """Integrate a chunk of grid cells using values from shared memory.
+
+    This is run in the worker processes used by
+    :func:`~virtual_ecosystem.models.soil.integration.integrate_parallel`.
+
+    Args:
+        shared_name: The name of the shared memory block.
+        shape: The shape of the array of values in the shared memory block.
+        cells: The grid cells in the chunk.
+        constants: Set of constants for the soil model.
+        pool_names: The order of the soil pools.
+        t_end: The time to integrate to, starting from zero [days].
+        method: The integration method for the chunk.
+        rtol: The relative tolerance for each step.
+        atol: The absolute tolerance for each step.
+    """
+
+    shared = SharedMemory(name=shared_name)
+    try:
+        shared_values: NDArray[np.float64] = np.ndarray(
+            shape, dtype=np.float64, buffer=shared.buf
+        )
+        values = shared_values[:, cells].copy()
+        del shared_values
+    finally:
+        shared.close()
+
+    n_rates = len(fields(SoilRateConstants))
+    soil_rhs = SoilCarbonRHS(
+        rate_constants=SoilRateConstants.from_array(values[:n_rates]),
+        constants=constants,
+        pool_names=pool_names,
+    )
+
+    # The last row holds the initial step size for each cell
+    return integrate_chunk(
+        soil_rhs,
+        values[n_rates:-1],
+        t_end,
+        method,
+        rtol=rtol,
+        atol=atol,
+        first_step=values[-1],
+    )
+
+
+def make_worker_pool(n_workers: int) -> ProcessPoolExecutor:
+    """Create a pool of worker processes for integrating chunks of grid cells.
+
+    The workers are started using the ``forkserver`` method where it is available, and
+    otherwise the ``spawn`` method, rather than the default ``fork`` method on Linux.
+    Forking a process that has other threads running, such as the thread extracting
+    forcing data in the background, can deadlock if one of those threads holds a lock
+    when the process is forked. The fork server is a separate single threaded process
+    that has already imported this module, so workers forked from it start quickly, but
+    the pool should still be created once and reused.
+
+    Args:
+        n_workers: The number of worker processes.
+    """
+
+    context: BaseContext
+    if "forkserver" in get_all_start_methods():
+        context = get_context("forkserver")
+        context.set_forkserver_preload([__name__])
+    else:
+        context = get_context("spawn")
+
+    return ProcessPoolExecutor(max_workers=n_workers, mp_context=context)
+
+
+def integrate_parallel(
+    soil_rhs: SoilCarbonRHS,
+    y0: NDArray[np.floating],
+    t_end: float,
+    method: str = "RK45",
+    n_workers: int = 2,
+    rtol: float = 1e-3,
+    atol: float = 1e-6,
+    first_step: NDArray[np.floating] | None = None,
+    executor: ProcessPoolExecutor | None = None,
+) -> PerCellIntegrationResult:
+    """Integrate the soil pools in chunks of grid cells using worker processes.
+
+    The grid cells are split into a contiguous chunk for each worker. The rate
+    constants, initial pool values and initial step sizes are copied into a shared
+    memory block, which the workers read their chunk from, and the results for each
+    chunk are then combined. The chunks are integrated using the pool of workers in
+    ``executor`` if one is provided, otherwise a pool is created for this call and then
+    shut down (see
+    :func:`~virtual_ecosystem.models.soil.integration.make_worker_pool`).
+
+    Args:
+        soil_rhs: The right hand side function for all cells.
+        y0: The initial pool values, with a row for each pool and a column for each
+            cell.
+        t_end: The time to integrate to, starting from zero [days].
+        method: The integration method used for each chunk (see
+            :func:`~virtual_ecosystem.models.soil.integration.integrate_chunk`).
+        n_workers: The number of worker processes.
+        rtol: The relative tolerance for each step.
+        atol: The absolute tolerance for each step.
+        first_step: The initial step size for each cell [days].
+        executor: A pool of worker processes to reuse.
+
+    Returns:
+        The final pool values and the integration status for each cell.
+    """
+
+    n_cells = y0.shape[1]
+    if first_step is None:
+        first_step = np.full(n_cells, np.nan)
+    values = np.concatenate(
+        [soil_rhs.rate_constants.to_array(), y0, first_step[None, :]]
+    ).astype(np.float64)
+    bounds = np.linspace(0, n_cells, min(n_workers, n_cells) + 1).round().astype(int)
+    chunks = [slice(start, stop) for start, stop in pairwise(bounds)]
+
+    own_executor = executor is None
+    if executor is None:
+        executor = make_worker_pool(len(chunks))
+
+    shared = SharedMemory(create=True, size=values.nbytes)
+    try:
+        shared_values: NDArray[np.float64] = np.ndarray(
+            values.shape, dtype=np.float64, buffer=shared.buf
+        )
+        shared_values[:] = values
+        del shared_values
+
+        results = list(
+            executor.map(
+                _integrate_shared_chunk,
+                repeat(shared.name),
+                repeat(values.shape),
+                chunks,
+                repeat(soil_rhs.constants),
+                repeat(soil_rhs.pool_names),
+                repeat(t_end),
+                repeat(method),
+                repeat(rtol),
+                repeat(atol),
+            )
+        )
+    finally:
+        shared.close()
+        shared.unlink()
+        if own_executor:
+            executor.shutdown()
+
+    return PerCellIntegrationResult(
+        y=np.concatenate([result.y for result in results], axis=1),
+        success=np.concatenate([result.success for result in results]),
+        n_steps=np.concatenate([result.n_steps for result in results]),
+        n_evaluations=np.concatenate([result.n_evaluations for result in results]),
+        n_jacobians=np.concatenate([result.n_jacobians for result in results]),
+        last_step=np.concatenate([result.last_step for result in results]),
+        messages=[message for result in results for message in result.messages],
+    )
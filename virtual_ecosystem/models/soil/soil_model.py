@@ -2,8 +2,7 @@
 :class:`~virtual_ecosystem.models.soil.soil_model.SoilModel` class as a child of the
 :class:`~virtual_ecosystem.core.base_model.BaseModel` class. At present a lot of the
 abstract methods of the parent class (e.g.
-:func:`~virtual_ecosystem.core.base_model.BaseModel.setup` and
-:func:`~virtual_ecosystem.core.base_model.BaseModel.spinup`) are overwritten using
+:func:`~virtual_ecosystem.core.base_model.BaseModel.setup`) are overwritten using
 placeholder functions that don't do anything. This will change as the Virtual Ecosystem
 model develops. The factory method
 :func:`~virtual_ecosystem.models.soil.soil_model.SoilModel.from_config` exists in a
@@ -14,10 +13,54 @@ to the required types (e.g. :class:`~numpy.timedelta64`) they are caught and the
 logged, and at the end of the unpacking an error is thrown. This error should be caught
 and handled by downstream functions so that all model configuration failures can be
 reported as one.
+
+The soil pools are integrated using :func:`scipy.integrate.solve_ivp`, using the method
+set by the ``soil.integration_method`` configuration option. The default explicit
+``RK45`` method can be forced to take very small steps by stiff microbial and enzyme
+dynamics, so the implicit ``Radau``, ``BDF`` and ``LSODA`` methods are also available.
+The pools in each grid cell only interact with other pools in the same cell, so the
+implicit ``Radau`` and ``BDF`` methods are given the block diagonal sparsity structure
+of the Jacobian (see
+:func:`~virtual_ecosystem.models.soil.integration.make_jacobian_sparsity`), which keeps
+the cost of estimating and factorising the Jacobian linear in the number of cells.
+
+Setting ``soil.integration_method`` to ``per_cell`` instead integrates the pools using
+:func:`~virtual_ecosystem.models.soil.integration.integrate_per_cell`, which uses the
+``RK45`` method with a separate adaptive step size for each grid cell. Cells with slowly
+changing pools are then not forced to take the small steps needed by other cells, and
+any grid cells that fail to integrate are reported by cell id.
+
+Each integration starts with the last accepted step size from the previous update,
+which is stored in the ``soil_integration_step_size`` variable, and uses the tolerances
+set by the ``soil.integration_rtol`` and ``soil.integration_atol`` configuration
+options. The number of steps, rate of change evaluations and Jacobian evaluations for
+each grid cell are stored as diagnostic variables, which are included in the
+continuous output for each update and show when the soil pools become stiff.
+
+The pools in different grid cells do not interact, so setting
+``soil.integration_workers`` to more than one splits the grid cells into chunks that are
+integrated in parallel by worker processes, using the configured integration method for
+each chunk (see :func:`~virtual_ecosystem.models.soil.integration.integrate_parallel`).
+The worker processes are started when the model is first updated and are reused for
+every update until the model is cleaned up, but passing the pools to and from the
+workers still has a cost for each update, so this is only faster for larger grids.
+
+Setting ``soil.spinup_to_equilibrium`` to ``true`` spins up the model before the
+simulation starts, by solving for the steady state of the soil pools under the initial
+environmental conditions (see :mod:`~virtual_ecosystem.models.soil.equilibrium`), rather
+than simulating the centuries needed for the slowest pools to equilibrate.
+
+The environmental conditions that control the soil carbon rates are fixed within an
+update, so the rates of change of the pools are calculated using a
+:class:`~virtual_ecosystem.models.soil.integration.SoilCarbonRHS` instance, which
+calculates the rate constants for each grid cell once per update. The
+:func:`~virtual_ecosystem.models.soil.soil_model.construct_full_soil_model` function
+gives the same rates of change calculated directly from the data object.
 """  # noqa: D205
 
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any
 
 import numpy as np
@@ -35,6 +78,29 @@ from virtual_ecosystem.core.exceptions import InitialisationError
 from virtual_ecosystem.core.logger import LOGGER
 from virtual_ecosystem.models.soil.carbon import calculate_soil_carbon_updates
 from virtual_ecosystem.models.soil.constants import SoilConsts
+from virtual_ecosystem.models.soil.equilibrium import solve_equilibrium
+from virtual_ecosystem.models.soil.integration import (
+    PerCellIntegrationResult,
+    SoilCarbonRHS,
+    SoilRateConstants,
+    get_first_step,
+    integrate_parallel,
+    integrate_per_cell,
+    make_jacobian_sparsity,
+    make_worker_pool,
+)
+
+SOIL_POOLS: tuple[str, ...] = (
+    "soil_c_pool_lmwc",
+    "soil_c_pool_maom",
+    "soil_c_pool_microbe",
+    "soil_c_pool_pom",
+    "soil_c_pool_necromass",
+    "soil_enzyme_pom",
+    "soil_enzyme_maom",
+)
+"""The soil pools integrated by the soil model, in the order they are stored in the
+vector of pools."""
 
 
 class IntegrationError(Exception):
@@ -76,8 +142,17 @@ class SoilModel(
         "soil_c_pool_necromass",
         "soil_enzyme_pom",
         "soil_enzyme_maom",
+        "soil_integration_steps",
+        "soil_integration_evaluations",
+        "soil_integration_jacobians",
+        "soil_integration_step_size",
+    ),
+    vars_populated_by_first_update=(
+        "soil_integration_steps",
+        "soil_integration_evaluations",
+        "soil_integration_jacobians",
+        "soil_integration_step_size",
     ),
-    vars_populated_by_first_update=(),
 ):
     """A class defining the soil model.
 
@@ -92,6 +167,15 @@ class SoilModel(
         soil_layers: A list giving the number and depth of soil layers to be modelled.
         canopy_layers: The number of canopy layers to be modelled.
         constants: Set of constants for the soil model.
+        integration_method: The :func:`~scipy.integrate.solve_ivp` method used to
+            integrate the soil pools, or ``per_cell`` to integrate each grid cell with
+            its own step size.
+        integration_workers: The number of worker processes used to integrate chunks
+            of grid cells in parallel.
+        integration_rtol: The relative tolerance used to integrate the soil pools.
+        integration_atol: The absolute tolerance used to integrate the soil pools.
+        spinup_to_equilibrium: Should the soil pools be set to their steady state when
+            the model is spun up.
     """
 
     def __init__(
@@ -99,6 +183,11 @@ class SoilModel(
         data: Data,
         core_components: CoreComponents,
         model_constants: SoilConsts,
+        integration_method: str = "RK45",
+        integration_workers: int = 1,
+        integration_rtol: float = 1e-3,
+        integration_atol: float = 1e-6,
+        spinup_to_equilibrium: bool = False,
         **kwargs: Any,
     ):
         super().__init__(data=data, core_components=core_components, **kwargs)
@@ -123,6 +212,22 @@ class SoilModel(
         # both the soil and abiotic models get more complex this might well change.
         self.model_constants: SoilConsts = model_constants
         """Set of constants for the soil model."""
+        self.integration_method: str = integration_method
+        """The :func:`~scipy.integrate.solve_ivp` method used to integrate the pools."""
+        self.integration_workers: int = integration_workers
+        """The number of worker processes used to integrate the pools."""
+        self.integration_rtol: float = integration_rtol
+        """The relative tolerance used to integrate the pools."""
+        self.integration_atol: float = integration_atol
+        """The absolute tolerance used to integrate the pools."""
+        self.spinup_to_equilibrium: bool = spinup_to_equilibrium
+        """Should the pools be set to their steady state when the model is spun up."""
+        self.solver_statistics: dict[str, DataArray] = {}
+        """Solver statistics for each grid cell from the last integration."""
+        self.worker_pool: ProcessPoolExecutor | None = (
+            make_worker_pool(integration_workers) if integration_workers > 1 else None
+        )
+        """The pool of worker processes used to integrate the pools in parallel."""
 
     @classmethod
     def from_config(
@@ -142,6 +247,11 @@ class SoilModel(
 
         # Load in the relevant constants
         model_constants = load_constants(config, "soil", "SoilConsts")
+        integration_method = config["soil"]["integration_method"]
+        integration_workers = config["soil"]["integration_workers"]
+        integration_rtol = config["soil"]["integration_rtol"]
+        integration_atol = config["soil"]["integration_atol"]
+        spinup_to_equilibrium = config["soil"]["spinup_to_equilibrium"]
 
         LOGGER.info(
             "Information required to initialise the soil model successfully "
@@ -152,13 +262,54 @@ class SoilModel(
             data=data,
             core_components=core_components,
             model_constants=model_constants,
+            integration_method=integration_method,
+            integration_workers=integration_workers,
+            integration_rtol=integration_rtol,
+            integration_atol=integration_atol,
+            spinup_to_equilibrium=spinup_to_equilibrium,
         )
 
     def setup(self) -> None:
         """Placeholder function to setup up the soil model."""
 
     def spinup(self) -> None:
-        """Placeholder function to spin up the soil model."""
+        """Spin up the soil carbon pools to their steady state.
+
+        This only changes the pools if the ``spinup_to_equilibrium`` option is set. The
+        steady state of the pools is found for the environmental conditions and litter
+        mineralisation rate in the data object, so these should hold representative
+        mean conditions when the model is spun up (see
+        :func:`~virtual_ecosystem.models.soil.equilibrium.solve_equilibrium`). Grid
+        cells without a steady state keep their current pool values and a warning is
+        logged.
+        """
+
+        if not self.spinup_to_equilibrium:
+            return
+
+        pool_names = list(SOIL_POOLS)
+        y0 = np.stack([self.data[name].to_numpy() for name in pool_names])
+
+        result = solve_equilibrium(self._get_soil_rhs(pool_names), y0)
+
+        if not np.all(result.success):
+            failed_cell_ids = np.asarray(self.data.grid.cell_id)[result.failed_cells]
+            LOGGER.warning(
+                "Soil carbon steady state not found for grid cells: "
+                f"{', '.join(map(str, failed_cell_ids))}"
+            )
+
+        LOGGER.info(
+            "Soil carbon pools spun up to steady state in at most "
+            f"{result.n_iterations.max()} iterations"
+        )
+
+        self.data.add_from_dict(
+            {
+                name: DataArray(values, dims="cell_id")
+                for name, values in zip(pool_names, result.y)
+            }
+        )
 
     def update(self, time_index: int, **kwargs: Any) -> None:
         """Update the soil model by integrating.
@@ -174,9 +325,14 @@ class SoilModel(
         # Update carbon pools (attributes and data object)
         # n.b. this also updates the data object automatically
         self.data.add_from_dict(updated_carbon_pools)
+        self.data.add_from_dict(self.solver_statistics)
 
     def cleanup(self) -> None:
-        """Placeholder function for soil model cleanup."""
+        """Shut down the worker processes used to integrate the pools in parallel."""
+
+        if self.worker_pool is not None:
+            self.worker_pool.shutdown()
+            self.worker_pool = None
 
     def integrate(self) -> dict[str, DataArray]:
         """Integrate the soil model.
@@ -186,7 +342,10 @@ class SoilModel(
         that is feasible).
 
         This function unpacks the variables that are to be integrated into a single
-        numpy array suitable for integration.
+        numpy array suitable for integration. The integration starts with the last
+        accepted step size from the previous update, if there is one, and the solver
+        statistics for the integration are stored in the ``solver_statistics``
+        attribute.
 
         Returns:
             A data array containing the new pool values (i.e. the values at the final
@@ -204,56 +363,163 @@ class SoilModel(
         t_span = (0.0, update_time)
 
         # Construct vector of initial values y0
-        y0 = np.concatenate(
-            [
-                self.data[name].to_numpy()
-                for name in map(str, self.data.data.keys())
-                if name.startswith("soil_c_pool_") or name.startswith("soil_enzyme_")
-            ]
-        )
+        y0 = np.concatenate([self.data[name].to_numpy() for name in SOIL_POOLS])
 
         # Find and store order of pools
-        delta_pools_ordered = {
-            name: np.array([])
-            for name in map(str, self.data.data.keys())
-            if name.startswith("soil_c_pool_") or name.startswith("soil_enzyme_")
-        }
+        delta_pools_ordered = {name: np.array([]) for name in SOIL_POOLS}
 
-        # Carry out simulation
-        output = solve_ivp(
-            construct_full_soil_model,
-            t_span,
-            y0,
-            args=(
-                self.data,
-                no_cells,
-                self.layer_structure.index_topsoil_scalar,
-                delta_pools_ordered,
-                self.model_constants,
-                self.core_constants,
-            ),
+        # The environmental conditions are fixed within an update, so calculate the
+        # rate constants once and use them for every evaluation of the pool changes
+        soil_rhs = self._get_soil_rhs(list(delta_pools_ordered))
+
+        # Start from the last accepted step size of the previous update
+        first_step = (
+            self.data["soil_integration_step_size"].to_numpy()
+            if "soil_integration_step_size" in self.data
+            else None
         )
 
-        # Check if integration failed
-        if not output.success:
-            LOGGER.error(
-                "Integration of soil module failed with following message: {}".format(  # noqa: UP032
-                    str(output.message)
+        # Carry out simulation
+        if self.integration_method == "per_cell" or self.integration_workers > 1:
+            result = self._integrate_cells(soil_rhs, y0, update_time, first_step)
+        else:
+            # The implicit methods that estimate the Jacobian by finite differences can
+            # use the block diagonal structure of the Jacobian to reduce the cost of
+            # estimation
+            solver_options: dict[str, Any] = {
+                "rtol": self.integration_rtol,
+                "atol": self.integration_atol,
+                "first_step": get_first_step(first_step, update_time),
+            }
+            if self.integration_method in ("Radau", "BDF"):
+                solver_options["jac_sparsity"] = make_jacobian_sparsity(
+                    no_cells, len(delta_pools_ordered)
                 )
+
+            output = solve_ivp(
+                soil_rhs,
+                t_span,
+                y0,
+                method=self.integration_method,
+                **solver_options,
             )
-            raise IntegrationError()
+
+            # Check if integration failed
+            if not output.success:
+                LOGGER.error(
+                    "Integration of soil module failed with following message: {}".format(  # noqa: E501, UP032
+                        str(output.message)
+                    )
+                )
+                raise IntegrationError()
+
+            result = PerCellIntegrationResult.from_solve_ivp(
+                output, (len(delta_pools_ordered), no_cells)
+            )
+
+        self.solver_statistics = {
+            "soil_integration_steps": DataArray(result.n_steps, dims="cell_id"),
+            "soil_integration_evaluations": DataArray(
+                result.n_evaluations, dims="cell_id"
+            ),
+            "soil_integration_jacobians": DataArray(result.n_jacobians, dims="cell_id"),
+            "soil_integration_step_size": DataArray(result.last_step, dims="cell_id"),
+        }
+        final_pools = result.y.ravel()
 
         # Construct index slices
         slices = make_slices(no_cells, round(len(y0) / no_cells))
 
         # Construct dictionary of data arrays
         new_c_pools = {
-            str(pool): DataArray(output.y[slc, -1], dims="cell_id")
+            str(pool): DataArray(final_pools[slc], dims="cell_id")
             for slc, pool in zip(slices, delta_pools_ordered.keys())
         }
 
         return new_c_pools
 
+    def _get_soil_rhs(self, pool_names: list[str]) -> SoilCarbonRHS:
+        """Get the right hand side function for the current environmental conditions.
+
+        Args:
+            pool_names: The order of the soil pools in the vector of pools.
+        """
+
+        return SoilCarbonRHS(
+            rate_constants=SoilRateConstants.from_data(
+                data=self.data,
+                top_soil_layer_index=self.layer_structure.index_topsoil_scalar,
+                constants=self.model_constants,
+            ),
+            constants=self.model_constants,
+            pool_names=pool_names,
+        )
+
+    def _integrate_cells(
+        self,
+        soil_rhs: SoilCarbonRHS,
+        y0: NDArray[np.float32],
+        update_time: float,
+        first_step: NDArray[np.floating] | None = None,
+    ) -> PerCellIntegrationResult:
+        """Integrate the soil pools reporting the success of each grid cell.
+
+        This is used to integrate the pools with a separate step size for each grid
+        cell, or to integrate chunks of grid cells in parallel.
+
+        Args:
+            soil_rhs: The right hand side function for all grid cells.
+            y0: The initial values of the pools for all grid cells as a single vector.
+            update_time: The time to integrate over [days].
+            first_step: The initial step size for each grid cell [days].
+
+        Returns:
+            The final values of the pools and the solver statistics for each grid cell.
+
+        Raises:
+            IntegrationError: When the integration fails for any grid cell.
+        """
+
+        y0_cells = y0.reshape(len(soil_rhs.pool_names), -1)
+
+        output: PerCellIntegrationResult
+        if self.worker_pool is not None:
+            output = integrate_parallel(
+                soil_rhs,
+                y0_cells,
+                update_time,
+                method=self.integration_method,
+                n_workers=self.integration_workers,
+                rtol=self.integration_rtol,
+                atol=self.integration_atol,
+                first_step=first_step,
+                executor=self.worker_pool,
+            )
+        else:
+            output = integrate_per_cell(
+                soil_rhs,
+                y0_cells,
+                update_time,
+                rtol=self.integration_rtol,
+                atol=self.integration_atol,
+                first_step=first_step,
+            )
+
+        if not np.all(output.success):
+            for message in output.messages:
+                LOGGER.error(
+                    f"Integration of soil module failed with following message: "
+                    f"{message}"
+                )
+            failed_cell_ids = np.asarray(self.data.grid.cell_id)[output.failed_cells]
+            LOGGER.error(
+                "Integration of soil module failed for grid cells: "
+                f"{', '.join(map(str, failed_cell_ids))}"
+            )
+            raise IntegrationError()
+
+        return output
+
 
 def construct_full_soil_model(
     t: float,